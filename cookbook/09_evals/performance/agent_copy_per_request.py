@@ -0,0 +1,45 @@
+"""Compare the per-request cost of deep_copy() and copy_for_run(), as done by AgentOS for every run request.
+
+Run `uv pip install agno openai memory_profiler` to install dependencies.
+"""
+
+from typing import Literal
+
+from agno.agent import Agent
+from agno.eval.performance import PerformanceEval
+from agno.models.openai import OpenAIChat
+from agno.tools.calculator import CalculatorTools
+
+
+def get_weather(city: Literal["nyc", "sf"]):
+    """Use this to get weather information."""
+    if city == "nyc":
+        return "It might be cloudy in nyc"
+    elif city == "sf":
+        return "It's always sunny in sf"
+
+
+agent = Agent(
+    id="weather-agent",
+    model=OpenAIChat(id="gpt-4o"),
+    tools=[get_weather, CalculatorTools()],
+    instructions=["Answer questions about the weather.", "Use the calculator for any arithmetic."],
+    session_state={"favourite_cities": ["nyc", "sf"]},
+    markdown=True,
+)
+
+
+def deep_copy_agent():
+    return agent.deep_copy()
+
+
+def copy_agent_for_run():
+    return agent.copy_for_run()
+
+
+deep_copy_perf = PerformanceEval(name="Agent deep_copy", func=deep_copy_agent, num_iterations=1000)
+copy_for_run_perf = PerformanceEval(name="Agent copy_for_run", func=copy_agent_for_run, num_iterations=1000)
+
+if __name__ == "__main__":
+    deep_copy_perf.run(print_results=True, print_summary=True)
+    copy_for_run_perf.run(print_results=True, print_summary=True)
@@ -0,0 +1,82 @@
+"""Measure the cost of serializing a run with a 50-message history, as done when saving sessions and streaming events.
+
+Compares RunOutput.to_dict() with the previous approach of filtering the output of dataclasses.asdict().
+
+Run `uv pip install agno memory_profiler` to install dependencies.
+"""
+
+import base64
+from dataclasses import asdict
+
+from agno.eval.performance import PerformanceEval
+from agno.media import Image
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.response import ToolExecution
+from agno.run.agent import RunOutput
+
+image = Image(content=base64.b64encode(b"\x89PNG" + bytes(64 * 1024)), format="png")
+
+messages = [Message(role="system", content="You are a helpful assistant. " * 20)]
+for i in range(49):
+    if i % 2 == 0:
+        messages.append(
+            Message(role="user", content=f"Question {i}: " + "lorem ipsum " * 50)
+        )
+    else:
+        messages.append(
+            Message(
+                role="assistant",
+                content=f"Answer {i}: " + "dolor sit amet " * 80,
+                metrics=Metrics(
+                    input_tokens=1200, output_tokens=300, total_tokens=1500
+                ),
+            )
+        )
+messages[1].images = [image]
+
+run_output = RunOutput(
+    run_id="run-1",
+    agent_id="agent-1",
+    session_id="session-1",
+    content="Final answer " * 50,
+    messages=messages,
+    images=[image],
+    metrics=Metrics(input_tokens=30_000, output_tokens=7_500, total_tokens=37_500),
+    tools=[
+        ToolExecution(
+            tool_name="search", tool_args={"query": f"q{i}"}, result="result " * 100
+        )
+        for i in range(5)
+    ],
+    session_state={"shopping_list": ["milk", "eggs"]},
+)
+
+
+def serialize_with_asdict():
+    excluded = {"messages", "metrics", "tools", "images", "status"}
+    _dict = {
+        k: v
+        for k, v in asdict(run_output).items()
+        if v is not None and k not in excluded
+    }
+    _dict["messages"] = [m.to_dict() for m in messages]
+    return _dict
+
+
+def serialize_run_output():
+    return run_output.to_dict()
+
+
+asdict_perf = PerformanceEval(
+    name="RunOutput asdict serialization",
+    func=serialize_with_asdict,
+    num_iterations=200,
+)
+to_dict_perf = PerformanceEval(
+    name="RunOutput.to_dict", func=serialize_run_output, num_iterations=200
+)
+
+if __name__ == "__main__":
+    asdict_perf.run(print_results=True, print_summary=True)
+    to_dict_perf.run(print_results=True, print_summary=True)
@@ -257,6 +257,9 @@ class Agent:
     num_history_runs: Optional[int] = None
     # Number of historical messages to include in the messages list sent to the Model.
     num_history_messages: Optional[int] = None
+    # Maximum number of tokens in the historical messages, keeping the latest runs that fit.
+    # Token counts are stored with the messages, so each message is only tokenized once per tokenizer.
+    max_history_tokens: Optional[int] = None
     # Maximum number of tool calls to include from history (None = no limit)
     max_tool_calls_from_history: Optional[int] = None
 
@@ -287,6 +290,10 @@ class Agent:
 
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # Maximum number of tool calls from a single model response to run concurrently in sync runs.
+    # Tools must be thread-safe. Tool calls run sequentially when not set.
+    # Async runs ignore it: they always run the tool calls of a model response concurrently.
+    max_concurrent_tool_calls: Optional[int] = None
     # Controls which (if any) tool is called by the model.
     # "none" means the model will not call a tool and instead generates a message.
     # "auto" means the model can pick between generating a message or calling a tool.
@@ -499,6 +506,7 @@ class Agent:
         add_history_to_context: bool = False,
         num_history_runs: Optional[int] = None,
         num_history_messages: Optional[int] = None,
+        max_history_tokens: Optional[int] = None,
         max_tool_calls_from_history: Optional[int] = None,
         store_media: bool = True,
         store_tool_messages: bool = True,
@@ -513,6 +521,7 @@ class Agent:
         metadata: Optional[Dict[str, Any]] = None,
         tools: Optional[Sequence[Union[Toolkit, Callable, Function, Dict]]] = None,
         tool_call_limit: Optional[int] = None,
+        max_concurrent_tool_calls: Optional[int] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
         pre_hooks: Optional[List[Union[Callable[..., Any], BaseGuardrail, BaseEval]]] = None,
@@ -625,7 +634,9 @@ class Agent:
                 "num_history_messages and num_history_runs cannot be set at the same time. Using num_history_runs."
             )
             self.num_history_messages = None
-        if self.num_history_messages is None and self.num_history_runs is None:
+        self.max_history_tokens = max_history_tokens
+        # Without a token budget, default to the last 3 runs
+        if self.num_history_messages is None and self.num_history_runs is None and self.max_history_tokens is None:
             self.num_history_runs = 3
 
         self.max_tool_calls_from_history = max_tool_calls_from_history
@@ -647,6 +658,7 @@ class Agent:
 
         self.tools = list(tools) if tools else []
         self.tool_call_limit = tool_call_limit
+        self.max_concurrent_tool_calls = max_concurrent_tool_calls
         self.tool_choice = tool_choice
         self.tool_hooks = tool_hooks
 
@@ -1166,6 +1178,7 @@ class Agent:
                         tools=_tools,
                         tool_choice=self.tool_choice,
                         tool_call_limit=self.tool_call_limit,
+                        max_concurrent_tool_calls=self.max_concurrent_tool_calls,
                         response_format=response_format,
                         run_response=run_response,
                         send_media_to_model=self.send_media_to_model,
@@ -1866,7 +1879,9 @@ class Agent:
         )
 
         # Read existing session from database
-        agent_session = self._read_or_create_session(session_id=session_id, user_id=user_id)
+        agent_session = self._read_or_create_session(
+            session_id=session_id, user_id=user_id, num_history_runs=self._get_num_history_runs_to_read()
+        )
         self._update_metadata(session=agent_session)
 
         # Initialize session state. Get it from DB if relevant.
@@ -3345,6 +3360,7 @@ class Agent:
                         tools=tools,
                         tool_choice=self.tool_choice,
                         tool_call_limit=self.tool_call_limit,
+                        max_concurrent_tool_calls=self.max_concurrent_tool_calls,
                         run_response=run_response,
                         send_media_to_model=self.send_media_to_model,
                         compression_manager=self.compression_manager if self.compress_tool_results else None,
@@ -5598,6 +5614,7 @@ class Agent:
             tools=tools,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            max_concurrent_tool_calls=self.max_concurrent_tool_calls,
             stream_model_response=stream_model_response,
             run_response=run_response,
             send_media_to_model=self.send_media_to_model,
@@ -6878,10 +6895,11 @@ class Agent:
                     continue
                 _function_names.append(tool.name)
 
+                # Process a copy, the Function can be shared by concurrent runs
+                tool = tool.model_copy(deep=True)
                 # Respect the function's explicit strict setting if set
                 effective_strict = strict if tool.strict is None else tool.strict
                 tool.process_entrypoint(strict=effective_strict)
-                tool = tool.model_copy(deep=True)
 
                 tool._agent = self
                 if strict and tool.strict is None:
@@ -7119,12 +7137,19 @@ class Agent:
 
     # -*- Session Database Functions
     def _read_session(
-        self, session_id: str, session_type: SessionType = SessionType.AGENT
+        self,
+        session_id: str,
+        session_type: SessionType = SessionType.AGENT,
+        num_history_runs: Optional[int] = None,
     ) -> Optional[Union[AgentSession, TeamSession, WorkflowSession]]:
         """Get a Session from the database."""
         try:
             if not self.db:
                 raise ValueError("Db not initialized")
+            if num_history_runs is not None:
+                return self.db.get_session(  # type: ignore
+                    session_id=session_id, session_type=session_type, num_history_runs=num_history_runs
+                )
             return self.db.get_session(session_id=session_id, session_type=session_type)  # type: ignore
         except Exception as e:
             import traceback
@@ -7228,10 +7253,29 @@ class Agent:
         else:
             return Metrics()
 
+    def _get_num_history_runs_to_read(self) -> Optional[int]:
+        """Get the number of runs to read with the session, when only the runs used as history are needed.
+
+        Only applies to databases storing runs in their own table. Returns None when all runs have to be read.
+        """
+        if not getattr(self.db, "append_only_runs", False):
+            return None
+        if not self.add_history_to_context or self.num_history_runs is None or self.num_history_messages is not None:
+            return None
+        # These read the full session, and a cached session is reused across runs
+        if self.cache_session or self.read_chat_history or self.read_tool_call_history:
+            return None
+        if self.enable_session_summaries or self.session_summary_manager is not None:
+            return None
+        if self.add_session_summary_to_context:
+            return None
+        return self.num_history_runs
+
     def _read_or_create_session(
         self,
         session_id: str,
         user_id: Optional[str] = None,
+        num_history_runs: Optional[int] = None,
     ) -> AgentSession:
         from time import time
 
@@ -7244,7 +7288,9 @@ class Agent:
         if self.db is not None and self.team_id is None and self.workflow_id is None:
             log_debug(f"Reading AgentSession: {session_id}")
 
-            agent_session = cast(AgentSession, self._read_session(session_id=session_id))
+            agent_session = cast(
+                AgentSession, self._read_session(session_id=session_id, num_history_runs=num_history_runs)
+            )
 
         if agent_session is None:
             # Creating new session if none found
@@ -7418,6 +7464,8 @@ class Agent:
             config["num_history_runs"] = self.num_history_runs
         if self.num_history_messages is not None:
             config["num_history_messages"] = self.num_history_messages
+        if self.max_history_tokens is not None:
+            config["max_history_tokens"] = self.max_history_tokens
         if self.max_tool_calls_from_history is not None:
             config["max_tool_calls_from_history"] = self.max_tool_calls_from_history
 
@@ -7461,6 +7509,8 @@ class Agent:
 
         if self.tool_call_limit is not None:
             config["tool_call_limit"] = self.tool_call_limit
+        if self.max_concurrent_tool_calls is not None:
+            config["max_concurrent_tool_calls"] = self.max_concurrent_tool_calls
         if self.tool_choice is not None:
             config["tool_choice"] = self.tool_choice
 
@@ -7787,6 +7837,7 @@ class Agent:
             add_history_to_context=config.get("add_history_to_context", False),
             num_history_runs=config.get("num_history_runs"),
             num_history_messages=config.get("num_history_messages"),
+            max_history_tokens=config.get("max_history_tokens"),
             max_tool_calls_from_history=config.get("max_tool_calls_from_history"),
             # --- Knowledge settings ---
             # knowledge=config.get("knowledge"),  # TODO
@@ -7797,6 +7848,7 @@ class Agent:
             # --- Tools ---
             tools=config.get("tools"),
             tool_call_limit=config.get("tool_call_limit"),
+            max_concurrent_tool_calls=config.get("max_concurrent_tool_calls"),
             tool_choice=config.get("tool_choice"),
             # --- Reasoning settings ---
             reasoning=config.get("reasoning", False),
@@ -9851,6 +9903,8 @@ class Agent:
             history: List[Message] = session.get_messages(
                 last_n_runs=self.num_history_runs,
                 limit=self.num_history_messages,
+                max_tokens=self.max_history_tokens,
+                model_id=self.model.id if self.model is not None else "gpt-4o",
                 skip_roles=[skip_role] if skip_role else None,
                 agent_id=self.id if self.team_id is not None else None,
             )
@@ -10054,6 +10108,8 @@ class Agent:
             history: List[Message] = session.get_messages(
                 last_n_runs=self.num_history_runs,
                 limit=self.num_history_messages,
+                max_tokens=self.max_history_tokens,
+                model_id=self.model.id if self.model is not None else "gpt-4o",
                 skip_roles=[skip_role] if skip_role else None,
                 agent_id=self.id if self.team_id is not None else None,
             )
@@ -10532,6 +10588,70 @@ class Agent:
             log_error(f"Failed to create deep copy of {self.__class__.__name__}: {e}")
             raise
 
+    def copy_for_run(self, *, update: Optional[Dict[str, Any]] = None) -> Agent:
+        """Create and return a lightweight copy of this Agent to isolate a single run.
+
+        Unlike deep_copy, the configuration (tools, instructions, model, knowledge, etc.) is shared with this Agent
+        and __init__ is not run again. Lists, dicts and sets are copied one level deep, so a run can reassign or add
+        to them without affecting this Agent, and the per-run state (cached session, connected tools) starts empty.
+        Toolkits that connect and close on each run are deep-copied, so concurrent runs don't close each other's
+        connections. Use deep_copy when the tools or other nested configuration of the copy will be modified.
+
+        Args:
+            update (Optional[Dict[str, Any]]): Optional dictionary of fields for the new Agent.
+
+        Returns:
+            Agent: A new Agent instance.
+        """
+        from copy import copy, deepcopy
+        from dataclasses import fields
+
+        new_agent = copy(self)
+        for f in fields(self):
+            field_value = getattr(self, f.name)
+            if f.name == "session_state" and field_value is not None:
+                try:
+                    new_agent.session_state = deepcopy(field_value)
+                except Exception as e:
+                    log_warning(f"Failed to deep copy field 'session_state': {e}. Using a shallow copy.")
+                    new_agent.session_state = dict(field_value)
+            elif f.name == "reasoning_agent" and field_value is not None:
+                new_agent.reasoning_agent = field_value.copy_for_run()
+            elif f.name == "tools" and field_value is not None:
+                new_agent.tools = [self._copy_tool_for_run(tool) for tool in field_value]
+            elif isinstance(field_value, list):
+                setattr(new_agent, f.name, list(field_value))
+            elif isinstance(field_value, dict):
+                setattr(new_agent, f.name, dict(field_value))
+            elif isinstance(field_value, set):
+                setattr(new_agent, f.name, set(field_value))
+
+        # Reset the state that belongs to a run
+        new_agent._cached_session = None
+        new_agent._tool_instructions = None
+        new_agent._mcp_tools_initialized_on_run = []
+        new_agent._connectable_tools_initialized_on_run = []
+
+        if update:
+            for key, value in update.items():
+                setattr(new_agent, key, value)
+
+        log_debug(f"Created run copy of {self.__class__.__name__}")
+        return new_agent
+
+    @staticmethod
+    def _copy_tool_for_run(tool: Any) -> Any:
+        """Deep copy a toolkit that connects on each run, share every other tool."""
+        if not isinstance(tool, Toolkit) or not tool.requires_connect:
+            return tool
+        from copy import deepcopy
+
+        try:
+            return deepcopy(tool)
+        except Exception as e:
+            log_warning(f"Failed to copy tool {tool.name}: {e}. Sharing it with the run.")
+            return tool
+
     def _deep_copy_field(self, field_name: str, field_value: Any) -> Any:
         """Helper method to deep copy a field based on its type."""
         from copy import copy, deepcopy
@@ -25,12 +25,13 @@ from agno.db.schemas.culture import CulturalKnowledge
 from agno.db.schemas.evals import EvalFilterType, EvalRunRecord, EvalType
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.db.schemas.memory import UserMemory
+from agno.db.utils import HISTORY_SKIP_STATUSES, get_history_run_owner, get_run_row, get_runs_to_save, mark_runs_saved
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
 
 try:
-    from sqlalchemy import TEXT, ForeignKey, Index, UniqueConstraint, and_, cast, func, update
+    from sqlalchemy import TEXT, ForeignKey, Index, UniqueConstraint, and_, cast, func, or_, update
     from sqlalchemy.dialects import mysql
     from sqlalchemy.engine import Engine, create_engine
     from sqlalchemy.orm import scoped_session, sessionmaker
@@ -56,6 +57,8 @@ class MySQLDb(BaseDb):
         traces_table: Optional[str] = None,
         spans_table: Optional[str] = None,
         versions_table: Optional[str] = None,
+        runs_table: Optional[str] = None,
+        append_only_runs: bool = False,
         create_schema: bool = True,
     ):
         """
@@ -80,6 +83,9 @@ class MySQLDb(BaseDb):
             traces_table (Optional[str]): Name of the table to store run traces.
             spans_table (Optional[str]): Name of the table to store span events.
             versions_table (Optional[str]): Name of the table to store schema versions.
+            runs_table (Optional[str]): Name of the table to store session runs when append_only_runs is enabled.
+            append_only_runs (bool): Store the runs of a session as rows of the runs table instead of in the session
+                record, so saving a session only writes its new or updated runs.
             create_schema (bool): Whether to automatically create the database schema if it doesn't exist.
                 Set to False if schema is managed externally (e.g., via migrations). Defaults to True.
 
@@ -104,7 +110,9 @@ class MySQLDb(BaseDb):
             traces_table=traces_table,
             spans_table=spans_table,
             versions_table=versions_table,
+            runs_table=runs_table,
         )
+        self.append_only_runs = append_only_runs
 
         _engine: Optional[Engine] = db_engine
         if _engine is None and db_url is not None:
@@ -171,6 +179,8 @@ class MySQLDb(BaseDb):
                 column_kwargs = {}
                 if col_config.get("primary_key", False):
                     column_kwargs["primary_key"] = True
+                if "autoincrement" in col_config:
+                    column_kwargs["autoincrement"] = col_config["autoincrement"]
                 if "nullable" in col_config:
                     column_kwargs["nullable"] = col_config["nullable"]
                 if col_config.get("index", False):
@@ -267,6 +277,8 @@ class MySQLDb(BaseDb):
             (self.span_table_name, "spans"),
             (self.versions_table_name, "versions"),
         ]
+        if self.append_only_runs:
+            tables_to_create.append((self.runs_table_name, "runs"))
 
         for table_name, table_type in tables_to_create:
             self._get_or_create_table(table_name=table_name, table_type=table_type, create_table_if_not_found=True)
@@ -348,6 +360,14 @@ class MySQLDb(BaseDb):
             )
             return self.spans_table
 
+        if table_type == "runs":
+            self.runs_table = self._get_or_create_table(
+                table_name=self.runs_table_name,
+                table_type="runs",
+                create_table_if_not_found=create_table_if_not_found,
+            )
+            return self.runs_table
+
         raise ValueError(f"Unknown table type: {table_type}")
 
     def _get_or_create_table(
@@ -442,10 +462,13 @@ class MySQLDb(BaseDb):
             table = self._get_table(table_type="sessions")
             if table is None:
                 return False
+            runs_table = self._get_table(table_type="runs") if self.append_only_runs else None
 
             with self.Session() as sess, sess.begin():
                 delete_stmt = table.delete().where(table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if runs_table is not None:
+                    sess.execute(runs_table.delete().where(runs_table.c.session_id == session_id))
                 if result.rowcount == 0:
                     log_debug(f"No session found to delete with session_id: {session_id} in table {table.name}")
                     return False
@@ -471,22 +494,110 @@ class MySQLDb(BaseDb):
             table = self._get_table(table_type="sessions")
             if table is None:
                 return
+            runs_table = self._get_table(table_type="runs") if self.append_only_runs else None
 
             with self.Session() as sess, sess.begin():
                 delete_stmt = table.delete().where(table.c.session_id.in_(session_ids))
                 result = sess.execute(delete_stmt)
+                if runs_table is not None:
+                    sess.execute(runs_table.delete().where(runs_table.c.session_id.in_(session_ids)))
 
             log_debug(f"Successfully deleted {result.rowcount} sessions")
 
         except Exception as e:
             log_error(f"Error deleting sessions: {e}")
 
+    def _write_session_runs(self, sess, runs_table: Table, session: Session) -> None:
+        """Write the new and updated runs of a session to the runs table."""
+        runs = get_runs_to_save(session)
+        if not runs:
+            return
+
+        # New runs are positioned after all existing ones by the database, existing runs keep their position
+        rows = [get_run_row(run, session_id=session.session_id) for run in runs]
+
+        stmt = mysql.insert(runs_table).values(rows)
+        stmt = stmt.on_duplicate_key_update(
+            parent_run_id=stmt.inserted.parent_run_id,
+            status=stmt.inserted.status,
+            run_data=stmt.inserted.run_data,
+            updated_at=stmt.inserted.updated_at,
+        )
+        sess.execute(stmt)
+
+    def _attach_session_runs(
+        self,
+        sess,
+        runs_table: Table,
+        sessions_raw: List[Dict[str, Any]],
+        num_history_runs: Optional[int] = None,
+    ) -> None:
+        """Add the runs stored in the runs table to the given session records, after any runs still in the record.
+
+        Args:
+            num_history_runs (Optional[int]): Only read the last n top-level runs that can be used as history.
+                Only supported when reading a single session.
+        """
+        if not sessions_raw:
+            return
+
+        stmt = select(runs_table.c.session_id, runs_table.c.run_data)
+        if num_history_runs is not None and len(sessions_raw) == 1:
+            stmt = (
+                stmt.where(runs_table.c.session_id == sessions_raw[0]["session_id"])
+                .where(runs_table.c.parent_run_id.is_(None))
+                .where(or_(runs_table.c.status.is_(None), runs_table.c.status.notin_(HISTORY_SKIP_STATUSES)))
+                .order_by(runs_table.c.position.desc())
+                .limit(num_history_runs)
+            )
+            owner = get_history_run_owner(sessions_raw[0])
+            if owner is not None:
+                stmt = stmt.where(runs_table.c[owner[0]] == owner[1])
+            records = list(reversed(sess.execute(stmt).fetchall()))
+        else:
+            session_ids = [session_raw["session_id"] for session_raw in sessions_raw]
+            stmt = stmt.where(runs_table.c.session_id.in_(session_ids)).order_by(runs_table.c.position)
+            records = sess.execute(stmt).fetchall()
+
+        runs_by_session: Dict[str, Dict[str, Any]] = {}
+        for session_raw in sessions_raw:
+            runs_by_session[session_raw["session_id"]] = {
+                run["run_id"]: run for run in session_raw.get("runs") or [] if isinstance(run, dict)
+            }
+        for session_id, run_data in records:
+            runs_by_session[session_id][run_data["run_id"]] = run_data
+        for session_raw in sessions_raw:
+            session_raw["runs"] = list(runs_by_session[session_raw["session_id"]].values()) or None
+
+    def _deserialize_upserted_session(
+        self, row, session: Session, deserialize: Optional[bool], runs_table: Optional[Table]
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        """Build the return value of upsert_session from the upserted session record."""
+        session_raw = dict(row._mapping) if row else None
+        if session_raw is None:
+            return None
+
+        if runs_table is None:
+            return type(session).from_dict(session_raw) if deserialize else session_raw
+
+        # The record holds no runs, so use the runs of the given session
+        mark_runs_saved(session)
+        if not deserialize:
+            session_raw["runs"] = [run.to_dict() for run in session.runs] if session.runs else None
+            return session_raw
+        upserted_session = type(session).from_dict(session_raw)
+        if upserted_session is not None:
+            upserted_session.runs = session.runs  # type: ignore
+            mark_runs_saved(upserted_session)
+        return upserted_session
+
     def get_session(
         self,
         session_id: str,
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        num_history_runs: Optional[int] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """
         Read a session from the database.
@@ -496,6 +607,8 @@ class MySQLDb(BaseDb):
             session_type (SessionType): Type of session to get.
             user_id (Optional[str]): User ID to filter by. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            num_history_runs (Optional[int]): With append_only_runs, only read the last n top-level runs that can be
+                used as history (not paused, cancelled or errored). Defaults to reading all runs.
 
         Returns:
             Union[Session, Dict[str, Any], None]:
@@ -509,6 +622,7 @@ class MySQLDb(BaseDb):
             table = self._get_table(table_type="sessions")
             if table is None:
                 return None
+            runs_table = self._get_table(table_type="runs") if self.append_only_runs else None
 
             with self.Session() as sess:
                 stmt = select(table).where(table.c.session_id == session_id)
@@ -520,19 +634,30 @@ class MySQLDb(BaseDb):
                     return None
 
                 session = dict(result._mapping)
+                # Runs still stored in the session record are all read, and moved to the runs table on the next upsert
+                runs_in_record = bool(session.get("runs"))
+                if runs_table is not None:
+                    self._attach_session_runs(
+                        sess, runs_table, [session], num_history_runs=None if runs_in_record else num_history_runs
+                    )
 
             if not deserialize:
                 return session
 
+            deserialized_session: Optional[Session]
             if session_type == SessionType.AGENT:
-                return AgentSession.from_dict(session)
+                deserialized_session = AgentSession.from_dict(session)
             elif session_type == SessionType.TEAM:
-                return TeamSession.from_dict(session)
+                deserialized_session = TeamSession.from_dict(session)
             elif session_type == SessionType.WORKFLOW:
-                return WorkflowSession.from_dict(session)
+                deserialized_session = WorkflowSession.from_dict(session)
             else:
                 raise ValueError(f"Invalid session type: {session_type}")
 
+            if deserialized_session is not None and runs_table is not None and not runs_in_record:
+                mark_runs_saved(deserialized_session)
+            return deserialized_session
+
         except Exception as e:
             log_error(f"Exception reading from session table: {e}")
             return None
@@ -579,6 +704,7 @@ class MySQLDb(BaseDb):
             table = self._get_table(table_type="sessions")
             if table is None:
                 return [] if deserialize else ([], 0)
+            runs_table = self._get_table(table_type="runs") if self.append_only_runs else None
 
             with self.Session() as sess, sess.begin():
                 stmt = select(table)
@@ -625,6 +751,8 @@ class MySQLDb(BaseDb):
                     return [] if deserialize else ([], 0)
 
                 session_dicts = [dict(row._mapping) for row in result]
+                if runs_table is not None:
+                    self._attach_session_runs(sess, runs_table, session_dicts)
                 if not deserialize:
                     return session_dicts, total_count
 
@@ -723,8 +851,12 @@ class MySQLDb(BaseDb):
             table = self._get_table(table_type="sessions", create_table_if_not_found=True)
             if table is None:
                 return None
+            runs_table = (
+                self._get_table(table_type="runs", create_table_if_not_found=True) if self.append_only_runs else None
+            )
 
-            session_dict = session.to_dict()
+            # With a runs table, only the new and updated runs are written, to their own rows
+            session_dict = session.to_dict(include_runs=runs_table is None)
 
             if isinstance(session, AgentSession):
                 with self.Session() as sess, sess.begin():
@@ -759,10 +891,10 @@ class MySQLDb(BaseDb):
                     row = result.fetchone()
                     if not row:
                         return None
-                    session_dict = dict(row._mapping)
-                    if session_dict is None or not deserialize:
-                        return session_dict
-                    return AgentSession.from_dict(session_dict)
+                    if runs_table is not None:
+                        self._write_session_runs(sess, runs_table, session)
+
+                return self._deserialize_upserted_session(row, session, deserialize, runs_table)
 
             elif isinstance(session, TeamSession):
                 with self.Session() as sess, sess.begin():
@@ -797,10 +929,10 @@ class MySQLDb(BaseDb):
                     row = result.fetchone()
                     if not row:
                         return None
-                    session_dict = dict(row._mapping)
-                    if session_dict is None or not deserialize:
-                        return session_dict
-                    return TeamSession.from_dict(session_dict)
+                    if runs_table is not None:
+                        self._write_session_runs(sess, runs_table, session)
+
+                return self._deserialize_upserted_session(row, session, deserialize, runs_table)
 
             else:
                 with self.Session() as sess, sess.begin():
@@ -835,10 +967,10 @@ class MySQLDb(BaseDb):
                     row = result.fetchone()
                     if not row:
                         return None
-                    session_dict = dict(row._mapping)
-                    if session_dict is None or not deserialize:
-                        return session_dict
-                    return WorkflowSession.from_dict(session_dict)
+                    if runs_table is not None:
+                        self._write_session_runs(sess, runs_table, session)
+
+                return self._deserialize_upserted_session(row, session, deserialize, runs_table)
 
         except Exception as e:
             log_error(f"Exception upserting into sessions table: {e}")
@@ -864,6 +996,16 @@ class MySQLDb(BaseDb):
         if not sessions:
             return []
 
+        if self.append_only_runs:
+            # Runs are written to their own table, one session at a time
+            return [
+                result
+                for session in sessions
+                if session is not None
+                for result in [self.upsert_session(session, deserialize=deserialize)]
+                if result is not None
+            ]
+
         try:
             table = self._get_table(table_type="sessions", create_table_if_not_found=True)
             if table is None:
@@ -1560,8 +1702,10 @@ class MySQLDb(BaseDb):
             table = self._get_table(table_type="sessions")
             if table is None:
                 return []
+            runs_table = self._get_table(table_type="runs") if self.append_only_runs else None
 
             stmt = select(
+                table.c.session_id,
                 table.c.user_id,
                 table.c.session_data,
                 table.c.runs,
@@ -1576,7 +1720,12 @@ class MySQLDb(BaseDb):
 
             with self.Session() as sess:
                 result = sess.execute(stmt).fetchall()
-                return [record._mapping for record in result]
+                if runs_table is None:
+                    return [record._mapping for record in result]
+
+                sessions_raw = [dict(record._mapping) for record in result]
+                self._attach_session_runs(sess, runs_table, sessions_raw)
+                return sessions_raw
 
         except Exception as e:
             log_error(f"Exception reading from sessions table: {e}")
@@ -31,6 +31,26 @@ SESSION_TABLE_SCHEMA = {
     ],
 }
 
+RUNS_TABLE_SCHEMA = {
+    "session_id": {"type": lambda: String(128), "nullable": False, "index": True},
+    "run_id": {"type": lambda: String(128), "nullable": False},
+    "parent_run_id": {"type": lambda: String(128), "nullable": True},
+    "status": {"type": lambda: String(20), "nullable": True},
+    "agent_id": {"type": lambda: String(128), "nullable": True},
+    "team_id": {"type": lambda: String(128), "nullable": True},
+    # Insertion order of the run, generated by the database so it is consistent across processes
+    "position": {"type": BigInteger, "primary_key": True, "autoincrement": True, "nullable": False},
+    "run_data": {"type": JSON, "nullable": False},
+    "created_at": {"type": BigInteger, "nullable": False},
+    "updated_at": {"type": BigInteger, "nullable": True},
+    "_unique_constraints": [
+        {
+            "name": "uq_session_run",
+            "columns": ["session_id", "run_id"],
+        }
+    ],
+}
+
 USER_MEMORY_TABLE_SCHEMA = {
     "memory_id": {"type": lambda: String(128), "primary_key": True, "nullable": False},
     "memory": {"type": JSON, "nullable": False},
@@ -188,6 +208,7 @@ def get_table_schema_definition(
 
     schemas = {
         "sessions": SESSION_TABLE_SCHEMA,
+        "runs": RUNS_TABLE_SCHEMA,
         "evals": EVAL_TABLE_SCHEMA,
         "metrics": METRICS_TABLE_SCHEMA,
         "memories": USER_MEMORY_TABLE_SCHEMA,
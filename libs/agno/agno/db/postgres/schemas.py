@@ -23,7 +23,8 @@ SESSION_TABLE_SCHEMA = {
     "runs": {"type": JSONB, "nullable": True},
     "summary": {"type": JSONB, "nullable": True},
     "created_at": {"type": BigInteger, "nullable": False, "index": True},
-    "updated_at": {"type": BigInteger, "nullable": True},
+    # Indexed to find the sessions updated since the last metrics calculation
+    "updated_at": {"type": BigInteger, "nullable": True, "index": True},
     "_unique_constraints": [
         {
             "name": "uq_session_id",
@@ -32,6 +33,26 @@ SESSION_TABLE_SCHEMA = {
     ],
 }
 
+RUNS_TABLE_SCHEMA = {
+    "session_id": {"type": String, "nullable": False, "index": True},
+    "run_id": {"type": String, "nullable": False},
+    "parent_run_id": {"type": String, "nullable": True},
+    "status": {"type": String, "nullable": True},
+    "agent_id": {"type": String, "nullable": True},
+    "team_id": {"type": String, "nullable": True},
+    # Insertion order of the run, generated by the database so it is consistent across processes
+    "position": {"type": BigInteger, "primary_key": True, "autoincrement": True, "nullable": False},
+    "run_data": {"type": JSONB, "nullable": False},
+    "created_at": {"type": BigInteger, "nullable": False},
+    "updated_at": {"type": BigInteger, "nullable": True},
+    "_unique_constraints": [
+        {
+            "name": "uq_session_run",
+            "columns": ["session_id", "run_id"],
+        }
+    ],
+}
+
 MEMORY_TABLE_SCHEMA = {
     "memory_id": {"type": String, "primary_key": True, "nullable": False},
     "memory": {"type": JSONB, "nullable": False},
@@ -251,6 +272,7 @@ def get_table_schema_definition(
 
     schemas = {
         "sessions": SESSION_TABLE_SCHEMA,
+        "runs": RUNS_TABLE_SCHEMA,
         "evals": EVAL_TABLE_SCHEMA,
         "metrics": METRICS_TABLE_SCHEMA,
         "memories": MEMORY_TABLE_SCHEMA,
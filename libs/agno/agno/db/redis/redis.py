@@ -1,6 +1,6 @@
 import time
 from datetime import date, datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from uuid import uuid4
 
 if TYPE_CHECKING:
@@ -8,7 +8,9 @@ if TYPE_CHECKING:
 
 from agno.db.base import BaseDb, SessionType
 from agno.db.redis.utils import (
-    apply_filters,
+    SORTED_INDEX_SCORE_FIELDS,
+    SORTED_INDEX_VERSION,
+    SORTED_INDEXES,
     apply_pagination,
     apply_sorting,
     calculate_date_metrics,
@@ -17,9 +19,16 @@ from agno.db.redis.utils import (
     deserialize_data,
     fetch_all_sessions_data,
     generate_redis_key,
+    generate_sorted_index_entries_key,
+    generate_sorted_index_key,
+    generate_sorted_index_version_key,
     get_all_keys_for_table,
     get_dates_to_calculate_metrics_for,
+    get_sorted_index_keys,
+    get_sorted_index_score,
+    get_sorted_index_values,
     remove_index_entries,
+    select_sorted_index,
     serialize_cultural_knowledge_for_db,
     serialize_data,
 )
@@ -33,6 +42,7 @@ from agno.utils.string import generate_id
 
 try:
     from redis import Redis, RedisCluster
+    from redis.exceptions import WatchError
 except ImportError:
     raise ImportError("`redis` not installed. Please install it using `pip install redis`")
 
@@ -101,6 +111,8 @@ class RedisDb(BaseDb):
 
         self.db_prefix = db_prefix
         self.expire = expire
+        # Number of records read per round trip when building or scanning the sorted set indexes
+        self.index_batch_size = 500
 
         if redis_client is not None:
             self.redis_client = redis_client
@@ -109,6 +121,9 @@ class RedisDb(BaseDb):
         else:
             raise ValueError("One of redis_client or db_url must be provided")
 
+        # Tables whose sorted set indexes are known to be built
+        self._sorted_indexes_built: Set[str] = set()
+
     # -- DB methods --
 
     def table_exists(self, table_name: str) -> bool:
@@ -162,7 +177,15 @@ class RedisDb(BaseDb):
             key = generate_redis_key(prefix=self.db_prefix, table_type=table_type, key_id=record_id)
             serialized_data = serialize_data(data)
 
-            self.redis_client.set(key, serialized_data, ex=self.expire)
+            if table_type in SORTED_INDEXES:
+                # Store the record and update its sorted set indexes together
+                def store(pipeline: Any) -> None:
+                    self._add_to_sorted_indexes(pipeline, table_type, record_id, data)
+                    pipeline.set(key, serialized_data, ex=self.expire)
+
+                self._execute_record_update(key, store)
+            else:
+                self.redis_client.set(key, serialized_data, ex=self.expire)
 
             if index_fields:
                 create_index_entries(
@@ -232,7 +255,15 @@ class RedisDb(BaseDb):
                     )
 
             key = generate_redis_key(prefix=self.db_prefix, table_type=table_type, key_id=record_id)
-            result = self.redis_client.delete(key)
+            if table_type in SORTED_INDEXES:
+
+                def delete(pipeline: Any) -> None:
+                    self._remove_from_sorted_indexes(pipeline, table_type, [record_id])
+                    pipeline.delete(key)
+
+                result = self._execute_record_update(key, delete)[-1]
+            else:
+                result = self.redis_client.delete(key)
             if result is None or result == 0:
                 return False
 
@@ -269,6 +300,236 @@ class RedisDb(BaseDb):
             log_error(f"Error getting all records for {table_type}: {e}")
             return []
 
+    # -- Sorted set indexes --
+
+    def _mget(self, keys: List[str]) -> List[Any]:
+        """Get the values of many keys in one round trip, or one per hash slot in a cluster."""
+        if not keys:
+            return []
+        if isinstance(self.redis_client, RedisCluster):
+            return self.redis_client.mget_nonatomic(keys)
+        return self.redis_client.mget(keys)  # type: ignore
+
+    def _execute_record_update(self, key: str, queue_commands: Callable[[Any], None]) -> List[Any]:
+        """Run the commands updating a record and its sorted set indexes, and return their results.
+
+        `queue_commands` reads the indexes the record is in through the pipeline, then queues the updates. On a
+        single Redis server the record key is watched and the updates run in a transaction, retried when another
+        client changes the record in between. In a cluster the record and its indexes are in different hash slots,
+        so the updates are sent in one non-transactional pipeline.
+        """
+        if isinstance(self.redis_client, RedisCluster):
+            pipeline = self.redis_client.pipeline(transaction=False)
+            queue_commands(pipeline)
+            return pipeline.execute()
+
+        pipeline = self.redis_client.pipeline(transaction=True)
+        try:
+            while True:
+                try:
+                    pipeline.watch(key)
+                    queue_commands(pipeline)
+                    return pipeline.execute()
+                except WatchError:
+                    log_debug(f"Record {key} changed while updating its indexes, retrying")
+        finally:
+            pipeline.reset()
+
+    def _add_to_sorted_indexes(
+        self,
+        pipeline: Any,
+        table_type: str,
+        record_id: str,
+        data: Dict[str, Any],
+        previous_index_values: Optional[Dict[str, str]] = None,
+        read_previous: bool = True,
+    ) -> None:
+        """Queue adding a record to its sorted set indexes, and removing it from the ones it no longer belongs to.
+
+        When the pipeline is watching keys, the previous index values are read through it and the pipeline is
+        switched to a transaction before queueing.
+        """
+        entries_key = generate_sorted_index_entries_key(self.db_prefix, table_type)
+        if read_previous:
+            previous = self._read_sorted_index_entries(pipeline, entries_key, [record_id])[0]
+            previous_index_values = deserialize_data(previous) if previous else None  # type: ignore
+
+        index_values = get_sorted_index_values(table_type, data)
+        index_keys = get_sorted_index_keys(self.db_prefix, table_type, index_values)
+        if previous_index_values:
+            for key in (
+                get_sorted_index_keys(self.db_prefix, table_type, previous_index_values).keys() - index_keys.keys()
+            ):
+                pipeline.zrem(key, record_id)
+        for key, score_field in index_keys.items():
+            pipeline.zadd(key, {record_id: get_sorted_index_score(data, score_field)})
+        pipeline.hset(entries_key, record_id, serialize_data(index_values))
+
+    def _read_sorted_index_entries(self, pipeline: Any, entries_key: str, record_ids: List[str]) -> List[Any]:
+        """Read the index values of records, through the pipeline when it is watching the records."""
+        if getattr(pipeline, "watching", False) and not getattr(pipeline, "explicit_transaction", False):
+            entries = pipeline.hmget(entries_key, record_ids)
+            pipeline.multi()
+            return entries
+        return self.redis_client.hmget(entries_key, record_ids)  # type: ignore
+
+    def _remove_from_sorted_indexes(self, pipeline: Any, table_type: str, record_ids: List[str]) -> None:
+        """Queue removing records from the sorted set indexes of a table."""
+        entries_key = generate_sorted_index_entries_key(self.db_prefix, table_type)
+        entries = self._read_sorted_index_entries(pipeline, entries_key, record_ids)
+        for record_id, entry in zip(record_ids, entries):  # type: ignore
+            if entry is None:
+                continue
+            for key in get_sorted_index_keys(self.db_prefix, table_type, deserialize_data(entry)):  # type: ignore
+                pipeline.zrem(key, record_id)
+        pipeline.hdel(entries_key, *record_ids)
+
+    def _ensure_sorted_indexes(self, table_type: str) -> None:
+        """Build the sorted set indexes of the records stored before they were maintained, once per database."""
+        if table_type in self._sorted_indexes_built:
+            return
+
+        version_key = generate_sorted_index_version_key(self.db_prefix, table_type)
+        version = self.redis_client.get(version_key)
+        if isinstance(version, bytes):
+            version = version.decode()
+        if version != SORTED_INDEX_VERSION:
+            log_info(f"Building the Redis indexes of the existing {table_type}")
+            key_prefix = f"{self.db_prefix}:{table_type}:"
+            keys = get_all_keys_for_table(redis_client=self.redis_client, prefix=self.db_prefix, table_type=table_type)
+            for i in range(0, len(keys), self.index_batch_size):
+                batch_keys = keys[i : i + self.index_batch_size]
+                pipeline = self.redis_client.pipeline(transaction=False)
+                for key, data in zip(batch_keys, self._mget(batch_keys)):
+                    if data is not None:
+                        record_id = key[len(key_prefix) :]
+                        self._add_to_sorted_indexes(
+                            pipeline, table_type, record_id, deserialize_data(data), read_previous=False
+                        )
+                pipeline.execute()
+            self.redis_client.set(version_key, SORTED_INDEX_VERSION)
+
+        self._sorted_indexes_built.add(table_type)
+
+    def _get_records_by_id(self, table_type: str, record_ids: List[str]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Get records by id, in order, with the ids of the records that no longer exist."""
+        keys = [generate_redis_key(prefix=self.db_prefix, table_type=table_type, key_id=id) for id in record_ids]
+        records, missing_ids = [], []
+        for record_id, data in zip(record_ids, self._mget(keys)):
+            if data is None:
+                missing_ids.append(record_id)
+            else:
+                records.append(deserialize_data(data))
+        return records, missing_ids
+
+    def _query_sorted_index(
+        self,
+        table_type: str,
+        filters: Dict[str, Any],
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        score_range: Optional[Tuple[str, Optional[int], Optional[int]]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of the records matching the filters, and the total number of matching records.
+
+        Reads the sorted set index covering most of the equality filters. When it covers all of them and there
+        is no predicate, only the requested page is read. Otherwise the index is read in batches and the other
+        conditions are checked on the records.
+
+        Args:
+            table_type (str): The type of table to query.
+            filters (Dict[str, Any]): Equality filters on indexed fields. None values are ignored.
+            sort_by (Optional[str]): The field to sort by.
+            sort_order (Optional[str]): The order to sort by.
+            limit (Optional[int]): The maximum number of records to return.
+            page (Optional[int]): The page number to return.
+            score_range (Optional[Tuple[str, Optional[int], Optional[int]]]): A field and the inclusive range its value must be in.
+            predicate (Optional[Callable[[Dict[str, Any]], bool]]): Other condition the records must match.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: The records, and the total number of matching records.
+        """
+        self._ensure_sorted_indexes(table_type)
+
+        index_filters, remaining_filters = select_sorted_index(table_type, filters)
+        sorted_by_index = sort_by is None or sort_by in SORTED_INDEX_SCORE_FIELDS
+        if sort_by in SORTED_INDEX_SCORE_FIELDS:
+            score_field = sort_by
+        else:
+            score_field = score_range[0] if score_range is not None else SORTED_INDEX_SCORE_FIELDS[0]
+        key = generate_sorted_index_key(self.db_prefix, table_type, score_field, index_filters)  # type: ignore
+        descending = sort_order == "desc"
+
+        conditions: List[Callable[[Dict[str, Any]], bool]] = []
+        if remaining_filters:
+            conditions.append(
+                lambda record: all(
+                    get_sorted_index_values(table_type, record).get(field) == value
+                    for field, value in remaining_filters.items()
+                )
+            )
+        min_score: Union[float, str] = "-inf"
+        max_score: Union[float, str] = "+inf"
+        if score_range is not None:
+            range_field, low, high = score_range
+            if range_field == score_field:
+                min_score = low if low is not None else "-inf"
+                max_score = high if high is not None else "+inf"
+            else:
+                conditions.append(
+                    lambda record: (low is None or (record.get(range_field) or 0) >= low)
+                    and (high is None or (record.get(range_field) or 0) <= high)
+                )
+        if predicate is not None:
+            conditions.append(predicate)
+
+        def read_ids(offset: int, count: int) -> List[str]:
+            if descending:
+                return self.redis_client.zrevrangebyscore(key, max_score, min_score, start=offset, num=count)  # type: ignore
+            return self.redis_client.zrangebyscore(key, min_score, max_score, start=offset, num=count)  # type: ignore
+
+        start = (page - 1) * limit if limit is not None and page is not None and page > 0 else 0
+        missing_ids: List[str] = []
+
+        if not conditions and sorted_by_index:
+            # The index answers the query: read the page only
+            if score_range is None:
+                total = self.redis_client.zcard(key)
+            else:
+                total = self.redis_client.zcount(key, min_score, max_score)
+            records, missing_ids = self._get_records_by_id(table_type, read_ids(start, -1 if limit is None else limit))
+            # Records that no longer exist are still counted by the index
+            total = max(0, total - len(missing_ids))  # type: ignore
+        else:
+            records, total, offset = [], 0, 0
+            while True:
+                record_ids = read_ids(offset, self.index_batch_size)
+                offset += len(record_ids)
+                batch, batch_missing_ids = self._get_records_by_id(table_type, record_ids)
+                missing_ids.extend(batch_missing_ids)
+                for record in batch:
+                    if not all(condition(record) for condition in conditions):
+                        continue
+                    # Keep only the requested page when the index order is the requested order
+                    if not sorted_by_index or (total >= start and (limit is None or total < start + limit)):
+                        records.append(record)
+                    total += 1
+                if len(record_ids) < self.index_batch_size:
+                    break
+            if not sorted_by_index:
+                records = apply_pagination(apply_sorting(records, sort_by, sort_order), limit=limit, page=page)
+
+        if missing_ids:
+            # Records that expired or were deleted without updating the indexes
+            pipeline = self.redis_client.pipeline(transaction=False)
+            self._remove_from_sorted_indexes(pipeline, table_type, missing_ids)
+            pipeline.execute()
+
+        return records, int(total)  # type: ignore
+
     def get_latest_schema_version(self):
         """Get the latest version of the database schema."""
         pass
@@ -373,7 +634,6 @@ class RedisDb(BaseDb):
             log_error(f"Exception reading session: {e}")
             raise e
 
-    # TODO: optimizable
     def get_sessions(
         self,
         session_type: Optional[SessionType] = None,
@@ -405,41 +665,36 @@ class RedisDb(BaseDb):
             List[Union[AgentSession, TeamSession, WorkflowSession]]: The list of sessions.
         """
         try:
-            all_sessions = self._get_all_records("sessions")
-
-            conditions: Dict[str, Any] = {}
+            filters: Dict[str, Any] = {"session_type": session_type, "user_id": user_id}
+            # component_id is only used together with the session type it belongs to
             if session_type is not None:
-                conditions["session_type"] = session_type
-            if user_id is not None:
-                conditions["user_id"] = user_id
-
-            filtered_sessions = apply_filters(records=all_sessions, conditions=conditions)
-
-            if component_id is not None:
-                if session_type == SessionType.AGENT:
-                    filtered_sessions = [s for s in filtered_sessions if s.get("agent_id") == component_id]
-                elif session_type == SessionType.TEAM:
-                    filtered_sessions = [s for s in filtered_sessions if s.get("team_id") == component_id]
-                elif session_type == SessionType.WORKFLOW:
-                    filtered_sessions = [s for s in filtered_sessions if s.get("workflow_id") == component_id]
-            if start_timestamp is not None:
-                filtered_sessions = [s for s in filtered_sessions if s.get("created_at", 0) >= start_timestamp]
-            if end_timestamp is not None:
-                filtered_sessions = [s for s in filtered_sessions if s.get("created_at", 0) <= end_timestamp]
+                filters["component_id"] = component_id
 
-            if session_name is not None:
-                filtered_sessions = [
-                    s
-                    for s in filtered_sessions
-                    if session_name.lower() in s.get("session_data", {}).get("session_name", "").lower()
-                ]
+            score_range = None
+            if start_timestamp is not None or end_timestamp is not None:
+                score_range = ("created_at", start_timestamp, end_timestamp)
 
-            sorted_sessions = apply_sorting(records=filtered_sessions, sort_by=sort_by, sort_order=sort_order)
-            sessions = apply_pagination(records=sorted_sessions, limit=limit, page=page)
-            sessions = [record for record in sessions]
+            predicate = None
+            if session_name is not None:
+                session_name_filter = session_name.lower()
+
+                def predicate(record: Dict[str, Any]) -> bool:
+                    name = (record.get("session_data") or {}).get("session_name") or ""
+                    return session_name_filter in name.lower()
+
+            sessions, total_count = self._query_sorted_index(
+                "sessions",
+                filters=filters,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=limit,
+                page=page,
+                score_range=score_range,
+                predicate=predicate,
+            )
 
             if not deserialize:
-                return sessions, len(filtered_sessions)
+                return sessions, total_count
 
             if session_type == SessionType.AGENT:
                 return [AgentSession.from_dict(record) for record in sessions]  # type: ignore
@@ -544,7 +799,6 @@ class RedisDb(BaseDb):
                     table_type="sessions",
                     record_id=session.session_id,
                     data=data,
-                    index_fields=["user_id", "agent_id", "session_type"],
                 )
                 if not success:
                     return None
@@ -577,7 +831,6 @@ class RedisDb(BaseDb):
                     table_type="sessions",
                     record_id=session.session_id,
                     data=data,
-                    index_fields=["user_id", "team_id", "session_type"],
                 )
                 if not success:
                     return None
@@ -610,7 +863,6 @@ class RedisDb(BaseDb):
                     table_type="sessions",
                     record_id=session.session_id,
                     data=data,
-                    index_fields=["user_id", "workflow_id", "session_type"],
                 )
                 if not success:
                     return None
@@ -815,38 +1067,30 @@ class RedisDb(BaseDb):
             Exception: If any error occurs while reading the memories.
         """
         try:
-            all_memories = self._get_all_records("memories")
-
-            # Apply filters
-            conditions = {}
-            if user_id is not None:
-                conditions["user_id"] = user_id
-            if agent_id is not None:
-                conditions["agent_id"] = agent_id
-            if team_id is not None:
-                conditions["team_id"] = team_id
-
-            filtered_memories = apply_filters(records=all_memories, conditions=conditions)
-
-            # Apply topic filter
-            if topics is not None:
-                filtered_memories = [
-                    m for m in filtered_memories if any(topic in m.get("topics", []) for topic in topics)
-                ]
-
-            # Apply content search
-            if search_content is not None:
-                filtered_memories = [
-                    m for m in filtered_memories if search_content.lower() in str(m.get("memory", "")).lower()
-                ]
-
-            sorted_memories = apply_sorting(records=filtered_memories, sort_by=sort_by, sort_order=sort_order)
-            paginated_memories = apply_pagination(records=sorted_memories, limit=limit, page=page)
+            predicate = None
+            if topics is not None or search_content is not None:
+
+                def predicate(record: Dict[str, Any]) -> bool:
+                    if topics is not None and not any(topic in (record.get("topics") or []) for topic in topics):
+                        return False
+                    if search_content is not None:
+                        return search_content.lower() in str(record.get("memory", "")).lower()
+                    return True
+
+            memories, total_count = self._query_sorted_index(
+                "memories",
+                filters={"user_id": user_id, "agent_id": agent_id, "team_id": team_id},
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=limit,
+                page=page,
+                predicate=predicate,
+            )
 
             if not deserialize:
-                return paginated_memories, len(filtered_memories)
+                return memories, total_count
 
-            return [UserMemory.from_dict(record) for record in paginated_memories]
+            return [UserMemory.from_dict(record) for record in memories]
 
         except Exception as e:
             log_error(f"Exception reading memories: {e}")
@@ -939,9 +1183,7 @@ class RedisDb(BaseDb):
                 "updated_at": int(time.time()),
             }
 
-            success = self._store_record(
-                "memories", memory.memory_id, data, index_fields=["user_id", "agent_id", "team_id", "workflow_id"]
-            )
+            success = self._store_record("memories", memory.memory_id, data)
 
             if not success:
                 return None
@@ -1002,6 +1244,10 @@ class RedisDb(BaseDb):
             # Get all keys for memories table
             keys = get_all_keys_for_table(redis_client=self.redis_client, prefix=self.db_prefix, table_type="memories")
 
+            # Along with their indexes
+            keys += list(self.redis_client.scan_iter(match=f"{self.db_prefix}:memories:index:*"))
+            self._sorted_indexes_built.discard("memories")
+
             if keys:
                 # Delete all memory keys in a single batch operation
                 self.redis_client.delete(*keys)
@@ -3,7 +3,8 @@
 import json
 import time
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Union
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from agno.db.schemas.culture import CulturalKnowledge
@@ -173,6 +174,113 @@ def remove_index_entries(
             redis_client.srem(index_key, record_id)
 
 
+# -- Sorted set indexes --
+
+# Combinations of fields with one sorted set per value, for the tables listed with filters and pagination.
+# Every query filtering on one of these combinations reads a single sorted set.
+SORTED_INDEXES: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    "sessions": (
+        (),
+        ("user_id",),
+        ("session_type",),
+        ("session_type", "user_id"),
+        ("session_type", "component_id"),
+        ("session_type", "user_id", "component_id"),
+    ),
+    "memories": (
+        (),
+        ("user_id",),
+        ("agent_id",),
+        ("team_id",),
+        ("user_id", "agent_id"),
+        ("user_id", "team_id"),
+    ),
+}
+
+# Every sorted set index exists once per field its members can be ordered by
+SORTED_INDEX_SCORE_FIELDS = ("created_at", "updated_at")
+
+# Bump to rebuild the sorted set indexes of existing records
+SORTED_INDEX_VERSION = "1"
+
+
+def get_session_component_id(record: Dict[str, Any]) -> Optional[str]:
+    """The id of the agent, team or workflow a session belongs to, as filtered by get_sessions."""
+    session_type = record.get("session_type")
+    if session_type == "agent":
+        return record.get("agent_id")
+    if session_type == "team":
+        return record.get("team_id")
+    if session_type == "workflow":
+        return record.get("workflow_id")
+    return None
+
+
+def get_sorted_index_values(table_type: str, record: Dict[str, Any]) -> Dict[str, str]:
+    """The values of the indexed fields of a record, skipping empty ones."""
+    fields = {field for index in SORTED_INDEXES[table_type] for field in index}
+    values: Dict[str, str] = {}
+    for field in fields:
+        value = get_session_component_id(record) if field == "component_id" else record.get(field)
+        if value is not None:
+            values[field] = str(value)
+    return values
+
+
+def generate_sorted_index_key(prefix: str, table_type: str, score_field: str, filters: Dict[str, str]) -> str:
+    """Generate the key of the sorted set with the records matching `filters`, scored by `score_field`."""
+    conditions = "".join(f":{field}={filters[field]}" for field in sorted(filters))
+    return f"{prefix}:{table_type}:index:sorted:{score_field}{conditions}"
+
+
+def generate_sorted_index_entries_key(prefix: str, table_type: str) -> str:
+    """Generate the key of the hash with the indexed values of every record, to update and remove its entries."""
+    return f"{prefix}:{table_type}:index:sorted_entries"
+
+
+def generate_sorted_index_version_key(prefix: str, table_type: str) -> str:
+    """Generate the key marking that the sorted set indexes of a table were built."""
+    return f"{prefix}:{table_type}:index:sorted_version"
+
+
+def get_sorted_index_keys(prefix: str, table_type: str, index_values: Dict[str, str]) -> Dict[str, str]:
+    """The keys of every sorted set a record with these indexed values belongs to, mapped to their score field."""
+    keys: Dict[str, str] = {}
+    for index in SORTED_INDEXES[table_type]:
+        if all(field in index_values for field in index):
+            filters = {field: index_values[field] for field in index}
+            for score_field in SORTED_INDEX_SCORE_FIELDS:
+                keys[generate_sorted_index_key(prefix, table_type, score_field, filters)] = score_field
+    return keys
+
+
+def get_sorted_index_score(record: Dict[str, Any], score_field: str) -> float:
+    """Score of a record in a sorted set index. Records without a value come first."""
+    value = get_sort_value(record, score_field)
+    try:
+        return float(value) if value is not None else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def select_sorted_index(table_type: str, filters: Dict[str, Any]) -> Tuple[Dict[str, str], Dict[str, Any]]:
+    """Select the index covering most of the given equality filters.
+
+    Returns:
+        The filters answered by the index, and the remaining filters to apply to the records.
+    """
+    active = {field: value for field, value in filters.items() if value is not None}
+    best: Tuple[str, ...] = ()
+    for index in SORTED_INDEXES[table_type]:
+        if len(index) > len(best) and all(field in active for field in index):
+            best = index
+    index_filters = {
+        field: str(active[field].value if isinstance(active[field], Enum) else active[field]) for field in best
+    }
+    remaining = {field: value for field, value in active.items() if field not in index_filters}
+    return index_filters, remaining
+
+
 # -- Metrics utils --
 
 
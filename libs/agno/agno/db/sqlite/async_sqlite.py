@@ -19,10 +19,12 @@ from agno.db.sqlite.utils import (
     ais_table_available,
     ais_valid_table,
     apply_sorting,
-    calculate_date_metrics,
+    build_daily_metrics_records,
+    date_to_day,
     deserialize_cultural_knowledge_from_db,
-    fetch_all_sessions_data,
+    get_daily_metrics_stmts,
     get_dates_to_calculate_metrics_for,
+    get_updated_session_days_stmt,
     serialize_cultural_knowledge_for_db,
 )
 from agno.db.utils import deserialize_session_json_fields, serialize_session_json_fields
@@ -1543,48 +1545,6 @@ class AsyncSqliteDb(AsyncBaseDb):
 
     # -- Metrics methods --
 
-    async def _get_all_sessions_for_metrics_calculation(
-        self, start_timestamp: Optional[int] = None, end_timestamp: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
-        """
-        Get all sessions of all types (agent, team, workflow) as raw dictionaries.
-
-         Args:
-            start_timestamp (Optional[int]): The start timestamp to filter by. Defaults to None.
-            end_timestamp (Optional[int]): The end timestamp to filter by. Defaults to None.
-
-        Returns:
-            List[Dict[str, Any]]: List of session dictionaries with session_type field.
-
-        Raises:
-            Exception: If an error occurs during retrieval.
-        """
-        try:
-            table = await self._get_table(table_type="sessions", create_table_if_not_found=True)
-            if table is None:
-                return []
-
-            stmt = select(
-                table.c.user_id,
-                table.c.session_data,
-                table.c.runs,
-                table.c.created_at,
-                table.c.session_type,
-            )
-
-            if start_timestamp is not None:
-                stmt = stmt.where(table.c.created_at >= start_timestamp)
-            if end_timestamp is not None:
-                stmt = stmt.where(table.c.created_at <= end_timestamp)
-
-            async with self.async_session_factory() as sess:
-                result = (await sess.execute(stmt)).fetchall()
-                return [dict(record._mapping) for record in result]
-
-        except Exception as e:
-            log_error(f"Error reading from sessions table: {e}")
-            raise e
-
     async def _get_metrics_calculation_starting_date(self, table: Table) -> Optional[date]:
         """Get the first date for which metrics calculation is needed:
 
@@ -1620,7 +1580,11 @@ class AsyncSqliteDb(AsyncBaseDb):
         return datetime.fromtimestamp(first_session_date, tz=timezone.utc).date()
 
     async def calculate_metrics(self) -> Optional[list[dict]]:
-        """Calculate metrics for all dates without complete metrics.
+        """Calculate metrics for all dates without complete metrics, and for the dates of the sessions updated since
+        the last calculation.
+
+        The metrics of each date are aggregated in the database, so the cost of a calculation grows with the number of
+        dates to update rather than with the number of sessions.
 
         Returns:
             Optional[list[dict]]: The calculated metrics.
@@ -1629,60 +1593,44 @@ class AsyncSqliteDb(AsyncBaseDb):
             Exception: If an error occurs during metrics calculation.
         """
         try:
-            table = await self._get_table(table_type="metrics")
+            table = await self._get_table(table_type="metrics", create_table_if_not_found=True)
             if table is None:
                 return None
 
+            sessions_table = await self._get_table(table_type="sessions")
             starting_date = await self._get_metrics_calculation_starting_date(table)
-            if starting_date is None:
+            if sessions_table is None or starting_date is None:
                 log_info("No session data found. Won't calculate metrics.")
                 return None
 
-            dates_to_process = get_dates_to_calculate_metrics_for(starting_date)
-            if not dates_to_process:
-                log_info("Metrics already calculated for all relevant dates.")
-                return None
+            days_to_process = {date_to_day(day) for day in get_dates_to_calculate_metrics_for(starting_date)}
 
-            start_timestamp = int(
-                datetime.combine(dates_to_process[0], datetime.min.time()).replace(tzinfo=timezone.utc).timestamp()
-            )
-            end_timestamp = int(
-                datetime.combine(dates_to_process[-1] + timedelta(days=1), datetime.min.time())
-                .replace(tzinfo=timezone.utc)
-                .timestamp()
-            )
+            async with self.async_session_factory() as sess:
+                # Completed dates are calculated again when their sessions were updated after the last calculation
+                last_calculated_at = (await sess.execute(select(func.max(table.c.updated_at)))).scalar()
+                if last_calculated_at is not None:
+                    updated_days_stmt = get_updated_session_days_stmt(sessions_table, since=last_calculated_at)
+                    days_to_process.update((await sess.execute(updated_days_stmt)).scalars())
+
+                if not days_to_process:
+                    log_info("Metrics already calculated for all relevant dates.")
+                    return None
 
-            sessions = await self._get_all_sessions_for_metrics_calculation(
-                start_timestamp=start_timestamp, end_timestamp=end_timestamp
-            )
-            all_sessions_data = fetch_all_sessions_data(
-                sessions=sessions,
-                dates_to_process=dates_to_process,
-                start_timestamp=start_timestamp,
-            )
-            if not all_sessions_data:
+                sessions_stmt, users_stmt, runs_stmt = get_daily_metrics_stmts(sessions_table, None, days_to_process)
+                metrics_records = build_daily_metrics_records(
+                    session_rows=(await sess.execute(sessions_stmt)).fetchall(),
+                    user_rows=(await sess.execute(users_stmt)).fetchall(),
+                    run_rows=(await sess.execute(runs_stmt)).fetchall(),
+                )
+
+            if not metrics_records:
                 log_info("No new session data found. Won't calculate metrics.")
                 return None
 
-            results = []
-            metrics_records = []
-
-            for date_to_process in dates_to_process:
-                date_key = date_to_process.isoformat()
-                sessions_for_date = all_sessions_data.get(date_key, {})
-
-                # Skip dates with no sessions
-                if not any(len(sessions) > 0 for sessions in sessions_for_date.values()):
-                    continue
-
-                metrics_record = calculate_date_metrics(date_to_process, sessions_for_date)
-                metrics_records.append(metrics_record)
-
-            if metrics_records:
-                async with self.async_session_factory() as sess, sess.begin():
-                    results = await abulk_upsert_metrics(session=sess, table=table, metrics_records=metrics_records)
+            async with self.async_session_factory() as sess, sess.begin():
+                results = await abulk_upsert_metrics(session=sess, table=table, metrics_records=metrics_records)
 
-            log_debug("Updated metrics calculations")
+            log_debug(f"Updated metrics calculations for {len(metrics_records)} dates")
 
             return results
 
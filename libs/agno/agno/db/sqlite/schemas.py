@@ -3,7 +3,7 @@
 from typing import Any
 
 try:
-    from sqlalchemy.types import JSON, BigInteger, Boolean, Date, String
+    from sqlalchemy.types import JSON, BigInteger, Boolean, Date, Integer, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
@@ -23,7 +23,29 @@ SESSION_TABLE_SCHEMA = {
     "runs": {"type": JSON, "nullable": True},
     "summary": {"type": JSON, "nullable": True},
     "created_at": {"type": BigInteger, "nullable": False, "index": True},
+    # Indexed to find the sessions updated since the last metrics calculation
+    "updated_at": {"type": BigInteger, "nullable": True, "index": True},
+}
+
+RUNS_TABLE_SCHEMA = {
+    "session_id": {"type": String, "nullable": False, "index": True},
+    "run_id": {"type": String, "nullable": False},
+    "parent_run_id": {"type": String, "nullable": True},
+    "status": {"type": String, "nullable": True},
+    "agent_id": {"type": String, "nullable": True},
+    "team_id": {"type": String, "nullable": True},
+    # Insertion order of the run, generated by the database so it is consistent across processes.
+    # Integer (not BigInteger) so the column aliases the SQLite rowid.
+    "position": {"type": Integer, "primary_key": True, "autoincrement": True, "nullable": False},
+    "run_data": {"type": JSON, "nullable": False},
+    "created_at": {"type": BigInteger, "nullable": False},
     "updated_at": {"type": BigInteger, "nullable": True},
+    "_unique_constraints": [
+        {
+            "name": "uq_session_run",
+            "columns": ["session_id", "run_id"],
+        }
+    ],
 }
 
 USER_MEMORY_TABLE_SCHEMA = {
@@ -245,6 +267,7 @@ def get_table_schema_definition(table_type: str, traces_table_name: str = "agno_
 
     schemas = {
         "sessions": SESSION_TABLE_SCHEMA,
+        "runs": RUNS_TABLE_SCHEMA,
         "evals": EVAL_TABLE_SCHEMA,
         "metrics": METRICS_TABLE_SCHEMA,
         "memories": USER_MEMORY_TABLE_SCHEMA,
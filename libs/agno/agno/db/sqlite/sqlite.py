@@ -1,3 +1,4 @@
+import json
 import time
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
@@ -16,22 +17,33 @@ from agno.db.schemas.memory import UserMemory
 from agno.db.sqlite.schemas import get_table_schema_definition
 from agno.db.sqlite.utils import (
     apply_sorting,
+    build_daily_metrics_records,
     bulk_upsert_metrics,
-    calculate_date_metrics,
+    date_to_day,
     deserialize_cultural_knowledge_from_db,
-    fetch_all_sessions_data,
+    get_daily_metrics_stmts,
     get_dates_to_calculate_metrics_for,
+    get_updated_session_days_stmt,
     is_table_available,
     is_valid_table,
     serialize_cultural_knowledge_for_db,
 )
-from agno.db.utils import deserialize_session_json_fields, serialize_session_json_fields
+from agno.db.utils import (
+    HISTORY_SKIP_STATUSES,
+    CustomJSONEncoder,
+    deserialize_session_json_fields,
+    get_history_run_owner,
+    get_run_row,
+    get_runs_to_save,
+    mark_runs_saved,
+    serialize_session_json_fields,
+)
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
 
 try:
-    from sqlalchemy import Column, MetaData, String, Table, func, select, text
+    from sqlalchemy import Column, MetaData, String, Table, func, or_, select, text
     from sqlalchemy.dialects import sqlite
     from sqlalchemy.engine import Engine, create_engine
     from sqlalchemy.orm import scoped_session, sessionmaker
@@ -59,6 +71,8 @@ class SqliteDb(BaseDb):
         component_configs_table: Optional[str] = None,
         component_links_table: Optional[str] = None,
         learnings_table: Optional[str] = None,
+        runs_table: Optional[str] = None,
+        append_only_runs: bool = False,
         id: Optional[str] = None,
     ):
         """
@@ -87,6 +101,9 @@ class SqliteDb(BaseDb):
             component_configs_table (Optional[str]): Name of the table to store component configurations.
             component_links_table (Optional[str]): Name of the table to store component links.
             learnings_table (Optional[str]): Name of the table to store learning records.
+            runs_table (Optional[str]): Name of the table to store session runs when append_only_runs is enabled.
+            append_only_runs (bool): Store the runs of a session as rows of the runs table instead of in the session
+                record, so saving a session only writes its new or updated runs.
             id (Optional[str]): ID of the database.
 
         Raises:
@@ -111,7 +128,9 @@ class SqliteDb(BaseDb):
             component_configs_table=component_configs_table,
             component_links_table=component_links_table,
             learnings_table=learnings_table,
+            runs_table=runs_table,
         )
+        self.append_only_runs = append_only_runs
 
         _engine: Optional[Engine] = db_engine
         if _engine is None:
@@ -144,6 +163,7 @@ class SqliteDb(BaseDb):
             {
                 "db_file": self.db_file,
                 "db_url": self.db_url,
+                "append_only_runs": self.append_only_runs,
                 "type": "sqlite",
             }
         )
@@ -166,6 +186,8 @@ class SqliteDb(BaseDb):
             components_table=data.get("components_table"),
             component_configs_table=data.get("component_configs_table"),
             component_links_table=data.get("component_links_table"),
+            runs_table=data.get("runs_table"),
+            append_only_runs=data.get("append_only_runs", False),
             id=data.get("id"),
         )
 
@@ -205,6 +227,8 @@ class SqliteDb(BaseDb):
             (self.component_links_table_name, "component_links"),
             (self.learnings_table_name, "learnings"),
         ]
+        if self.append_only_runs:
+            tables_to_create.append((self.runs_table_name, "runs"))
 
         for table_name, table_type in tables_to_create:
             self._get_or_create_table(table_name=table_name, table_type=table_type, create_table_if_not_found=True)
@@ -249,6 +273,9 @@ class SqliteDb(BaseDb):
                 if col_config.get("primary_key", False) and schema_primary_key is None:
                     column_kwargs["primary_key"] = True
 
+                if "autoincrement" in col_config:
+                    column_kwargs["autoincrement"] = col_config["autoincrement"]
+
                 if "nullable" in col_config:
                     column_kwargs["nullable"] = col_config["nullable"]
 
@@ -398,6 +425,7 @@ class SqliteDb(BaseDb):
             "knowledge": self.knowledge_table_name,
             "culture": self.culture_table_name,
             "versions": self.versions_table_name,
+            "runs": self.runs_table_name,
         }
         return table_map.get(logical_name, logical_name)
 
@@ -519,6 +547,14 @@ class SqliteDb(BaseDb):
             )
             return self.learnings_table
 
+        elif table_type == "runs":
+            self.runs_table = self._get_or_create_table(
+                table_name=self.runs_table_name,
+                table_type="runs",
+                create_table_if_not_found=create_table_if_not_found,
+            )
+            return self.runs_table
+
         else:
             raise ValueError(f"Unknown table type: '{table_type}'")
 
@@ -610,10 +646,13 @@ class SqliteDb(BaseDb):
             table = self._get_table(table_type="sessions")
             if table is None:
                 return False
+            runs_table = self._get_table(table_type="runs") if self.append_only_runs else None
 
             with self.Session() as sess, sess.begin():
                 delete_stmt = table.delete().where(table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if runs_table is not None:
+                    sess.execute(runs_table.delete().where(runs_table.c.session_id == session_id))
                 if result.rowcount == 0:
                     log_debug(f"No session found to deletewith session_id: {session_id}")
                     return False
@@ -639,10 +678,13 @@ class SqliteDb(BaseDb):
             table = self._get_table(table_type="sessions")
             if table is None:
                 return
+            runs_table = self._get_table(table_type="runs") if self.append_only_runs else None
 
             with self.Session() as sess, sess.begin():
                 delete_stmt = table.delete().where(table.c.session_id.in_(session_ids))
                 result = sess.execute(delete_stmt)
+                if runs_table is not None:
+                    sess.execute(runs_table.delete().where(runs_table.c.session_id.in_(session_ids)))
 
             log_debug(f"Successfully deleted {result.rowcount} sessions")
 
@@ -650,12 +692,110 @@ class SqliteDb(BaseDb):
             log_error(f"Error deleting sessions: {e}")
             raise e
 
+    def _write_session_runs(self, sess, runs_table: Table, session: Session) -> None:
+        """Write the new and updated runs of a session to the runs table."""
+        runs = get_runs_to_save(session)
+        if not runs:
+            return
+
+        # New runs are positioned after all existing ones by the database, existing runs keep their position
+        rows = []
+        for run in runs:
+            row = get_run_row(run, session_id=session.session_id)
+            row["run_data"] = json.dumps(row["run_data"], cls=CustomJSONEncoder)
+            rows.append(row)
+
+        # Stay below SQLite's bound parameter limit
+        for i in range(0, len(rows), 100):
+            stmt = sqlite.insert(runs_table).values(rows[i : i + 100])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id", "run_id"],
+                set_=dict(
+                    parent_run_id=stmt.excluded.parent_run_id,
+                    status=stmt.excluded.status,
+                    run_data=stmt.excluded.run_data,
+                    updated_at=stmt.excluded.updated_at,
+                ),
+            )
+            sess.execute(stmt)
+
+    def _attach_session_runs(
+        self,
+        sess,
+        runs_table: Table,
+        sessions_raw: List[Dict[str, Any]],
+        num_history_runs: Optional[int] = None,
+    ) -> None:
+        """Add the runs stored in the runs table to the given session records, after any runs still in the record.
+
+        Args:
+            num_history_runs (Optional[int]): Only read the last n top-level runs that can be used as history.
+                Only supported when reading a single session.
+        """
+        if not sessions_raw:
+            return
+
+        stmt = select(runs_table.c.session_id, runs_table.c.run_data)
+        if num_history_runs is not None and len(sessions_raw) == 1:
+            stmt = (
+                stmt.where(runs_table.c.session_id == sessions_raw[0]["session_id"])
+                .where(runs_table.c.parent_run_id.is_(None))
+                .where(or_(runs_table.c.status.is_(None), runs_table.c.status.notin_(HISTORY_SKIP_STATUSES)))
+                .order_by(runs_table.c.position.desc())
+                .limit(num_history_runs)
+            )
+            owner = get_history_run_owner(sessions_raw[0])
+            if owner is not None:
+                stmt = stmt.where(runs_table.c[owner[0]] == owner[1])
+            records = list(reversed(sess.execute(stmt).fetchall()))
+        else:
+            session_ids = [session_raw["session_id"] for session_raw in sessions_raw]
+            records = []
+            # Stay below SQLite's bound parameter limit
+            for i in range(0, len(session_ids), 500):
+                chunk_stmt = stmt.where(runs_table.c.session_id.in_(session_ids[i : i + 500]))
+                records.extend(sess.execute(chunk_stmt.order_by(runs_table.c.position)).fetchall())
+
+        runs_by_session: Dict[str, Dict[str, Any]] = {}
+        for session_raw in sessions_raw:
+            runs_by_session[session_raw["session_id"]] = {
+                run["run_id"]: run for run in session_raw.get("runs") or [] if isinstance(run, dict)
+            }
+        for session_id, run_data in records:
+            run = json.loads(run_data) if isinstance(run_data, str) else run_data
+            runs_by_session[session_id][run["run_id"]] = run
+        for session_raw in sessions_raw:
+            session_raw["runs"] = list(runs_by_session[session_raw["session_id"]].values()) or None
+
+    def _deserialize_upserted_session(
+        self, row, session: Session, deserialize: Optional[bool], runs_table: Optional[Table]
+    ) -> Optional[Union[Session, Dict[str, Any]]]:
+        """Build the return value of upsert_session from the upserted session record."""
+        session_raw = deserialize_session_json_fields(dict(row._mapping)) if row else None
+        if session_raw is None:
+            return None
+
+        if runs_table is None:
+            return type(session).from_dict(session_raw) if deserialize else session_raw
+
+        # The record holds no runs, so use the runs of the given session
+        mark_runs_saved(session)
+        if not deserialize:
+            session_raw["runs"] = [run.to_dict() for run in session.runs] if session.runs else None
+            return session_raw
+        upserted_session = type(session).from_dict(session_raw)
+        if upserted_session is not None:
+            upserted_session.runs = session.runs  # type: ignore
+            mark_runs_saved(upserted_session)
+        return upserted_session
+
     def get_session(
         self,
         session_id: str,
         session_type: SessionType,
         user_id: Optional[str] = None,
         deserialize: Optional[bool] = True,
+        num_history_runs: Optional[int] = None,
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """
         Read a session from the database.
@@ -665,6 +805,8 @@ class SqliteDb(BaseDb):
             session_type (SessionType): Type of session to get.
             user_id (Optional[str]): User ID to filter by. Defaults to None.
             deserialize (Optional[bool]): Whether to serialize the session. Defaults to True.
+            num_history_runs (Optional[int]): With append_only_runs, only read the last n top-level runs that can be
+                used as history (not paused, cancelled or errored). Defaults to reading all runs.
 
         Returns:
             Optional[Union[Session, Dict[str, Any]]]:
@@ -678,6 +820,7 @@ class SqliteDb(BaseDb):
             table = self._get_table(table_type="sessions")
             if table is None:
                 return None
+            runs_table = self._get_table(table_type="runs") if self.append_only_runs else None
 
             with self.Session() as sess, sess.begin():
                 stmt = select(table).where(table.c.session_id == session_id)
@@ -691,18 +834,29 @@ class SqliteDb(BaseDb):
                     return None
 
                 session_raw = deserialize_session_json_fields(dict(result._mapping))
+                # Runs still stored in the session record are all read, and moved to the runs table on the next upsert
+                runs_in_record = bool(session_raw.get("runs"))
+                if runs_table is not None:
+                    self._attach_session_runs(
+                        sess, runs_table, [session_raw], num_history_runs=None if runs_in_record else num_history_runs
+                    )
                 if not session_raw or not deserialize:
                     return session_raw
 
+            session: Optional[Session]
             if session_type == SessionType.AGENT:
-                return AgentSession.from_dict(session_raw)
+                session = AgentSession.from_dict(session_raw)
             elif session_type == SessionType.TEAM:
-                return TeamSession.from_dict(session_raw)
+                session = TeamSession.from_dict(session_raw)
             elif session_type == SessionType.WORKFLOW:
-                return WorkflowSession.from_dict(session_raw)
+                session = WorkflowSession.from_dict(session_raw)
             else:
                 raise ValueError(f"Invalid session type: {session_type}")
 
+            if session is not None and runs_table is not None and not runs_in_record:
+                mark_runs_saved(session)
+            return session
+
         except Exception as e:
             log_debug(f"Exception reading from sessions table: {e}")
             raise e
@@ -749,6 +903,7 @@ class SqliteDb(BaseDb):
             table = self._get_table(table_type="sessions")
             if table is None:
                 return [] if deserialize else ([], 0)
+            runs_table = self._get_table(table_type="runs") if self.append_only_runs else None
 
             with self.Session() as sess, sess.begin():
                 stmt = select(table)
@@ -790,6 +945,8 @@ class SqliteDb(BaseDb):
                     return [] if deserialize else ([], 0)
 
                 sessions_raw = [deserialize_session_json_fields(dict(record._mapping)) for record in records]
+                if runs_table is not None:
+                    self._attach_session_runs(sess, runs_table, sessions_raw)
                 if not deserialize:
                     return sessions_raw, total_count
                 if not sessions_raw:
@@ -874,8 +1031,12 @@ class SqliteDb(BaseDb):
             table = self._get_table(table_type="sessions", create_table_if_not_found=True)
             if table is None:
                 return None
+            runs_table = (
+                self._get_table(table_type="runs", create_table_if_not_found=True) if self.append_only_runs else None
+            )
 
-            serialized_session = serialize_session_json_fields(session.to_dict())
+            # With a runs table, only the new and updated runs are written, to their own rows
+            serialized_session = serialize_session_json_fields(session.to_dict(include_runs=runs_table is None))
 
             if isinstance(session, AgentSession):
                 with self.Session() as sess, sess.begin():
@@ -909,10 +1070,10 @@ class SqliteDb(BaseDb):
                     result = sess.execute(stmt)
                     row = result.fetchone()
 
-                    session_raw = deserialize_session_json_fields(dict(row._mapping)) if row else None
-                    if session_raw is None or not deserialize:
-                        return session_raw
-                    return AgentSession.from_dict(session_raw)
+                    if runs_table is not None:
+                        self._write_session_runs(sess, runs_table, session)
+
+                return self._deserialize_upserted_session(row, session, deserialize, runs_table)
 
             elif isinstance(session, TeamSession):
                 with self.Session() as sess, sess.begin():
@@ -947,10 +1108,10 @@ class SqliteDb(BaseDb):
                     result = sess.execute(stmt)
                     row = result.fetchone()
 
-                    session_raw = deserialize_session_json_fields(dict(row._mapping)) if row else None
-                    if session_raw is None or not deserialize:
-                        return session_raw
-                    return TeamSession.from_dict(session_raw)
+                    if runs_table is not None:
+                        self._write_session_runs(sess, runs_table, session)
+
+                return self._deserialize_upserted_session(row, session, deserialize, runs_table)
 
             else:
                 with self.Session() as sess, sess.begin():
@@ -984,10 +1145,10 @@ class SqliteDb(BaseDb):
                     result = sess.execute(stmt)
                     row = result.fetchone()
 
-                    session_raw = deserialize_session_json_fields(dict(row._mapping)) if row else None
-                    if session_raw is None or not deserialize:
-                        return session_raw
-                    return WorkflowSession.from_dict(session_raw)
+                    if runs_table is not None:
+                        self._write_session_runs(sess, runs_table, session)
+
+                return self._deserialize_upserted_session(row, session, deserialize, runs_table)
 
         except Exception as e:
             log_warning(f"Exception upserting into table: {e}")
@@ -1016,6 +1177,16 @@ class SqliteDb(BaseDb):
         if not sessions:
             return []
 
+        if self.append_only_runs:
+            # Runs are written to their own table, one session at a time
+            return [
+                result
+                for session in sessions
+                if session is not None
+                for result in [self.upsert_session(session, deserialize=deserialize)]
+                if result is not None
+            ]
+
         try:
             table = self._get_table(table_type="sessions", create_table_if_not_found=True)
             if table is None:
@@ -1706,48 +1877,6 @@ class SqliteDb(BaseDb):
 
     # -- Metrics methods --
 
-    def _get_all_sessions_for_metrics_calculation(
-        self, start_timestamp: Optional[int] = None, end_timestamp: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
-        """
-        Get all sessions of all types (agent, team, workflow) as raw dictionaries.
-
-         Args:
-            start_timestamp (Optional[int]): The start timestamp to filter by. Defaults to None.
-            end_timestamp (Optional[int]): The end timestamp to filter by. Defaults to None.
-
-        Returns:
-            List[Dict[str, Any]]: List of session dictionaries with session_type field.
-
-        Raises:
-            Exception: If an error occurs during retrieval.
-        """
-        try:
-            table = self._get_table(table_type="sessions")
-            if table is None:
-                return []
-
-            stmt = select(
-                table.c.user_id,
-                table.c.session_data,
-                table.c.runs,
-                table.c.created_at,
-                table.c.session_type,
-            )
-
-            if start_timestamp is not None:
-                stmt = stmt.where(table.c.created_at >= start_timestamp)
-            if end_timestamp is not None:
-                stmt = stmt.where(table.c.created_at <= end_timestamp)
-
-            with self.Session() as sess:
-                result = sess.execute(stmt).fetchall()
-                return [record._mapping for record in result]
-
-        except Exception as e:
-            log_error(f"Error reading from sessions table: {e}")
-            raise e
-
     def _get_metrics_calculation_starting_date(self, table: Table) -> Optional[date]:
         """Get the first date for which metrics calculation is needed:
 
@@ -1783,7 +1912,11 @@ class SqliteDb(BaseDb):
         return datetime.fromtimestamp(first_session_date, tz=timezone.utc).date()
 
     def calculate_metrics(self) -> Optional[list[dict]]:
-        """Calculate metrics for all dates without complete metrics.
+        """Calculate metrics for all dates without complete metrics, and for the dates of the sessions updated since
+        the last calculation.
+
+        The metrics of each date are aggregated in the database, so the cost of a calculation grows with the number of
+        dates to update rather than with the number of sessions.
 
         Returns:
             Optional[list[dict]]: The calculated metrics.
@@ -1796,56 +1929,43 @@ class SqliteDb(BaseDb):
             if table is None:
                 return None
 
+            sessions_table = self._get_table(table_type="sessions")
             starting_date = self._get_metrics_calculation_starting_date(table)
-            if starting_date is None:
+            if sessions_table is None or starting_date is None:
                 log_info("No session data found. Won't calculate metrics.")
                 return None
 
-            dates_to_process = get_dates_to_calculate_metrics_for(starting_date)
-            if not dates_to_process:
-                log_info("Metrics already calculated for all relevant dates.")
-                return None
+            days_to_process = {date_to_day(day) for day in get_dates_to_calculate_metrics_for(starting_date)}
+            runs_table = self._get_table(table_type="runs") if self.append_only_runs else None
 
-            start_timestamp = int(
-                datetime.combine(dates_to_process[0], datetime.min.time()).replace(tzinfo=timezone.utc).timestamp()
-            )
-            end_timestamp = int(
-                datetime.combine(dates_to_process[-1] + timedelta(days=1), datetime.min.time())
-                .replace(tzinfo=timezone.utc)
-                .timestamp()
-            )
+            with self.Session() as sess:
+                # Completed dates are calculated again when their sessions were updated after the last calculation
+                last_calculated_at = sess.execute(select(func.max(table.c.updated_at))).scalar()
+                if last_calculated_at is not None:
+                    updated_days_stmt = get_updated_session_days_stmt(sessions_table, since=last_calculated_at)
+                    days_to_process.update(sess.execute(updated_days_stmt).scalars())
+
+                if not days_to_process:
+                    log_info("Metrics already calculated for all relevant dates.")
+                    return None
 
-            sessions = self._get_all_sessions_for_metrics_calculation(
-                start_timestamp=start_timestamp, end_timestamp=end_timestamp
-            )
-            all_sessions_data = fetch_all_sessions_data(
-                sessions=sessions,
-                dates_to_process=dates_to_process,
-                start_timestamp=start_timestamp,
-            )
-            if not all_sessions_data:
+                sessions_stmt, users_stmt, runs_stmt = get_daily_metrics_stmts(
+                    sessions_table, runs_table, days_to_process
+                )
+                metrics_records = build_daily_metrics_records(
+                    session_rows=sess.execute(sessions_stmt).fetchall(),
+                    user_rows=sess.execute(users_stmt).fetchall(),
+                    run_rows=sess.execute(runs_stmt).fetchall(),
+                )
+
+            if not metrics_records:
                 log_info("No new session data found. Won't calculate metrics.")
                 return None
 
-            results = []
-            metrics_records = []
-
-            for date_to_process in dates_to_process:
-                date_key = date_to_process.isoformat()
-                sessions_for_date = all_sessions_data.get(date_key, {})
-
-                # Skip dates with no sessions
-                if not any(len(sessions) > 0 for sessions in sessions_for_date.values()):
-                    continue
-
-                metrics_record = calculate_date_metrics(date_to_process, sessions_for_date)
-                metrics_records.append(metrics_record)
-
-            if metrics_records:
-                with self.Session() as sess, sess.begin():
-                    results = bulk_upsert_metrics(session=sess, table=table, metrics_records=metrics_records)
+            with self.Session() as sess, sess.begin():
+                results = bulk_upsert_metrics(session=sess, table=table, metrics_records=metrics_records)
 
-            log_debug("Updated metrics calculations")
+            log_debug(f"Updated metrics calculations for {len(metrics_records)} dates")
 
             return results
 
@@ -1,7 +1,7 @@
 import json
 import time
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
@@ -11,7 +11,7 @@ from agno.db.sqlite.schemas import get_table_schema_definition
 from agno.utils.log import log_debug, log_error, log_warning
 
 try:
-    from sqlalchemy import Table, func
+    from sqlalchemy import Integer, Table, and_, cast, distinct, func, literal, or_, select, union
     from sqlalchemy.dialects import sqlite
     from sqlalchemy.engine import Engine
     from sqlalchemy.inspection import inspect
@@ -240,144 +240,223 @@ async def abulk_upsert_metrics(session: AsyncSession, table: Table, metrics_reco
     return results  # type: ignore
 
 
-def calculate_date_metrics(date_to_process: date, sessions_data: dict) -> dict:
-    """Calculate metrics for the given single date.
+def get_dates_to_calculate_metrics_for(starting_date: date) -> list[date]:
+    """Return the list of dates to calculate metrics for.
 
     Args:
-        date_to_process (date): The date to calculate metrics for.
-        sessions_data (dict): The sessions data to calculate metrics for.
+        starting_date (date): The starting date to calculate metrics for.
 
     Returns:
-        dict: The calculated metrics.
+        list[date]: The list of dates to calculate metrics for.
     """
-    metrics = {
-        "users_count": 0,
-        "agent_sessions_count": 0,
-        "team_sessions_count": 0,
-        "workflow_sessions_count": 0,
-        "agent_runs_count": 0,
-        "team_runs_count": 0,
-        "workflow_runs_count": 0,
-    }
-    token_metrics = {
-        "input_tokens": 0,
-        "output_tokens": 0,
-        "total_tokens": 0,
-        "audio_total_tokens": 0,
-        "audio_input_tokens": 0,
-        "audio_output_tokens": 0,
-        "cache_read_tokens": 0,
-        "cache_write_tokens": 0,
-        "reasoning_tokens": 0,
-    }
-    model_counts: Dict[str, int] = {}
-
-    session_types = [
-        ("agent", "agent_sessions_count", "agent_runs_count"),
-        ("team", "team_sessions_count", "team_runs_count"),
-        ("workflow", "workflow_sessions_count", "workflow_runs_count"),
-    ]
-    all_user_ids = set()
-
-    for session_type, sessions_count_key, runs_count_key in session_types:
-        sessions = sessions_data.get(session_type, []) or []
-        metrics[sessions_count_key] = len(sessions)
-
-        for session in sessions:
-            if session.get("user_id"):
-                all_user_ids.add(session["user_id"])
-
-            # Parse runs from JSON string
-            if runs := session.get("runs", []):
-                runs = json.loads(runs) if isinstance(runs, str) else runs
-                metrics[runs_count_key] += len(runs)
-                for run in runs:
-                    if model_id := run.get("model"):
-                        model_provider = run.get("model_provider", "")
-                        model_counts[f"{model_id}:{model_provider}"] = (
-                            model_counts.get(f"{model_id}:{model_provider}", 0) + 1
-                        )
-
-            # Parse session_data from JSON string
-            session_data = session.get("session_data", {})
-            if isinstance(session_data, str):
-                session_data = json.loads(session_data)
-            session_metrics = session_data.get("session_metrics", {})
-            for field in token_metrics:
-                token_metrics[field] += session_metrics.get(field, 0)
-
-    model_metrics = []
-    for model, count in model_counts.items():
-        model_id, model_provider = model.rsplit(":", 1)
-        model_metrics.append({"model_id": model_id, "model_provider": model_provider, "count": count})
-
-    metrics["users_count"] = len(all_user_ids)
-    current_time = int(time.time())
+    today = datetime.now(timezone.utc).date()
+    days_diff = (today - starting_date).days + 1
+    if days_diff <= 0:
+        return []
+    return [starting_date + timedelta(days=x) for x in range(days_diff)]
 
-    return {
-        "id": str(uuid4()),
-        "date": date_to_process,
-        "completed": date_to_process < datetime.now(timezone.utc).date(),
-        "token_metrics": token_metrics,
-        "model_metrics": model_metrics,
-        "created_at": current_time,
-        "updated_at": current_time,
-        "aggregation_period": "daily",
-        **metrics,
-    }
 
+SECONDS_PER_DAY = 86400
 
-def fetch_all_sessions_data(
-    sessions: List[Dict[str, Any]], dates_to_process: list[date], start_timestamp: int
-) -> Optional[dict]:
-    """Return all session data for the given dates, for all session types.
+TOKEN_METRICS_FIELDS = [
+    "input_tokens",
+    "output_tokens",
+    "total_tokens",
+    "audio_total_tokens",
+    "audio_input_tokens",
+    "audio_output_tokens",
+    "cache_read_tokens",
+    "cache_write_tokens",
+    "reasoning_tokens",
+]
 
-    Args:
-        dates_to_process (list[date]): The dates to fetch session data for.
 
-    Returns:
-        dict: A dictionary with dates as keys and session data as values, for all session types.
-
-    Example:
-    {
-        "2000-01-01": {
-            "agent": [<session1>, <session2>, ...],
-            "team": [...],
-            "workflow": [...],
-        }
-    }
-    """
-    if not dates_to_process:
-        return None
+def _json_field(column, path: str):
+    """Extract a value from a JSON column holding either a JSON value or a JSON value serialized as a string."""
+    return func.json_extract(func.json_extract(column, "$"), path)
 
-    all_sessions_data: Dict[str, Dict[str, List[Dict[str, Any]]]] = {
-        date_to_process.isoformat(): {"agent": [], "team": [], "workflow": []} for date_to_process in dates_to_process
-    }
 
-    for session in sessions:
-        session_date = (
-            datetime.fromtimestamp(session.get("created_at", start_timestamp), tz=timezone.utc).date().isoformat()
-        )
-        if session_date in all_sessions_data:
-            all_sessions_data[session_date][session["session_type"]].append(session)
+def _day_number(column):
+    """Number of the UTC day of a unix timestamp column."""
+    return cast(column / SECONDS_PER_DAY, Integer)
 
-    return all_sessions_data
 
+def _day_ranges(days: Iterable[int]) -> List[Tuple[int, int]]:
+    """Group day numbers into (first, last) ranges of consecutive days."""
+    ranges: List[Tuple[int, int]] = []
+    for day in sorted(set(days)):
+        if ranges and ranges[-1][1] == day - 1:
+            ranges[-1] = (ranges[-1][0], day)
+        else:
+            ranges.append((day, day))
+    return ranges
 
-def get_dates_to_calculate_metrics_for(starting_date: date) -> list[date]:
-    """Return the list of dates to calculate metrics for.
 
-    Args:
-        starting_date (date): The starting date to calculate metrics for.
+def day_to_date(day: int) -> date:
+    return date(1970, 1, 1) + timedelta(days=day)
+
+
+def date_to_day(value: date) -> int:
+    return (value - date(1970, 1, 1)).days
+
+
+def get_updated_session_days_stmt(sessions_table: Table, since: int):
+    """Select the days with sessions created or updated at or after the given timestamp."""
+    return (
+        select(_day_number(sessions_table.c.created_at))
+        .distinct()
+        .where(or_(sessions_table.c.updated_at >= since, sessions_table.c.created_at >= since))
+    )
+
+
+def get_daily_metrics_stmts(sessions_table: Table, runs_table: Optional[Table], days: Iterable[int]):
+    """Build the statements aggregating the metrics of the sessions created on the given days, per day.
+
+    The aggregation runs in SQLite, so only one row per day, session type and model is read back.
 
     Returns:
-        list[date]: The list of dates to calculate metrics for.
+        The sessions statement, with session counts and token sums per day and session type, the users
+        statement, with distinct users per day, and the runs statement, with run counts per day, session
+        type and model.
     """
+    created_at = sessions_table.c.created_at
+    in_days = or_(
+        *[
+            and_(created_at >= first * SECONDS_PER_DAY, created_at < (last + 1) * SECONDS_PER_DAY)
+            for first, last in _day_ranges(days)
+        ]
+    )
+    day = _day_number(created_at).label("day")
+
+    sessions_stmt = (
+        select(
+            day,
+            sessions_table.c.session_type,
+            func.count().label("sessions_count"),
+            *[
+                func.sum(
+                    func.coalesce(_json_field(sessions_table.c.session_data, f"$.session_metrics.{field}"), 0)
+                ).label(field)
+                for field in TOKEN_METRICS_FIELDS
+            ],
+        )
+        .where(in_days)
+        .group_by(day, sessions_table.c.session_type)
+    )
+
+    users_stmt = (
+        select(day, func.count(distinct(sessions_table.c.user_id)).label("users_count"))
+        .where(in_days)
+        .where(sessions_table.c.user_id.isnot(None))
+        .where(sessions_table.c.user_id != "")
+        .group_by(day)
+    )
+
+    # Runs kept in the session record
+    session_runs = func.json_each(func.json_extract(sessions_table.c.runs, "$")).table_valued("value").alias("run")
+    runs_source = select(
+        day,
+        sessions_table.c.session_type,
+        sessions_table.c.session_id,
+        func.json_extract(session_runs.c.value, "$.run_id").label("run_id"),
+        func.json_extract(session_runs.c.value, "$.model").label("model_id"),
+        func.json_extract(session_runs.c.value, "$.model_provider").label("model_provider"),
+    ).where(in_days)
+    runs_source = runs_source.select_from(sessions_table).join(session_runs, literal(True))
+
+    # Runs stored as rows of the runs table, counted once if they are also in the session record
+    if runs_table is not None:
+        table_runs = (
+            select(
+                day,
+                sessions_table.c.session_type,
+                sessions_table.c.session_id,
+                runs_table.c.run_id,
+                _json_field(runs_table.c.run_data, "$.model").label("model_id"),
+                _json_field(runs_table.c.run_data, "$.model_provider").label("model_provider"),
+            )
+            .select_from(sessions_table)
+            .join(runs_table, runs_table.c.session_id == sessions_table.c.session_id)
+            .where(in_days)
+        )
+        runs_subquery = union(runs_source, table_runs).subquery("runs")
+    else:
+        runs_subquery = runs_source.subquery("runs")
+
+    runs_stmt = select(
+        runs_subquery.c.day,
+        runs_subquery.c.session_type,
+        runs_subquery.c.model_id,
+        runs_subquery.c.model_provider,
+        func.count().label("runs_count"),
+    ).group_by(
+        runs_subquery.c.day,
+        runs_subquery.c.session_type,
+        runs_subquery.c.model_id,
+        runs_subquery.c.model_provider,
+    )
+
+    return sessions_stmt, users_stmt, runs_stmt
+
+
+def build_daily_metrics_records(
+    session_rows: Iterable[Any], user_rows: Iterable[Any], run_rows: Iterable[Any]
+) -> List[dict]:
+    """Build one metrics record per day from the rows of the statements of get_daily_metrics_stmts."""
     today = datetime.now(timezone.utc).date()
-    days_diff = (today - starting_date).days + 1
-    if days_diff <= 0:
-        return []
-    return [starting_date + timedelta(days=x) for x in range(days_diff)]
+    current_time = int(time.time())
+    records: Dict[int, dict] = {}
+    model_counts: Dict[int, Dict[Tuple[str, str], int]] = {}
+
+    for row in session_rows:
+        record = records.get(row.day)
+        if record is None:
+            record_date = day_to_date(row.day)
+            record = {
+                "id": str(uuid4()),
+                "date": record_date,
+                "completed": record_date < today,
+                "token_metrics": {field: 0 for field in TOKEN_METRICS_FIELDS},
+                "model_metrics": [],
+                "created_at": current_time,
+                "updated_at": current_time,
+                "aggregation_period": "daily",
+                "users_count": 0,
+                "agent_sessions_count": 0,
+                "team_sessions_count": 0,
+                "workflow_sessions_count": 0,
+                "agent_runs_count": 0,
+                "team_runs_count": 0,
+                "workflow_runs_count": 0,
+            }
+            records[row.day] = record
+        if f"{row.session_type}_sessions_count" in record:
+            record[f"{row.session_type}_sessions_count"] += row.sessions_count
+        for field in TOKEN_METRICS_FIELDS:
+            record["token_metrics"][field] += int(getattr(row, field) or 0)
+
+    for row in user_rows:
+        if row.day in records:
+            records[row.day]["users_count"] = row.users_count
+
+    for row in run_rows:
+        record = records.get(row.day)
+        if record is None:
+            continue
+        if f"{row.session_type}_runs_count" in record:
+            record[f"{row.session_type}_runs_count"] += row.runs_count
+        if row.model_id:
+            key = (row.model_id, row.model_provider or "")
+            day_model_counts = model_counts.setdefault(row.day, {})
+            day_model_counts[key] = day_model_counts.get(key, 0) + row.runs_count
+
+    for day, day_model_counts in model_counts.items():
+        records[day]["model_metrics"] = [
+            {"model_id": model_id, "model_provider": model_provider, "count": count}
+            for (model_id, model_provider), count in day_model_counts.items()
+        ]
+
+    return [records[day] for day in sorted(records)]
 
 
 # -- Cultural Knowledge util methods --
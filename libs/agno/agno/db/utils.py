@@ -1,8 +1,10 @@
 """Logic shared across different database implementations"""
 
 import json
+import time
 from datetime import date, datetime
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from agno.models.message import Message
@@ -11,6 +13,10 @@ from agno.utils.log import log_error, log_warning
 
 if TYPE_CHECKING:
     from agno.db.base import BaseDb
+    from agno.session import Session
+
+# Run statuses that are never used as history, see AgentSession.get_messages
+HISTORY_SKIP_STATUSES = ["PAUSED", "CANCELLED", "ERROR"]
 
 
 def get_sort_value(record: Dict[str, Any], sort_by: str) -> Any:
@@ -144,6 +150,58 @@ def deserialize_session_json_fields(session: dict) -> dict:
     return session
 
 
+def get_history_run_owner(session_raw: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """Get the runs table column and value identifying the agent or team whose runs are history for a session.
+
+    Mirrors the agent_id/team_id filter applied by get_messages, so runs written to a shared session by
+    other agents or teams are not read as history.
+    """
+    session_type = session_raw.get("session_type")
+    if session_type == "agent" and session_raw.get("agent_id"):
+        return "agent_id", session_raw["agent_id"]
+    if session_type == "team" and session_raw.get("team_id"):
+        return "team_id", session_raw["team_id"]
+    return None
+
+
+def get_runs_to_save(session: "Session") -> List[Any]:
+    """Get the runs of a session that have to be written to a separate runs table.
+
+    Agent and Team sessions track the runs added through upsert_run since they were last read or written.
+    Workflow runs are updated in place, so all of them are written.
+    """
+    unsaved_run_ids = getattr(session, "_unsaved_run_ids", None)
+    if unsaved_run_ids is None:
+        return list(session.runs or [])
+    return [run for run in session.runs or [] if run.run_id in unsaved_run_ids]
+
+
+def mark_runs_saved(session: "Session") -> None:
+    """Mark the runs of a session as persisted in a separate runs table."""
+    if hasattr(session, "_unsaved_run_ids"):
+        session._unsaved_run_ids = set()  # type: ignore[union-attr]
+
+
+def get_run_row(run: Any, session_id: str) -> Dict[str, Any]:
+    """Build the runs table row for a run. The run data is left as a dict.
+
+    The position of the run is generated by the database when the row is first inserted.
+    """
+    status = getattr(run, "status", None)
+    now = int(time.time())
+    return {
+        "session_id": session_id,
+        "run_id": run.run_id,
+        "parent_run_id": getattr(run, "parent_run_id", None),
+        "agent_id": getattr(run, "agent_id", None),
+        "team_id": getattr(run, "team_id", None),
+        "status": status.value if isinstance(status, Enum) else status,
+        "run_data": run.to_dict(),
+        "created_at": getattr(run, "created_at", None) or now,
+        "updated_at": now,
+    }
+
+
 def db_from_dict(db_data: Dict[str, Any]) -> Optional[Union["BaseDb"]]:
     """
     Create a database instance from a dictionary.
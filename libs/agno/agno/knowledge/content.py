@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
+from agno.knowledge.fingerprint import ContentFingerprint
 from agno.knowledge.reader import Reader
 from agno.knowledge.remote_content.remote_content import RemoteContent
 
@@ -48,6 +49,8 @@ class Content:
     created_at: Optional[int] = None
     updated_at: Optional[int] = None
     external_id: Optional[str] = None
+    # Fingerprint of the indexed file, set by incremental inserts
+    fingerprint: Optional[ContentFingerprint] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Content":
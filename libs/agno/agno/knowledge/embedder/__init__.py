@@ -1,5 +1,7 @@
 from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.embedder.cache import EmbeddingCache
 
 __all__ = [
     "Embedder",
+    "EmbeddingCache",
 ]
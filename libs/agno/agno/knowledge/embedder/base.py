@@ -1,5 +1,26 @@
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from functools import wraps
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+from agno.utils.log import log_warning
+
+if TYPE_CHECKING:
+    from agno.knowledge.embedder.cache import EmbeddingCache
+    from agno.utils.rate_limit import RateLimiter
+
+# Settings that change the vector produced for the same text, included in the cache namespace when present
+_CACHE_NAMESPACE_ATTRIBUTES = (
+    "input_type",
+    "task_type",
+    "encoding_format",
+    "embedding_type",
+    "embedding_types",
+    "prompt",
+    "normalize_embeddings",
+    "late_chunking",
+)
 
 
 @dataclass
@@ -9,6 +30,18 @@ class Embedder:
     dimensions: Optional[int] = 1536
     enable_batch: bool = False
     batch_size: int = 100  # Number of texts to process in each API call
+    # Optional content-addressed cache, so unchanged texts are never embedded twice
+    embedding_cache: Optional["EmbeddingCache"] = None
+    # Optional client-side rate limiter, can be shared with other Embedders and Models using the same provider quota
+    rate_limiter: Optional["RateLimiter"] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Route every embedding method an implementation defines through the embedding cache and rate limiter
+        for method_name, wrapper in _CACHED_METHOD_WRAPPERS.items():
+            method = cls.__dict__.get(method_name)
+            if method is not None and not getattr(method, "_uses_embedding_cache", False):
+                setattr(cls, method_name, wrapper(method))
 
     def get_embedding(self, text: str) -> List[float]:
         raise NotImplementedError
@@ -21,3 +54,223 @@ class Embedder:
 
     async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    @contextmanager
+    def _rate_limited(self, texts: List[str]) -> Iterator[None]:
+        """Hold a rate limiter slot, if one is set, for one provider request embedding `texts`.
+
+        Batch implementations take a slot for each request they send, so a bulk ingestion is limited per request.
+        """
+        if self.rate_limiter is None or _in_rate_limited_call.get():
+            yield
+            return
+        token = _in_rate_limited_call.set(True)
+        try:
+            with self.rate_limiter.limit(tokens=_estimate_tokens(self, texts)):
+                yield
+        finally:
+            _in_rate_limited_call.reset(token)
+
+    @asynccontextmanager
+    async def _async_rate_limited(self, texts: List[str]) -> AsyncIterator[None]:
+        """Async variant of _rate_limited."""
+        if self.rate_limiter is None or _in_rate_limited_call.get():
+            yield
+            return
+        token = _in_rate_limited_call.set(True)
+        try:
+            async with self.rate_limiter.alimit(tokens=_estimate_tokens(self, texts)):
+                yield
+        finally:
+            _in_rate_limited_call.reset(token)
+
+    def warmup(self) -> None:
+        """Load the local model used by this embedder, if any, so the first request doesn't have to."""
+        pass
+
+    def get_embedding_cache_namespace(self) -> str:
+        """Identify the embedder class, model and settings that produced a cached vector."""
+        parts = [
+            f"{self.__class__.__module__}.{self.__class__.__qualname__}",
+            str(getattr(self, "id", "")),
+            str(self.dimensions),
+        ]
+        for attribute in _CACHE_NAMESPACE_ATTRIBUTES:
+            value = getattr(self, attribute, None)
+            if value is not None:
+                parts.append(f"{attribute}={value}")
+        return "|".join(parts)
+
+
+# Set while an embedding request holds a rate limiter slot, so nested embedding methods do not acquire another one
+_in_rate_limited_call: ContextVar[bool] = ContextVar("in_rate_limited_call", default=False)
+
+
+def _estimate_tokens(embedder: Embedder, texts: List[str]) -> int:
+    if embedder.rate_limiter is None or not embedder.rate_limiter.counts_tokens:
+        return 0
+    from agno.utils.tokens import count_text_tokens
+
+    model_id = str(getattr(embedder, "id", None) or "")
+    try:
+        return sum(count_text_tokens(text, model_id) for text in texts)
+    except Exception as e:
+        log_warning(f"Could not estimate tokens for rate limiting: {e}")
+        return 0
+
+
+def _call(embedder: Embedder, method: Callable, texts: List[str], *args: Any, **kwargs: Any) -> Any:
+    """Call an embedding method, holding a rate limiter slot if one is set."""
+    with embedder._rate_limited(texts):
+        return method(embedder, *args, **kwargs)
+
+
+async def _acall(embedder: Embedder, method: Callable, texts: List[str], *args: Any, **kwargs: Any) -> Any:
+    """Async variant of _call."""
+    async with embedder._async_rate_limited(texts):
+        return await method(embedder, *args, **kwargs)
+
+
+def _cached_embedding(method: Callable) -> Callable:
+    @wraps(method)
+    def wrapper(self: Embedder, text: str) -> List[float]:
+        if self.embedding_cache is None:
+            return _call(self, method, [text], text)
+        namespace = self.get_embedding_cache_namespace()
+        cached = self.embedding_cache.get(namespace, text)
+        if cached is not None:
+            return cached
+        embedding = _call(self, method, [text], text)
+        self.embedding_cache.set(namespace, text, embedding)
+        return embedding
+
+    wrapper._uses_embedding_cache = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _cached_embedding_and_usage(method: Callable) -> Callable:
+    @wraps(method)
+    def wrapper(self: Embedder, text: str) -> Tuple[List[float], Optional[Dict]]:
+        if self.embedding_cache is None:
+            return _call(self, method, [text], text)
+        namespace = self.get_embedding_cache_namespace()
+        cached = self.embedding_cache.get(namespace, text)
+        if cached is not None:
+            return cached, None
+        embedding, usage = _call(self, method, [text], text)
+        self.embedding_cache.set(namespace, text, embedding)
+        return embedding, usage
+
+    wrapper._uses_embedding_cache = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _async_cached_embedding(method: Callable) -> Callable:
+    @wraps(method)
+    async def wrapper(self: Embedder, text: str) -> List[float]:
+        if self.embedding_cache is None:
+            return await _acall(self, method, [text], text)
+        namespace = self.get_embedding_cache_namespace()
+        cached = self.embedding_cache.get(namespace, text)
+        if cached is not None:
+            return cached
+        embedding = await _acall(self, method, [text], text)
+        self.embedding_cache.set(namespace, text, embedding)
+        return embedding
+
+    wrapper._uses_embedding_cache = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _async_cached_embedding_and_usage(method: Callable) -> Callable:
+    @wraps(method)
+    async def wrapper(self: Embedder, text: str) -> Tuple[List[float], Optional[Dict]]:
+        if self.embedding_cache is None:
+            return await _acall(self, method, [text], text)
+        namespace = self.get_embedding_cache_namespace()
+        cached = self.embedding_cache.get(namespace, text)
+        if cached is not None:
+            return cached, None
+        embedding, usage = await _acall(self, method, [text], text)
+        self.embedding_cache.set(namespace, text, embedding)
+        return embedding, usage
+
+    wrapper._uses_embedding_cache = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _split_batch(embedder: Embedder, texts: List[str]) -> Tuple[str, Dict[str, List[float]], List[str]]:
+    """Look up a batch in the cache and return (namespace, cached embeddings, unique texts still to embed)."""
+    namespace = embedder.get_embedding_cache_namespace()
+    cached = embedder.embedding_cache.get_many(namespace, texts)  # type: ignore[union-attr]
+    missing = list(dict.fromkeys(text for text in texts if text not in cached))
+    return namespace, cached, missing
+
+
+def _merge_batch(
+    embedder: Embedder,
+    namespace: str,
+    texts: List[str],
+    cached: Dict[str, List[float]],
+    missing: List[str],
+    embeddings: List[List[float]],
+    usages: List[Optional[Dict]],
+) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+    computed = {text: embeddings[i] for i, text in enumerate(missing) if i < len(embeddings)}
+    embedder.embedding_cache.set_many(namespace, computed)  # type: ignore[union-attr]
+    computed_usage = {text: usages[i] for i, text in enumerate(missing) if i < len(usages)}
+
+    all_embeddings: List[List[float]] = []
+    all_usage: List[Optional[Dict]] = []
+    for text in texts:
+        if text in cached:
+            all_embeddings.append(cached[text])
+            all_usage.append(None)
+        else:
+            all_embeddings.append(computed.get(text, []))
+            all_usage.append(computed_usage.get(text))
+    return all_embeddings, all_usage
+
+
+def _cached_embeddings_batch(method: Callable) -> Callable:
+    @wraps(method)
+    def wrapper(self: Embedder, texts: List[str], *args: Any, **kwargs: Any):
+        # Batch implementations take a rate limiter slot for each provider request they send
+        if self.embedding_cache is None:
+            return method(self, texts, *args, **kwargs)
+        namespace, cached, missing = _split_batch(self, texts)
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        if missing:
+            embeddings, usages = method(self, missing, *args, **kwargs)
+        return _merge_batch(self, namespace, texts, cached, missing, embeddings, usages)
+
+    wrapper._uses_embedding_cache = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _async_cached_embeddings_batch(method: Callable) -> Callable:
+    @wraps(method)
+    async def wrapper(self: Embedder, texts: List[str], *args: Any, **kwargs: Any):
+        # Batch implementations take a rate limiter slot for each provider request they send
+        if self.embedding_cache is None:
+            return await method(self, texts, *args, **kwargs)
+        namespace, cached, missing = _split_batch(self, texts)
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        if missing:
+            embeddings, usages = await method(self, missing, *args, **kwargs)
+        return _merge_batch(self, namespace, texts, cached, missing, embeddings, usages)
+
+    wrapper._uses_embedding_cache = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+_CACHED_METHOD_WRAPPERS: Dict[str, Callable[[Callable], Callable]] = {
+    "get_embedding": _cached_embedding,
+    "get_embedding_and_usage": _cached_embedding_and_usage,
+    "async_get_embedding": _async_cached_embedding,
+    "async_get_embedding_and_usage": _async_cached_embedding_and_usage,
+    "get_embeddings_batch_and_usage": _cached_embeddings_batch,
+    "async_get_embeddings_batch_and_usage": _async_cached_embeddings_batch,
+}
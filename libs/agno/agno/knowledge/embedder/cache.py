@@ -0,0 +1,192 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from agno.utils.log import log_debug, log_warning
+
+CacheKey = Tuple[str, str]
+
+
+def hash_text(text: str) -> str:
+    """Return the content hash used to key a text in the embedding cache."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Content-addressed cache for embeddings, shared by all Embedder implementations.
+
+    Entries are keyed on (namespace, text hash), where the namespace identifies the embedder class,
+    model id, dimensions and any other setting that changes the vector. Lookups go through an
+    in-process LRU tier first, then an optional persistent SQLite tier.
+
+    Args:
+        max_entries: Maximum number of embeddings kept in the in-process LRU tier.
+        db_path: Optional path to a SQLite file used as the persistent tier. The file and its
+            parent directories are created if they do not exist.
+    """
+
+    def __init__(self, max_entries: int = 10_000, db_path: Optional[Union[str, Path]] = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.db_path = Path(db_path) if db_path is not None else None
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lru: "OrderedDict[CacheKey, List[float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+        if self.db_path is not None:
+            self._connection = self._open(self.db_path)
+
+    # --- Persistent tier ---
+
+    def _open(self, db_path: Path) -> sqlite3.Connection:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(db_path), check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "namespace TEXT NOT NULL, "
+            "text_hash TEXT NOT NULL, "
+            "embedding BLOB NOT NULL, "
+            "created_at INTEGER NOT NULL, "
+            "PRIMARY KEY (namespace, text_hash))"
+        )
+        connection.commit()
+        log_debug(f"Embedding cache using SQLite file: {db_path}")
+        return connection
+
+    @staticmethod
+    def _encode(embedding: List[float]) -> bytes:
+        return array("f", embedding).tobytes()
+
+    @staticmethod
+    def _decode(blob: bytes) -> List[float]:
+        values = array("f")
+        values.frombytes(blob)
+        return values.tolist()
+
+    def _read_persistent(self, keys: List[CacheKey]) -> Dict[CacheKey, List[float]]:
+        if self._connection is None or not keys:
+            return {}
+
+        found: Dict[CacheKey, List[float]] = {}
+        by_namespace: Dict[str, List[str]] = {}
+        for namespace, text_hash in keys:
+            by_namespace.setdefault(namespace, []).append(text_hash)
+
+        try:
+            for namespace, text_hashes in by_namespace.items():
+                # Stay well below SQLite's bound parameter limit
+                for i in range(0, len(text_hashes), 500):
+                    chunk = text_hashes[i : i + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._connection.execute(
+                        f"SELECT text_hash, embedding FROM embeddings WHERE namespace = ? AND text_hash IN ({placeholders})",
+                        [namespace, *chunk],
+                    ).fetchall()
+                    for text_hash, blob in rows:
+                        found[(namespace, text_hash)] = self._decode(blob)
+        except sqlite3.Error as e:
+            log_warning(f"Error reading from embedding cache: {e}")
+        return found
+
+    def _write_persistent(self, items: Dict[CacheKey, List[float]]) -> None:
+        if self._connection is None or not items:
+            return
+        now = int(time.time())
+        try:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (namespace, text_hash, embedding, created_at) VALUES (?, ?, ?, ?)",
+                [
+                    (namespace, text_hash, self._encode(embedding), now)
+                    for (namespace, text_hash), embedding in items.items()
+                ],
+            )
+            self._connection.commit()
+        except sqlite3.Error as e:
+            log_warning(f"Error writing to embedding cache: {e}")
+
+    # --- In-process tier ---
+
+    def _remember(self, key: CacheKey, embedding: List[float]) -> None:
+        self._lru[key] = embedding
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    # --- Public API ---
+
+    def get(self, namespace: str, text: str) -> Optional[List[float]]:
+        """Return the cached embedding for a text, or None on a miss."""
+        return self.get_many(namespace, [text]).get(text)
+
+    def get_many(self, namespace: str, texts: Iterable[str]) -> Dict[str, List[float]]:
+        """Return the cached embeddings for the given texts, keyed by text. Misses are omitted."""
+        keys_by_text = {text: (namespace, hash_text(text)) for text in texts}
+        found: Dict[str, List[float]] = {}
+
+        with self._lock:
+            missing: List[CacheKey] = []
+            for text, key in keys_by_text.items():
+                embedding = self._lru.get(key)
+                if embedding is not None:
+                    self._lru.move_to_end(key)
+                    found[text] = list(embedding)
+                else:
+                    missing.append(key)
+
+            if missing:
+                persisted = self._read_persistent(missing)
+                for text, key in keys_by_text.items():
+                    if key in persisted:
+                        self._remember(key, persisted[key])
+                        found[text] = list(persisted[key])
+
+            self.hits += len(found)
+            self.misses += len(keys_by_text) - len(found)
+
+        return found
+
+    def set(self, namespace: str, text: str, embedding: List[float]) -> None:
+        """Store the embedding for a text."""
+        self.set_many(namespace, {text: embedding})
+
+    def set_many(self, namespace: str, embeddings: Dict[str, List[float]]) -> None:
+        """Store embeddings keyed by text. Empty embeddings (failed calls) are never cached."""
+        items = {(namespace, hash_text(text)): list(embedding) for text, embedding in embeddings.items() if embedding}
+        if not items:
+            return
+        with self._lock:
+            for key, embedding in items.items():
+                self._remember(key, embedding)
+            self._write_persistent(items)
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._lru.clear()
+            if self._connection is not None:
+                try:
+                    self._connection.execute("DELETE FROM embeddings")
+                    self._connection.commit()
+                except sqlite3.Error as e:
+                    log_warning(f"Error clearing embedding cache: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __len__(self) -> int:
+        return len(self._lru)
@@ -1,7 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
 from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.embedder.micro_batch import MicroBatcher
+from agno.knowledge.local_models import get_model_key, local_model_registry
 from agno.utils.log import logger
 
 try:
@@ -24,9 +26,19 @@ class FastEmbedEmbedder(Embedder):
 
     id: str = "BAAI/bge-small-en-v1.5"
     dimensions: Optional[int] = 384
+    # Opt-in: embed concurrent async requests made within this window together, up to batch_size texts per call
+    micro_batch_wait_ms: Optional[float] = None
+    _micro_batcher: Optional[MicroBatcher] = field(default=None, init=False, repr=False)
+
+    def _get_model(self) -> TextEmbedding:
+        """Get the TextEmbedding model from the local model registry, loading it on first use."""
+        return local_model_registry.get(get_model_key("fastembed", self.id), lambda: TextEmbedding(model_name=self.id))
+
+    def warmup(self) -> None:
+        self._get_model()
 
     def get_embedding(self, text: str) -> List[float]:
-        model = TextEmbedding(model_name=self.id)
+        model = self._get_model()
         embeddings = model.embed(text)
         embedding_list = list(embeddings)[0]
         if isinstance(embedding_list, np.ndarray):
@@ -45,10 +57,24 @@ class FastEmbedEmbedder(Embedder):
 
         return embedding, usage
 
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts with a single call to the model."""
+        return [np.asarray(embedding).tolist() for embedding in self._get_model().embed(texts, batch_size=len(texts))]
+
+    def _get_micro_batcher(self) -> MicroBatcher:
+        if self._micro_batcher is None:
+            self._micro_batcher = MicroBatcher(
+                self._embed_batch, max_batch_size=self.batch_size, max_wait_ms=self.micro_batch_wait_ms or 0
+            )
+        return self._micro_batcher
+
     async def async_get_embedding(self, text: str) -> List[float]:
         """Async version using thread executor for CPU-bound operations."""
         import asyncio
 
+        if self.micro_batch_wait_ms is not None:
+            return await self._get_micro_batcher().embed(text)
+
         loop = asyncio.get_event_loop()
         # Run the CPU-bound operation in a thread executor
         return await loop.run_in_executor(None, self.get_embedding, text)
@@ -57,6 +83,9 @@ class FastEmbedEmbedder(Embedder):
         """Async version using thread executor for CPU-bound operations."""
         import asyncio
 
+        if self.micro_batch_wait_ms is not None:
+            return await self._get_micro_batcher().embed(text), None
+
         loop = asyncio.get_event_loop()
         # Run the CPU-bound operation in a thread executor
         return await loop.run_in_executor(None, self.get_embedding_and_usage, text)
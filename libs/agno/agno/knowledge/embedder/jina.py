@@ -139,6 +139,65 @@ class JinaEmbedder(Embedder):
                 response.raise_for_status()
                 return await response.json()
 
+    def _batch_response(self, texts: List[str]) -> Dict[str, Any]:
+        """Batch version of _response."""
+        data = {
+            "model": self.id,
+            "late_chunking": self.late_chunking,
+            "dimensions": self.dimensions,
+            "embedding_type": self.embedding_type,
+            "input": texts,  # Jina API expects a list of texts for batch processing
+        }
+        if self.user is not None:
+            data["user"] = self.user
+        if self.request_params:
+            data.update(self.request_params)
+
+        response = requests.post(self.base_url, headers=self._get_headers(), json=data, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings and usage for multiple texts in batches.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        all_embeddings = []
+        all_usage = []
+        logger.info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size}")
+
+        for i in range(0, len(texts), self.batch_size):
+            batch_texts = texts[i : i + self.batch_size]
+
+            try:
+                with self._rate_limited(batch_texts):
+                    result = self._batch_response(batch_texts)
+                batch_embeddings = [data["embedding"] for data in result["data"]]
+                all_embeddings.extend(batch_embeddings)
+
+                # For each embedding in the batch, add the same usage information
+                usage_dict = result.get("usage")
+                all_usage.extend([usage_dict] * len(batch_embeddings))
+            except Exception as e:
+                logger.warning(f"Error in batch embedding: {e}")
+                # Fallback to individual calls for this batch
+                for text in batch_texts:
+                    try:
+                        embedding, usage = self.get_embedding_and_usage(text)
+                        all_embeddings.append(embedding)
+                        all_usage.append(usage)
+                    except Exception as e2:
+                        logger.warning(f"Error in individual embedding fallback: {e2}")
+                        all_embeddings.append([])
+                        all_usage.append(None)
+
+        return all_embeddings, all_usage
+
     async def async_get_embeddings_batch_and_usage(
         self, texts: List[str]
     ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
@@ -159,7 +218,8 @@ class JinaEmbedder(Embedder):
             batch_texts = texts[i : i + self.batch_size]
 
             try:
-                result = await self._async_batch_response(batch_texts)
+                async with self._async_rate_limited(batch_texts):
+                    result = await self._async_batch_response(batch_texts)
                 batch_embeddings = [data["embedding"] for data in result["data"]]
                 all_embeddings.extend(batch_embeddings)
 
@@ -0,0 +1,78 @@
+import asyncio
+from typing import Callable, List, Set, Tuple
+from weakref import WeakKeyDictionary
+
+from agno.utils.log import log_debug
+
+PendingRequest = Tuple[str, "asyncio.Future[List[float]]"]
+
+
+class MicroBatcher:
+    """Groups concurrent embedding requests into a single batch call.
+
+    Requests made within `max_wait_ms` of the first pending request are embedded together with one call to
+    `embed_batch`, run in a thread. A batch is started right away once it has `max_batch_size` requests.
+    Only requests made on the same event loop are batched together.
+
+    Args:
+        embed_batch: Embeds a list of texts, returning one embedding per text.
+        max_batch_size: Maximum number of texts in a batch.
+        max_wait_ms: Maximum time a request waits for other requests to be batched with.
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[[List[str]], List[List[float]]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        self.embed_batch = embed_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max_wait_ms
+        self._pending: "WeakKeyDictionary[asyncio.AbstractEventLoop, List[PendingRequest]]" = WeakKeyDictionary()
+        self._timers: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.TimerHandle]" = WeakKeyDictionary()
+        # Keep a reference to running batches so they are not garbage collected
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def embed(self, text: str) -> List[float]:
+        """Embed a text in the next batch."""
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[List[float]]" = loop.create_future()
+        pending = self._pending.setdefault(loop, [])
+        pending.append((text, future))
+
+        if len(pending) >= self.max_batch_size:
+            self._flush(loop)
+        elif len(pending) == 1:
+            self._timers[loop] = loop.call_later(self.max_wait_ms / 1000, self._flush, loop)
+        return await future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start embedding the pending requests of a loop."""
+        timer = self._timers.pop(loop, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(loop, None)
+        if not batch:
+            return
+        task = loop.create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[PendingRequest]) -> None:
+        texts = [text for text, _ in batch]
+        log_debug(f"Embedding a micro-batch of {len(texts)} texts")
+        try:
+            embeddings = await asyncio.to_thread(self.embed_batch, texts)
+            if len(embeddings) != len(texts):
+                raise ValueError(f"Expected {len(texts)} embeddings, got {len(embeddings)}")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), embedding in zip(batch, embeddings):
+            # Requests cancelled while waiting for the batch are skipped
+            if not future.done():
+                future.set_result(embedding)
@@ -138,6 +138,64 @@ class MistralEmbedder(Embedder):
             log_warning(f"Error getting embedding and usage: {e}")
             return [], {}
 
+    def get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict[str, Any]]]]:
+        """
+        Get embeddings and usage for multiple texts in batches.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        all_embeddings: List[List[float]] = []
+        all_usage: List[Optional[Dict[str, Any]]] = []
+        log_info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size}")
+
+        for i in range(0, len(texts), self.batch_size):
+            batch_texts = texts[i : i + self.batch_size]
+
+            _request_params: Dict[str, Any] = {
+                "inputs": batch_texts,  # Mistral API expects a list for batch processing
+                "model": self.id,
+            }
+            if self.request_params:
+                _request_params.update(self.request_params)
+
+            try:
+                with self._rate_limited(batch_texts):
+                    response: EmbeddingResponse = self.client.embeddings.create(**_request_params)
+
+                # Extract embeddings from batch response
+                if response.data:
+                    batch_embeddings = [data.embedding for data in response.data if data.embedding]
+                    all_embeddings.extend(batch_embeddings)
+                else:
+                    # If no embeddings, add empty lists for each text in batch
+                    all_embeddings.extend([[] for _ in batch_texts])
+
+                # Extract usage information
+                usage_dict = response.usage.model_dump() if response.usage else None
+                # Add same usage info for each embedding in the batch
+                all_usage.extend([usage_dict] * len(batch_texts))
+
+            except Exception as e:
+                log_warning(f"Error in batch embedding: {e}")
+                # Fallback to individual calls for this batch
+                for text in batch_texts:
+                    try:
+                        embedding, usage = self.get_embedding_and_usage(text)
+                        all_embeddings.append(embedding)
+                        all_usage.append(usage)
+                    except Exception as e2:
+                        log_warning(f"Error in individual embedding fallback: {e2}")
+                        all_embeddings.append([])
+                        all_usage.append(None)
+
+        return all_embeddings, all_usage
+
     async def async_get_embeddings_batch_and_usage(
         self, texts: List[str]
     ) -> Tuple[List[List[float]], List[Optional[Dict[str, Any]]]]:
@@ -165,17 +223,18 @@ class MistralEmbedder(Embedder):
                 _request_params.update(self.request_params)
 
             try:
-                # Check if the client has an async version of embeddings.create
-                if hasattr(self.client.embeddings, "create_async"):
-                    response: EmbeddingResponse = await self.client.embeddings.create_async(**_request_params)
-                else:
-                    # Fallback to running sync method in thread executor
-                    import asyncio
+                async with self._async_rate_limited(batch_texts):
+                    # Check if the client has an async version of embeddings.create
+                    if hasattr(self.client.embeddings, "create_async"):
+                        response: EmbeddingResponse = await self.client.embeddings.create_async(**_request_params)
+                    else:
+                        # Fallback to running sync method in thread executor
+                        import asyncio
 
-                    loop = asyncio.get_running_loop()
-                    response: EmbeddingResponse = await loop.run_in_executor(  # type: ignore
-                        None, lambda: self.client.embeddings.create(**_request_params)
-                    )
+                        loop = asyncio.get_running_loop()
+                        response: EmbeddingResponse = await loop.run_in_executor(  # type: ignore
+                            None, lambda: self.client.embeddings.create(**_request_params)
+                        )
 
                 # Extract embeddings from batch response
                 if response.data:
@@ -1,7 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Union
 
 from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.embedder.micro_batch import MicroBatcher
+from agno.knowledge.local_models import get_model_key, local_model_registry
 from agno.utils.log import logger
 
 try:
@@ -24,16 +26,28 @@ class SentenceTransformerEmbedder(Embedder):
     sentence_transformer_client: Optional[SentenceTransformer] = None
     prompt: Optional[str] = None
     normalize_embeddings: bool = False
+    # Opt-in: embed concurrent async requests made within this window together, up to batch_size texts per encode()
+    micro_batch_wait_ms: Optional[float] = None
+    _micro_batcher: Optional[MicroBatcher] = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
-        # Initialize the SentenceTransformer model eagerly to avoid race conditions in async contexts
-        if self.sentence_transformer_client is None:
-            self.sentence_transformer_client = SentenceTransformer(model_name_or_path=self.id)
+        # Load the SentenceTransformer model eagerly to avoid race conditions in async contexts
+        self.warmup()
+
+    def _get_model(self) -> SentenceTransformer:
+        """The given client, or the model shared through the local model registry."""
+        if self.sentence_transformer_client is not None:
+            return self.sentence_transformer_client
+        return local_model_registry.get(
+            get_model_key("sentence-transformers", self.id),
+            lambda: SentenceTransformer(model_name_or_path=self.id),
+        )
+
+    def warmup(self) -> None:
+        self._get_model()
 
     def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
-        if self.sentence_transformer_client is None:
-            raise RuntimeError("SentenceTransformer model not initialized")
-        model = self.sentence_transformer_client
+        model = self._get_model()
         embedding = model.encode(text, prompt=self.prompt, normalize_embeddings=self.normalize_embeddings)
         try:
             if isinstance(embedding, np.ndarray):
@@ -47,10 +61,42 @@ class SentenceTransformerEmbedder(Embedder):
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
 
+    def _encode_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts with a single encode() call."""
+        embeddings = self._get_model().encode(
+            texts,
+            prompt=self.prompt,
+            normalize_embeddings=self.normalize_embeddings,
+            batch_size=len(texts),
+        )
+        return [embedding.tolist() for embedding in np.asarray(embeddings)]
+
+    def _get_micro_batcher(self) -> MicroBatcher:
+        if self._micro_batcher is None:
+            self._micro_batcher = MicroBatcher(
+                self._encode_batch, max_batch_size=self.batch_size, max_wait_ms=self.micro_batch_wait_ms or 0
+            )
+        return self._micro_batcher
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed multiple texts with one encode() call per batch."""
+        all_embeddings: List[List[float]] = []
+        for i in range(0, len(texts), self.batch_size):
+            batch_texts = texts[i : i + self.batch_size]
+            try:
+                all_embeddings.extend(self._encode_batch(batch_texts))
+            except Exception as e:
+                logger.warning(f"Error in batch embedding: {e}")
+                all_embeddings.extend(self.get_embedding(text) for text in batch_texts)
+        return all_embeddings, [None] * len(all_embeddings)
+
     async def async_get_embedding(self, text: Union[str, List[str]]) -> List[float]:
         """Async version using thread executor for CPU-bound operations."""
         import asyncio
 
+        if self.micro_batch_wait_ms is not None and isinstance(text, str):
+            return await self._get_micro_batcher().embed(text)
+
         loop = asyncio.get_event_loop()
         # Run the CPU-bound operation in a thread executor
         return await loop.run_in_executor(None, self.get_embedding, text)
@@ -59,5 +105,8 @@ class SentenceTransformerEmbedder(Embedder):
         """Async version using thread executor for CPU-bound operations."""
         import asyncio
 
+        if self.micro_batch_wait_ms is not None and isinstance(text, str):
+            return await self._get_micro_batcher().embed(text), None
+
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, self.get_embedding_and_usage, text)
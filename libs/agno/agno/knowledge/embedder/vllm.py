@@ -210,6 +210,60 @@ class VLLMEmbedder(Embedder):
                 logger.warning(f"Error in async local embedding: {e}")
                 return [], None
 
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings and usage for multiple texts in batches.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        all_embeddings: List[List[float]] = []
+        all_usage: List[Optional[Dict]] = []
+        logger.info(f"Getting embeddings for {len(texts)} texts in batches of {self.batch_size}")
+
+        for i in range(0, len(texts), self.batch_size):
+            batch_texts = texts[i : i + self.batch_size]
+
+            try:
+                if self.is_remote:
+                    # Remote mode: use batch API
+                    req: Dict[str, Any] = {
+                        "input": batch_texts,
+                        "model": self.id,
+                    }
+                    if self.request_params:
+                        req.update(self.request_params)
+                    with self._rate_limited(batch_texts):
+                        response: "CreateEmbeddingResponse" = self._get_remote_client().embeddings.create(**req)
+                    batch_embeddings = [data.embedding for data in response.data]
+                    all_embeddings.extend(batch_embeddings)
+
+                    # For each embedding in the batch, add the same usage information
+                    usage_dict = response.usage.model_dump() if response.usage else None
+                    all_usage.extend([usage_dict] * len(batch_embeddings))
+                else:
+                    # Local mode: embed the whole batch in a single VLLM call
+                    outputs = self._get_vllm_client().embed(batch_texts)
+                    for output in outputs:
+                        if output and hasattr(output, "outputs") and hasattr(output.outputs, "embedding"):
+                            all_embeddings.append(output.outputs.embedding)
+                        else:
+                            all_embeddings.append([])
+                        # Local VLLM doesn't provide usage information
+                        all_usage.append(None)
+
+            except Exception as e:
+                logger.warning(f"Error in batch embedding: {e}")
+                # Fallback: add empty results for failed batch
+                for _ in batch_texts:
+                    all_embeddings.append([])
+                    all_usage.append(None)
+
+        return all_embeddings, all_usage
+
     async def async_get_embeddings_batch_and_usage(
         self, texts: List[str]
     ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
@@ -238,7 +292,10 @@ class VLLMEmbedder(Embedder):
                     }
                     if self.request_params:
                         req.update(self.request_params)
-                    response: "CreateEmbeddingResponse" = await self._get_async_remote_client().embeddings.create(**req)
+                    async with self._async_rate_limited(batch_texts):
+                        response: "CreateEmbeddingResponse" = await self._get_async_remote_client().embeddings.create(
+                            **req
+                        )
                     batch_embeddings = [data.embedding for data in response.data]
                     all_embeddings.extend(batch_embeddings)
 
@@ -115,6 +115,54 @@ class VoyageAIEmbedder(Embedder):
             logger.warning(f"Error getting embedding and usage: {e}")
             return [], None
 
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """
+        Get embeddings and usage for multiple texts in batches.
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            Tuple of (List of embedding vectors, List of usage dictionaries)
+        """
+        all_embeddings: List[List[float]] = []
+        all_usage: List[Optional[Dict]] = []
+        logger.info(f"Getting embeddings and usage for {len(texts)} texts in batches of {self.batch_size}")
+
+        for i in range(0, len(texts), self.batch_size):
+            batch_texts = texts[i : i + self.batch_size]
+
+            req: Dict[str, Any] = {
+                "texts": batch_texts,
+                "model": self.id,
+            }
+            if self.request_params:
+                req.update(self.request_params)
+
+            try:
+                with self._rate_limited(batch_texts):
+                    response: EmbeddingsObject = self.client.embed(**req)
+                batch_embeddings = [[float(x) for x in emb] for emb in response.embeddings]
+                all_embeddings.extend(batch_embeddings)
+
+                # For each embedding in the batch, add the same usage information
+                usage_dict = {"total_tokens": response.total_tokens}
+                all_usage.extend([usage_dict] * len(batch_embeddings))
+            except Exception as e:
+                logger.warning(f"Error in batch embedding: {e}")
+                # Fallback to individual calls for this batch
+                for text in batch_texts:
+                    try:
+                        embedding, usage = self.get_embedding_and_usage(text)
+                        all_embeddings.append(embedding)
+                        all_usage.append(usage)
+                    except Exception as e2:
+                        logger.warning(f"Error in individual embedding fallback: {e2}")
+                        all_embeddings.append([])
+                        all_usage.append(None)
+
+        return all_embeddings, all_usage
+
     async def async_get_embeddings_batch_and_usage(
         self, texts: List[str]
     ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
@@ -142,7 +190,8 @@ class VoyageAIEmbedder(Embedder):
                 req.update(self.request_params)
 
             try:
-                response: EmbeddingsObject = await self.aclient.embed(**req)
+                async with self._async_rate_limited(batch_texts):
+                    response: EmbeddingsObject = await self.aclient.embed(**req)
                 batch_embeddings = [[float(x) for x in emb] for emb in response.embeddings]
                 all_embeddings.extend(batch_embeddings)
 
@@ -0,0 +1,89 @@
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Key under which the fingerprint is kept in the contents db row metadata
+FINGERPRINT_METADATA_KEY = "_agno_fingerprint"
+
+# Document metadata key identifying a chunk, so a single stale chunk can be deleted from the vector db
+CHUNK_DIGEST_METADATA_KEY = "chunk_digest"
+
+_READ_BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass
+class ContentFingerprint:
+    """Identifies the exact version of a file that was indexed, and the chunks it produced.
+
+    Stored in the contents db so an incremental insert can tell added, changed and unchanged files apart
+    without reading them, and only re-embed the chunks that changed.
+    """
+
+    path: str
+    size: int
+    mtime_ns: int
+    digest: str
+    metadata_digest: Optional[str] = None
+    chunks: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> Optional["ContentFingerprint"]:
+        if not isinstance(data, dict):
+            return None
+        try:
+            return cls(
+                path=data["path"],
+                size=data["size"],
+                mtime_ns=data["mtime_ns"],
+                digest=data["digest"],
+                metadata_digest=data.get("metadata_digest"),
+                chunks=list(data.get("chunks") or []),
+            )
+        except KeyError:
+            return None
+
+    def same_source(self, other: Optional["ContentFingerprint"]) -> bool:
+        """Whether two fingerprints describe the same file bytes indexed with the same metadata."""
+        return other is not None and self.digest == other.digest and self.metadata_digest == other.metadata_digest
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_READ_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def metadata_digest(metadata: Optional[Dict[str, Any]]) -> Optional[str]:
+    if not metadata:
+        return None
+    return hashlib.sha256(json.dumps(metadata, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def fingerprint_file(
+    path: Path, metadata: Optional[Dict[str, Any]] = None, previous: Optional[ContentFingerprint] = None
+) -> ContentFingerprint:
+    """Fingerprint a file. The digest of the previous fingerprint is reused when size and mtime are unchanged."""
+    stat = path.stat()
+    if previous is not None and previous.size == stat.st_size and previous.mtime_ns == stat.st_mtime_ns:
+        digest = previous.digest
+    else:
+        digest = file_digest(path)
+    return ContentFingerprint(
+        path=str(path.resolve()),
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        digest=digest,
+        metadata_digest=metadata_digest(metadata),
+    )
+
+
+def chunk_digest(content_id: str, text: str) -> str:
+    """Digest of a chunk, scoped to its content so identical chunks in different files stay distinct."""
+    return hashlib.sha256(f"{content_id}:{text}".encode()).hexdigest()
@@ -0,0 +1,191 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Iterator, Optional, Set
+
+from agno.knowledge.content import Content, ContentStatus
+from agno.utils.log import log_warning
+
+
+@dataclass
+class IngestionPipeline:
+    """Bounded-concurrency settings for bulk ingestion with Knowledge.insert_many / ainsert_many.
+
+    Content items are processed concurrently, up to `max_concurrency` at a time. Within each item,
+    the read stage (fetching, parsing and chunking) and the write stage (embedding and vector db upsert)
+    are throttled independently, so a slow stage only limits itself instead of the whole backfill.
+
+    Args:
+        max_concurrency: Maximum number of content items in flight.
+        read_concurrency: Maximum number of concurrent reads. Defaults to max_concurrency.
+        write_concurrency: Maximum number of concurrent embed + vector db writes. Defaults to max_concurrency.
+        on_progress: Optional callback invoked once per Content when it reaches COMPLETED or FAILED.
+    """
+
+    max_concurrency: int = 4
+    read_concurrency: Optional[int] = None
+    write_concurrency: Optional[int] = None
+    on_progress: Optional[Callable[[Content], None]] = None
+
+    def __post_init__(self):
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        for stage_limit in (self.read_concurrency, self.write_concurrency):
+            if stage_limit is not None and stage_limit < 1:
+                raise ValueError("Stage concurrency limits must be at least 1")
+
+    @property
+    def read_limit(self) -> int:
+        return self.read_concurrency or self.max_concurrency
+
+    @property
+    def write_limit(self) -> int:
+        return self.write_concurrency or self.max_concurrency
+
+
+@dataclass
+class IngestionProgress:
+    """Running totals for a bulk ingestion."""
+
+    completed: int = 0
+    failed: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.completed + self.failed
+
+
+@dataclass
+class IngestionRun:
+    """Per-call state shared by every worker of one bulk ingestion."""
+
+    pipeline: IngestionPipeline
+    progress: IngestionProgress = field(default_factory=IngestionProgress)
+    _read_semaphore: Optional[threading.Semaphore] = None
+    _write_semaphore: Optional[threading.Semaphore] = None
+    _async_read_semaphore: Optional[asyncio.Semaphore] = None
+    _async_write_semaphore: Optional[asyncio.Semaphore] = None
+    _reported: Set[str] = field(default_factory=set)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def __post_init__(self):
+        self._read_semaphore = threading.Semaphore(self.pipeline.read_limit)
+        self._write_semaphore = threading.Semaphore(self.pipeline.write_limit)
+
+    def _ensure_async_semaphores(self) -> None:
+        # asyncio primitives must be created inside the running event loop
+        if self._async_read_semaphore is None:
+            self._async_read_semaphore = asyncio.Semaphore(self.pipeline.read_limit)
+        if self._async_write_semaphore is None:
+            self._async_write_semaphore = asyncio.Semaphore(self.pipeline.write_limit)
+
+    @contextmanager
+    def read_stage(self) -> Iterator[None]:
+        with self._read_semaphore:  # type: ignore[union-attr]
+            yield
+
+    @contextmanager
+    def write_stage(self) -> Iterator[None]:
+        with self._write_semaphore:  # type: ignore[union-attr]
+            yield
+
+    @asynccontextmanager
+    async def aread_stage(self) -> AsyncIterator[None]:
+        self._ensure_async_semaphores()
+        async with self._async_read_semaphore:  # type: ignore[union-attr]
+            yield
+
+    @asynccontextmanager
+    async def awrite_stage(self) -> AsyncIterator[None]:
+        self._ensure_async_semaphores()
+        async with self._async_write_semaphore:  # type: ignore[union-attr]
+            yield
+
+    def report(self, content: Content) -> None:
+        """Record a terminal ContentStatus for a Content item and notify the progress callback once."""
+        if content.status not in (ContentStatus.COMPLETED, ContentStatus.FAILED):
+            return
+
+        key = content.id or str(id(content))
+        with self._lock:
+            if key in self._reported:
+                return
+            self._reported.add(key)
+            if content.status == ContentStatus.COMPLETED:
+                self.progress.completed += 1
+            else:
+                self.progress.failed += 1
+
+        if self.pipeline.on_progress is not None:
+            try:
+                self.pipeline.on_progress(content)
+            except Exception as e:
+                log_warning(f"Ingestion progress callback failed: {e}")
+
+
+# The ingestion run active in the current context. Set by insert_many / ainsert_many and
+# inherited by worker threads (via copy_context) and asyncio tasks.
+_current_ingestion_run: ContextVar[Optional[IngestionRun]] = ContextVar("agno_ingestion_run", default=None)
+
+
+def get_current_ingestion_run() -> Optional[IngestionRun]:
+    return _current_ingestion_run.get()
+
+
+@contextmanager
+def ingestion_run_context(run: IngestionRun) -> Iterator[IngestionRun]:
+    token = _current_ingestion_run.set(run)
+    try:
+        yield run
+    finally:
+        _current_ingestion_run.reset(token)
+
+
+@contextmanager
+def read_stage() -> Iterator[None]:
+    """Throttle a read if a bulk ingestion is active, otherwise a no-op."""
+    run = _current_ingestion_run.get()
+    if run is None:
+        yield
+        return
+    with run.read_stage():
+        yield
+
+
+@contextmanager
+def write_stage() -> Iterator[None]:
+    """Throttle an embed + vector db write if a bulk ingestion is active, otherwise a no-op."""
+    run = _current_ingestion_run.get()
+    if run is None:
+        yield
+        return
+    with run.write_stage():
+        yield
+
+
+@asynccontextmanager
+async def aread_stage() -> AsyncIterator[None]:
+    run = _current_ingestion_run.get()
+    if run is None:
+        yield
+        return
+    async with run.aread_stage():
+        yield
+
+
+@asynccontextmanager
+async def awrite_stage() -> AsyncIterator[None]:
+    run = _current_ingestion_run.get()
+    if run is None:
+        yield
+        return
+    async with run.awrite_stage():
+        yield
+
+
+def report_content_status(content: Content) -> None:
+    run = _current_ingestion_run.get()
+    if run is not None:
+        run.report(content)
@@ -7,7 +7,7 @@ from enum import Enum
 from io import BytesIO
 from os.path import basename
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast, overload
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple, Union, cast, overload
 
 import httpx
 from httpx import AsyncClient
@@ -17,6 +17,23 @@ from agno.db.schemas.knowledge import KnowledgeRow
 from agno.filters import FilterExpr
 from agno.knowledge.content import Content, ContentAuth, ContentStatus, FileData
 from agno.knowledge.document import Document
+from agno.knowledge.fingerprint import (
+    CHUNK_DIGEST_METADATA_KEY,
+    FINGERPRINT_METADATA_KEY,
+    ContentFingerprint,
+    chunk_digest,
+    fingerprint_file,
+)
+from agno.knowledge.ingestion import (
+    IngestionPipeline,
+    IngestionRun,
+    aread_stage,
+    awrite_stage,
+    ingestion_run_context,
+    read_stage,
+    report_content_status,
+    write_stage,
+)
 from agno.knowledge.reader import Reader, ReaderFactory
 from agno.knowledge.remote_content.config import (
     AzureBlobConfig,
@@ -86,6 +103,7 @@ class Knowledge:
         exclude: Optional[List[str]] = None,
         upsert: bool = True,
         skip_if_exists: bool = False,
+        incremental: bool = False,
         reader: Optional[Reader] = None,
         auth: Optional[ContentAuth] = None,
     ) -> None: ...
@@ -109,6 +127,7 @@ class Knowledge:
         upsert: bool = True,
         skip_if_exists: bool = False,
         auth: Optional[ContentAuth] = None,
+        incremental: bool = False,
     ) -> None:
         """
         Synchronously insert content into the knowledge base.
@@ -127,6 +146,9 @@ class Knowledge:
             exclude: Optional list of file patterns to exclude
             upsert: Whether to update existing content if it already exists (only used when skip_if_exists=False)
             skip_if_exists: Whether to skip inserting content if it already exists (default: False)
+            incremental: Sync a path against the fingerprints stored in the contents db. Unchanged files are
+                skipped, changed files only re-embed the chunks that changed, and files that were removed from
+                a directory are deleted from the knowledge base. Requires a contents db.
         """
         # Validation: At least one of the parameters must be provided
         if all(argument is None for argument in [path, url, text_content, topics, remote_content]):
@@ -155,7 +177,7 @@ class Knowledge:
         content.content_hash = self._build_content_hash(content)
         content.id = generate_id(content.content_hash)
 
-        self._load_content(content, upsert, skip_if_exists, include, exclude)
+        self._load_content(content, upsert, skip_if_exists, include, exclude, incremental=incremental)
 
     @overload
     async def ainsert(
@@ -169,6 +191,7 @@ class Knowledge:
         exclude: Optional[List[str]] = None,
         upsert: bool = True,
         skip_if_exists: bool = False,
+        incremental: bool = False,
         reader: Optional[Reader] = None,
         auth: Optional[ContentAuth] = None,
     ) -> None: ...
@@ -192,6 +215,7 @@ class Knowledge:
         upsert: bool = True,
         skip_if_exists: bool = False,
         auth: Optional[ContentAuth] = None,
+        incremental: bool = False,
     ) -> None:
         # Validation: At least one of the parameters must be provided
         if all(argument is None for argument in [path, url, text_content, topics, remote_content]):
@@ -220,7 +244,7 @@ class Knowledge:
         content.content_hash = self._build_content_hash(content)
         content.id = generate_id(content.content_hash)
 
-        await self._aload_content(content, upsert, skip_if_exists, include, exclude)
+        await self._aload_content(content, upsert, skip_if_exists, include, exclude, incremental=incremental)
 
     # --- Insert Many ---
     @overload
@@ -241,115 +265,38 @@ class Knowledge:
         upsert: bool = True,
         skip_if_exists: bool = False,
         remote_content: Optional[RemoteContent] = None,
+        pipeline: Optional[IngestionPipeline] = None,
     ) -> None: ...
 
     async def ainsert_many(self, *args, **kwargs) -> None:
-        if args and isinstance(args[0], list):
-            arguments = args[0]
-            upsert = kwargs.get("upsert", True)
-            skip_if_exists = kwargs.get("skip_if_exists", False)
-            for argument in arguments:
-                await self.ainsert(
-                    name=argument.get("name"),
-                    description=argument.get("description"),
-                    path=argument.get("path"),
-                    url=argument.get("url"),
-                    metadata=argument.get("metadata"),
-                    topics=argument.get("topics"),
-                    text_content=argument.get("text_content"),
-                    reader=argument.get("reader"),
-                    include=argument.get("include"),
-                    exclude=argument.get("exclude"),
-                    upsert=argument.get("upsert", upsert),
-                    skip_if_exists=argument.get("skip_if_exists", skip_if_exists),
-                    remote_content=argument.get("remote_content", None),
-                    auth=argument.get("auth"),
-                )
+        """
+        Asynchronously insert multiple content items into the knowledge base.
 
-        elif kwargs:
-            name = kwargs.get("name", [])
-            metadata = kwargs.get("metadata", {})
-            description = kwargs.get("description", [])
-            topics = kwargs.get("topics", [])
-            reader = kwargs.get("reader", None)
-            paths = kwargs.get("paths", [])
-            urls = kwargs.get("urls", [])
-            text_contents = kwargs.get("text_contents", [])
-            include = kwargs.get("include")
-            exclude = kwargs.get("exclude")
-            upsert = kwargs.get("upsert", True)
-            skip_if_exists = kwargs.get("skip_if_exists", False)
-            remote_content = kwargs.get("remote_content", None)
-            auth = kwargs.get("auth")
-            for path in paths:
-                await self.ainsert(
-                    name=name,
-                    description=description,
-                    path=path,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
-            for url in urls:
-                await self.ainsert(
-                    name=name,
-                    description=description,
-                    url=url,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
-            for i, text_content in enumerate(text_contents):
-                content_name = f"{name}_{i}" if name else f"text_content_{i}"
-                log_debug(f"Adding text content: {content_name}")
-                await self.ainsert(
-                    name=content_name,
-                    description=description,
-                    text_content=text_content,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
-            if topics:
-                await self.ainsert(
-                    name=name,
-                    description=description,
-                    topics=topics,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
+        Accepts the same arguments as insert_many(). Pass `pipeline=IngestionPipeline(...)` to process
+        the items concurrently with bounded read and write stages instead of one at a time.
+        """
+        pipeline: Optional[IngestionPipeline] = kwargs.pop("pipeline", None)
+        insert_calls = self._build_insert_many_calls(args, kwargs)
 
-            if remote_content:
-                await self.ainsert(
-                    name=name,
-                    metadata=metadata,
-                    description=description,
-                    remote_content=remote_content,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
-                )
+        if pipeline is None:
+            for insert_kwargs in insert_calls:
+                await self.ainsert(**insert_kwargs)
+            return
 
-        else:
-            raise ValueError("Invalid usage of insert_many.")
+        run = IngestionRun(pipeline=pipeline)
+        item_semaphore = asyncio.Semaphore(pipeline.max_concurrency)
+
+        async def insert_item(insert_kwargs: Dict[str, Any]) -> None:
+            async with item_semaphore:
+                await self.ainsert(**insert_kwargs)
+
+        with ingestion_run_context(run):
+            # Tasks copy the current context, so every item sees the active ingestion run
+            results = await asyncio.gather(
+                *[insert_item(insert_kwargs) for insert_kwargs in insert_calls], return_exceptions=True
+            )
+
+        self._raise_first_ingestion_error(results, run)
 
     @overload
     def insert_many(self, contents: List[ContentDict]) -> None: ...
@@ -369,6 +316,7 @@ class Knowledge:
         upsert: bool = True,
         skip_if_exists: bool = False,
         remote_content: Optional[RemoteContent] = None,
+        pipeline: Optional[IngestionPipeline] = None,
     ) -> None: ...
 
     def insert_many(self, *args, **kwargs) -> None:
@@ -392,27 +340,65 @@ class Knowledge:
             upsert: Whether to update existing content if it already exists (only used when skip_if_exists=False)
             skip_if_exists: Whether to skip inserting content if it already exists (default: True)
             remote_content: Optional remote content (S3, GCS, etc.) to insert
+            pipeline: Optional IngestionPipeline to insert the items concurrently with bounded read and
+                write stages. When not provided, items are inserted one at a time.
         """
+        pipeline: Optional[IngestionPipeline] = kwargs.pop("pipeline", None)
+        insert_calls = self._build_insert_many_calls(args, kwargs)
+
+        if pipeline is None:
+            for insert_kwargs in insert_calls:
+                self.insert(**insert_kwargs)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+        from contextvars import copy_context
+
+        run = IngestionRun(pipeline=pipeline)
+
+        def insert_item(insert_kwargs: Dict[str, Any]) -> None:
+            self.insert(**insert_kwargs)
+
+        with ingestion_run_context(run):
+            with ThreadPoolExecutor(max_workers=pipeline.max_concurrency, thread_name_prefix="agno-ingest") as executor:
+                # Use copy_context().run so worker threads see the active ingestion run
+                futures = [
+                    executor.submit(copy_context().run, insert_item, insert_kwargs) for insert_kwargs in insert_calls
+                ]
+                results: List[Any] = []
+                for future in futures:
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        results.append(e)
+
+        self._raise_first_ingestion_error(results, run)
+
+    def _build_insert_many_calls(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Expand the arguments of insert_many() / ainsert_many() into one set of insert() kwargs per item."""
+        insert_calls: List[Dict[str, Any]] = []
         if args and isinstance(args[0], list):
             arguments = args[0]
             upsert = kwargs.get("upsert", True)
             skip_if_exists = kwargs.get("skip_if_exists", False)
             for argument in arguments:
-                self.insert(
-                    name=argument.get("name"),
-                    description=argument.get("description"),
-                    path=argument.get("path"),
-                    url=argument.get("url"),
-                    metadata=argument.get("metadata"),
-                    topics=argument.get("topics"),
-                    text_content=argument.get("text_content"),
-                    reader=argument.get("reader"),
-                    include=argument.get("include"),
-                    exclude=argument.get("exclude"),
-                    upsert=argument.get("upsert", upsert),
-                    skip_if_exists=argument.get("skip_if_exists", skip_if_exists),
-                    remote_content=argument.get("remote_content", None),
-                    auth=argument.get("auth"),
+                insert_calls.append(
+                    dict(
+                        name=argument.get("name"),
+                        description=argument.get("description"),
+                        path=argument.get("path"),
+                        url=argument.get("url"),
+                        metadata=argument.get("metadata"),
+                        topics=argument.get("topics"),
+                        text_content=argument.get("text_content"),
+                        reader=argument.get("reader"),
+                        include=argument.get("include"),
+                        exclude=argument.get("exclude"),
+                        upsert=argument.get("upsert", upsert),
+                        skip_if_exists=argument.get("skip_if_exists", skip_if_exists),
+                        remote_content=argument.get("remote_content", None),
+                        auth=argument.get("auth"),
+                    )
                 )
 
         elif kwargs:
@@ -431,75 +417,97 @@ class Knowledge:
             remote_content = kwargs.get("remote_content", None)
             auth = kwargs.get("auth")
             for path in paths:
-                self.insert(
-                    name=name,
-                    description=description,
-                    path=path,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
+                insert_calls.append(
+                    dict(
+                        name=name,
+                        description=description,
+                        path=path,
+                        metadata=metadata,
+                        include=include,
+                        exclude=exclude,
+                        upsert=upsert,
+                        skip_if_exists=skip_if_exists,
+                        reader=reader,
+                        auth=auth,
+                    )
                 )
             for url in urls:
-                self.insert(
-                    name=name,
-                    description=description,
-                    url=url,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
+                insert_calls.append(
+                    dict(
+                        name=name,
+                        description=description,
+                        url=url,
+                        metadata=metadata,
+                        include=include,
+                        exclude=exclude,
+                        upsert=upsert,
+                        skip_if_exists=skip_if_exists,
+                        reader=reader,
+                        auth=auth,
+                    )
                 )
             for i, text_content in enumerate(text_contents):
                 content_name = f"{name}_{i}" if name else f"text_content_{i}"
                 log_debug(f"Adding text content: {content_name}")
-                self.insert(
-                    name=content_name,
-                    description=description,
-                    text_content=text_content,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
+                insert_calls.append(
+                    dict(
+                        name=content_name,
+                        description=description,
+                        text_content=text_content,
+                        metadata=metadata,
+                        include=include,
+                        exclude=exclude,
+                        upsert=upsert,
+                        skip_if_exists=skip_if_exists,
+                        reader=reader,
+                        auth=auth,
+                    )
                 )
             if topics:
-                self.insert(
-                    name=name,
-                    description=description,
-                    topics=topics,
-                    metadata=metadata,
-                    include=include,
-                    exclude=exclude,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
+                insert_calls.append(
+                    dict(
+                        name=name,
+                        description=description,
+                        topics=topics,
+                        metadata=metadata,
+                        include=include,
+                        exclude=exclude,
+                        upsert=upsert,
+                        skip_if_exists=skip_if_exists,
+                        reader=reader,
+                        auth=auth,
+                    )
                 )
 
             if remote_content:
-                self.insert(
-                    name=name,
-                    metadata=metadata,
-                    description=description,
-                    remote_content=remote_content,
-                    upsert=upsert,
-                    skip_if_exists=skip_if_exists,
-                    reader=reader,
-                    auth=auth,
+                insert_calls.append(
+                    dict(
+                        name=name,
+                        metadata=metadata,
+                        description=description,
+                        remote_content=remote_content,
+                        upsert=upsert,
+                        skip_if_exists=skip_if_exists,
+                        reader=reader,
+                        auth=auth,
+                    )
                 )
 
         else:
             raise ValueError("Invalid usage of insert_many.")
 
+        return insert_calls
+
+    def _raise_first_ingestion_error(self, results: List[Any], run: IngestionRun) -> None:
+        """Log a summary of a concurrent bulk ingestion and re-raise the first unexpected error."""
+        errors = [result for result in results if isinstance(result, BaseException)]
+        log_info(
+            f"Bulk ingestion finished: {run.progress.completed} completed, {run.progress.failed} failed, "
+            f"{len(errors)} errored"
+        )
+        if errors:
+            raise errors[0]
+
     # ==========================================
     # PUBLIC API - SEARCH METHODS
     # ==========================================
@@ -1039,10 +1047,11 @@ class Knowledge:
         skip_if_exists: bool,
         include: Optional[List[str]] = None,
         exclude: Optional[List[str]] = None,
+        incremental: bool = False,
     ) -> None:
         """Synchronously load content."""
         if content.path:
-            self._load_from_path(content, upsert, skip_if_exists, include, exclude)
+            self._load_from_path(content, upsert, skip_if_exists, include, exclude, incremental=incremental)
 
         if content.url:
             self._load_from_url(content, upsert, skip_if_exists)
@@ -1063,9 +1072,10 @@ class Knowledge:
         skip_if_exists: bool,
         include: Optional[List[str]] = None,
         exclude: Optional[List[str]] = None,
+        incremental: bool = False,
     ) -> None:
         if content.path:
-            await self._aload_from_path(content, upsert, skip_if_exists, include, exclude)
+            await self._aload_from_path(content, upsert, skip_if_exists, include, exclude, incremental=incremental)
 
         if content.url:
             await self._aload_from_url(content, upsert, skip_if_exists)
@@ -1187,16 +1197,10 @@ class Knowledge:
         import inspect
 
         read_signature = inspect.signature(reader.read)
-        if password is not None and "password" in read_signature.parameters:
-            if isinstance(source, BytesIO):
+        with read_stage():
+            if password is not None and "password" in read_signature.parameters:
                 return reader.read(source, name=name, password=password)
-            else:
-                return reader.read(source, name=name, password=password)
-        else:
-            if isinstance(source, BytesIO):
-                return reader.read(source, name=name)
-            else:
-                return reader.read(source, name=name)
+            return reader.read(source, name=name)
 
     async def _aread(
         self,
@@ -1220,13 +1224,40 @@ class Knowledge:
         import inspect
 
         read_signature = inspect.signature(reader.async_read)
+        async with aread_stage():
+            if password is not None and "password" in read_signature.parameters:
+                return await reader.async_read(source, name=name, password=password)
+            return await reader.async_read(source, name=name)
+
+    def _iter_read(
+        self,
+        reader: Reader,
+        source: Union[Path, str, BytesIO],
+        name: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> Iterator[List[Document]]:
+        """Read content in batches using a reader's iter_read method, with optional password handling."""
+        import inspect
+
+        read_signature = inspect.signature(reader.iter_read)
         if password is not None and "password" in read_signature.parameters:
-            return await reader.async_read(source, name=name, password=password)
-        else:
-            if isinstance(source, BytesIO):
-                return await reader.async_read(source, name=name)
-            else:
-                return await reader.async_read(source, name=name)
+            return reader.iter_read(source, name=name, password=password)
+        return reader.iter_read(source, name=name)
+
+    def _aiter_read(
+        self,
+        reader: Reader,
+        source: Union[Path, str, BytesIO],
+        name: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> AsyncIterator[List[Document]]:
+        """Read content in batches using a reader's async_iter_read method, with optional password handling."""
+        import inspect
+
+        read_signature = inspect.signature(reader.async_iter_read)
+        if password is not None and "password" in read_signature.parameters:
+            return reader.async_iter_read(source, name=name, password=password)
+        return reader.async_iter_read(source, name=name)
 
     def _prepare_documents_for_insert(
         self,
@@ -1274,6 +1305,23 @@ class Knowledge:
             chunked_documents.extend(reader.chunk_document(doc))
         return chunked_documents
 
+    def _set_file_info(self, content: Content, path: Path) -> None:
+        """Set the file type, size and id of a Content loaded from a file, if they are not set yet."""
+        if not content.file_type:
+            content.file_type = path.suffix
+
+        if not content.size and content.file_data:
+            content.size = len(content.file_data.content)  # type: ignore
+        if not content.size:
+            try:
+                content.size = path.stat().st_size
+            except (OSError, IOError) as e:
+                log_warning(f"Could not get file size for {path}: {e}")
+                content.size = 0
+
+        if not content.id:
+            content.id = generate_id(content.content_hash or "")
+
     async def _aload_from_path(
         self,
         content: Content,
@@ -1281,6 +1329,7 @@ class Knowledge:
         skip_if_exists: bool,
         include: Optional[List[str]] = None,
         exclude: Optional[List[str]] = None,
+        incremental: bool = False,
     ):
         from agno.vectordb import VectorDb
 
@@ -1297,6 +1346,12 @@ class Knowledge:
                 if not content.name:
                     content.name = path.name
 
+                previous_fingerprint = None
+                if incremental:
+                    previous_fingerprint, unchanged = await self._acheck_fingerprint(content, path)
+                    if unchanged:
+                        return
+
                 await self._ainsert_contents_db(content)
                 if self._should_skip(content.content_hash, skip_if_exists):  # type: ignore[arg-type]
                     content.status = ContentStatus.COMPLETED
@@ -1314,31 +1369,39 @@ class Knowledge:
                     reader = ReaderFactory.get_reader_for_extension(path.suffix)
                     log_debug(f"Using Reader: {reader.__class__.__name__}")
 
+                password = content.auth.password if content.auth and content.auth.password is not None else None
+                if reader and reader.streams_documents and reader.stream_windows and content.fingerprint is None:
+                    # Embed and insert the file one window of pages or rows at a time, while it is being read
+                    self._set_file_info(content, path)
+                    await self._ainsert_document_stream(
+                        content,
+                        self._aiter_read(reader, path, name=content.name or path.name, password=password),
+                        upsert,
+                        source=f"file: {path}",
+                        metadata=content.metadata,
+                    )
+                    return
+
                 if reader:
-                    password = content.auth.password if content.auth and content.auth.password is not None else None
                     read_documents = await self._aread(reader, path, name=content.name or path.name, password=password)
                 else:
                     read_documents = []
 
-                if not content.file_type:
-                    content.file_type = path.suffix
-
-                if not content.size and content.file_data:
-                    content.size = len(content.file_data.content)  # type: ignore
-                if not content.size:
-                    try:
-                        content.size = path.stat().st_size
-                    except (OSError, IOError) as e:
-                        log_warning(f"Could not get file size for {path}: {e}")
-                        content.size = 0
-
-                if not content.id:
-                    content.id = generate_id(content.content_hash or "")
-                self._prepare_documents_for_insert(read_documents, content.id, metadata=content.metadata)
+                self._set_file_info(content, path)
+                self._prepare_documents_for_insert(read_documents, content.id, metadata=content.metadata)  # type: ignore[arg-type]
 
-                await self._ahandle_vector_db_insert(content, read_documents, upsert)
+                if content.fingerprint is not None:
+                    await self._ahandle_incremental_vector_db_insert(
+                        content, read_documents, upsert, previous_fingerprint
+                    )
+                else:
+                    await self._ahandle_vector_db_insert(content, read_documents, upsert)
 
         elif path.is_dir():
+            if incremental:
+                await self._aload_directory_incremental(content, path, upsert, skip_if_exists, include, exclude)
+                return
+
             for file_path in path.iterdir():
                 # Apply include/exclude filtering
                 if not self._should_include_file(str(file_path), include, exclude):
@@ -1366,6 +1429,7 @@ class Knowledge:
         skip_if_exists: bool,
         include: Optional[List[str]] = None,
         exclude: Optional[List[str]] = None,
+        incremental: bool = False,
     ):
         from agno.vectordb import VectorDb
 
@@ -1382,6 +1446,12 @@ class Knowledge:
                 if not content.name:
                     content.name = path.name
 
+                previous_fingerprint = None
+                if incremental:
+                    previous_fingerprint, unchanged = self._check_fingerprint(content, path)
+                    if unchanged:
+                        return
+
                 self._insert_contents_db(content)
                 if self._should_skip(content.content_hash, skip_if_exists):  # type: ignore[arg-type]
                     content.status = ContentStatus.COMPLETED
@@ -1399,31 +1469,37 @@ class Knowledge:
                     reader = ReaderFactory.get_reader_for_extension(path.suffix)
                     log_debug(f"Using Reader: {reader.__class__.__name__}")
 
+                password = content.auth.password if content.auth and content.auth.password is not None else None
+                if reader and reader.streams_documents and reader.stream_windows and content.fingerprint is None:
+                    # Embed and insert the file one window of pages or rows at a time, while it is being read
+                    self._set_file_info(content, path)
+                    self._insert_document_stream(
+                        content,
+                        self._iter_read(reader, path, name=content.name or path.name, password=password),
+                        upsert,
+                        source=f"file: {path}",
+                        metadata=content.metadata,
+                    )
+                    return
+
                 if reader:
-                    password = content.auth.password if content.auth and content.auth.password is not None else None
                     read_documents = self._read(reader, path, name=content.name or path.name, password=password)
                 else:
                     read_documents = []
 
-                if not content.file_type:
-                    content.file_type = path.suffix
-
-                if not content.size and content.file_data:
-                    content.size = len(content.file_data.content)  # type: ignore
-                if not content.size:
-                    try:
-                        content.size = path.stat().st_size
-                    except (OSError, IOError) as e:
-                        log_warning(f"Could not get file size for {path}: {e}")
-                        content.size = 0
-
-                if not content.id:
-                    content.id = generate_id(content.content_hash or "")
-                self._prepare_documents_for_insert(read_documents, content.id, metadata=content.metadata)
+                self._set_file_info(content, path)
+                self._prepare_documents_for_insert(read_documents, content.id, metadata=content.metadata)  # type: ignore[arg-type]
 
-                self._handle_vector_db_insert(content, read_documents, upsert)
+                if content.fingerprint is not None:
+                    self._handle_incremental_vector_db_insert(content, read_documents, upsert, previous_fingerprint)
+                else:
+                    self._handle_vector_db_insert(content, read_documents, upsert)
 
         elif path.is_dir():
+            if incremental:
+                self._load_directory_incremental(content, path, upsert, skip_if_exists, include, exclude)
+                return
+
             for file_path in path.iterdir():
                 # Apply include/exclude filtering
                 if not self._should_include_file(str(file_path), include, exclude):
@@ -1519,6 +1595,17 @@ class Knowledge:
                 name = basename(parsed_url.path) or default_name
         else:
             reader = content.reader or self.website_reader
+            # Concurrent website crawls are chunked and inserted page by page, while the crawl continues
+            if reader is not None and getattr(reader, "concurrent", False):
+                await self._ainsert_document_stream(
+                    content,
+                    reader.async_iter_read(content.url, name=name),
+                    upsert,
+                    source=f"URL: {content.url}",
+                    reader=reader,
+                    calculate_sizes=True,
+                )
+                return
         # 5. Read content
         try:
             read_documents = []
@@ -1547,6 +1634,140 @@ class Knowledge:
         self._prepare_documents_for_insert(read_documents, content.id, calculate_sizes=True)
         await self._ahandle_vector_db_insert(content, read_documents, upsert)
 
+    async def _ainsert_document_stream(
+        self,
+        content: Content,
+        batches: AsyncIterator[List[Document]],
+        upsert: bool,
+        source: str,
+        reader: Optional[Reader] = None,
+        calculate_sizes: bool = False,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Insert each batch of documents read from a source in the vector database as soon as it is read.
+
+        Args:
+            content: Content the documents belong to
+            batches: Batches of documents, e.g. from a reader's async_iter_read
+            upsert: Whether to replace the documents previously inserted for the content
+            source: Description of the source, used in error messages
+            reader: Reader used to chunk the batches, if it does not chunk them itself
+            calculate_sizes: Whether to calculate document sizes
+            metadata: Optional metadata to merge into document metadata
+        """
+        from agno.vectordb import VectorDb
+
+        self.vector_db = cast(VectorDb, self.vector_db)
+
+        if not self.vector_db:
+            log_error("No vector database configured")
+            content.status = ContentStatus.FAILED
+            content.status_message = "No vector database configured"
+            await self._aupdate_content(content)
+            return
+
+        if not content.id:
+            content.id = generate_id(content.content_hash or "")
+
+        # An upsert replaces the previously inserted documents, even when the source now has none
+        replace = upsert and self.vector_db.upsert_available()
+        num_batches = 0
+        try:
+            if replace:
+                async with awrite_stage():
+                    self.vector_db.delete_by_content_id(content.id)
+            while True:
+                async with aread_stage():
+                    try:
+                        documents = await batches.__anext__()
+                    except StopAsyncIteration:
+                        break
+                if reader is not None and not reader.chunk:
+                    documents = await reader.chunk_documents_async(documents)
+                self._prepare_documents_for_insert(documents, content.id, calculate_sizes, metadata)
+                async with awrite_stage():
+                    if replace and num_batches == 0:
+                        await self.vector_db.async_upsert(content.content_hash, documents, content.metadata)  # type: ignore[arg-type]
+                    else:
+                        await self.vector_db.async_insert(
+                            content.content_hash,  # type: ignore[arg-type]
+                            documents=documents,
+                            filters=content.metadata,  # type: ignore[arg-type]
+                        )
+                num_batches += 1
+        except Exception as e:
+            log_error(f"Error reading {source} - {str(e)}")
+            content.status = ContentStatus.FAILED
+            content.status_message = f"Error reading {source} - {str(e)}"
+            await self._aupdate_content(content)
+            return
+
+        log_debug(f"Inserted {num_batches} batches of documents from {source}")
+        content.status = ContentStatus.COMPLETED
+        await self._aupdate_content(content)
+
+    def _insert_document_stream(
+        self,
+        content: Content,
+        batches: Iterator[List[Document]],
+        upsert: bool,
+        source: str,
+        reader: Optional[Reader] = None,
+        calculate_sizes: bool = False,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        """Synchronously insert each batch of documents read from a source in the vector database as it is read."""
+        from agno.vectordb import VectorDb
+
+        self.vector_db = cast(VectorDb, self.vector_db)
+
+        if not self.vector_db:
+            log_error("No vector database configured")
+            content.status = ContentStatus.FAILED
+            content.status_message = "No vector database configured"
+            self._update_content(content)
+            return
+
+        if not content.id:
+            content.id = generate_id(content.content_hash or "")
+
+        # An upsert replaces the previously inserted documents, even when the source now has none
+        replace = upsert and self.vector_db.upsert_available()
+        num_batches = 0
+        try:
+            if replace:
+                with write_stage():
+                    self.vector_db.delete_by_content_id(content.id)
+            while True:
+                with read_stage():
+                    documents = next(batches, None)
+                if documents is None:
+                    break
+                if reader is not None:
+                    documents = self._chunk_documents_sync(reader, documents)
+                self._prepare_documents_for_insert(documents, content.id, calculate_sizes, metadata)
+                with write_stage():
+                    if replace and num_batches == 0:
+                        self.vector_db.upsert(content.content_hash, documents, content.metadata)  # type: ignore[arg-type]
+                    else:
+                        self.vector_db.insert(
+                            content.content_hash,  # type: ignore[arg-type]
+                            documents=documents,
+                            filters=content.metadata,  # type: ignore[arg-type]
+                        )
+                num_batches += 1
+        except Exception as e:
+            log_error(f"Error reading {source} - {str(e)}")
+            content.status = ContentStatus.FAILED
+            content.status_message = f"Error reading {source} - {str(e)}"
+            self._update_content(content)
+            return
+
+        log_debug(f"Inserted {num_batches} batches of documents from {source}")
+        content.status = ContentStatus.COMPLETED
+        self._update_content(content)
+
     def _load_from_url(
         self,
         content: Content,
@@ -3754,7 +3975,8 @@ class Knowledge:
 
         if self.vector_db.upsert_available() and upsert:
             try:
-                await self.vector_db.async_upsert(content.content_hash, read_documents, content.metadata)  # type: ignore[arg-type]
+                async with awrite_stage():
+                    await self.vector_db.async_upsert(content.content_hash, read_documents, content.metadata)  # type: ignore[arg-type]
             except Exception as e:
                 log_error(f"Error upserting document: {e}")
                 content.status = ContentStatus.FAILED
@@ -3763,11 +3985,12 @@ class Knowledge:
                 return
         else:
             try:
-                await self.vector_db.async_insert(
-                    content.content_hash,  # type: ignore[arg-type]
-                    documents=read_documents,
-                    filters=content.metadata,  # type: ignore[arg-type]
-                )
+                async with awrite_stage():
+                    await self.vector_db.async_insert(
+                        content.content_hash,  # type: ignore[arg-type]
+                        documents=read_documents,
+                        filters=content.metadata,  # type: ignore[arg-type]
+                    )
             except Exception as e:
                 log_error(f"Error inserting document: {e}")
                 content.status = ContentStatus.FAILED
@@ -3793,7 +4016,8 @@ class Knowledge:
 
         if self.vector_db.upsert_available() and upsert:
             try:
-                self.vector_db.upsert(content.content_hash, read_documents, content.metadata)  # type: ignore[arg-type]
+                with write_stage():
+                    self.vector_db.upsert(content.content_hash, read_documents, content.metadata)  # type: ignore[arg-type]
             except Exception as e:
                 log_error(f"Error upserting document: {e}")
                 content.status = ContentStatus.FAILED
@@ -3802,11 +4026,12 @@ class Knowledge:
                 return
         else:
             try:
-                self.vector_db.insert(
-                    content.content_hash,  # type: ignore[arg-type]
-                    documents=read_documents,
-                    filters=content.metadata,  # type: ignore[arg-type]
-                )
+                with write_stage():
+                    self.vector_db.insert(
+                        content.content_hash,  # type: ignore[arg-type]
+                        documents=read_documents,
+                        filters=content.metadata,  # type: ignore[arg-type]
+                    )
             except Exception as e:
                 log_error(f"Error inserting document: {e}")
                 content.status = ContentStatus.FAILED
@@ -3817,6 +4042,267 @@ class Knowledge:
         content.status = ContentStatus.COMPLETED
         self._update_content(content)
 
+    # --- Incremental Sync ---
+
+    def _check_fingerprint(self, content: Content, path: Path) -> Tuple[Optional[ContentFingerprint], bool]:
+        """
+        Fingerprint a file for an incremental insert and compare it with the stored fingerprint.
+
+        Returns:
+            The previously stored fingerprint, and whether the file is unchanged. Unchanged files are marked completed.
+        """
+        if self.contents_db is None:
+            log_warning("Incremental inserts require a contents db, processing the full content")
+            return None, False
+
+        previous = self.get_content_by_id(content.id) if content.id else None
+        previous_fingerprint = previous.fingerprint if previous else None
+        content.fingerprint = fingerprint_file(path, content.metadata, previous_fingerprint)
+
+        if (
+            previous is None
+            or previous_fingerprint is None
+            or previous.status != ContentStatus.COMPLETED
+            or not content.fingerprint.same_source(previous_fingerprint)
+        ):
+            return previous_fingerprint, False
+
+        log_debug(f"Content unchanged since last insert, skipping: {path}")
+        content.fingerprint.chunks = previous_fingerprint.chunks
+        content.status = ContentStatus.COMPLETED
+        if content.fingerprint != previous_fingerprint:
+            # Same bytes with a new mtime, store it so the next sync does not hash the file again
+            self._update_content(content)
+        else:
+            report_content_status(content)
+        return previous_fingerprint, True
+
+    async def _acheck_fingerprint(self, content: Content, path: Path) -> Tuple[Optional[ContentFingerprint], bool]:
+        if self.contents_db is None:
+            log_warning("Incremental inserts require a contents db, processing the full content")
+            return None, False
+
+        previous = await self.aget_content_by_id(content.id) if content.id else None
+        previous_fingerprint = previous.fingerprint if previous else None
+        content.fingerprint = fingerprint_file(path, content.metadata, previous_fingerprint)
+
+        if (
+            previous is None
+            or previous_fingerprint is None
+            or previous.status != ContentStatus.COMPLETED
+            or not content.fingerprint.same_source(previous_fingerprint)
+        ):
+            return previous_fingerprint, False
+
+        log_debug(f"Content unchanged since last insert, skipping: {path}")
+        content.fingerprint.chunks = previous_fingerprint.chunks
+        content.status = ContentStatus.COMPLETED
+        if content.fingerprint != previous_fingerprint:
+            await self._aupdate_content(content)
+        else:
+            report_content_status(content)
+        return previous_fingerprint, True
+
+    def _tag_chunks(self, content: Content, documents: List[Document]) -> Dict[str, Document]:
+        """Tag documents with their chunk digest and record the digests on the content fingerprint."""
+        chunks: Dict[str, Document] = {}
+        for document in documents:
+            digest = chunk_digest(content.id or "", document.content)
+            if digest not in chunks:
+                document.meta_data[CHUNK_DIGEST_METADATA_KEY] = digest
+                chunks[digest] = document
+        if content.fingerprint is not None:
+            content.fingerprint.chunks = list(chunks)
+        return chunks
+
+    def _diff_chunks(
+        self, content: Content, chunks: Dict[str, Document], previous_fingerprint: Optional[ContentFingerprint]
+    ) -> Optional[Tuple[List[str], List[Document]]]:
+        """
+        Compare the chunks of a changed file with the stored ones.
+
+        New documents are given their chunk digest as id. Chunkers number their chunks by position, so a new
+        chunk could otherwise reuse the id of a stored chunk that is still current and overwrite it.
+
+        Returns:
+            The digests of stale chunks and the new documents to insert, or None if nothing stored can be reused.
+        """
+        if (
+            previous_fingerprint is None
+            or content.fingerprint is None
+            or previous_fingerprint.metadata_digest != content.fingerprint.metadata_digest
+        ):
+            return None
+        previous_chunks = set(previous_fingerprint.chunks)
+        stale = [digest for digest in previous_fingerprint.chunks if digest not in chunks]
+        added = []
+        for digest, document in chunks.items():
+            if digest not in previous_chunks:
+                document.id = digest
+                added.append(document)
+        return stale, added
+
+    def _handle_incremental_vector_db_insert(
+        self,
+        content: Content,
+        read_documents: List[Document],
+        upsert: bool,
+        previous_fingerprint: Optional[ContentFingerprint],
+    ):
+        """Synchronously apply only the chunks of a file that changed to the vector database."""
+        chunks = self._tag_chunks(content, read_documents)
+        changes = self._diff_chunks(content, chunks, previous_fingerprint)
+        if changes is None or not self.vector_db:
+            # Nothing to reuse, so replace everything stored for this content
+            if previous_fingerprint is not None and self.vector_db and content.id:
+                self.vector_db.delete_by_content_id(content.id)
+            self._handle_vector_db_insert(content, list(chunks.values()), upsert)
+            return
+
+        stale, added = changes
+        log_debug(f"Updating {content.name}: {len(added)} new chunks, {len(stale)} stale chunks")
+        try:
+            with write_stage():
+                for digest in stale:
+                    self.vector_db.delete_by_metadata({CHUNK_DIGEST_METADATA_KEY: digest})
+                if added:
+                    self.vector_db.insert(
+                        content.content_hash,  # type: ignore[arg-type]
+                        documents=added,
+                        filters=content.metadata,
+                    )
+        except Exception as e:
+            log_error(f"Error updating changed chunks: {e}")
+            content.status = ContentStatus.FAILED
+            content.status_message = "Could not update embeddings"
+            self._update_content(content)
+            return
+
+        content.status = ContentStatus.COMPLETED
+        self._update_content(content)
+
+    async def _ahandle_incremental_vector_db_insert(
+        self,
+        content: Content,
+        read_documents: List[Document],
+        upsert: bool,
+        previous_fingerprint: Optional[ContentFingerprint],
+    ):
+        chunks = self._tag_chunks(content, read_documents)
+        changes = self._diff_chunks(content, chunks, previous_fingerprint)
+        if changes is None or not self.vector_db:
+            # Nothing to reuse, so replace everything stored for this content
+            if previous_fingerprint is not None and self.vector_db and content.id:
+                self.vector_db.delete_by_content_id(content.id)
+            await self._ahandle_vector_db_insert(content, list(chunks.values()), upsert)
+            return
+
+        stale, added = changes
+        log_debug(f"Updating {content.name}: {len(added)} new chunks, {len(stale)} stale chunks")
+        try:
+            async with awrite_stage():
+                for digest in stale:
+                    self.vector_db.delete_by_metadata({CHUNK_DIGEST_METADATA_KEY: digest})
+                if added:
+                    await self.vector_db.async_insert(
+                        content.content_hash,  # type: ignore[arg-type]
+                        documents=added,
+                        filters=content.metadata,
+                    )
+        except Exception as e:
+            log_error(f"Error updating changed chunks: {e}")
+            content.status = ContentStatus.FAILED
+            content.status_message = "Could not update embeddings"
+            await self._aupdate_content(content)
+            return
+
+        content.status = ContentStatus.COMPLETED
+        await self._aupdate_content(content)
+
+    def _iter_directory_files(
+        self, path: Path, include: Optional[List[str]] = None, exclude: Optional[List[str]] = None
+    ) -> List[Path]:
+        """List the files a directory insert visits, applying include/exclude filters the same way."""
+        files: List[Path] = []
+        for file_path in path.iterdir():
+            if not self._should_include_file(str(file_path), include, exclude):
+                log_debug(f"Skipping file {file_path} due to include/exclude filters")
+                continue
+            if file_path.is_dir():
+                files.extend(self._iter_directory_files(file_path, include, exclude))
+            elif file_path.is_file():
+                files.append(file_path)
+        return files
+
+    def _build_directory_file_content(self, content: Content, file_path: Path) -> Content:
+        file_content = Content(
+            name=content.name,
+            path=str(file_path),
+            metadata=content.metadata,
+            description=content.description,
+            reader=content.reader,
+        )
+        file_content.content_hash = self._build_content_hash(file_content)
+        file_content.id = generate_id(file_content.content_hash)
+        return file_content
+
+    def _removed_directory_contents(self, contents: List[Content], path: Path, seen: Set[str]) -> List[Content]:
+        """Contents previously synced from a directory whose file no longer exists (or is now excluded)."""
+        root = path.resolve()
+        removed: List[Content] = []
+        for content in contents:
+            if content.id is None or content.fingerprint is None:
+                continue
+            file_path = Path(content.fingerprint.path)
+            if root in file_path.parents and content.fingerprint.path not in seen:
+                removed.append(content)
+        return removed
+
+    def _load_directory_incremental(
+        self,
+        content: Content,
+        path: Path,
+        upsert: bool,
+        skip_if_exists: bool,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> None:
+        """Sync a directory: load added and changed files, then remove the content of deleted files."""
+        seen: Set[str] = set()
+        for file_path in self._iter_directory_files(path, include, exclude):
+            seen.add(str(file_path.resolve()))
+            file_content = self._build_directory_file_content(content, file_path)
+            self._load_from_path(file_content, upsert, skip_if_exists, include, exclude, incremental=True)
+
+        if self.contents_db is None:
+            return
+        contents, _ = self.get_content()
+        for removed in self._removed_directory_contents(contents, path, seen):
+            log_info(f"Removing content of deleted file: {removed.fingerprint.path}")  # type: ignore[union-attr]
+            self.remove_content_by_id(removed.id)  # type: ignore[arg-type]
+
+    async def _aload_directory_incremental(
+        self,
+        content: Content,
+        path: Path,
+        upsert: bool,
+        skip_if_exists: bool,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> None:
+        seen: Set[str] = set()
+        for file_path in self._iter_directory_files(path, include, exclude):
+            seen.add(str(file_path.resolve()))
+            file_content = self._build_directory_file_content(content, file_path)
+            await self._aload_from_path(file_content, upsert, skip_if_exists, include, exclude, incremental=True)
+
+        if self.contents_db is None:
+            return
+        contents, _ = await self.aget_content()
+        for removed in self._removed_directory_contents(contents, path, seen):
+            log_info(f"Removing content of deleted file: {removed.fingerprint.path}")  # type: ignore[union-attr]
+            await self.aremove_content_by_id(removed.id)  # type: ignore[arg-type]
+
     # --- Remote Content Sources ---
 
     def _get_remote_configs(self) -> List[RemoteContentConfig]:
@@ -3940,11 +4426,17 @@ class Knowledge:
 
     def _content_row_to_content(self, content_row: KnowledgeRow) -> Content:
         """Convert a KnowledgeRow to a Content object."""
+        metadata = content_row.metadata
+        fingerprint = None
+        if metadata and FINGERPRINT_METADATA_KEY in metadata:
+            metadata = {key: value for key, value in metadata.items() if key != FINGERPRINT_METADATA_KEY}
+            fingerprint = ContentFingerprint.from_dict(content_row.metadata[FINGERPRINT_METADATA_KEY])  # type: ignore[index]
         return Content(
             id=content_row.id,
             name=content_row.name,
             description=content_row.description,
-            metadata=content_row.metadata,
+            metadata=metadata,
+            fingerprint=fingerprint,
             file_type=content_row.type,
             size=content_row.size,
             status=ContentStatus(content_row.status) if content_row.status else None,
@@ -3954,6 +4446,22 @@ class Knowledge:
             external_id=content_row.external_id,
         )
 
+    def _row_metadata(self, content: Content, metadata: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Build the metadata stored on a contents db row.
+
+        The fingerprint of an incremental insert is only stored once the content completed, so content that failed
+        or was interrupted is processed again on the next sync. Content processed without a fingerprint drops the
+        stored one, as its chunks are no longer tracked.
+        """
+        stale_fingerprint = content.status is not None and bool(metadata) and FINGERPRINT_METADATA_KEY in metadata  # type: ignore[operator]
+        if content.fingerprint is None and not stale_fingerprint:
+            return metadata
+        row_metadata = {key: value for key, value in (metadata or {}).items() if key != FINGERPRINT_METADATA_KEY}
+        if content.fingerprint is not None and content.status == ContentStatus.COMPLETED:
+            row_metadata[FINGERPRINT_METADATA_KEY] = content.fingerprint.to_dict()
+        return row_metadata
+
     def _build_knowledge_row(self, content: Content) -> KnowledgeRow:
         """Build a KnowledgeRow from a Content object."""
         created_at = content.created_at if content.created_at else int(time.time())
@@ -3969,7 +4477,7 @@ class Knowledge:
             id=content.id,
             name=self._ensure_string_field(content.name, "content.name", default=""),
             description=self._ensure_string_field(content.description, "content.description", default=""),
-            metadata=content.metadata,
+            metadata=self._row_metadata(content, content.metadata),
             type=file_type,
             size=content.size
             if content.size
@@ -4021,6 +4529,7 @@ class Knowledge:
         from agno.vectordb import VectorDb
 
         self.vector_db = cast(VectorDb, self.vector_db)
+        report_content_status(content)
         if self.contents_db:
             if isinstance(self.contents_db, AsyncBaseDb):
                 raise ValueError(
@@ -4044,8 +4553,9 @@ class Knowledge:
                 content_row.description = self._ensure_string_field(
                     content.description, "content.description", default=""
                 )
-            if content.metadata is not None:
-                content_row.metadata = content.metadata
+            content_row.metadata = self._row_metadata(
+                content, content.metadata if content.metadata is not None else content_row.metadata
+            )
             if content.status is not None:
                 content_row.status = content.status
             if content.status_message is not None:
@@ -4068,6 +4578,7 @@ class Knowledge:
             return None
 
     async def _aupdate_content(self, content: Content) -> Optional[Dict[str, Any]]:
+        report_content_status(content)
         if self.contents_db:
             if not content.id:
                 log_warning("Content id is required to update Knowledge content")
@@ -4089,8 +4600,9 @@ class Knowledge:
                 content_row.description = self._ensure_string_field(
                     content.description, "content.description", default=""
                 )
-            if content.metadata is not None:
-                content_row.metadata = content.metadata
+            content_row.metadata = self._row_metadata(
+                content, content.metadata if content.metadata is not None else content_row.metadata
+            )
             if content.status is not None:
                 content_row.status = content.status
             if content.status_message is not None:
@@ -0,0 +1,154 @@
+"""
+Local Model Registry
+====================
+Process-wide cache of the local models used by embedders and rerankers.
+
+Models are loaded lazily, once per process, and shared by every embedder and
+reranker using the same model, across Knowledge instances and threads. The
+least recently used models are unloaded when the registry goes over its
+memory budget or model count.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from agno.utils.log import log_debug, log_info
+
+T = TypeVar("T")
+
+
+def get_model_key(kind: str, model_id: str, **kwargs: Any) -> Tuple[str, str, str]:
+    """Key of a model in the registry: its kind, id and the arguments it was loaded with."""
+    return kind, model_id, json.dumps(kwargs, sort_keys=True, default=str)
+
+
+def estimate_model_size(model: Any) -> int:
+    """Estimate the memory used by a model, in bytes. Returns 0 when it can't be estimated."""
+    for module in (model, getattr(model, "model", None)):
+        parameters = getattr(module, "parameters", None)
+        if callable(parameters):
+            try:
+                return sum(parameter.numel() * parameter.element_size() for parameter in parameters())
+            except Exception:
+                continue
+    return 0
+
+
+@dataclass
+class _LoadedModel:
+    model: Any
+    size: int
+    last_used_at: float
+
+
+class LocalModelRegistry:
+    """Loads local models once and keeps the most recently used ones in memory.
+
+    Args:
+        max_memory_bytes: Unload the least recently used models when the estimated size of the loaded models is over this.
+        max_models: Unload the least recently used models when more than this number of models are loaded.
+    """
+
+    def __init__(self, max_memory_bytes: Optional[int] = None, max_models: Optional[int] = None):
+        self.max_memory_bytes = max_memory_bytes
+        self.max_models = max_models
+        # Loaded models, least recently used first
+        self._models: "OrderedDict[Hashable, _LoadedModel]" = OrderedDict()
+        self._lock = threading.Lock()
+        # One lock per model being loaded, so a model is only loaded once and other models are not blocked
+        self._load_locks: Dict[Hashable, threading.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._models
+
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated size of the loaded models, in bytes."""
+        return sum(entry.size for entry in self._models.values())
+
+    def get(self, key: Hashable, loader: Callable[[], T], size: Callable[[Any], int] = estimate_model_size) -> T:
+        """Get a model, loading it with `loader` if it is not loaded yet.
+
+        Args:
+            key: Key of the model, see get_model_key.
+            loader: Loads the model.
+            size: Estimates the memory used by the model, in bytes.
+        """
+        model = self._get_loaded(key)
+        if model is not None:
+            return model
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            # Loaded by another thread while waiting for the lock
+            model = self._get_loaded(key)
+            if model is not None:
+                return model
+
+            log_debug(f"Loading local model: {key}")
+            start = monotonic()
+            try:
+                model = loader()
+                entry = _LoadedModel(model=model, size=size(model), last_used_at=monotonic())
+                log_info(f"Loaded local model {key} in {entry.last_used_at - start:.2f}s")
+                with self._lock:
+                    self._models[key] = entry
+                    self._evict(keep=key)
+            finally:
+                with self._lock:
+                    self._load_locks.pop(key, None)
+        return model
+
+    def _get_loaded(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._models.get(key)
+            if entry is None:
+                return None
+            self._models.move_to_end(key)
+            entry.last_used_at = monotonic()
+            return entry.model
+
+    def _evict(self, keep: Hashable) -> None:
+        """Unload the least recently used models until the registry is within its limits. Must hold the lock."""
+        while len(self._models) > 1:
+            over_count = self.max_models is not None and len(self._models) > self.max_models
+            over_memory = self.max_memory_bytes is not None and self.memory_bytes > self.max_memory_bytes
+            if not (over_count or over_memory):
+                return
+            key = next(key for key in self._models if key != keep)
+            del self._models[key]
+            log_debug(f"Unloaded local model: {key}")
+
+    def unload(self, key: Hashable) -> bool:
+        """Unload a model. Returns whether it was loaded."""
+        with self._lock:
+            return self._models.pop(key, None) is not None
+
+    def unload_idle(self, max_idle_seconds: float) -> int:
+        """Unload the models not used in the last `max_idle_seconds`. Returns the number of models unloaded."""
+        cutoff = monotonic() - max_idle_seconds
+        with self._lock:
+            idle_keys = [key for key, entry in self._models.items() if entry.last_used_at < cutoff]
+            for key in idle_keys:
+                del self._models[key]
+        return len(idle_keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+
+# Shared by every local embedder and reranker in the process
+local_model_registry = LocalModelRegistry()
+
+
+def get_local_model_registry() -> LocalModelRegistry:
+    return local_model_registry
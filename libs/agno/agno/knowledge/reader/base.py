@@ -1,6 +1,6 @@
 import asyncio
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from typing import Any, AsyncIterator, ClassVar, Iterator, List, Optional
 
 from agno.knowledge.chunking.fixed import FixedSizeChunking
 from agno.knowledge.chunking.strategy import ChunkingStrategy, ChunkingStrategyFactory, ChunkingStrategyType
@@ -20,6 +20,12 @@ class Reader:
     description: Optional[str] = None
     max_results: int = 5  # Maximum number of results to return (useful for search-based readers)
     encoding: Optional[str] = None
+    # Whether Knowledge inserts each batch of iter_read as it is read, for readers that set `streams_documents`.
+    # The batches are windows of pages or rows, whose documents and metadata differ from the ones of read().
+    stream_windows: bool = False
+
+    # Whether iter_read and async_iter_read parse the source incrementally, instead of reading it all at once
+    streams_documents: ClassVar[bool] = False
 
     def __init__(
         self,
@@ -31,6 +37,7 @@ class Reader:
         description: Optional[str] = None,
         max_results: int = 5,
         encoding: Optional[str] = None,
+        stream_windows: bool = False,
         **kwargs,
     ) -> None:
         self.chunk = chunk
@@ -43,6 +50,7 @@ class Reader:
         self.description = description
         self.max_results = max_results
         self.encoding = encoding
+        self.stream_windows = stream_windows
 
     def set_chunking_strategy_from_string(
         self, strategy_name: str, chunk_size: Optional[int] = None, overlap: Optional[int] = None, **kwargs
@@ -62,6 +70,43 @@ class Reader:
     async def async_read(self, obj: Any, name: Optional[str] = None, password: Optional[str] = None) -> List[Document]:
         raise NotImplementedError
 
+    def iter_read(
+        self, obj: Any, name: Optional[str] = None, password: Optional[str] = None
+    ) -> Iterator[List[Document]]:
+        """
+        Read documents in batches, e.g. one window of pages or rows at a time.
+
+        Readers that set `streams_documents` parse their source incrementally, so a batch can be embedded and
+        inserted before the rest of the source is read. By default, the result of read() is a single batch.
+        """
+        if password is not None:
+            yield self.read(obj, name=name, password=password)
+        else:
+            yield self.read(obj, name=name)
+
+    async def async_iter_read(
+        self, obj: Any, name: Optional[str] = None, password: Optional[str] = None
+    ) -> AsyncIterator[List[Document]]:
+        """Async version of iter_read."""
+        if password is not None:
+            yield await self.async_read(obj, name=name, password=password)
+        else:
+            yield await self.async_read(obj, name=name)
+
+    async def _aiter_in_thread(self, batches: Iterator[List[Document]]) -> AsyncIterator[List[Document]]:
+        """Consume a blocking iter_read generator from a worker thread, one batch at a time."""
+        done = object()
+        try:
+            while True:
+                batch = await asyncio.to_thread(next, batches, done)
+                if batch is done:
+                    return
+                yield batch  # type: ignore[misc]
+        finally:
+            close = getattr(batches, "close", None)
+            if close is not None:
+                close()
+
     @classmethod
     def get_supported_chunking_strategies(cls) -> List[ChunkingStrategyType]:
         raise NotImplementedError
@@ -2,7 +2,7 @@ import asyncio
 import csv
 import io
 from pathlib import Path
-from typing import IO, Any, List, Optional, Union
+from typing import IO, Any, AsyncIterator, Iterator, List, Optional, Union
 from uuid import uuid4
 
 try:
@@ -27,6 +27,7 @@ class CSVReader(Reader):
 
     Args:
         chunking_strategy: Strategy for chunking documents. Default is RowChunking.
+        rows_per_window: Number of rows read at a time by iter_read and async_iter_read.
         **kwargs: Additional arguments passed to base Reader.
 
     Example:
@@ -38,11 +39,20 @@ class CSVReader(Reader):
 
         # Custom delimiter
         docs = reader.read("data.tsv", delimiter="\\t")
+
+        # Large files, a window of rows at a time
+        for docs in reader.iter_read(Path("data.csv")):
+            ...
         ```
     """
 
-    def __init__(self, chunking_strategy: Optional[ChunkingStrategy] = RowChunking(), **kwargs):
+    streams_documents = True
+
+    def __init__(
+        self, chunking_strategy: Optional[ChunkingStrategy] = RowChunking(), rows_per_window: int = 1000, **kwargs
+    ):
         super().__init__(chunking_strategy=chunking_strategy, **kwargs)
+        self.rows_per_window = rows_per_window
 
     @classmethod
     def get_supported_chunking_strategies(cls) -> List[ChunkingStrategyType]:
@@ -213,3 +223,90 @@ class CSVReader(Reader):
             file_desc = getattr(file, "name", str(file)) if isinstance(file, IO) else file
             log_error(f"Error reading {file_desc}: {e}")
             return []
+
+    def iter_read(
+        self,
+        file: Union[Path, IO[Any]],
+        name: Optional[str] = None,
+        delimiter: str = ",",
+        quotechar: str = '"',
+    ) -> Iterator[List[Document]]:
+        """Read a CSV file one window of `rows_per_window` rows at a time, yielding the documents of each window.
+
+        Files on disk are parsed row by row, so only one window of rows is held in memory at a time. Like read(),
+        encoding and parsing errors are logged and end the iteration instead of being raised.
+
+        Args:
+            file: Path to CSV file or file-like object.
+            name: Optional name override for the document.
+            delimiter: CSV field delimiter. Default is comma.
+            quotechar: CSV quote character. Default is double quote.
+
+        Raises:
+            FileNotFoundError: If the file path doesn't exist.
+        """
+        try:
+            if isinstance(file, Path):
+                if not file.exists():
+                    raise FileNotFoundError(f"Could not find file: {file}")
+                log_debug(f"Reading in windows of {self.rows_per_window} rows: {file}")
+                csv_name = name or file.stem
+                file_content: Union[io.TextIOWrapper, io.StringIO] = file.open(
+                    newline="", mode="r", encoding=self.encoding or "utf-8"
+                )
+            else:
+                log_debug(
+                    f"Reading retrieved file in windows of {self.rows_per_window} rows: {getattr(file, 'name', 'BytesIO')}"
+                )
+                csv_name = name or getattr(file, "name", "csv_file").split(".")[0]
+                file.seek(0)
+                file_content = io.StringIO(file.read().decode(self.encoding or "utf-8"))
+
+            with file_content as csvfile:
+                csv_reader = csv.reader(csvfile, delimiter=delimiter, quotechar=quotechar)
+                window: List[str] = []
+                page_number = 1
+                for row in csv_reader:
+                    window.append(", ".join(stringify_cell_value(cell) for cell in row))
+                    if len(window) >= self.rows_per_window:
+                        yield self._window_to_documents(csv_name, window, page_number)
+                        window = []
+                        page_number += 1
+                if window:
+                    yield self._window_to_documents(csv_name, window, page_number)
+        except FileNotFoundError:
+            raise
+        except UnicodeDecodeError as e:
+            file_desc = getattr(file, "name", str(file)) if isinstance(file, IO) else file
+            log_error(f"Encoding error reading {file_desc}: {e}. Try specifying a different encoding.")
+        except Exception as e:
+            file_desc = getattr(file, "name", str(file)) if isinstance(file, IO) else file
+            log_error(f"Error reading {file_desc}: {e}")
+
+    async def async_iter_read(
+        self,
+        file: Union[Path, IO[Any]],
+        name: Optional[str] = None,
+        delimiter: str = ",",
+        quotechar: str = '"',
+    ) -> AsyncIterator[List[Document]]:
+        """Async version of iter_read, parsing each window of rows in a worker thread."""
+        async for documents in self._aiter_in_thread(
+            self.iter_read(file, name=name, delimiter=delimiter, quotechar=quotechar)
+        ):
+            yield documents
+
+    def _window_to_documents(self, csv_name: str, lines: List[str], page_number: int) -> List[Document]:
+        document = Document(
+            name=csv_name,
+            id=str(uuid4()),
+            meta_data={
+                "page": page_number,
+                "start_row": (page_number - 1) * self.rows_per_window + 1,
+                "rows": len(lines),
+            },
+            content="\n".join(lines),
+        )
+        if self.chunk:
+            return self.chunk_document(document)
+        return [document]
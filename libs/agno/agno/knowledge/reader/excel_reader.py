@@ -1,7 +1,8 @@
 import asyncio
 import io
+from contextlib import contextmanager
 from pathlib import Path
-from typing import IO, Any, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import IO, Any, AsyncIterator, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from agno.knowledge.chunking.row import RowChunking
 from agno.knowledge.chunking.strategy import ChunkingStrategy, ChunkingStrategyType
@@ -12,6 +13,7 @@ from agno.knowledge.reader.utils import (
     excel_rows_to_documents,
     get_workbook_name,
     infer_file_extension,
+    iter_excel_row_windows,
 )
 from agno.knowledge.types import ContentType
 from agno.utils.log import log_debug, log_error
@@ -20,14 +22,19 @@ from agno.utils.log import log_debug, log_error
 class ExcelReader(Reader):
     """Reader for Excel files (.xlsx and .xls)."""
 
+    streams_documents = True
+
     def __init__(
         self,
         sheets: Optional[List[Union[str, int]]] = None,
         chunking_strategy: Optional[ChunkingStrategy] = RowChunking(),
+        rows_per_window: int = 1000,
         **kwargs,
     ):
         super().__init__(chunking_strategy=chunking_strategy, **kwargs)
         self.sheets = sheets
+        # Number of rows per document yielded by iter_read and async_iter_read
+        self.rows_per_window = rows_per_window
 
     @classmethod
     def get_supported_chunking_strategies(cls) -> List[ChunkingStrategyType]:
@@ -81,8 +88,9 @@ class ExcelReader(Reader):
 
         return False
 
-    def _read_xlsx(self, file: Union[Path, IO[Any]], *, workbook_name: str) -> List[Document]:
-        """Read .xlsx file using openpyxl."""
+    @contextmanager
+    def _open_xlsx_sheets(self, file: Union[Path, IO[Any]]) -> Iterator[List[Tuple[str, int, Iterable[Sequence[Any]]]]]:
+        """Open an .xlsx file using openpyxl, yielding lazy row iterators of the included sheets."""
         try:
             import openpyxl
         except ImportError as e:
@@ -107,12 +115,17 @@ class ExcelReader(Reader):
 
                 sheets.append((worksheet.title, sheet_index + 1, worksheet.iter_rows(values_only=True)))
 
-            return excel_rows_to_documents(workbook_name=workbook_name, sheets=sheets)
+            yield sheets
         finally:
             workbook.close()
 
-    def _read_xls(self, file: Union[Path, IO[Any]], *, workbook_name: str) -> List[Document]:
-        """Read .xls file using xlrd."""
+    def _read_xlsx(self, file: Union[Path, IO[Any]], *, workbook_name: str) -> List[Document]:
+        """Read .xlsx file using openpyxl."""
+        with self._open_xlsx_sheets(file) as sheets:
+            return excel_rows_to_documents(workbook_name=workbook_name, sheets=sheets)
+
+    def _xls_sheets(self, file: Union[Path, IO[Any]]) -> List[Tuple[str, int, Iterable[Sequence[Any]]]]:
+        """Open an .xls file using xlrd, returning lazy row iterators of the included sheets."""
         try:
             import xlrd
         except ImportError as e:
@@ -149,7 +162,11 @@ class ExcelReader(Reader):
 
             sheets.append((sheet.name, sheet_index + 1, _iter_sheet_rows()))
 
-        return excel_rows_to_documents(workbook_name=workbook_name, sheets=sheets)
+        return sheets
+
+    def _read_xls(self, file: Union[Path, IO[Any]], *, workbook_name: str) -> List[Document]:
+        """Read .xls file using xlrd."""
+        return excel_rows_to_documents(workbook_name=workbook_name, sheets=self._xls_sheets(file))
 
     def read(
         self,
@@ -223,3 +240,46 @@ class ExcelReader(Reader):
             file_desc = getattr(file, "name", str(file)) if isinstance(file, IO) else file
             log_error(f"Error reading {file_desc}: {e}")
             return []
+
+    def iter_read(
+        self,
+        file: Union[Path, IO[Any]],
+        name: Optional[str] = None,
+    ) -> Iterator[List[Document]]:
+        """Read an Excel file one window of `rows_per_window` rows at a time, yielding the documents of each window.
+
+        .xlsx rows are streamed from the workbook, .xls workbooks are loaded by xlrd as a whole.
+        """
+        file_extension = infer_file_extension(file, name)
+        workbook_name = get_workbook_name(file, name)
+
+        if isinstance(file, Path) and not file.exists():
+            raise FileNotFoundError(f"Could not find file: {file}")
+
+        file_desc = str(file) if isinstance(file, Path) else getattr(file, "name", "BytesIO")
+        log_debug(f"Reading Excel file in windows of {self.rows_per_window} rows: {file_desc}")
+
+        if file_extension == ContentType.XLSX or file_extension == ".xlsx":
+            with self._open_xlsx_sheets(file) as sheets:
+                yield from self._iter_row_windows(workbook_name, sheets)
+        elif file_extension == ContentType.XLS or file_extension == ".xls":
+            yield from self._iter_row_windows(workbook_name, self._xls_sheets(file))
+        else:
+            raise ValueError(f"Unsupported file extension: '{file_extension}'. Expected .xlsx or .xls")
+
+    async def async_iter_read(
+        self,
+        file: Union[Path, IO[Any]],
+        name: Optional[str] = None,
+    ) -> AsyncIterator[List[Document]]:
+        """Async version of iter_read, reading each window of rows in a worker thread."""
+        async for documents in self._aiter_in_thread(self.iter_read(file, name=name)):
+            yield documents
+
+    def _iter_row_windows(
+        self, workbook_name: str, sheets: Iterable[Tuple[str, int, Iterable[Sequence[Any]]]]
+    ) -> Iterator[List[Document]]:
+        for document in iter_excel_row_windows(
+            workbook_name=workbook_name, sheets=sheets, rows_per_window=self.rows_per_window
+        ):
+            yield self.chunk_document(document) if self.chunk else [document]
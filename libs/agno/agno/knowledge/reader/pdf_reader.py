@@ -1,7 +1,7 @@
 import asyncio
 import re
 from pathlib import Path
-from typing import IO, Any, List, Optional, Tuple, Union
+from typing import IO, Any, AsyncIterator, Iterator, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from agno.knowledge.chunking.document import DocumentChunking
@@ -119,7 +119,7 @@ def _clean_page_numbers(
     if all(x is None or x > 5 for x in page_numbers):
         # This approach won't work reliably for higher page numbers.
         page_content_list = [
-            f"\n{page_content_list[i]}\n{extra_content[i]}" if extra_content else page_content_list[i]
+            _format_page(page_content_list[i], extra_content[i] if extra_content else None)
             for i in range(len(page_content_list))
         ]
         return page_content_list, None
@@ -132,28 +132,51 @@ def _clean_page_numbers(
     if best_match and best_correct_count / len(page_numbers) >= PAGE_NUMBERING_CORRECTNESS_RATIO_FOR_REMOVAL:
         # Remove the page numbers from the content
         for i, expected_number in enumerate(best_match):
-            page_content_list[i] = re.sub(
-                rf"^\s*{expected_number}\s*|\s*{expected_number}\s*$", "", page_content_list[i]
+            page_content_list[i] = _format_page(
+                page_content_list[i],
+                extra_content[i] if extra_content else None,
+                page_nr=expected_number,
+                page_start_numbering_format=page_start_numbering_format,
+                page_end_numbering_format=page_end_numbering_format,
             )
-
-            page_start = (
-                page_start_numbering_format.format(page_nr=expected_number) + "\n"
-                if page_start_numbering_format
-                else ""
-            )
-            page_end = (
-                "\n" + page_end_numbering_format.format(page_nr=expected_number) if page_end_numbering_format else ""
-            )
-            extra_info = "\n" + extra_content[i] if extra_content else ""
-
-            # Add formatted page numbering if configured.
-            page_content_list[i] = page_start + page_content_list[i] + extra_info + page_end
     else:
         best_shift = None
 
     return page_content_list, best_shift
 
 
+def _format_page(
+    page_content: str,
+    extra_content: Optional[str] = None,
+    page_nr: Optional[int] = None,
+    page_start_numbering_format: str = PAGE_START_NUMBERING_FORMAT_DEFAULT,
+    page_end_numbering_format: str = PAGE_END_NUMBERING_FORMAT_DEFAULT,
+) -> str:
+    """Format the content of a page, replacing its page number `page_nr` with the configured numbering, if any."""
+    if page_nr is None:
+        return f"\n{page_content}\n{extra_content}" if extra_content is not None else page_content
+
+    page_content = re.sub(rf"^\s*{page_nr}\s*|\s*{page_nr}\s*$", "", page_content)
+    page_start = page_start_numbering_format.format(page_nr=page_nr) + "\n" if page_start_numbering_format else ""
+    page_end = "\n" + page_end_numbering_format.format(page_nr=page_nr) if page_end_numbering_format else ""
+    extra_info = "\n" + extra_content if extra_content is not None else ""
+
+    # Add formatted page numbering if configured.
+    return page_start + page_content + extra_info + page_end
+
+
+async def _async_read_pdf_page(page: Any, read_images: bool) -> Tuple[str, str]:
+    # We tried "asyncio.to_thread(page.extract_text)", but it maintains state internally, which leads to issues.
+    page_text = page.extract_text()
+
+    if read_images:
+        pdf_images_text = await _async_ocr_reader(page)
+    else:
+        pdf_images_text = ""
+
+    return page_text, pdf_images_text
+
+
 def _identify_best_page_sequence(page_numbers, range_shifts):
     best_match = None
     best_shift: Optional[int] = None
@@ -178,6 +201,8 @@ def _identify_best_page_sequence(page_numbers, range_shifts):
 
 
 class BasePDFReader(Reader):
+    streams_documents = True
+
     def __init__(
         self,
         split_on_pages: bool = True,
@@ -185,6 +210,7 @@ class BasePDFReader(Reader):
         page_end_numbering_format: Optional[str] = None,
         password: Optional[str] = None,
         chunking_strategy: Optional[ChunkingStrategy] = DocumentChunking(chunk_size=5000),
+        pages_per_window: int = 20,
         **kwargs,
     ):
         if page_start_numbering_format is None:
@@ -196,6 +222,8 @@ class BasePDFReader(Reader):
         self.page_start_numbering_format = page_start_numbering_format
         self.page_end_numbering_format = page_end_numbering_format
         self.password = password
+        # Number of pages read at a time by iter_read and async_iter_read
+        self.pages_per_window = pages_per_window
 
         super().__init__(chunking_strategy=chunking_strategy, **kwargs)
 
@@ -250,11 +278,18 @@ class BasePDFReader(Reader):
             log_error(f'Error decrypting PDF file "{doc_name}": {e}')
             return False
 
-    def _create_documents(self, pdf_content: List[str], doc_name: str, use_uuid_for_id: bool, page_number_shift):
+    def _create_documents(
+        self,
+        pdf_content: List[str],
+        doc_name: str,
+        use_uuid_for_id: bool,
+        page_number_shift,
+        first_page_index: int = 0,
+    ):
         if self.split_on_pages:
             shift = page_number_shift if page_number_shift is not None else 1
             documents: List[Document] = []
-            for page_number, page_content in enumerate(pdf_content, start=shift):
+            for page_number, page_content in enumerate(pdf_content, start=first_page_index + shift):
                 documents.append(
                     Document(
                         name=doc_name,
@@ -306,20 +341,9 @@ class BasePDFReader(Reader):
         read_images=False,
         use_uuid_for_id=False,
     ):
-        async def _read_pdf_page(page, read_images) -> Tuple[str, str]:
-            # We tried "asyncio.to_thread(page.extract_text)", but it maintains state internally, which leads to issues.
-            page_text = page.extract_text()
-
-            if read_images:
-                pdf_images_text = await _async_ocr_reader(page)
-            else:
-                pdf_images_text = ""
-
-            return page_text, pdf_images_text
-
         # Process pages in parallel using asyncio.gather
         pdf_content: List[Tuple[str, str]] = await asyncio.gather(
-            *[_read_pdf_page(page, read_images) for page in doc_reader.pages]
+            *[_async_read_pdf_page(page, read_images) for page in doc_reader.pages]
         )
 
         pdf_content_clean, shift = _clean_page_numbers(
@@ -331,6 +355,128 @@ class BasePDFReader(Reader):
 
         return self._create_documents(pdf_content_clean, doc_name, use_uuid_for_id, shift)
 
+    def _format_page_window(
+        self,
+        page_contents: List[str],
+        images_text: List[str],
+        first_page_index: int,
+        page_number_shift: Optional[int],
+    ) -> List[str]:
+        """Format a window of pages after the first one, with the page numbering detected on the first window."""
+        return [
+            _format_page(
+                page_content,
+                images_text[i] if images_text else None,
+                page_nr=first_page_index + i + page_number_shift if page_number_shift is not None else None,
+                page_start_numbering_format=self.page_start_numbering_format,
+                page_end_numbering_format=self.page_end_numbering_format,
+            )
+            for i, page_content in enumerate(page_contents)
+        ]
+
+    def _open_pdf(
+        self, pdf: Optional[Union[str, Path, IO[Any]]], doc_name: str, password: Optional[str] = None
+    ) -> Optional[DocumentReader]:
+        try:
+            pdf_reader = DocumentReader(pdf)  # type: ignore[arg-type]
+        except PdfStreamError as e:
+            log_error(f"Error reading PDF: {e}")
+            return None
+        if not self._decrypt_pdf(pdf_reader, doc_name, password):
+            return None
+        return pdf_reader
+
+    def _iter_pdf_reader_documents(
+        self, doc_reader: DocumentReader, doc_name: str, read_images: bool = False
+    ) -> Iterator[List[Document]]:
+        """Yield the documents of a PDF one window of `pages_per_window` pages at a time.
+
+        Page numbers are detected on the first window and the same numbering is applied to the next ones.
+        """
+        num_pages = len(doc_reader.pages)
+        page_number_shift: Optional[int] = None
+        for first_page_index in range(0, num_pages, self.pages_per_window):
+            pages = [
+                doc_reader.pages[i]
+                for i in range(first_page_index, min(first_page_index + self.pages_per_window, num_pages))
+            ]
+            page_contents = [page.extract_text() for page in pages]
+            images_text = [_ocr_reader(page) for page in pages] if read_images else []
+
+            if first_page_index == 0:
+                page_contents, page_number_shift = _clean_page_numbers(
+                    page_content_list=page_contents,
+                    extra_content=images_text,
+                    page_start_numbering_format=self.page_start_numbering_format,
+                    page_end_numbering_format=self.page_end_numbering_format,
+                )
+            else:
+                page_contents = self._format_page_window(
+                    page_contents, images_text, first_page_index, page_number_shift
+                )
+            yield self._create_documents(
+                page_contents, doc_name, True, page_number_shift, first_page_index=first_page_index
+            )
+
+    async def _async_iter_pdf_reader_documents(
+        self, doc_reader: DocumentReader, doc_name: str, read_images: bool = False
+    ) -> AsyncIterator[List[Document]]:
+        """Async version of _iter_pdf_reader_documents, reading the pages of each window in parallel."""
+        num_pages = len(doc_reader.pages)
+        page_number_shift: Optional[int] = None
+        for first_page_index in range(0, num_pages, self.pages_per_window):
+            pages = [
+                doc_reader.pages[i]
+                for i in range(first_page_index, min(first_page_index + self.pages_per_window, num_pages))
+            ]
+            pdf_content: List[Tuple[str, str]] = await asyncio.gather(
+                *[_async_read_pdf_page(page, read_images) for page in pages]
+            )
+            page_contents = [x[0] for x in pdf_content]
+            images_text = [x[1] for x in pdf_content]
+
+            if first_page_index == 0:
+                page_contents, page_number_shift = _clean_page_numbers(
+                    page_content_list=page_contents,
+                    extra_content=images_text,
+                    page_start_numbering_format=self.page_start_numbering_format,
+                    page_end_numbering_format=self.page_end_numbering_format,
+                )
+            else:
+                page_contents = self._format_page_window(
+                    page_contents, images_text, first_page_index, page_number_shift
+                )
+            yield self._create_documents(
+                page_contents, doc_name, True, page_number_shift, first_page_index=first_page_index
+            )
+
+    def _iter_read(
+        self, pdf: Optional[Union[str, Path, IO[Any]]], name: Optional[str], password: Optional[str], read_images: bool
+    ) -> Iterator[List[Document]]:
+        if pdf is None:
+            log_error("No pdf provided")
+            return
+        doc_name = self._get_doc_name(pdf, name)
+        log_debug(f"Reading in windows of {self.pages_per_window} pages: {doc_name}")
+
+        pdf_reader = self._open_pdf(pdf, doc_name, password)
+        if pdf_reader is not None:
+            yield from self._iter_pdf_reader_documents(pdf_reader, doc_name, read_images=read_images)
+
+    async def _async_iter_read(
+        self, pdf: Optional[Union[str, Path, IO[Any]]], name: Optional[str], password: Optional[str], read_images: bool
+    ) -> AsyncIterator[List[Document]]:
+        if pdf is None:
+            log_error("No pdf provided")
+            return
+        doc_name = self._get_doc_name(pdf, name)
+        log_debug(f"Reading in windows of {self.pages_per_window} pages: {doc_name}")
+
+        pdf_reader = self._open_pdf(pdf, doc_name, password)
+        if pdf_reader is not None:
+            async for documents in self._async_iter_pdf_reader_documents(pdf_reader, doc_name, read_images=read_images):
+                yield documents
+
 
 class PDFReader(BasePDFReader):
     """Reader for PDF files"""
@@ -388,6 +534,24 @@ class PDFReader(BasePDFReader):
         # Read and chunk.
         return await self._async_pdf_reader_to_documents(pdf_reader, doc_name, use_uuid_for_id=True)
 
+    def iter_read(
+        self,
+        pdf: Optional[Union[str, Path, IO[Any]]] = None,
+        name: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> Iterator[List[Document]]:
+        """Read and chunk a PDF one window of `pages_per_window` pages at a time."""
+        return self._iter_read(pdf, name, password, read_images=False)
+
+    def async_iter_read(
+        self,
+        pdf: Optional[Union[str, Path, IO[Any]]] = None,
+        name: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> AsyncIterator[List[Document]]:
+        """Async version of iter_read."""
+        return self._async_iter_read(pdf, name, password, read_images=False)
+
 
 class PDFImageReader(BasePDFReader):
     """Reader for PDF files with text and images extraction"""
@@ -434,3 +598,19 @@ class PDFImageReader(BasePDFReader):
 
         # Read and chunk.
         return await self._async_pdf_reader_to_documents(pdf_reader, doc_name, read_images=True, use_uuid_for_id=True)
+
+    def iter_read(
+        self, pdf: Union[str, Path, IO[Any]], name: Optional[str] = None, password: Optional[str] = None
+    ) -> Iterator[List[Document]]:
+        """Read and chunk a PDF, with the text of its images, one window of `pages_per_window` pages at a time."""
+        if not pdf:
+            raise ValueError("No pdf provided")
+        return self._iter_read(pdf, name, password, read_images=True)
+
+    def async_iter_read(
+        self, pdf: Union[str, Path, IO[Any]], name: Optional[str] = None, password: Optional[str] = None
+    ) -> AsyncIterator[List[Document]]:
+        """Async version of iter_read."""
+        if not pdf:
+            raise ValueError("No pdf provided")
+        return self._async_iter_read(pdf, name, password, read_images=True)
@@ -3,6 +3,7 @@ from agno.knowledge.reader.utils.spreadsheet import (
     excel_rows_to_documents,
     get_workbook_name,
     infer_file_extension,
+    iter_excel_row_windows,
     row_to_csv_line,
     stringify_cell_value,
 )
@@ -12,6 +13,7 @@ __all__ = [
     "excel_rows_to_documents",
     "get_workbook_name",
     "infer_file_extension",
+    "iter_excel_row_windows",
     "row_to_csv_line",
     "stringify_cell_value",
 ]
@@ -1,6 +1,6 @@
 from datetime import date, datetime
 from pathlib import Path
-from typing import IO, Any, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import IO, Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from uuid import uuid4
 
 from agno.knowledge.document.base import Document
@@ -112,3 +112,43 @@ def excel_rows_to_documents(
         )
 
     return documents
+
+
+def iter_excel_row_windows(
+    *,
+    workbook_name: str,
+    sheets: Iterable[Tuple[str, int, Iterable[Sequence[Any]]]],
+    rows_per_window: int,
+) -> Iterator[Document]:
+    """Convert Excel sheet rows to Documents of up to `rows_per_window` non-empty rows, consuming the rows lazily."""
+    for sheet_name, sheet_index, rows in sheets:
+        lines: List[str] = []
+        start_row = 1
+        is_empty = True
+        for row_number, row in enumerate(rows, start=1):
+            line = row_to_csv_line(row)
+            if not line:
+                continue
+            if not lines:
+                start_row = row_number
+            lines.append(line)
+            if len(lines) >= rows_per_window:
+                yield _row_window_document(workbook_name, sheet_name, sheet_index, start_row, lines)
+                lines = []
+                is_empty = False
+
+        if lines:
+            yield _row_window_document(workbook_name, sheet_name, sheet_index, start_row, lines)
+        elif is_empty:
+            log_debug(f"Sheet '{sheet_name}' is empty, skipping")
+
+
+def _row_window_document(
+    workbook_name: str, sheet_name: str, sheet_index: int, start_row: int, lines: List[str]
+) -> Document:
+    return Document(
+        name=workbook_name,
+        id=str(uuid4()),
+        meta_data={"sheet_name": sheet_name, "sheet_index": sheet_index, "start_row": start_row, "rows": len(lines)},
+        content="\n".join(lines),
+    )
@@ -1,9 +1,10 @@
 import asyncio
 import random
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
-from urllib.parse import urljoin, urlparse
+from typing import AsyncIterator, Deque, Dict, List, Optional, Set, Tuple
+from urllib.parse import urldefrag, urljoin, urlparse
 
 import httpx
 
@@ -12,6 +13,7 @@ from agno.knowledge.chunking.strategy import ChunkingStrategy, ChunkingStrategyT
 from agno.knowledge.document.base import Document
 from agno.knowledge.reader.base import Reader
 from agno.knowledge.types import ContentType
+from agno.utils.http import get_default_async_client
 from agno.utils.log import log_debug, log_error, log_warning
 
 try:
@@ -20,6 +22,31 @@ except ImportError:
     raise ImportError("The `bs4` package is not installed. Please install it via `pip install beautifulsoup4`.")
 
 
+class _HostLimit:
+    """Bounds the number of concurrent requests to a host and spaces out their start."""
+
+    def __init__(self, max_concurrent_requests: int, min_request_interval: float):
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self._min_request_interval = min_request_interval
+        self._next_start = 0.0
+
+    async def __aenter__(self) -> None:
+        await self._semaphore.acquire()
+        # Reserve the next start slot, the event loop runs one coroutine at a time so no lock is needed
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + self._min_request_interval
+        if start > now:
+            try:
+                await asyncio.sleep(start - now)
+            except BaseException:
+                self._semaphore.release()
+                raise
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._semaphore.release()
+
+
 @dataclass
 class WebsiteReader(Reader):
     """Reader for Websites"""
@@ -27,8 +54,16 @@ class WebsiteReader(Reader):
     max_depth: int = 3
     max_links: int = 10
 
+    # Crawl pages concurrently instead of one at a time with a random delay between requests
+    concurrent: bool = False
+    # Maximum number of pages fetched at once, in total and per host
+    max_concurrent_requests: int = 8
+    max_concurrent_requests_per_host: int = 4
+    # Minimum number of seconds between the start of two requests to the same host
+    min_request_interval: float = 0.2
+
     _visited: Set[str] = field(default_factory=set)
-    _urls_to_crawl: List[Tuple[str, int]] = field(default_factory=list)
+    _urls_to_crawl: Deque[Tuple[str, int]] = field(default_factory=deque)
 
     def __init__(
         self,
@@ -37,6 +72,10 @@ class WebsiteReader(Reader):
         max_links: int = 10,
         timeout: int = 10,
         proxy: Optional[str] = None,
+        concurrent: bool = False,
+        max_concurrent_requests: int = 8,
+        max_concurrent_requests_per_host: int = 4,
+        min_request_interval: float = 0.2,
         **kwargs,
     ):
         super().__init__(chunking_strategy=chunking_strategy, **kwargs)
@@ -44,9 +83,13 @@ class WebsiteReader(Reader):
         self.max_links = max_links
         self.proxy = proxy
         self.timeout = timeout
+        self.concurrent = concurrent
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_concurrent_requests_per_host = max_concurrent_requests_per_host
+        self.min_request_interval = min_request_interval
 
         self._visited = set()
-        self._urls_to_crawl = []
+        self._urls_to_crawl = deque()
 
     @classmethod
     def get_supported_chunking_strategies(cls) -> List[ChunkingStrategyType]:
@@ -161,14 +204,24 @@ class WebsiteReader(Reader):
         The crawler will also respect the `max_depth` attribute of the WebCrawler class, ensuring it does not
         crawl deeper than the specified depth.
         """
+        if self.concurrent:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # The shared async client is bound to the event loop it is used in, so use a dedicated one
+                return asyncio.run(self._async_crawl_concurrently(url, starting_depth=starting_depth, own_client=True))
+            log_debug("Crawling sequentially, use async_crawl() to crawl concurrently from a running event loop")
+
         num_links = 0
         crawler_result: Dict[str, str] = {}
         primary_domain = self._get_primary_domain(url)
+        # URLs already in the queue, so links are only queued once
+        queued: Set[Tuple[str, int]] = set()
         # Add starting URL with its depth to the global list
         self._urls_to_crawl.append((url, starting_depth))
         while self._urls_to_crawl:
             # Unpack URL and depth from the global list
-            current_url, current_depth = self._urls_to_crawl.pop(0)
+            current_url, current_depth = self._urls_to_crawl.popleft()
 
             # Skip if
             # - URL is already visited
@@ -220,10 +273,8 @@ class WebsiteReader(Reader):
                         parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
                     ):
                         full_url_str = str(full_url)
-                        if (
-                            full_url_str not in self._visited
-                            and (full_url_str, current_depth + 1) not in self._urls_to_crawl
-                        ):
+                        if full_url_str not in self._visited and (full_url_str, current_depth + 1) not in queued:
+                            queued.add((full_url_str, current_depth + 1))
                             self._urls_to_crawl.append((full_url_str, current_depth + 1))
 
             except httpx.HTTPStatusError as e:
@@ -272,18 +323,22 @@ class WebsiteReader(Reader):
         - httpx.HTTPStatusError: If there's an HTTP status error.
         - httpx.RequestError: If there's a request-related error (connection, timeout, etc).
         """
+        if self.concurrent:
+            return await self._async_crawl_concurrently(url, starting_depth=starting_depth)
+
         num_links = 0
         crawler_result: Dict[str, str] = {}
         primary_domain = self._get_primary_domain(url)
 
         # Clear previously visited URLs and URLs to crawl
         self._visited = set()
-        self._urls_to_crawl = [(url, starting_depth)]
+        self._urls_to_crawl = deque([(url, starting_depth)])
+        queued: Set[Tuple[str, int]] = set()
 
         client_args = {"proxy": self.proxy} if self.proxy else {}
         async with httpx.AsyncClient(**client_args) as client:  # type: ignore
             while self._urls_to_crawl and num_links < self.max_links:
-                current_url, current_depth = self._urls_to_crawl.pop(0)
+                current_url, current_depth = self._urls_to_crawl.popleft()
 
                 if (
                     current_url in self._visited
@@ -325,10 +380,8 @@ class WebsiteReader(Reader):
                             parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
                         ):
                             full_url_str = str(full_url)
-                            if (
-                                full_url_str not in self._visited
-                                and (full_url_str, current_depth + 1) not in self._urls_to_crawl
-                            ):
+                            if full_url_str not in self._visited and (full_url_str, current_depth + 1) not in queued:
+                                queued.add((full_url_str, current_depth + 1))
                                 self._urls_to_crawl.append((full_url_str, current_depth + 1))
 
                 except httpx.HTTPStatusError as e:
@@ -359,6 +412,174 @@ class WebsiteReader(Reader):
 
         return crawler_result
 
+    def _parse_page(self, html: bytes, page_url: str, primary_domain: str) -> Tuple[str, List[str]]:
+        """
+        Parses a page, returning its main content and the URLs of the linked pages to crawl.
+
+        :param html: The content of the page.
+        :param page_url: The URL of the page, used to resolve relative links.
+        :param primary_domain: Only links to this domain are returned.
+        :return: The main content and the linked URLs, without fragments.
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        main_content = self._extract_main_content(soup)
+
+        links: List[str] = []
+        for link in soup.find_all("a", href=True):
+            if not isinstance(link, Tag):
+                continue
+            full_url, _ = urldefrag(urljoin(page_url, str(link["href"])))
+            parsed_url = urlparse(full_url)
+            if parsed_url.netloc.endswith(primary_domain) and not any(
+                parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
+            ):
+                links.append(full_url)
+        return main_content, links
+
+    async def _async_crawl_page(
+        self,
+        client: httpx.AsyncClient,
+        page_url: str,
+        primary_domain: str,
+        host_limits: Dict[str, _HostLimit],
+    ) -> Tuple[str, List[str]]:
+        host = urlparse(page_url).netloc
+        host_limit = host_limits.get(host)
+        if host_limit is None:
+            host_limit = _HostLimit(self.max_concurrent_requests_per_host, self.min_request_interval)
+            host_limits[host] = host_limit
+
+        async with host_limit:
+            log_debug(f"Crawling concurrently: {page_url}")
+            response = await client.get(page_url, timeout=self.timeout, follow_redirects=True)
+        response.raise_for_status()
+
+        # Parse in a worker thread, so other pages are fetched meanwhile
+        return await asyncio.to_thread(self._parse_page, response.content, page_url, primary_domain)
+
+    async def async_iter_crawl(
+        self, url: str, starting_depth: int = 1, client: Optional[httpx.AsyncClient] = None
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Crawls a website concurrently, yielding each URL and its main content as soon as the page is crawled.
+
+        Up to `max_concurrent_requests` pages are fetched at once, with at most `max_concurrent_requests_per_host`
+        requests to the same host, started at least `min_request_interval` seconds apart.
+
+        Parameters:
+        - url (str): The starting URL to begin the crawl.
+        - starting_depth (int, optional): The starting depth level for the crawl. Defaults to 1.
+        - client (httpx.AsyncClient, optional): The client to use. Defaults to the shared async client, or a
+                                                dedicated client when a proxy is set.
+
+        Raises:
+        - httpx.HTTPStatusError: If there's an HTTP status error for the starting URL.
+        - httpx.RequestError: If there's a request-related error for the starting URL, or no content was extracted.
+        """
+        if client is None and self.proxy:
+            async with httpx.AsyncClient(proxy=self.proxy) as proxy_client:
+                async for page in self.async_iter_crawl(url, starting_depth=starting_depth, client=proxy_client):
+                    yield page
+            return
+        if client is None:
+            client = get_default_async_client()
+
+        primary_domain = self._get_primary_domain(url)
+        host_limits: Dict[str, _HostLimit] = {}
+        frontier: Deque[Tuple[str, int]] = deque([(url, starting_depth)])
+        # URLs already crawled or in the frontier
+        seen: Set[str] = {url}
+        in_flight: Dict["asyncio.Task[Tuple[str, List[str]]]", Tuple[str, int]] = {}
+        num_links = 0
+
+        try:
+            while frontier or in_flight:
+                # Only fetch as many pages as could still be needed
+                while frontier and len(in_flight) < min(self.max_concurrent_requests, self.max_links - num_links):
+                    page_url, depth = frontier.popleft()
+                    task = asyncio.create_task(self._async_crawl_page(client, page_url, primary_domain, host_limits))
+                    in_flight[task] = (page_url, depth)
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    page_url, depth = in_flight.pop(task)
+                    try:
+                        main_content, links = task.result()
+                    except httpx.HTTPStatusError as e:
+                        log_warning(f"HTTP status error while crawling {page_url}: {e}")
+                        if page_url == url:
+                            raise
+                        continue
+                    except httpx.RequestError as e:
+                        log_warning(f"Request error while crawling {page_url}: {e}")
+                        if page_url == url:
+                            raise
+                        continue
+                    except Exception as e:
+                        log_warning(f"Failed to crawl {page_url}: {e}")
+                        if page_url == url:
+                            raise httpx.RequestError(
+                                f"Failed to crawl starting URL {url}: {str(e)}", request=None
+                            ) from e
+                        continue
+
+                    if depth < self.max_depth:
+                        for link in links:
+                            if link not in seen:
+                                seen.add(link)
+                                frontier.append((link, depth + 1))
+
+                    if main_content and num_links < self.max_links:
+                        num_links += 1
+                        yield page_url, main_content
+
+                if num_links >= self.max_links:
+                    break
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+        # If we couldn't crawl any pages, raise an error
+        if num_links == 0:
+            raise httpx.RequestError(f"Failed to extract any content from {url}", request=None)
+
+    async def _async_crawl_concurrently(
+        self, url: str, starting_depth: int = 1, own_client: bool = False
+    ) -> Dict[str, str]:
+        """Collect the pages of async_iter_crawl, optionally with a client bound to the current event loop."""
+        crawler_result: Dict[str, str] = {}
+        if own_client and not self.proxy:
+            async with httpx.AsyncClient() as client:
+                async for page_url, main_content in self.async_iter_crawl(url, starting_depth, client=client):
+                    crawler_result[page_url] = main_content
+        else:
+            async for page_url, main_content in self.async_iter_crawl(url, starting_depth):
+                crawler_result[page_url] = main_content
+        return crawler_result
+
+    async def async_iter_read(self, url: str, name: Optional[str] = None) -> AsyncIterator[List[Document]]:
+        """
+        Reads a website concurrently, yielding the documents of each page as soon as it is crawled.
+
+        Documents are chunked when `chunk` is set, so pages can be chunked and embedded while the crawl continues.
+
+        :param url: The URL of the website to read.
+        :return: An iterator over the documents of each crawled page.
+        :raises httpx.HTTPStatusError: If there's an HTTP status error.
+        :raises httpx.RequestError: If there's a request-related error.
+        """
+        log_debug(f"Reading concurrently: {url}")
+        async for crawled_url, crawled_content in self.async_iter_crawl(url):
+            document = Document(
+                name=name or url,
+                id=str(crawled_url),
+                meta_data={"url": str(crawled_url)},
+                content=crawled_content,
+            )
+            yield await self.achunk_document(document) if self.chunk else [document]
+
     def read(self, url: str, name: Optional[str] = None) -> List[Document]:
         """
         Reads a website and returns a list of documents.
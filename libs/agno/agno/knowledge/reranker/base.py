@@ -12,3 +12,7 @@ class Reranker(BaseModel):
 
     def rerank(self, query: str, documents: List[Document]) -> List[Document]:
         raise NotImplementedError
+
+    def warmup(self) -> None:
+        """Load the local model used by this reranker, if any, so the first request doesn't have to."""
+        pass
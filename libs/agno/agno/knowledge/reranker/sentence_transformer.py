@@ -1,6 +1,7 @@
 from typing import Any, Dict, List, Optional
 
 from agno.knowledge.document import Document
+from agno.knowledge.local_models import get_model_key, local_model_registry
 from agno.knowledge.reranker.base import Reranker
 from agno.utils.log import logger
 
@@ -15,11 +16,21 @@ class SentenceTransformerReranker(Reranker):
     model_kwargs: Optional[Dict[str, Any]] = None
     top_n: Optional[int] = None
 
+    def _get_cross_encoder(self) -> CrossEncoder:
+        """Get the CrossEncoder from the local model registry, loading it on first use."""
+        return local_model_registry.get(
+            get_model_key("sentence-transformers-cross-encoder", self.model, **(self.model_kwargs or {})),
+            lambda: CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs),
+        )
+
+    def warmup(self) -> None:
+        self._get_cross_encoder()
+
     def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
         if not documents:
             return []
 
-        sentence_transformer_client = CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs)
+        sentence_transformer_client = self._get_cross_encoder()
 
         top_n = self.top_n
         if top_n and not (0 < top_n):
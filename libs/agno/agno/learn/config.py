@@ -329,6 +329,13 @@ class EntityMemoryConfig:
         agent_can_update_entity: If agent_tools enabled, provide update_entity tool.
         agent_can_search_entities: If agent_tools enabled, provide search_entities tool.
 
+        # Search
+        search_index_refresh_interval: Seconds after which the in-memory search index of a
+            namespace is rebuilt from the database, to pick up changes made by other processes.
+            None to never rebuild. Changes made through this process are indexed immediately.
+        max_search_indexes: Maximum number of namespace (and user) search indexes kept in memory
+            per database. The least recently used index is dropped, and rebuilt on its next search.
+
         # Prompt customization
         instructions: Custom instructions for entity extraction.
         additional_instructions: Extra instructions appended to default.
@@ -361,6 +368,10 @@ class EntityMemoryConfig:
     agent_can_update_entity: bool = True
     agent_can_search_entities: bool = True
 
+    # Search
+    search_index_refresh_interval: Optional[float] = 60.0
+    max_search_indexes: int = 128
+
     # Prompt customization
     instructions: Optional[str] = None
     additional_instructions: Optional[str] = None
@@ -0,0 +1,157 @@
+"""
+Learning Search Index
+=====================
+In-memory inverted index used to search learnings.
+
+Documents are tokenized into lowercase words and ranked with BM25.
+Lookups only touch the posting lists of the query terms, so they stay
+fast and complete however many documents are indexed, and documents
+can be added, replaced and removed one at a time.
+"""
+
+import math
+import re
+import threading
+from collections import Counter
+from heapq import nlargest
+from time import monotonic
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Words, with underscores treated as separators so identifiers like "acme_corp" match "acme"
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class BM25Index:
+    """Inverted index ranking documents with BM25.
+
+    Args:
+        k1: Term frequency saturation.
+        b: Document length normalization.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        # term -> {doc_id: term frequency}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        # doc_id -> document length in tokens, and the terms of each document
+        self._lengths: Dict[str, int] = {}
+        self._doc_terms: Dict[str, List[str]] = {}
+        self._total_length = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._lengths
+
+    def add(self, doc_id: str, text: str) -> None:
+        """Index a document, replacing any previous version of it."""
+        tokens = tokenize(text)
+        with self._lock:
+            self._remove(doc_id)
+            frequencies = Counter(tokens)
+            for term, frequency in frequencies.items():
+                self._postings.setdefault(term, {})[doc_id] = frequency
+            self._doc_terms[doc_id] = list(frequencies)
+            self._lengths[doc_id] = len(tokens)
+            self._total_length += len(tokens)
+
+    def remove(self, doc_id: str) -> None:
+        with self._lock:
+            self._remove(doc_id)
+
+    def _remove(self, doc_id: str) -> None:
+        length = self._lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self._total_length -= length
+        for term in self._doc_terms.pop(doc_id, []):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings.clear()
+            self._lengths.clear()
+            self._doc_terms.clear()
+            self._total_length = 0
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        doc_filter: Optional[Callable[[str], bool]] = None,
+    ) -> List[Tuple[str, float]]:
+        """Return up to `limit` (doc_id, score) pairs for documents containing any query term, best first."""
+        terms = set(tokenize(query))
+        with self._lock:
+            num_docs = len(self._lengths)
+            if not terms or num_docs == 0:
+                return []
+            average_length = self._total_length / num_docs or 1.0
+            scores: Dict[str, float] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (num_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, frequency in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._lengths[doc_id] / average_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        candidates: Iterable[Tuple[str, float]] = scores.items()
+        if doc_filter is not None:
+            candidates = (item for item in candidates if doc_filter(item[0]))
+        return nlargest(limit, candidates, key=lambda item: item[1])
+
+
+class LearningSearchIndex:
+    """Search index over the learnings of one scope (e.g. a namespace), keeping the indexed content.
+
+    Args:
+        refresh_interval: Seconds after which the index is considered stale and should be rebuilt from the
+            database, to pick up changes made by other processes. None to never rebuild.
+    """
+
+    def __init__(self, refresh_interval: Optional[float] = None):
+        self.refresh_interval = refresh_interval
+        self.index = BM25Index()
+        self.contents: Dict[str, Dict[str, Any]] = {}
+        self.built_at: Optional[float] = None
+        self.lock = threading.RLock()
+
+    @property
+    def is_stale(self) -> bool:
+        if self.built_at is None:
+            return True
+        return self.refresh_interval is not None and monotonic() - self.built_at > self.refresh_interval
+
+    def rebuild(self, documents: Iterable[Tuple[str, Dict[str, Any], str]]) -> None:
+        """Replace the indexed documents with (doc_id, content, text) triples."""
+        with self.lock:
+            self.index.clear()
+            self.contents.clear()
+            for doc_id, content, text in documents:
+                self.index.add(doc_id, text)
+                self.contents[doc_id] = content
+            self.built_at = monotonic()
+
+    def upsert(self, doc_id: str, content: Dict[str, Any], text: str) -> None:
+        with self.lock:
+            self.index.add(doc_id, text)
+            self.contents[doc_id] = content
+
+    def remove(self, doc_id: str) -> None:
+        with self.lock:
+            self.index.remove(doc_id)
+            self.contents.pop(doc_id, None)
@@ -34,14 +34,18 @@ Supported Modes:
 - AGENTIC: Agent calls tools directly to manage entity info
 """
 
+import threading
+from collections import OrderedDict
 from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from os import getenv
 from textwrap import dedent
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
 
 from agno.learn.config import EntityMemoryConfig, LearningMode
+from agno.learn.index import LearningSearchIndex
 from agno.learn.schemas import EntityMemory
 from agno.learn.stores.protocol import LearningStore
 from agno.utils.log import (
@@ -57,6 +61,13 @@ try:
 except ImportError:
     pass
 
+SearchScope = Tuple[str, Optional[str]]
+
+# Search indexes per database and (namespace, user_id), shared by every store using the same database.
+# Each database keeps its most recently used indexes, evicted ones are rebuilt on their next search.
+_search_indexes: "WeakKeyDictionary[Any, OrderedDict[SearchScope, LearningSearchIndex]]" = WeakKeyDictionary()
+_search_indexes_lock = threading.Lock()
+
 
 @dataclass
 class EntityMemoryStore(LearningStore):
@@ -80,6 +91,10 @@ class EntityMemoryStore(LearningStore):
     # State tracking (internal)
     entity_updated: bool = field(default=False, init=False)
     _schema: Any = field(default=None, init=False)
+    # Used when the database cannot be weakly referenced
+    _local_search_indexes: "OrderedDict[SearchScope, LearningSearchIndex]" = field(
+        default_factory=OrderedDict, init=False
+    )
 
     def __post_init__(self):
         self._schema = self.config.schema or EntityMemory
@@ -1716,6 +1731,10 @@ class EntityMemoryStore(LearningStore):
     ) -> List[EntityMemory]:
         """Search for entities matching query.
 
+        Entities are looked up in an in-memory BM25 index over their name, description,
+        properties, facts, events and relationships, built from the database on first use.
+        Queries matching no indexed word fall back to a substring match.
+
         Args:
             query: Search query (matched against name, facts, events, etc.).
             entity_type: Filter by entity type.
@@ -1732,27 +1751,16 @@ class EntityMemoryStore(LearningStore):
         effective_namespace = namespace or self.config.namespace
 
         try:
-            results = self.db.get_learnings(
-                learning_type=self.learning_type,
-                entity_type=entity_type,
-                namespace=effective_namespace,
-                user_id=user_id if effective_namespace == "user" else None,
-                limit=limit * 3,  # Over-fetch for filtering
-            )
-
-            entities = []
-            query_lower = query.lower()
-
-            for result in results or []:  # type: ignore[union-attr]
-                content = result.get("content", {})
-                if self._matches_query(content=content, query=query_lower):
-                    entity = self.schema.from_dict(content)
-                    if entity:
-                        entities.append(entity)
-
-                if len(entities) >= limit:
-                    break
+            index = self._get_search_index(namespace=effective_namespace, user_id=user_id)
+            if index.is_stale:
+                results = self.db.get_learnings(
+                    learning_type=self.learning_type,
+                    namespace=effective_namespace,
+                    user_id=user_id if effective_namespace == "user" else None,
+                )
+                index.rebuild(self._iter_search_documents(results or [], effective_namespace))  # type: ignore[arg-type]
 
+            entities = self._search_index(index=index, query=query, entity_type=entity_type, limit=limit)
             log_debug(f"EntityMemoryStore.search: found {len(entities)} entities for query: {query[:50]}...")
             return entities
 
@@ -1775,36 +1783,23 @@ class EntityMemoryStore(LearningStore):
         effective_namespace = namespace or self.config.namespace
 
         try:
-            if isinstance(self.db, AsyncBaseDb):
-                results = await self.db.get_learnings(
-                    learning_type=self.learning_type,
-                    entity_type=entity_type,
-                    namespace=effective_namespace,
-                    user_id=user_id if effective_namespace == "user" else None,
-                    limit=limit * 3,
-                )
-            else:
-                results = self.db.get_learnings(
-                    learning_type=self.learning_type,
-                    entity_type=entity_type,
-                    namespace=effective_namespace,
-                    user_id=user_id if effective_namespace == "user" else None,
-                    limit=limit * 3,
-                )
-
-            entities = []
-            query_lower = query.lower()
-
-            for result in results or []:
-                content = result.get("content", {})
-                if self._matches_query(content=content, query=query_lower):
-                    entity = self.schema.from_dict(content)
-                    if entity:
-                        entities.append(entity)
-
-                if len(entities) >= limit:
-                    break
-
+            index = self._get_search_index(namespace=effective_namespace, user_id=user_id)
+            if index.is_stale:
+                if isinstance(self.db, AsyncBaseDb):
+                    results = await self.db.get_learnings(
+                        learning_type=self.learning_type,
+                        namespace=effective_namespace,
+                        user_id=user_id if effective_namespace == "user" else None,
+                    )
+                else:
+                    results = self.db.get_learnings(
+                        learning_type=self.learning_type,
+                        namespace=effective_namespace,
+                        user_id=user_id if effective_namespace == "user" else None,
+                    )
+                index.rebuild(self._iter_search_documents(results or [], effective_namespace))
+
+            entities = self._search_index(index=index, query=query, entity_type=entity_type, limit=limit)
             log_debug(f"EntityMemoryStore.asearch: found {len(entities)} entities for query: {query[:50]}...")
             return entities
 
@@ -1812,6 +1807,92 @@ class EntityMemoryStore(LearningStore):
             log_debug(f"EntityMemoryStore.asearch failed: {e}")
             return []
 
+    # =========================================================================
+    # Search Index
+    # =========================================================================
+
+    def _get_search_index(self, namespace: str, user_id: Optional[str] = None) -> LearningSearchIndex:
+        """Get the search index of a namespace, creating an empty (stale) one if needed."""
+        scope: SearchScope = (namespace, user_id if namespace == "user" else None)
+        with _search_indexes_lock:
+            try:
+                indexes = _search_indexes.setdefault(self.db, OrderedDict())
+            except TypeError:
+                indexes = self._local_search_indexes
+            index = indexes.get(scope)
+            if index is None:
+                index = LearningSearchIndex(refresh_interval=self.config.search_index_refresh_interval)
+                indexes[scope] = index
+                while len(indexes) > max(self.config.max_search_indexes, 1):
+                    indexes.popitem(last=False)
+            else:
+                indexes.move_to_end(scope)
+        return index
+
+    def _update_search_index(self, content: Dict[str, Any], namespace: str, user_id: Optional[str] = None) -> None:
+        """Index a saved entity, if the search index of its namespace was already built."""
+        index = self._get_search_index(namespace=namespace, user_id=user_id)
+        if index.built_at is None:
+            return
+        doc_id = self._build_entity_db_id(content.get("entity_id", ""), content.get("entity_type", ""), namespace)
+        index.upsert(doc_id, content, self._get_search_text(content))
+
+    def _iter_search_documents(
+        self, results: List[Dict[str, Any]], namespace: str
+    ) -> Iterator[Tuple[str, Dict[str, Any], str]]:
+        for result in results:
+            content = result.get("content")
+            if not isinstance(content, dict):
+                continue
+            doc_id = self._build_entity_db_id(content.get("entity_id", ""), content.get("entity_type", ""), namespace)
+            yield doc_id, content, self._get_search_text(content)
+
+    def _search_index(
+        self, index: LearningSearchIndex, query: str, entity_type: Optional[str], limit: int
+    ) -> List[EntityMemory]:
+        with index.lock:
+            contents = index.contents
+
+            def matches_type(doc_id: str) -> bool:
+                return entity_type is None or contents[doc_id].get("entity_type") == entity_type
+
+            hits = [contents[doc_id] for doc_id, _ in index.index.search(query, limit=limit, doc_filter=matches_type)]
+            if not hits:
+                # Partial words are not in the index, so fall back to a substring match
+                query_lower = query.lower()
+                for doc_id, content in contents.items():
+                    if matches_type(doc_id) and self._matches_query(content=content, query=query_lower):
+                        hits.append(content)
+                        if len(hits) >= limit:
+                            break
+
+        entities = []
+        for content in hits:
+            # Indexed content is copied, so changes to returned entities only apply once saved
+            entity = self.schema.from_dict(deepcopy(content))
+            if entity:
+                entities.append(entity)
+        return entities
+
+    def _get_search_text(self, content: Dict[str, Any]) -> str:
+        """Text indexed for an entity, covering the fields checked by _matches_query."""
+        parts = [
+            str(content.get("name") or ""),
+            str(content.get("entity_id") or ""),
+            str(content.get("description") or ""),
+        ]
+        properties = content.get("properties") or {}
+        if isinstance(properties, dict):
+            parts.extend(str(value) for value in properties.values())
+        for key in ("facts", "events"):
+            for item in content.get(key) or []:
+                parts.append(str(item.get("content", "")) if isinstance(item, dict) else str(item))
+        for rel in content.get("relationships") or []:
+            if isinstance(rel, dict):
+                parts.append(str(rel.get("entity_id", "")))
+                parts.append(str(rel.get("relation", "")))
+        return "\n".join(parts)
+
     def _matches_query(self, content: Dict[str, Any], query: str) -> bool:
         """Check if entity content matches search query."""
         # Check name
@@ -1944,6 +2025,7 @@ class EntityMemoryStore(LearningStore):
                 team_id=team_id,
                 content=entity.to_dict(),
             )
+            self._update_search_index(entity.to_dict(), namespace=effective_namespace, user_id=user_id)
 
             log_debug(f"EntityMemoryStore.create_entity: created {entity_type}/{entity_id}")
             return True
@@ -2028,6 +2110,7 @@ class EntityMemoryStore(LearningStore):
                     team_id=team_id,
                     content=entity.to_dict(),
                 )
+            self._update_search_index(entity.to_dict(), namespace=effective_namespace, user_id=user_id)
 
             log_debug(f"EntityMemoryStore.acreate_entity: created {entity_type}/{entity_id}")
             return True
@@ -2566,6 +2649,7 @@ class EntityMemoryStore(LearningStore):
                 team_id=team_id,
                 content=content,
             )
+            self._update_search_index(content, namespace=effective_namespace, user_id=user_id)
 
             return True
 
@@ -2616,6 +2700,7 @@ class EntityMemoryStore(LearningStore):
                     team_id=team_id,
                     content=content,
                 )
+            self._update_search_index(content, namespace=effective_namespace, user_id=user_id)
 
             return True
 
@@ -0,0 +1,146 @@
+"""
+Memory Vector Index
+===================
+In-memory vector index over the memories of one user.
+
+Memories are embedded once, when they are written or first searched, and
+queries are answered with a local cosine similarity top-k instead of a
+model call. Uses numpy when it is installed.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from heapq import nlargest
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from agno.db.schemas import UserMemory
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+
+def get_memory_text(memory: UserMemory) -> str:
+    """Text embedded for a memory."""
+    text = memory.memory or ""
+    if memory.topics:
+        text += f"\nTopics: {', '.join(memory.topics)}"
+    return text
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm == 0:
+        return list(vector)
+    return [value / norm for value in vector]
+
+
+class MemoryVectorIndex:
+    """Normalized embeddings of the memories of one user, keyed by memory id."""
+
+    def __init__(self) -> None:
+        # memory_id -> (embedded text, normalized vector)
+        self._entries: Dict[str, Tuple[str, List[float]]] = {}
+        # Stacked vectors, rebuilt on the first search after a change
+        self._matrix: Optional[Any] = None
+        self._matrix_ids: List[str] = []
+        self.lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._entries
+
+    def is_current(self, memory_id: str, text: str) -> bool:
+        """Whether the memory is indexed with this exact text."""
+        entry = self._entries.get(memory_id)
+        return entry is not None and entry[0] == text
+
+    def upsert(self, memory_id: str, text: str, vector: List[float]) -> None:
+        with self.lock:
+            self._entries[memory_id] = (text, _normalize(vector))
+            self._matrix = None
+
+    def remove(self, memory_id: str) -> None:
+        with self.lock:
+            if self._entries.pop(memory_id, None) is not None:
+                self._matrix = None
+
+    def retain(self, memory_ids: Iterable[str]) -> None:
+        """Remove every memory not in memory_ids."""
+        keep = set(memory_ids)
+        with self.lock:
+            for memory_id in [memory_id for memory_id in self._entries if memory_id not in keep]:
+                del self._entries[memory_id]
+                self._matrix = None
+
+    def clear(self) -> None:
+        with self.lock:
+            self._entries.clear()
+            self._matrix = None
+
+    def search(self, query_vector: List[float], limit: int = 10) -> List[Tuple[str, float]]:
+        """Return up to `limit` (memory_id, cosine similarity) pairs, most similar first."""
+        query = _normalize(query_vector)
+        with self.lock:
+            if not self._entries or limit <= 0:
+                return []
+            if np is None:
+                scores = (
+                    (memory_id, sum(a * b for a, b in zip(query, vector)))
+                    for memory_id, (_, vector) in self._entries.items()
+                )
+                return nlargest(limit, scores, key=lambda item: item[1])
+
+            if self._matrix is None:
+                self._matrix_ids = list(self._entries)
+                self._matrix = np.array([self._entries[memory_id][1] for memory_id in self._matrix_ids])
+            matrix, matrix_ids = self._matrix, self._matrix_ids
+
+        similarities = matrix @ np.array(query)
+        if limit < len(matrix_ids):
+            top = np.argpartition(-similarities, limit)[:limit]
+        else:
+            top = np.arange(len(matrix_ids))
+        top = top[np.argsort(-similarities[top])]
+        return [(matrix_ids[i], float(similarities[i])) for i in top]
+
+
+# Indexes are shared by every MemoryManager using the same database, per user and embedder.
+# Each database keeps an LRU of its indexes, bounded by the max_indexes of the manager that creates one.
+IndexScope = Tuple[str, str]
+_memory_indexes: "WeakKeyDictionary[Any, OrderedDict[IndexScope, MemoryVectorIndex]]" = WeakKeyDictionary()
+_memory_indexes_lock = threading.Lock()
+
+
+def get_memory_vector_index(
+    db: Any,
+    user_id: str,
+    embedder_namespace: str,
+    local_indexes: "OrderedDict[IndexScope, MemoryVectorIndex]",
+    max_indexes: int = 128,
+) -> MemoryVectorIndex:
+    """Get the vector index of a user's memories in a database, creating an empty one if needed.
+
+    Falls back to `local_indexes` when the database can not be weakly referenced. The least recently used
+    indexes are evicted once more than `max_indexes` are kept, and are rebuilt on their user's next search.
+    """
+    scope: IndexScope = (user_id, embedder_namespace)
+    with _memory_indexes_lock:
+        try:
+            indexes = _memory_indexes.setdefault(db, OrderedDict())
+        except TypeError:
+            indexes = local_indexes
+        index = indexes.get(scope)
+        if index is None:
+            index = MemoryVectorIndex()
+            indexes[scope] = index
+            while len(indexes) > max(max_indexes, 1):
+                indexes.popitem(last=False)
+        else:
+            indexes.move_to_end(scope)
+    return index
@@ -1,13 +1,15 @@
+from collections import OrderedDict
 from copy import deepcopy
 from dataclasses import dataclass
 from os import getenv
 from textwrap import dedent
-from typing import Any, Callable, Dict, List, Literal, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Type, Union
 
 from pydantic import BaseModel, Field
 
 from agno.db.base import AsyncBaseDb, BaseDb
 from agno.db.schemas import UserMemory
+from agno.memory.index import IndexScope, MemoryVectorIndex, get_memory_text, get_memory_vector_index
 from agno.memory.strategies import MemoryOptimizationStrategy
 from agno.memory.strategies.types import (
     MemoryOptimizationStrategyFactory,
@@ -28,6 +30,9 @@ from agno.utils.log import (
 from agno.utils.prompts import get_json_output_prompt
 from agno.utils.string import parse_response_model_str
 
+if TYPE_CHECKING:
+    from agno.knowledge.embedder.base import Embedder
+
 
 class MemorySearchResponse(BaseModel):
     """Model for Memory Search Response."""
@@ -68,6 +73,11 @@ class MemoryManager:
     # The database to store memories
     db: Optional[Union[BaseDb, AsyncBaseDb]] = None
 
+    # Embedder used by the "semantic" retrieval method. Memories are embedded when written or first searched.
+    embedder: Optional["Embedder"] = None
+    # Maximum number of per-user memory indexes kept in memory. The least recently used ones are rebuilt when needed.
+    max_memory_indexes: int = 128
+
     debug_mode: bool = False
 
     def __init__(
@@ -81,6 +91,8 @@ class MemoryManager:
         update_memories: bool = True,
         add_memories: bool = True,
         clear_memories: bool = False,
+        embedder: Optional["Embedder"] = None,
+        max_memory_indexes: int = 128,
         debug_mode: bool = False,
     ):
         self.model = model  # type: ignore[assignment]
@@ -92,7 +104,11 @@ class MemoryManager:
         self.update_memories = update_memories
         self.add_memories = add_memories
         self.clear_memories = clear_memories
+        self.embedder = embedder
+        self.max_memory_indexes = max_memory_indexes
         self.debug_mode = debug_mode
+        # Used when the db can not be weakly referenced to share memory indexes across managers
+        self._local_memory_indexes: "OrderedDict[IndexScope, MemoryVectorIndex]" = OrderedDict()
 
         if self.model is not None:
             self.model = get_model(self.model)
@@ -328,6 +344,10 @@ class MemoryManager:
             self.db.delete_user_memories(memory_ids=memory_ids, user_id=user_id)
             log_debug(f"Cleared {len(memory_ids)} memories for user {user_id}")
 
+        index = self._get_memory_index(user_id)
+        if index is not None:
+            index.clear()
+
     async def aclear_user_memories(self, user_id: Optional[str] = None) -> None:
         """Clear all memories for a specific user (async).
 
@@ -361,6 +381,10 @@ class MemoryManager:
                 self.db.delete_user_memories(memory_ids=memory_ids, user_id=user_id)
             log_debug(f"Cleared {len(memory_ids)} memories for user {user_id}")
 
+        index = self._get_memory_index(user_id)
+        if index is not None:
+            index.clear()
+
     # -*- Agent Functions
     def create_user_memories(
         self,
@@ -557,6 +581,7 @@ class MemoryManager:
             if not self.db:
                 raise ValueError("Memory db not initialized")
             self.db.upsert_user_memory(memory=memory)
+            self._index_memory(memory)
             return "Memory added successfully"
         except Exception as e:
             log_warning(f"Error storing memory in db: {e}")
@@ -572,29 +597,120 @@ class MemoryManager:
                 user_id = "default"
 
             self.db.delete_user_memory(memory_id=memory_id, user_id=user_id)
+            self._unindex_memory(memory_id=memory_id, user_id=user_id)
             return "Memory deleted successfully"
         except Exception as e:
             log_warning(f"Error deleting memory in db: {e}")
             return f"Error deleting memory: {e}"
 
+    # -*- Memory Index Functions
+    def _get_memory_index(self, user_id: str) -> Optional[MemoryVectorIndex]:
+        """Get the vector index of a user's memories, if an embedder is set."""
+        if self.embedder is None or self.db is None:
+            return None
+        return get_memory_vector_index(
+            self.db,
+            user_id=user_id,
+            embedder_namespace=self.embedder.get_embedding_cache_namespace(),
+            local_indexes=self._local_memory_indexes,
+            max_indexes=self.max_memory_indexes,
+        )
+
+    def _get_stale_memory_index(self, memory: UserMemory) -> Optional[MemoryVectorIndex]:
+        """Get the vector index of a saved memory's user, if the memory is not indexed with its current text."""
+        if memory.memory_id is None or memory.user_id is None:
+            return None
+        index = self._get_memory_index(memory.user_id)
+        if index is None or index.is_current(memory.memory_id, get_memory_text(memory)):
+            return None
+        return index
+
+    def _index_memory(self, memory: UserMemory) -> None:
+        """Embed a saved memory into its user's vector index."""
+        index = self._get_stale_memory_index(memory)
+        if index is None:
+            return
+        text = get_memory_text(memory)
+        try:
+            embedding = self.embedder.get_embedding(text)  # type: ignore[union-attr]
+        except Exception as e:
+            log_warning(f"Error embedding memory: {e}")
+            return
+        if embedding:
+            index.upsert(memory.memory_id, text, embedding)  # type: ignore[arg-type]
+
+    async def _aindex_memory(self, memory: UserMemory) -> None:
+        """Embed a saved memory into its user's vector index."""
+        index = self._get_stale_memory_index(memory)
+        if index is None:
+            return
+        text = get_memory_text(memory)
+        try:
+            embedding = await self.embedder.async_get_embedding(text)  # type: ignore[union-attr]
+        except Exception as e:
+            log_warning(f"Error embedding memory: {e}")
+            return
+        if embedding:
+            index.upsert(memory.memory_id, text, embedding)  # type: ignore[arg-type]
+
+    def _unindex_memory(self, memory_id: str, user_id: str) -> None:
+        index = self._get_memory_index(user_id)
+        if index is not None:
+            index.remove(memory_id)
+
+    def _sync_memory_index(self, user_id: str, user_memories: List[UserMemory]) -> Optional[MemoryVectorIndex]:
+        """Bring a user's vector index in line with their memories, embedding only new and changed ones."""
+        index = self._get_memory_index(user_id)
+        if index is None:
+            return None
+        with index.lock:
+            index.retain(memory.memory_id for memory in user_memories if memory.memory_id is not None)
+            stale = [
+                (memory.memory_id, get_memory_text(memory))
+                for memory in user_memories
+                if memory.memory_id is not None and not index.is_current(memory.memory_id, get_memory_text(memory))
+            ]
+        if not stale:
+            return index
+
+        # Embed without holding the lock, so searches are not blocked on the embedder
+        log_debug(f"Embedding {len(stale)} memories for user {user_id}")
+        texts = [text for _, text in stale]
+        embedder: Any = self.embedder
+        try:
+            if embedder.enable_batch and hasattr(embedder, "get_embeddings_batch_and_usage"):
+                embeddings, _ = embedder.get_embeddings_batch_and_usage(texts)
+            else:
+                embeddings = [embedder.get_embedding(text) for text in texts]
+        except Exception as e:
+            log_warning(f"Error embedding memories: {e}")
+            return index
+        for (memory_id, text), embedding in zip(stale, embeddings):
+            if embedding:
+                index.upsert(memory_id, text, embedding)  # type: ignore[arg-type]
+        return index
+
     # -*- Utility Functions
     def search_user_memories(
         self,
         query: Optional[str] = None,
         limit: Optional[int] = None,
-        retrieval_method: Optional[Literal["last_n", "first_n", "agentic"]] = None,
+        retrieval_method: Optional[Literal["last_n", "first_n", "agentic", "semantic"]] = None,
         user_id: Optional[str] = None,
+        rerank: bool = False,
     ) -> List[UserMemory]:
         """Search through user memories using the specified retrieval method.
 
         Args:
-            query: The search query for agentic search. Required if retrieval_method is "agentic".
+            query: The search query. Required if retrieval_method is "agentic" or "semantic".
             limit: Maximum number of memories to return. Defaults to self.retrieval_limit if not specified. Optional.
             retrieval_method: The method to use for retrieving memories. Defaults to self.retrieval if not specified.
                 - "last_n": Return the most recent memories
                 - "first_n": Return the oldest memories
                 - "agentic": Return memories most similar to the query, but using an agentic approach
+                - "semantic": Return the memories whose embeddings are most similar to the query. Requires an embedder.
             user_id: The user to search for. Optional.
+            rerank: For "semantic" retrieval, have the model pick the related memories from the closest matches.
 
         Returns:
             A list of UserMemory objects matching the search criteria.
@@ -617,18 +733,30 @@ class MemoryManager:
         # Use default limit if not specified
         limit = limit
 
+        user_memories = memories.get(user_id, [])
+
         # Handle different retrieval methods
         if retrieval_method == "agentic":
             if not query:
                 raise ValueError("Query is required for agentic search")
 
-            return self._search_user_memories_agentic(user_id=user_id, query=query, limit=limit)
+            return self._search_user_memories_agentic(
+                user_id=user_id, query=query, limit=limit, user_memories=user_memories
+            )
+
+        elif retrieval_method == "semantic":
+            if not query:
+                raise ValueError("Query is required for semantic search")
+
+            return self._search_user_memories_semantic(
+                user_id=user_id, query=query, limit=limit, user_memories=user_memories, rerank=rerank
+            )
 
         elif retrieval_method == "first_n":
-            return self._get_first_n_memories(user_id=user_id, limit=limit)
+            return self._get_first_n_memories(user_id=user_id, limit=limit, user_memories=user_memories)
 
         else:  # Default to last_n
-            return self._get_last_n_memories(user_id=user_id, limit=limit)
+            return self._get_last_n_memories(user_id=user_id, limit=limit, user_memories=user_memories)
 
     def _get_response_format(self) -> Union[Dict[str, Any], Type[BaseModel]]:
         model = self.get_model()
@@ -646,13 +774,62 @@ class MemoryManager:
         else:
             return {"type": "json_object"}
 
-    def _search_user_memories_agentic(self, user_id: str, query: str, limit: Optional[int] = None) -> List[UserMemory]:
+    def _search_user_memories_semantic(
+        self,
+        user_id: str,
+        query: str,
+        limit: Optional[int] = None,
+        user_memories: Optional[List[UserMemory]] = None,
+        rerank: bool = False,
+    ) -> List[UserMemory]:
+        """Search through user memories by embedding similarity, optionally reranking the closest ones with the model."""
+        if self.embedder is None:
+            raise ValueError("An embedder is required for semantic search")
+
+        if user_memories is None:
+            memories = self.read_from_db(user_id=user_id) or {}
+            user_memories = memories.get(user_id, [])
+        if not user_memories:
+            return []
+
+        index = self._sync_memory_index(user_id=user_id, user_memories=user_memories)
+        if index is None:
+            return []
+
+        query_embedding = self.embedder.get_embedding(query)
+        if not query_embedding:
+            log_warning("Failed to embed the memory search query")
+            return []
+
+        num_results = limit if limit is not None and limit > 0 else len(user_memories)
+        # Give the model a few more candidates than requested to choose from
+        num_candidates = max(num_results * 3, 10) if rerank else num_results
+        memories_by_id = {memory.memory_id: memory for memory in user_memories}
+        candidates = [
+            memories_by_id[memory_id]
+            for memory_id, _ in index.search(query_embedding, limit=num_candidates)
+            if memory_id in memories_by_id
+        ]
+
+        if rerank and candidates:
+            return self._search_user_memories_agentic(
+                user_id=user_id, query=query, limit=num_results, user_memories=candidates
+            )
+        return candidates[:num_results]
+
+    def _search_user_memories_agentic(
+        self,
+        user_id: str,
+        query: str,
+        limit: Optional[int] = None,
+        user_memories: Optional[List[UserMemory]] = None,
+    ) -> List[UserMemory]:
         """Search through user memories using agentic search."""
-        memories = self.read_from_db(user_id=user_id)
-        if memories is None:
-            memories = {}
+        if user_memories is None:
+            memories = self.read_from_db(user_id=user_id) or {}
+            user_memories = memories.get(user_id, [])
 
-        if not memories:
+        if not user_memories:
             return []
 
         model = self.get_model()
@@ -660,9 +837,6 @@ class MemoryManager:
         response_format = self._get_response_format()
 
         log_debug("Searching for memories", center=True)
-
-        # Get all memories as a list
-        user_memories: List[UserMemory] = memories[user_id]
         system_message_str = "Your task is to search through user memories and return the IDs of the memories that are related to the query.\n"
         system_message_str += "\n<user_memories>\n"
         for memory in user_memories:
@@ -720,20 +894,23 @@ class MemoryManager:
                         memories_to_return.append(memory)
         return memories_to_return[:limit]
 
-    def _get_last_n_memories(self, user_id: str, limit: Optional[int] = None) -> List[UserMemory]:
+    def _get_last_n_memories(
+        self, user_id: str, limit: Optional[int] = None, user_memories: Optional[List[UserMemory]] = None
+    ) -> List[UserMemory]:
         """Get the most recent user memories.
 
         Args:
             limit: Maximum number of memories to return.
+            user_memories: The memories of the user, if already read from the db.
 
         Returns:
             A list of the most recent UserMemory objects.
         """
-        memories = self.read_from_db(user_id=user_id)
-        if memories is None:
-            memories = {}
+        if user_memories is None:
+            memories = self.read_from_db(user_id=user_id) or {}
+            user_memories = memories.get(user_id, [])
 
-        memories_list = memories.get(user_id, [])
+        memories_list = user_memories
 
         # Sort memories by updated_at timestamp if available
         if memories_list:
@@ -751,21 +928,24 @@ class MemoryManager:
 
         return sorted_memories_list
 
-    def _get_first_n_memories(self, user_id: str, limit: Optional[int] = None) -> List[UserMemory]:
+    def _get_first_n_memories(
+        self, user_id: str, limit: Optional[int] = None, user_memories: Optional[List[UserMemory]] = None
+    ) -> List[UserMemory]:
         """Get the oldest user memories.
 
         Args:
             limit: Maximum number of memories to return.
+            user_memories: The memories of the user, if already read from the db.
 
         Returns:
             A list of the oldest UserMemory objects.
         """
-        memories = self.read_from_db(user_id=user_id)
-        if memories is None:
-            memories = {}
+        if user_memories is None:
+            memories = self.read_from_db(user_id=user_id) or {}
+            user_memories = memories.get(user_id, [])
 
         MAX_UNIX_TS = 2**63 - 1
-        memories_list = memories.get(user_id, [])
+        memories_list = user_memories
         # Sort memories by updated_at timestamp if available
         if memories_list:
             # Sort memories by updated_at timestamp (oldest first)
@@ -1321,17 +1501,17 @@ class MemoryManager:
 
             try:
                 memory_id = str(uuid4())
-                db.upsert_user_memory(
-                    UserMemory(
-                        memory_id=memory_id,
-                        user_id=user_id,
-                        agent_id=agent_id,
-                        team_id=team_id,
-                        memory=memory,
-                        topics=topics,
-                        input=input_string,
-                    )
+                user_memory = UserMemory(
+                    memory_id=memory_id,
+                    user_id=user_id,
+                    agent_id=agent_id,
+                    team_id=team_id,
+                    memory=memory,
+                    topics=topics,
+                    input=input_string,
                 )
+                db.upsert_user_memory(user_memory)
+                self._index_memory(user_memory)
                 log_debug(f"Memory added: {memory_id}")
                 return "Memory added successfully"
             except Exception as e:
@@ -1353,15 +1533,15 @@ class MemoryManager:
                 return "Can't update memory with empty string. Use the delete memory function if available."
 
             try:
-                db.upsert_user_memory(
-                    UserMemory(
-                        memory_id=memory_id,
-                        memory=memory,
-                        topics=topics,
-                        user_id=user_id,
-                        input=input_string,
-                    )
+                user_memory = UserMemory(
+                    memory_id=memory_id,
+                    memory=memory,
+                    topics=topics,
+                    user_id=user_id,
+                    input=input_string,
                 )
+                db.upsert_user_memory(user_memory)
+                self._index_memory(user_memory)
                 log_debug("Memory updated")
                 return "Memory updated successfully"
             except Exception as e:
@@ -1377,6 +1557,7 @@ class MemoryManager:
             """
             try:
                 db.delete_user_memory(memory_id=memory_id, user_id=user_id)
+                self._unindex_memory(memory_id=memory_id, user_id=user_id)
                 log_debug("Memory deleted")
                 return "Memory deleted successfully"
             except Exception as e:
@@ -1430,30 +1611,20 @@ class MemoryManager:
 
             try:
                 memory_id = str(uuid4())
+                user_memory = UserMemory(
+                    memory_id=memory_id,
+                    user_id=user_id,
+                    agent_id=agent_id,
+                    team_id=team_id,
+                    memory=memory,
+                    topics=topics,
+                    input=input_string,
+                )
                 if isinstance(db, AsyncBaseDb):
-                    await db.upsert_user_memory(
-                        UserMemory(
-                            memory_id=memory_id,
-                            user_id=user_id,
-                            agent_id=agent_id,
-                            team_id=team_id,
-                            memory=memory,
-                            topics=topics,
-                            input=input_string,
-                        )
-                    )
+                    await db.upsert_user_memory(user_memory)
                 else:
-                    db.upsert_user_memory(
-                        UserMemory(
-                            memory_id=memory_id,
-                            user_id=user_id,
-                            agent_id=agent_id,
-                            team_id=team_id,
-                            memory=memory,
-                            topics=topics,
-                            input=input_string,
-                        )
-                    )
+                    db.upsert_user_memory(user_memory)
+                await self._aindex_memory(user_memory)
                 log_debug(f"Memory added: {memory_id}")
                 return "Memory added successfully"
             except Exception as e:
@@ -1475,24 +1646,18 @@ class MemoryManager:
                 return "Can't update memory with empty string. Use the delete memory function if available."
 
             try:
+                user_memory = UserMemory(
+                    memory_id=memory_id,
+                    memory=memory,
+                    topics=topics,
+                    user_id=user_id,
+                    input=input_string,
+                )
                 if isinstance(db, AsyncBaseDb):
-                    await db.upsert_user_memory(
-                        UserMemory(
-                            memory_id=memory_id,
-                            memory=memory,
-                            topics=topics,
-                            input=input_string,
-                        )
-                    )
+                    await db.upsert_user_memory(user_memory)
                 else:
-                    db.upsert_user_memory(
-                        UserMemory(
-                            memory_id=memory_id,
-                            memory=memory,
-                            topics=topics,
-                            input=input_string,
-                        )
-                    )
+                    db.upsert_user_memory(user_memory)
+                await self._aindex_memory(user_memory)
                 log_debug("Memory updated")
                 return "Memory updated successfully"
             except Exception as e:
@@ -1511,6 +1676,7 @@ class MemoryManager:
                     await db.delete_user_memory(memory_id=memory_id)
                 else:
                     db.delete_user_memory(memory_id=memory_id)
+                self._unindex_memory(memory_id=memory_id, user_id=user_id)
                 log_debug("Memory deleted")
                 return "Memory deleted successfully"
             except Exception as e:
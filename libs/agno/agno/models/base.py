@@ -2,9 +2,12 @@ import asyncio
 import collections.abc
 import json
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
 from dataclasses import dataclass, field
 from hashlib import md5
 from pathlib import Path
+from queue import Queue
 from time import sleep, time
 from types import AsyncGeneratorType, GeneratorType
 from typing import (
@@ -17,6 +20,7 @@ from typing import (
     Literal,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -40,7 +44,9 @@ from agno.run.team import RunContentEvent as TeamRunContentEvent
 from agno.run.team import TeamRunOutput, TeamRunOutputEvent
 from agno.run.workflow import WorkflowRunOutputEvent
 from agno.tools.function import Function, FunctionCall, FunctionExecutionResult, UserInputField
+from agno.utils.cache import TieredCache, get_tiered_cache
 from agno.utils.log import log_debug, log_error, log_info, log_warning
+from agno.utils.rate_limit import RateLimiter
 from agno.utils.timer import Timer
 from agno.utils.tools import get_function_call_for_tool_call, get_function_call_for_tool_execution
 
@@ -164,6 +170,9 @@ class Model(ABC):
     # Set the number of times to retry the model invocation with guidance.
     retry_with_guidance_limit: int = 1
 
+    # Client-side rate limiter, can be shared with other Models and Embedders using the same provider quota
+    rate_limiter: Optional[RateLimiter] = None
+
     def __post_init__(self):
         if self.provider is None and self.name is not None:
             self.provider = f"{self.name} ({self.id})"
@@ -217,6 +226,65 @@ class Model(ABC):
 
         return True
 
+    def _estimate_request_tokens(self, kwargs: Dict[str, Any]) -> int:
+        """Estimate the input tokens of a request, when the rate limiter needs them."""
+        if self.rate_limiter is None or not self.rate_limiter.counts_tokens:
+            return 0
+        from agno.utils.tokens import count_tokens
+
+        response_format = kwargs.get("response_format")
+        try:
+            return count_tokens(
+                messages=kwargs.get("messages") or [],
+                tools=kwargs.get("tools"),
+                model_id=self.id,
+                output_schema=response_format if isinstance(response_format, (dict, type)) else None,
+            )
+        except Exception as e:
+            log_warning(f"Could not estimate tokens for rate limiting: {e}")
+            return 0
+
+    def _invoke_rate_limited(self, **kwargs) -> ModelResponse:
+        if self.rate_limiter is None:
+            return self.invoke(**kwargs)
+        with self.rate_limiter.limit(tokens=self._estimate_request_tokens(kwargs)) as usage:
+            response = self.invoke(**kwargs)
+            if response.response_usage is not None:
+                usage.add(response.response_usage.total_tokens)
+            return response
+
+    async def _ainvoke_rate_limited(self, **kwargs) -> ModelResponse:
+        if self.rate_limiter is None:
+            return await self.ainvoke(**kwargs)
+        async with self.rate_limiter.alimit(tokens=self._estimate_request_tokens(kwargs)) as usage:
+            response = await self.ainvoke(**kwargs)
+            if response.response_usage is not None:
+                usage.add(response.response_usage.total_tokens)
+            return response
+
+    def _invoke_stream_rate_limited(self, **kwargs) -> Iterator[ModelResponse]:
+        if self.rate_limiter is None:
+            yield from self.invoke_stream(**kwargs)
+            return
+        # The request slot is held until the stream is consumed. Providers may report cumulative usage
+        # on several chunks, so the largest reported total is used instead of their sum.
+        with self.rate_limiter.limit(tokens=self._estimate_request_tokens(kwargs)) as usage:
+            for response in self.invoke_stream(**kwargs):
+                if response.response_usage is not None:
+                    usage.add_max(response.response_usage.total_tokens)
+                yield response
+
+    async def _ainvoke_stream_rate_limited(self, **kwargs) -> AsyncIterator[ModelResponse]:
+        if self.rate_limiter is None:
+            async for response in self.ainvoke_stream(**kwargs):
+                yield response
+            return
+        async with self.rate_limiter.alimit(tokens=self._estimate_request_tokens(kwargs)) as usage:
+            async for response in self.ainvoke_stream(**kwargs):
+                if response.response_usage is not None:
+                    usage.add_max(response.response_usage.total_tokens)
+                yield response
+
     def _invoke_with_retry(self, **kwargs) -> ModelResponse:
         """
         Invoke the model with retry logic for ModelProviderError.
@@ -229,7 +297,7 @@ class Model(ABC):
         for attempt in range(self.retries + 1):
             try:
                 retries_with_guidance_count = kwargs.pop("retries_with_guidance_count", 0)
-                return self.invoke(**kwargs)
+                return self._invoke_rate_limited(**kwargs)
             except ModelProviderError as e:
                 last_exception = e
                 # Check if error is non-retryable
@@ -276,7 +344,7 @@ class Model(ABC):
         for attempt in range(self.retries + 1):
             try:
                 retries_with_guidance_count = kwargs.pop("retries_with_guidance_count", 0)
-                return await self.ainvoke(**kwargs)
+                return await self._ainvoke_rate_limited(**kwargs)
             except ModelProviderError as e:
                 last_exception = e
                 # Check if error is non-retryable
@@ -324,7 +392,7 @@ class Model(ABC):
         for attempt in range(self.retries + 1):
             try:
                 retries_with_guidance_count = kwargs.pop("retries_with_guidance_count", 0)
-                yield from self.invoke_stream(**kwargs)
+                yield from self._invoke_stream_rate_limited(**kwargs)
                 return  # Success, exit the retry loop
             except ModelProviderError as e:
                 last_exception = e
@@ -375,7 +443,7 @@ class Model(ABC):
         for attempt in range(self.retries + 1):
             try:
                 retries_with_guidance_count = kwargs.pop("retries_with_guidance_count", 0)
-                async for response in self.ainvoke_stream(**kwargs):
+                async for response in self._ainvoke_stream_rate_limited(**kwargs):
                     yield response
                 return  # Success, exit the retry loop
             except ModelProviderError as e:
@@ -456,64 +524,50 @@ class Model(ABC):
         cache_str = json.dumps(cache_data, sort_keys=True)
         return md5(cache_str.encode()).hexdigest()
 
-    def _get_model_cache_file_path(self, cache_key: str) -> Path:
-        """Get the file path for a cache key."""
+    def _get_model_cache(self) -> TieredCache:
+        """Get the cache shared by all models using the same cache_dir."""
         if self.cache_dir:
             cache_dir = Path(self.cache_dir)
         else:
             cache_dir = Path.home() / ".agno" / "cache" / "model_responses"
-
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir / f"{cache_key}.json"
+        return get_tiered_cache(cache_dir / "model_responses.db")
 
     def _get_cached_model_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """Retrieve a cached response if it exists and is not expired."""
-        cache_file = self._get_model_cache_file_path(cache_key)
-
-        if not cache_file.exists():
+        try:
+            # A cache_ttl of None means no expiration
+            return self._get_model_cache().get("model_responses", cache_key, ttl=self.cache_ttl)
+        except Exception:
             return None
 
+    async def _aget_cached_model_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Retrieve a cached response if it exists and is not expired."""
         try:
-            with open(cache_file, "r") as f:
-                cached_data = json.load(f)
-
-            # Check TTL if set (None means no expiration)
-            if self.cache_ttl is not None:
-                if time() - cached_data["timestamp"] > self.cache_ttl:
-                    return None
-
-            return cached_data
+            return await self._get_model_cache().aget("model_responses", cache_key, ttl=self.cache_ttl)
         except Exception:
             return None
 
     def _save_model_response_to_cache(self, cache_key: str, result: ModelResponse, is_streaming: bool = False) -> None:
         """Save a model response to cache."""
         try:
-            cache_file = self._get_model_cache_file_path(cache_key)
-
             cache_data = {
                 "timestamp": int(time()),
                 "is_streaming": is_streaming,
                 "result": result.to_dict(),
             }
-            with open(cache_file, "w") as f:
-                json.dump(cache_data, f)
+            self._get_model_cache().set("model_responses", cache_key, cache_data)
         except Exception:
             pass
 
     def _save_streaming_responses_to_cache(self, cache_key: str, responses: List[ModelResponse]) -> None:
         """Save streaming responses to cache."""
-        cache_file = self._get_model_cache_file_path(cache_key)
-
-        cache_data = {
-            "timestamp": int(time()),
-            "is_streaming": True,
-            "streaming_responses": [r.to_dict() for r in responses],
-        }
-
         try:
-            with open(cache_file, "w") as f:
-                json.dump(cache_data, f)
+            cache_data = {
+                "timestamp": int(time()),
+                "is_streaming": True,
+                "streaming_responses": [r.to_dict() for r in responses],
+            }
+            self._get_model_cache().set("model_responses", cache_key, cache_data)
         except Exception:
             pass
 
@@ -611,6 +665,7 @@ class Model(ABC):
         run_response: Optional[Union[RunOutput, TeamRunOutput]] = None,
         send_media_to_model: bool = True,
         compression_manager: Optional["CompressionManager"] = None,
+        max_concurrent_tool_calls: Optional[int] = None,
     ) -> ModelResponse:
         """
         Generate a response from the model.
@@ -623,6 +678,8 @@ class Model(ABC):
             tool_call_limit: Tool call limit
             run_response: Run response to use
             send_media_to_model: Whether to send media to the model
+            max_concurrent_tool_calls: Run the tool calls of a turn on up to this many threads (sequential if not set).
+                Not used by aresponse, which always runs the tool calls of a turn concurrently.
         """
         try:
             # Check cache if enabled
@@ -693,6 +750,7 @@ class Model(ABC):
                         function_call_results=function_call_results,
                         current_function_call_count=function_call_count,
                         function_call_limit=tool_call_limit,
+                        max_concurrent_tool_calls=max_concurrent_tool_calls,
                     ):
                         if isinstance(function_call_response, ModelResponse):
                             # The session state is updated by the function call
@@ -836,7 +894,7 @@ class Model(ABC):
                 cache_key = self._get_model_cache_key(
                     messages, stream=False, response_format=response_format, tools=tools
                 )
-                cached_data = self._get_cached_model_response(cache_key)
+                cached_data = await self._aget_cached_model_response(cache_key)
 
                 if cached_data:
                     log_info("Cache hit for model response")
@@ -1251,6 +1309,7 @@ class Model(ABC):
         run_response: Optional[Union[RunOutput, TeamRunOutput]] = None,
         send_media_to_model: bool = True,
         compression_manager: Optional["CompressionManager"] = None,
+        max_concurrent_tool_calls: Optional[int] = None,
     ) -> Iterator[Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent]]:
         """
         Generate a streaming response from the model.
@@ -1372,6 +1431,7 @@ class Model(ABC):
                         function_call_results=function_call_results,
                         current_function_call_count=function_call_count,
                         function_call_limit=tool_call_limit,
+                        max_concurrent_tool_calls=max_concurrent_tool_calls,
                     ):
                         if self.cache_response and isinstance(function_call_response, ModelResponse):
                             streaming_responses.append(function_call_response)
@@ -1506,7 +1566,7 @@ class Model(ABC):
                 cache_key = self._get_model_cache_key(
                     messages, stream=True, response_format=response_format, tools=tools
                 )
-                cached_data = self._get_cached_model_response(cache_key)
+                cached_data = await self._aget_cached_model_response(cache_key)
 
                 if cached_data:
                     log_info("Cache hit for async streaming model response")
@@ -1930,17 +1990,7 @@ class Model(ABC):
         function_call_timer = Timer()
         function_call_timer.start()
         # Yield a tool_call_started event
-        yield ModelResponse(
-            content=function_call.get_call_str(),
-            tool_executions=[
-                ToolExecution(
-                    tool_call_id=function_call.call_id,
-                    tool_name=function_call.function.name,
-                    tool_args=function_call.arguments,
-                )
-            ],
-            event=ModelResponseEvent.tool_call_started.value,
-        )
+        yield self._get_tool_call_started_response(function_call)
 
         # Run function calls sequentially
         function_execution_result: FunctionExecutionResult = FunctionExecutionResult(status="failure")
@@ -2079,6 +2129,128 @@ class Model(ABC):
         # Add function call to function call results
         function_call_results.append(function_call_result)
 
+    def _get_paused_tool_executions(self, function_call: FunctionCall) -> List[ToolExecution]:
+        """Return the HITL tool executions a function call has to pause for, if any."""
+        paused_tool_executions = []
+
+        # The function requires user confirmation (HITL)
+        if function_call.function.requires_confirmation:
+            paused_tool_executions.append(
+                ToolExecution(
+                    tool_call_id=function_call.call_id,
+                    tool_name=function_call.function.name,
+                    tool_args=function_call.arguments,
+                    requires_confirmation=True,
+                )
+            )
+
+        # The function requires user input (HITL)
+        if function_call.function.requires_user_input:
+            user_input_schema = function_call.function.user_input_schema
+            if function_call.arguments and user_input_schema:
+                for name, value in function_call.arguments.items():
+                    for user_input_field in user_input_schema:
+                        if user_input_field.name == name:
+                            user_input_field.value = value
+
+            paused_tool_executions.append(
+                ToolExecution(
+                    tool_call_id=function_call.call_id,
+                    tool_name=function_call.function.name,
+                    tool_args=function_call.arguments,
+                    requires_user_input=True,
+                    user_input_schema=user_input_schema,
+                )
+            )
+
+        # If the function is from the user control flow (HITL) tools, we handle it here
+        if (
+            function_call.function.name == "get_user_input"
+            and function_call.arguments
+            and function_call.arguments.get("user_input_fields")
+        ):
+            user_input_schema = []
+            for input_field in function_call.arguments.get("user_input_fields", []):
+                field_type = input_field.get("field_type")
+                if isinstance(field_type, str):
+                    type_mapping = {
+                        "str": str,
+                        "int": int,
+                        "float": float,
+                        "bool": bool,
+                        "list": list,
+                        "dict": dict,
+                    }
+                    python_type = type_mapping.get(field_type, str)
+                elif isinstance(field_type, type):
+                    python_type = field_type
+                else:
+                    python_type = str
+                user_input_schema.append(
+                    UserInputField(
+                        name=input_field.get("field_name"),
+                        field_type=python_type,
+                        description=input_field.get("field_description"),
+                    )
+                )
+
+            paused_tool_executions.append(
+                ToolExecution(
+                    tool_call_id=function_call.call_id,
+                    tool_name=function_call.function.name,
+                    tool_args=function_call.arguments,
+                    requires_user_input=True,
+                    user_input_schema=user_input_schema,
+                )
+            )
+
+        # The function requires external execution (HITL)
+        if function_call.function.external_execution:
+            paused_tool_executions.append(
+                ToolExecution(
+                    tool_call_id=function_call.call_id,
+                    tool_name=function_call.function.name,
+                    tool_args=function_call.arguments,
+                    external_execution_required=True,
+                )
+            )
+
+        return paused_tool_executions
+
+    def _get_tool_call_started_response(self, function_call: FunctionCall) -> ModelResponse:
+        return ModelResponse(
+            content=function_call.get_call_str(),
+            tool_executions=[
+                ToolExecution(
+                    tool_call_id=function_call.call_id,
+                    tool_name=function_call.function.name,
+                    tool_args=function_call.arguments,
+                )
+            ],
+            event=ModelResponseEvent.tool_call_started.value,
+        )
+
+    def _run_function_call_to_queue(self, index: int, function_call: FunctionCall, events: Queue) -> None:
+        """Run a function call on a worker thread, forwarding its events to the queue as they are produced.
+
+        The tool_call_started event is skipped, the caller yields it before the call is submitted. The last item
+        put for a call is either (index, (results, additional_input)) or (index, exception).
+        """
+        results: List[Message] = []
+        additional_input: List[Message] = []
+        try:
+            for position, event in enumerate(
+                self.run_function_call(
+                    function_call=function_call, function_call_results=results, additional_input=additional_input
+                )
+            ):
+                if position > 0:
+                    events.put((index, event))
+        except Exception as e:
+            events.put((index, e))
+            return
+        events.put((index, (results, additional_input)))
+
     def run_function_calls(
         self,
         function_calls: List[FunctionCall],
@@ -2086,110 +2258,92 @@ class Model(ABC):
         additional_input: Optional[List[Message]] = None,
         current_function_call_count: int = 0,
         function_call_limit: Optional[int] = None,
+        max_concurrent_tool_calls: Optional[int] = None,
     ) -> Iterator[Union[ModelResponse, RunOutputEvent, TeamRunOutputEvent]]:
+        """
+        Run the function calls of a model turn.
+
+        When max_concurrent_tool_calls is greater than 1, the function calls that can run are executed on a thread pool
+        of that size. Their tool_call_started events are yielded up front, the rest of their events as they are
+        produced, and their results are still added in the order of function_calls.
+        """
         # Additional messages from function calls that will be added to the function call results
         if additional_input is None:
             additional_input = []
 
-        for fc in function_calls:
+        # Decide up front which function calls are over the limit, paused (HITL) or can run
+        limit_reached: Set[int] = set()
+        paused: Dict[int, List[ToolExecution]] = {}
+        runnable: List[int] = []
+        for index, fc in enumerate(function_calls):
             if function_call_limit is not None:
                 current_function_call_count += 1
                 # We have reached the function call limit, so we add an error result to the function call results
                 if current_function_call_count > function_call_limit:
-                    function_call_results.append(self.create_tool_call_limit_error_result(fc))
+                    limit_reached.add(index)
                     continue
 
-            paused_tool_executions = []
-
-            # The function requires user confirmation (HITL)
-            if fc.function.requires_confirmation:
-                paused_tool_executions.append(
-                    ToolExecution(
-                        tool_call_id=fc.call_id,
-                        tool_name=fc.function.name,
-                        tool_args=fc.arguments,
-                        requires_confirmation=True,
-                    )
-                )
-
-            # The function requires user input (HITL)
-            if fc.function.requires_user_input:
-                user_input_schema = fc.function.user_input_schema
-                if fc.arguments and user_input_schema:
-                    for name, value in fc.arguments.items():
-                        for user_input_field in user_input_schema:
-                            if user_input_field.name == name:
-                                user_input_field.value = value
-
-                paused_tool_executions.append(
-                    ToolExecution(
-                        tool_call_id=fc.call_id,
-                        tool_name=fc.function.name,
-                        tool_args=fc.arguments,
-                        requires_user_input=True,
-                        user_input_schema=user_input_schema,
-                    )
-                )
-
-            # If the function is from the user control flow (HITL) tools, we handle it here
-            if fc.function.name == "get_user_input" and fc.arguments and fc.arguments.get("user_input_fields"):
-                user_input_schema = []
-                for input_field in fc.arguments.get("user_input_fields", []):
-                    field_type = input_field.get("field_type")
-                    if isinstance(field_type, str):
-                        type_mapping = {
-                            "str": str,
-                            "int": int,
-                            "float": float,
-                            "bool": bool,
-                            "list": list,
-                            "dict": dict,
-                        }
-                        python_type = type_mapping.get(field_type, str)
-                    elif isinstance(field_type, type):
-                        python_type = field_type
-                    else:
-                        python_type = str
-                    user_input_schema.append(
-                        UserInputField(
-                            name=input_field.get("field_name"),
-                            field_type=python_type,
-                            description=input_field.get("field_description"),
-                        )
-                    )
+            paused_tool_executions = self._get_paused_tool_executions(fc)
+            if paused_tool_executions:
+                paused[index] = paused_tool_executions
+            else:
+                runnable.append(index)
 
-                paused_tool_executions.append(
-                    ToolExecution(
-                        tool_call_id=fc.call_id,
-                        tool_name=fc.function.name,
-                        tool_args=fc.arguments,
-                        requires_user_input=True,
-                        user_input_schema=user_input_schema,
+        if max_concurrent_tool_calls is None or max_concurrent_tool_calls <= 1 or len(runnable) <= 1:
+            for index, fc in enumerate(function_calls):
+                if index in limit_reached:
+                    function_call_results.append(self.create_tool_call_limit_error_result(fc))
+                elif index in paused:
+                    yield ModelResponse(
+                        tool_executions=paused[index],
+                        event=ModelResponseEvent.tool_call_paused.value,
                     )
-                )
-
-            # The function requires external execution (HITL)
-            if fc.function.external_execution:
-                paused_tool_executions.append(
-                    ToolExecution(
-                        tool_call_id=fc.call_id,
-                        tool_name=fc.function.name,
-                        tool_args=fc.arguments,
-                        external_execution_required=True,
+                    # We don't execute the function calls here
+                else:
+                    yield from self.run_function_call(
+                        function_call=fc, function_call_results=function_call_results, additional_input=additional_input
                     )
-                )
-
-            if paused_tool_executions:
+        else:
+            for index in sorted(paused):
                 yield ModelResponse(
-                    tool_executions=paused_tool_executions,
+                    tool_executions=paused[index],
                     event=ModelResponseEvent.tool_call_paused.value,
                 )
-                # We don't execute the function calls here
-                continue
+            for index in runnable:
+                yield self._get_tool_call_started_response(function_calls[index])
 
-            yield from self.run_function_call(
-                function_call=fc, function_call_results=function_call_results, additional_input=additional_input
-            )
+            events: Queue = Queue()
+            outputs: Dict[int, Tuple[List[Message], List[Message]]] = {}
+            futures: List[Future] = []
+            executor = ThreadPoolExecutor(max_workers=min(max_concurrent_tool_calls, len(runnable)))
+            try:
+                for index in runnable:
+                    futures.append(
+                        executor.submit(
+                            copy_context().run, self._run_function_call_to_queue, index, function_calls[index], events
+                        )
+                    )
+                while len(outputs) < len(runnable):
+                    index, item = events.get()
+                    if isinstance(item, Exception):
+                        raise item
+                    if isinstance(item, tuple):
+                        outputs[index] = item
+                    else:
+                        yield item
+            finally:
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=True)
+
+            # Add the results in the order of the function calls
+            for index, fc in enumerate(function_calls):
+                if index in limit_reached:
+                    function_call_results.append(self.create_tool_call_limit_error_result(fc))
+                elif index in outputs:
+                    results, call_additional_input = outputs[index]
+                    function_call_results.extend(results)
+                    additional_input.extend(call_additional_input)
 
         # Add any additional messages at the end
         if additional_input:
@@ -1,9 +1,9 @@
 import json
 from time import time
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from uuid import uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from agno.media import Audio, File, Image, Video
 from agno.models.metrics import Metrics
@@ -118,6 +118,10 @@ class Message(BaseModel):
     # When True, the message will be sent to the Model but not persisted afterwards.
     temporary: bool = False
 
+    # Token counts of the message per tokenizer, with a digest of the message state they were counted for.
+    # Stored as "token_counts" by to_dict, see agno.utils.tokens.count_message_tokens
+    _token_counts: Dict[str, Tuple[str, int]] = PrivateAttr(default_factory=dict)
+
     model_config = ConfigDict(extra="allow", populate_by_name=True, arbitrary_types_allowed=True)
 
     def get_content_string(self) -> str:
@@ -271,7 +275,15 @@ class Message(BaseModel):
                 else:
                     data["video_output"] = Video(**vid_data)
 
-        return cls(**data)
+        token_counts = data.get("token_counts")
+        message = cls(**{k: v for k, v in data.items() if k != "token_counts"})
+        if isinstance(token_counts, dict):
+            message._token_counts = {
+                tokenizer_key: (count["state"], count["tokens"])
+                for tokenizer_key, count in token_counts.items()
+                if isinstance(count, dict) and "state" in count and "tokens" in count
+            }
+        return message
 
     def to_dict(self) -> Dict[str, Any]:
         """Returns the message as a dictionary."""
@@ -316,6 +328,12 @@ class Message(BaseModel):
             if not message_dict["metrics"]:
                 message_dict.pop("metrics")
 
+        if self._token_counts:
+            message_dict["token_counts"] = {
+                tokenizer_key: {"state": state, "tokens": tokens}
+                for tokenizer_key, (state, tokens) in self._token_counts.items()
+            }
+
         message_dict["created_at"] = self.created_at
         return message_dict
 
@@ -1,6 +1,7 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
+from agno.utils.serialize import dataclass_to_dict
 from agno.utils.timer import Timer
 
 
@@ -44,9 +45,8 @@ class Metrics:
     additional_metrics: Optional[dict] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        metrics_dict = asdict(self)
-        # Remove the timer util if present
-        metrics_dict.pop("timer", None)
+        # Skip the timer util
+        metrics_dict = dataclass_to_dict(self, exclude={"timer"})
         # Remove any None, 0, or empty dict values
         metrics_dict = {
             k: v
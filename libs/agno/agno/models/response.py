@@ -7,6 +7,7 @@ from agno.media import Audio, File, Image, Video
 from agno.models.message import Citations
 from agno.models.metrics import Metrics
 from agno.tools.function import UserInputField
+from agno.utils.serialize import dataclass_to_dict
 
 
 class ModelResponseEvent(str, Enum):
@@ -57,12 +58,11 @@ class ToolExecution:
         return bool(self.requires_confirmation or self.requires_user_input or self.external_execution_required)
 
     def to_dict(self) -> Dict[str, Any]:
-        _dict = asdict(self)
-        if self.metrics is not None:
-            _dict["metrics"] = self.metrics.to_dict()
-
-        if self.user_input_schema is not None:
-            _dict["user_input_schema"] = [field.to_dict() for field in self.user_input_schema]
+        _dict = dataclass_to_dict(self, exclude={"metrics", "user_input_schema"}, exclude_none=False)
+        _dict["metrics"] = self.metrics.to_dict() if self.metrics is not None else None
+        _dict["user_input_schema"] = (
+            [field.to_dict() for field in self.user_input_schema] if self.user_input_schema is not None else None
+        )
 
         return _dict
 
@@ -101,6 +101,16 @@ async def db_lifespan(app: FastAPI, agent_os: "AgentOS"):
     await agent_os._close_databases()
 
 
+@asynccontextmanager
+async def local_models_lifespan(_, agent_os: "AgentOS"):
+    """Loads the local embedding and reranking models of the OS knowledge bases before serving requests."""
+    import asyncio
+
+    await asyncio.to_thread(agent_os._warmup_local_models)
+
+    yield
+
+
 def _combine_app_lifespans(lifespans: list) -> Any:
     """Combine multiple FastAPI app lifespan context managers into one."""
     if len(lifespans) == 1:
@@ -151,6 +161,7 @@ class AgentOS:
         tracing: bool = False,
         auto_provision_dbs: bool = True,
         run_hooks_in_background: bool = False,
+        warmup_local_models: bool = False,
         telemetry: bool = True,
         registry: Optional[Registry] = None,
     ):
@@ -180,6 +191,7 @@ class AgentOS:
             cors_allowed_origins: List of allowed CORS origins (will be merged with default Agno domains)
             tracing: If True, enables OpenTelemetry tracing for all agents and teams in the OS
             run_hooks_in_background: If True, run agent/team pre/post hooks as FastAPI background tasks (non-blocking)
+            warmup_local_models: If True, load the local embedding and reranking models used by the knowledge bases on startup
             telemetry: Whether to enable telemetry
             registry: Optional registry to use for the AgentOS
 
@@ -238,6 +250,9 @@ class AgentOS:
         # If True, run agent/team hooks as FastAPI background tasks
         self.run_hooks_in_background = run_hooks_in_background
 
+        # If True, load local embedder and reranker models on startup instead of on the first request
+        self.warmup_local_models = warmup_local_models
+
         # List of all MCP tools used inside the AgentOS
         self.mcp_tools: List[Any] = []
         self._mcp_app: Optional[Any] = None
@@ -580,6 +595,10 @@ class AgentOS:
             # The async database lifespan
             lifespans.append(partial(db_lifespan, agent_os=self))
 
+            # The local models warmup lifespan
+            if self.warmup_local_models:
+                lifespans.append(partial(local_models_lifespan, agent_os=self))
+
             # The httpx client cleanup lifespan (should be last to close after other lifespans)
             lifespans.append(http_client_lifespan)
 
@@ -608,6 +627,10 @@ class AgentOS:
             # Async database initialization lifespan
             lifespans.append(partial(db_lifespan, agent_os=self))  # type: ignore
 
+            # Local models warmup lifespan
+            if self.warmup_local_models:
+                lifespans.append(partial(local_models_lifespan, agent_os=self))  # type: ignore
+
             # The httpx client cleanup lifespan (should be last to close after other lifespans)
             lifespans.append(http_client_lifespan)
 
@@ -1004,6 +1027,24 @@ class AgentOS:
 
         self.knowledge_instances = knowledge_instances
 
+    def _warmup_local_models(self) -> None:
+        """Load the local models used by the embedders and rerankers of all knowledge bases in the OS."""
+        knowledge_bases: List[Any] = [agent.knowledge for agent in self.agents or [] if agent.knowledge]
+        knowledge_bases += [team.knowledge for team in self.teams or [] if team.knowledge]
+        knowledge_bases += self.knowledge or []
+
+        seen_ids: set[int] = set()
+        for knowledge in knowledge_bases:
+            vector_db = getattr(knowledge, "vector_db", None)
+            for component in (getattr(vector_db, "embedder", None), getattr(vector_db, "reranker", None)):
+                if component is None or id(component) in seen_ids or not hasattr(component, "warmup"):
+                    continue
+                seen_ids.add(id(component))
+                try:
+                    component.warmup()
+                except Exception as e:
+                    log_warning(f"Failed to load the local model of {component.__class__.__name__}: {e}")
+
     def _get_session_config(self) -> SessionConfig:
         session_config = self.config.session if self.config and self.config.session else SessionConfig()
 
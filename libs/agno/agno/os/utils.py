@@ -438,14 +438,14 @@ def get_agent_by_id(
 ) -> Optional[Union[Agent, RemoteAgent]]:
     """Get an agent by ID, optionally creating a fresh instance for request isolation.
 
-    When create_fresh=True, creates a new agent instance using deep_copy() to prevent
-    state contamination between concurrent requests. The new instance shares heavy
-    resources (db, model, MCP tools) but has isolated mutable state.
+    When create_fresh=True, creates a new agent instance using copy_for_run() to prevent
+    state contamination between concurrent requests. The new instance shares its configuration
+    (db, model, tools, instructions) with the registered agent but has isolated mutable state.
 
     Args:
         agent_id: The agent ID to look up
         agents: List of agents to search
-        create_fresh: If True, creates a new instance using deep_copy()
+        create_fresh: If True, creates a new instance using copy_for_run()
 
     Returns:
         The agent instance (shared or fresh copy based on create_fresh)
@@ -458,7 +458,7 @@ def get_agent_by_id(
         for agent in agents:
             if agent.id == agent_id:
                 if create_fresh and isinstance(agent, Agent):
-                    return agent.deep_copy()
+                    return agent.copy_for_run()
                 return agent
 
     # Try to get the agent from the database
@@ -739,6 +739,7 @@ def collect_mcp_tools_from_workflow(workflow: Workflow, mcp_tools: List[Any]) ->
 def collect_mcp_tools_from_workflow_step(step: Any, mcp_tools: List[Any]) -> None:
     """Collect MCP tools from a single workflow step."""
     from agno.workflow.condition import Condition
+    from agno.workflow.graph import Graph
     from agno.workflow.loop import Loop
     from agno.workflow.parallel import Parallel
     from agno.workflow.router import Router
@@ -765,7 +766,7 @@ def collect_mcp_tools_from_workflow_step(step: Any, mcp_tools: List[Any]) -> Non
             for step in steps:
                 collect_mcp_tools_from_workflow_step(step, mcp_tools)
 
-    elif isinstance(step, (Parallel, Loop, Condition, Router)):
+    elif isinstance(step, (Parallel, Loop, Condition, Router, Graph)):
         # These contain other steps - recursively check them
         if hasattr(step, "steps") and step.steps:
             for sub_step in step.steps:
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from enum import Enum
 from time import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
@@ -20,6 +20,7 @@ from agno.utils.media import (
     reconstruct_response_audio,
     reconstruct_videos,
 )
+from agno.utils.serialize import dataclass_to_dict
 
 if TYPE_CHECKING:
     from agno.session.summary import SessionSummary
@@ -662,12 +663,9 @@ class RunOutput:
         return [t for t in self.tools if t.external_execution_required] if self.tools else []
 
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
-            not in [
+        _dict = dataclass_to_dict(
+            self,
+            exclude={
                 "messages",
                 "metrics",
                 "tools",
@@ -685,8 +683,8 @@ class RunOutput:
                 "reasoning_messages",
                 "references",
                 "requirements",
-            ]
-        }
+            },
+        )
 
         if self.metrics is not None:
             _dict["metrics"] = self.metrics.to_dict() if isinstance(self.metrics, Metrics) else self.metrics
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional, Type, Union
 
@@ -10,6 +10,7 @@ from agno.models.message import Citations, Message, MessageReferences
 from agno.models.metrics import Metrics
 from agno.reasoning.step import ReasoningStep
 from agno.utils.log import log_error
+from agno.utils.serialize import dataclass_to_dict
 
 
 @dataclass
@@ -31,12 +32,9 @@ class RunContext:
 @dataclass
 class BaseRunOutputEvent:
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
-            not in [
+        _dict = dataclass_to_dict(
+            self,
+            exclude={
                 "tools",
                 "tool",
                 "metadata",
@@ -56,8 +54,8 @@ class BaseRunOutputEvent:
                 "run_input",
                 "requirements",
                 "memories",
-            ]
-        }
+            },
+        )
 
         if hasattr(self, "metadata") and self.metadata is not None:
             _dict["metadata"] = self.metadata
@@ -154,7 +152,7 @@ class BaseRunOutputEvent:
     def to_json(self, separators=(", ", ": "), indent: Optional[int] = 2) -> str:
         import json
 
-        from agno.utils.serialize import json_serializer
+        from agno.utils.serialize import json_dumps_compact, json_serializer
 
         try:
             _dict = self.to_dict()
@@ -162,6 +160,9 @@ class BaseRunOutputEvent:
             log_error("Failed to convert response event to json", exc_info=True)
             raise
 
+        # Compact encoding, as used for streamed events, goes through orjson when available
+        if indent is None and tuple(separators) == (",", ":"):
+            return json_dumps_compact(_dict)
         if indent is None:
             return json.dumps(_dict, separators=separators, default=json_serializer, ensure_ascii=False)
         else:
@@ -1,6 +1,9 @@
 """Redis-based run cancellation management."""
 
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+import asyncio
+import threading
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Union
 
 from agno.exceptions import RunCancelledException
 from agno.run.cancellation_management.base import BaseRunCancellationManager
@@ -42,9 +45,15 @@ class RedisRunCancellationManager(BaseRunCancellationManager):
         ttl_seconds: TTL for keys in seconds. Defaults to 86400 (1 day).
             Keys auto-expire to prevent orphaned keys if runs aren't cleaned up.
             Set to None to disable expiration.
+        use_pubsub: If True, cancellations are pushed over a Redis pub/sub channel and kept in a local cache,
+            so checking whether a run is cancelled does not hit Redis on every call. Defaults to False.
+        channel: Pub/sub channel for cancellations. Defaults to "<key_prefix>cancelled".
+        reconcile_interval_seconds: With use_pubsub, how often the state of a run is re-read from Redis in case
+            a message was missed. Defaults to 5 seconds. Set to None to rely on pub/sub only.
     """
 
     DEFAULT_TTL_SECONDS = 60 * 60 * 24  # 1 day
+    DEFAULT_RECONCILE_INTERVAL_SECONDS = 5.0
 
     def __init__(
         self,
@@ -52,6 +61,9 @@ class RedisRunCancellationManager(BaseRunCancellationManager):
         async_redis_client: Optional[Union[AsyncRedis, AsyncRedisCluster]] = None,
         key_prefix: str = "agno:run:cancellation:",
         ttl_seconds: Optional[int] = DEFAULT_TTL_SECONDS,
+        use_pubsub: bool = False,
+        channel: Optional[str] = None,
+        reconcile_interval_seconds: Optional[float] = DEFAULT_RECONCILE_INTERVAL_SECONDS,
     ):
         if not _redis_available:
             raise ImportError(_redis_import_error)
@@ -65,6 +77,20 @@ class RedisRunCancellationManager(BaseRunCancellationManager):
         if redis_client is None and async_redis_client is None:
             raise ValueError("At least one of redis_client or async_redis_client must be provided")
 
+        self.use_pubsub = use_pubsub
+        self.channel = channel or f"{key_prefix}cancelled"
+        self.reconcile_interval_seconds = reconcile_interval_seconds
+
+        # Local cache used with use_pubsub: cancelled runs, and when each tracked run was last read from Redis
+        self._cancelled_run_ids: Set[str] = set()
+        self._last_checked: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        # Set while the listener is subscribed. Until then, every check reads from Redis.
+        self._subscribed = threading.Event()
+        self._stop_listener = threading.Event()
+        self._listener_thread: Optional[threading.Thread] = None
+        self._listener_task: Optional[asyncio.Task] = None
+
     def _get_key(self, run_id: str) -> str:
         """Get the Redis key for a run ID."""
         return f"{self.key_prefix}{run_id}"
@@ -81,17 +107,164 @@ class RedisRunCancellationManager(BaseRunCancellationManager):
             raise RuntimeError("Async Redis client not provided. Use sync methods or provide an async client.")
         return self.async_redis_client
 
+    @staticmethod
+    def _decode(value: Any) -> str:
+        # Redis returns bytes, handle both bytes and str
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    # --- Pub/sub listener and local cache ---
+
+    def _ensure_listener(self) -> None:
+        """Start the listener thread if it is not running. Requires the sync client."""
+        if self.redis_client is None:
+            return
+        if self._listener_thread is not None and self._listener_thread.is_alive():
+            return
+        with self._lock:
+            if self._listener_thread is not None and self._listener_thread.is_alive():
+                return
+            self._stop_listener.clear()
+            self._listener_thread = threading.Thread(
+                target=self._listen, name="agno-run-cancellation-listener", daemon=True
+            )
+            self._listener_thread.start()
+
+    def _ensure_async_listener(self) -> None:
+        """Start the listener, as a task on the running event loop when only the async client is available."""
+        if self.redis_client is not None:
+            self._ensure_listener()
+            return
+        if self._listener_task is not None and not self._listener_task.done():
+            return
+        self._stop_listener.clear()
+        self._listener_task = asyncio.get_running_loop().create_task(self._alisten())
+
+    def _listen(self) -> None:
+        client = self._ensure_sync_client()
+        retry_delay = 0.1
+        while not self._stop_listener.is_set():
+            pubsub = client.pubsub()
+            try:
+                pubsub.subscribe(self.channel)
+                while not self._stop_listener.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        self._handle_message(message)
+                        retry_delay = 0.1
+            except Exception as e:
+                self._subscribed.clear()
+                logger.warning(f"Lost subscription to run cancellation channel {self.channel}: {e}")
+                self._stop_listener.wait(retry_delay)
+                retry_delay = min(retry_delay * 2, 5.0)
+            finally:
+                self._subscribed.clear()
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+
+    async def _alisten(self) -> None:
+        client = self._ensure_async_client()
+        retry_delay = 0.1
+        while not self._stop_listener.is_set():
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                while not self._stop_listener.is_set():
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        self._handle_message(message)
+                        retry_delay = 0.1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._subscribed.clear()
+                logger.warning(f"Lost subscription to run cancellation channel {self.channel}: {e}")
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, 5.0)
+            finally:
+                self._subscribed.clear()
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    def _handle_message(self, message: Dict[str, Any]) -> None:
+        message_type = self._decode(message.get("type"))
+        if message_type == "subscribe":
+            with self._lock:
+                # Messages may have been missed while not subscribed, so all tracked runs are read again
+                self._last_checked.clear()
+            self._subscribed.set()
+            logger.debug(f"Subscribed to run cancellation channel {self.channel}")
+        elif message_type == "message":
+            self._mark_cancelled(self._decode(message["data"]))
+
+    def _mark_cancelled(self, run_id: str) -> None:
+        with self._lock:
+            # Runs not tracked here are read from Redis on their first check
+            if run_id in self._last_checked:
+                self._cancelled_run_ids.add(run_id)
+
+    def _get_cached_status(self, run_id: str) -> Optional[bool]:
+        """Get the cancellation status of a run from the local cache, or None if it has to be read from Redis."""
+        if run_id in self._cancelled_run_ids:
+            return True
+        if not self._subscribed.is_set():
+            return None
+        last_checked = self._last_checked.get(run_id)
+        if last_checked is None:
+            return None
+        if (
+            self.reconcile_interval_seconds is not None
+            and monotonic() - last_checked >= self.reconcile_interval_seconds
+        ):
+            return None
+        return False
+
+    def _cache_status(self, run_id: str, cancelled: bool) -> None:
+        with self._lock:
+            self._last_checked[run_id] = monotonic()
+            if cancelled:
+                self._cancelled_run_ids.add(run_id)
+
+    def _forget_run(self, run_id: str) -> None:
+        with self._lock:
+            self._last_checked.pop(run_id, None)
+            self._cancelled_run_ids.discard(run_id)
+
+    def close(self) -> None:
+        """Stop the pub/sub listener."""
+        self._stop_listener.set()
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            self._listener_task = None
+        if self._listener_thread is not None:
+            self._listener_thread.join(timeout=2.0)
+            self._listener_thread = None
+        self._subscribed.clear()
+
+    # --- Run cancellation ---
+
     def register_run(self, run_id: str) -> None:
         """Register a new run as not cancelled."""
         client = self._ensure_sync_client()
         key = self._get_key(run_id)
+        if self.use_pubsub:
+            self._ensure_listener()
         client.set(key, "0", ex=self.ttl_seconds)
+        if self.use_pubsub:
+            self._cache_status(run_id, False)
 
     async def aregister_run(self, run_id: str) -> None:
         """Register a new run as not cancelled (async version)."""
         client = self._ensure_async_client()
         key = self._get_key(run_id)
+        if self.use_pubsub:
+            self._ensure_async_listener()
         await client.set(key, "0", ex=self.ttl_seconds)
+        if self.use_pubsub:
+            self._cache_status(run_id, False)
 
     def cancel_run(self, run_id: str) -> bool:
         """Cancel a run by marking it as cancelled.
@@ -107,6 +280,12 @@ class RedisRunCancellationManager(BaseRunCancellationManager):
 
         if result:
             logger.info(f"Run {run_id} marked for cancellation")
+            if self.use_pubsub:
+                self._mark_cancelled(run_id)
+            try:
+                client.publish(self.channel, run_id)
+            except Exception as e:
+                logger.warning(f"Could not publish cancellation of run {run_id}: {e}")
             return True
         else:
             logger.warning(f"Attempted to cancel unknown run {run_id}")
@@ -126,46 +305,66 @@ class RedisRunCancellationManager(BaseRunCancellationManager):
 
         if result:
             logger.info(f"Run {run_id} marked for cancellation")
+            if self.use_pubsub:
+                self._mark_cancelled(run_id)
+            try:
+                await client.publish(self.channel, run_id)
+            except Exception as e:
+                logger.warning(f"Could not publish cancellation of run {run_id}: {e}")
             return True
         else:
             logger.warning(f"Attempted to cancel unknown run {run_id}")
             return False
 
     def is_cancelled(self, run_id: str) -> bool:
-        """Check if a run is cancelled."""
+        """Check if a run is cancelled.
+
+        With use_pubsub, this is a local lookup while subscribed, with the run re-read from Redis every
+        reconcile_interval_seconds.
+        """
+        if self.use_pubsub:
+            self._ensure_listener()
+            cached_status = self._get_cached_status(run_id)
+            if cached_status is not None:
+                return cached_status
+
         client = self._ensure_sync_client()
         key = self._get_key(run_id)
         value = client.get(key)
-        if value is None:
-            return False
-        # Redis returns bytes, handle both bytes and str
-        if isinstance(value, bytes):
-            return value == b"1"
-        return value == "1"
+        cancelled = value is not None and self._decode(value) == "1"
+        if self.use_pubsub:
+            self._cache_status(run_id, cancelled)
+        return cancelled
 
     async def ais_cancelled(self, run_id: str) -> bool:
         """Check if a run is cancelled (async version)."""
+        if self.use_pubsub:
+            self._ensure_async_listener()
+            cached_status = self._get_cached_status(run_id)
+            if cached_status is not None:
+                return cached_status
+
         client = self._ensure_async_client()
         key = self._get_key(run_id)
         value = await client.get(key)
-        if value is None:
-            return False
-        # Redis returns bytes, handle both bytes and str
-        if isinstance(value, bytes):
-            return value == b"1"
-        return value == "1"
+        cancelled = value is not None and self._decode(value) == "1"
+        if self.use_pubsub:
+            self._cache_status(run_id, cancelled)
+        return cancelled
 
     def cleanup_run(self, run_id: str) -> None:
         """Remove a run from tracking (called when run completes)."""
         client = self._ensure_sync_client()
         key = self._get_key(run_id)
         client.delete(key)
+        self._forget_run(run_id)
 
     async def acleanup_run(self, run_id: str) -> None:
         """Remove a run from tracking (called when run completes) (async version)."""
         client = self._ensure_async_client()
         key = self._get_key(run_id)
         await client.delete(key)
+        self._forget_run(run_id)
 
     def raise_if_cancelled(self, run_id: str) -> None:
         """Check if a run should be cancelled and raise exception if so."""
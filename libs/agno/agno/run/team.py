@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from enum import Enum
 from time import time
 from typing import Any, Dict, List, Optional, Sequence, Union
@@ -21,6 +21,7 @@ from agno.utils.media import (
     reconstruct_response_audio,
     reconstruct_videos,
 )
+from agno.utils.serialize import dataclass_to_dict
 
 
 @dataclass
@@ -617,12 +618,9 @@ class TeamRunOutput:
         return self.status == RunStatus.cancelled
 
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
-            not in [
+        _dict = dataclass_to_dict(
+            self,
+            exclude={
                 "messages",
                 "metrics",
                 "status",
@@ -639,8 +637,8 @@ class TeamRunOutput:
                 "reasoning_steps",
                 "reasoning_messages",
                 "references",
-            ]
-        }
+            },
+        )
         if self.events is not None:
             _dict["events"] = [e.to_dict() for e in self.events]
 
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from enum import Enum
 from time import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
@@ -15,6 +15,7 @@ from agno.utils.media import (
     reconstruct_response_audio,
     reconstruct_videos,
 )
+from agno.utils.serialize import dataclass_to_dict
 
 if TYPE_CHECKING:
     from agno.workflow.types import StepOutput, WorkflowMetrics
@@ -76,7 +77,8 @@ class BaseWorkflowRunOutputEvent(BaseRunOutputEvent):
     parent_step_id: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {k: v for k, v in asdict(self).items() if v is not None}
+        # Step results are converted with their own to_dict below
+        _dict = dataclass_to_dict(self, exclude={"step_results", "step_response", "iteration_results", "all_results"})
 
         if hasattr(self, "content") and self.content and isinstance(self.content, BaseModel):
             _dict["content"] = self.content.model_dump(exclude_none=True)
@@ -534,12 +536,9 @@ class WorkflowRunOutput:
         return self.status == RunStatus.cancelled
 
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
-            not in [
+        _dict = dataclass_to_dict(
+            self,
+            exclude={
                 "metadata",
                 "images",
                 "videos",
@@ -550,8 +549,8 @@ class WorkflowRunOutput:
                 "events",
                 "metrics",
                 "workflow_agent_run",
-            ]
-        }
+            },
+        )
 
         if self.status is not None:
             _dict["status"] = self.status.value if isinstance(self.status, RunStatus) else self.status
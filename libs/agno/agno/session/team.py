@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -10,6 +10,7 @@ from agno.run.agent import RunOutput, RunStatus
 from agno.run.team import TeamRunOutput
 from agno.session.summary import SessionSummary
 from agno.utils.log import log_debug, log_warning
+from agno.utils.message import get_messages_within_token_budget, get_runs_within_token_budget
 
 
 @dataclass
@@ -42,10 +43,16 @@ class TeamSession:
     # The unix timestamp when this session was last updated
     updated_at: Optional[int] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        session_dict = asdict(self)
+    # IDs of the runs added or updated since the session was read from or written to a db that stores runs in their
+    # own table. None means all runs have to be written.
+    _unsaved_run_ids: Optional[Set[str]] = field(default=None, init=False, repr=False, compare=False)
 
-        session_dict["runs"] = [run.to_dict() for run in self.runs] if self.runs else None
+    def to_dict(self, include_runs: bool = True) -> Dict[str, Any]:
+        # Runs are serialized separately, so avoid deep-copying them in asdict
+        session_dict = asdict(replace(self, runs=None))
+        session_dict.pop("_unsaved_run_ids", None)
+
+        session_dict["runs"] = [run.to_dict() for run in self.runs] if include_runs and self.runs else None
         session_dict["summary"] = self.summary.to_dict() if self.summary else None
 
         return session_dict
@@ -62,7 +69,7 @@ class TeamSession:
 
         runs = data.get("runs")
         serialized_runs: List[Union[TeamRunOutput, RunOutput]] = []
-        if runs is not None and isinstance(runs[0], dict):
+        if runs and isinstance(runs[0], dict):
             for run in runs:
                 if "agent_id" in run:
                     serialized_runs.append(RunOutput.from_dict(run))
@@ -108,6 +115,9 @@ class TeamSession:
         else:
             self.runs.append(run_response)
 
+        if self._unsaved_run_ids is not None and run_response.run_id is not None:
+            self._unsaved_run_ids.add(run_response.run_id)
+
         log_debug("Added RunOutput to Team Session")
 
     def get_messages(
@@ -120,6 +130,8 @@ class TeamSession:
         skip_statuses: Optional[List[RunStatus]] = None,
         skip_history_messages: bool = True,
         skip_member_messages: bool = True,
+        max_tokens: Optional[int] = None,
+        model_id: str = "gpt-4o",
     ) -> List[Message]:
         """Returns the messages belonging to the session that fit the given criteria.
 
@@ -132,6 +144,8 @@ class TeamSession:
             skip_statuses: Skip messages with these statuses.
             skip_history_messages: Skip messages that were tagged as history in previous runs.
             skip_member_messages: Skip messages created by members of the team.
+            max_tokens: Keep the latest messages that fit in this number of tokens. Whole runs are kept unless limit is set.
+            model_id: The model whose tokenizer is used to count tokens when max_tokens is set.
 
         Returns:
             A list of Messages belonging to the session.
@@ -202,12 +216,24 @@ class TeamSession:
             else:
                 messages_from_history = messages_from_history[-limit:]
 
+            if max_tokens is not None:
+                messages_from_history = get_messages_within_token_budget(messages_from_history, max_tokens, model_id)
+
             # Remove tool result messages that don't have an associated assistant message with tool calls
             while len(messages_from_history) > 0 and messages_from_history[0].role == "tool":
                 messages_from_history.pop(0)
         else:
             # Filter by last_n runs
             runs_to_process = session_runs[-last_n_runs:] if last_n_runs is not None else session_runs
+            if max_tokens is not None:
+                runs_to_process = get_runs_within_token_budget(
+                    runs_to_process,
+                    max_tokens,
+                    model_id=model_id,
+                    should_skip_message=lambda message: _should_skip_message(
+                        message, skip_roles, skip_history_messages
+                    ),
+                )
 
             for run_response in runs_to_process:
                 if not (run_response and run_response.messages):
@@ -43,11 +43,11 @@ class WorkflowSession:
     # The unix timestamp when this session was last updated
     updated_at: Optional[int] = None
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, include_runs: bool = True) -> Dict[str, Any]:
         """Convert to dictionary for storage, serializing runs to dicts"""
 
         runs_data = None
-        if self.runs:
+        if include_runs and self.runs:
             runs_data = []
             for run in self.runs:
                 try:
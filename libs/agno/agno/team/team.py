@@ -3,9 +3,12 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import json
+import queue
+import threading
 import time
 from collections import ChainMap, deque
-from concurrent.futures import Future
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
 from copy import copy
 from dataclasses import dataclass
 from os import getenv
@@ -229,6 +232,9 @@ class Team:
     respond_directly: bool = False
     # If True, the team leader will delegate the task to all members, instead of deciding for a subset
     delegate_to_all_members: bool = False
+    # Maximum number of members to run concurrently when delegating to all members (sync runs only).
+    # Members run sequentially when not set. Async runs always run all members concurrently.
+    max_concurrent_member_runs: Optional[int] = None
     # Set to false if you want to send the run input directly to the member agents
     determine_input_for_members: bool = True
 
@@ -367,6 +373,10 @@ class Team:
     tool_choice: Optional[Union[str, Dict[str, Any]]] = None
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # Maximum number of tool calls from a single model response to run concurrently in sync runs.
+    # Tools must be thread-safe. Tool calls run sequentially when not set.
+    # Async runs ignore it: they always run the tool calls of a model response concurrently.
+    max_concurrent_tool_calls: Optional[int] = None
     # A list of hooks to be called before and after the tool call
     tool_hooks: Optional[List[Callable]] = None
 
@@ -429,6 +439,9 @@ class Team:
     num_history_runs: Optional[int] = None
     # Number of historical messages to include in the messages list sent to the Model.
     num_history_messages: Optional[int] = None
+    # Maximum number of tokens in the historical messages, keeping the latest runs that fit.
+    # Token counts are stored with the messages, so each message is only tokenized once per tokenizer.
+    max_history_tokens: Optional[int] = None
     # Maximum number of tool calls to include from history (None = no limit)
     max_tool_calls_from_history: Optional[int] = None
 
@@ -491,6 +504,7 @@ class Team:
         respond_directly: bool = False,
         determine_input_for_members: bool = True,
         delegate_to_all_members: bool = False,
+        max_concurrent_member_runs: Optional[int] = None,
         user_id: Optional[str] = None,
         session_id: Optional[str] = None,
         session_state: Optional[Dict[str, Any]] = None,
@@ -538,9 +552,11 @@ class Team:
         add_history_to_context: bool = False,
         num_history_runs: Optional[int] = None,
         num_history_messages: Optional[int] = None,
+        max_history_tokens: Optional[int] = None,
         max_tool_calls_from_history: Optional[int] = None,
         tools: Optional[List[Union[Toolkit, Callable, Function, Dict]]] = None,
         tool_call_limit: Optional[int] = None,
+        max_concurrent_tool_calls: Optional[int] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
         pre_hooks: Optional[List[Union[Callable[..., Any], BaseGuardrail, BaseEval]]] = None,
@@ -595,6 +611,7 @@ class Team:
         self.respond_directly = respond_directly
         self.determine_input_for_members = determine_input_for_members
         self.delegate_to_all_members = delegate_to_all_members
+        self.max_concurrent_member_runs = max_concurrent_member_runs
 
         self.user_id = user_id
         self.session_id = session_id
@@ -613,7 +630,9 @@ class Team:
                 "num_history_messages and num_history_runs cannot be set at the same time. Using num_history_runs."
             )
             self.num_history_messages = None
-        if self.num_history_messages is None and self.num_history_runs is None:
+        self.max_history_tokens = max_history_tokens
+        # Without a token budget, default to the last 3 runs
+        if self.num_history_messages is None and self.num_history_runs is None and self.max_history_tokens is None:
             self.num_history_runs = 3
 
         self.max_tool_calls_from_history = max_tool_calls_from_history
@@ -663,6 +682,7 @@ class Team:
         self.tools = tools
         self.tool_choice = tool_choice
         self.tool_call_limit = tool_call_limit
+        self.max_concurrent_tool_calls = max_concurrent_tool_calls
         self.tool_hooks = tool_hooks
 
         # Initialize hooks
@@ -1564,6 +1584,7 @@ class Team:
                         tools=_tools,
                         tool_choice=self.tool_choice,
                         tool_call_limit=self.tool_call_limit,
+                        max_concurrent_tool_calls=self.max_concurrent_tool_calls,
                         run_response=run_response,
                         send_media_to_model=self.send_media_to_model,
                         compression_manager=self.compression_manager if self.compress_tool_results else None,
@@ -3350,6 +3371,7 @@ class Team:
             tools=tools,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            max_concurrent_tool_calls=self.max_concurrent_tool_calls,
             stream_model_response=stream_model_response,
             run_response=run_response,
             send_media_to_model=self.send_media_to_model,
@@ -6252,6 +6274,8 @@ class Team:
             history = session.get_messages(
                 last_n_runs=self.num_history_runs,
                 limit=self.num_history_messages,
+                max_tokens=self.max_history_tokens,
+                model_id=self.model.id if self.model is not None else "gpt-4o",
                 skip_roles=[skip_role] if skip_role else None,
                 team_id=self.id if self.parent_team_id is not None else None,
             )
@@ -6383,6 +6407,8 @@ class Team:
             history = session.get_messages(
                 last_n_runs=self.num_history_runs,
                 limit=self.num_history_messages,
+                max_tokens=self.max_history_tokens,
+                model_id=self.model.id if self.model is not None else "gpt-4o",
                 skip_roles=[skip_role] if skip_role else None,
                 team_id=self.id,
             )
@@ -7707,6 +7733,144 @@ class Team:
                 member_session_state_copy,  # type: ignore
             )
 
+        def _format_member_response(
+            member_agent: Union[Agent, "Team"],
+            member_agent_run_response: Optional[Union[TeamRunOutput, RunOutput]],
+        ) -> Optional[str]:
+            """Format the response of a member for the team leader, when delegating to all members."""
+            try:
+                if member_agent_run_response.content is None and (  # type: ignore
+                    member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0  # type: ignore
+                ):
+                    return f"Agent {member_agent.name}: No response from the member agent."
+                elif isinstance(member_agent_run_response.content, str):  # type: ignore
+                    if len(member_agent_run_response.content.strip()) > 0:  # type: ignore
+                        return f"Agent {member_agent.name}: {member_agent_run_response.content}"  # type: ignore
+                    elif member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0:  # type: ignore
+                        return f"Agent {member_agent.name}: {','.join([tool.result for tool in member_agent_run_response.tools])}"  # type: ignore
+                elif issubclass(type(member_agent_run_response.content), BaseModel):  # type: ignore
+                    return f"Agent {member_agent.name}: {member_agent_run_response.content.model_dump_json(indent=2)}"  # type: ignore
+                else:
+                    import json
+
+                    return f"Agent {member_agent.name}: {json.dumps(member_agent_run_response.content, indent=2)}"  # type: ignore
+            except Exception as e:
+                return f"Agent {member_agent.name}: Error - {str(e)}"
+            return None
+
+        def _delegate_task_to_members_concurrently(
+            task: str, max_workers: int
+        ) -> Iterator[Union[RunOutputEvent, TeamRunOutputEvent, str]]:
+            """Run all the members in a thread pool, yielding their events and responses as they arrive.
+
+            Members are set up and their results processed on the calling thread, so only the member runs are concurrent.
+            """
+            members = []
+            for member_agent in self.members:
+                member_agent_task, history = _setup_delegate_task_to_member(member_agent=member_agent, task=task)
+                members.append((member_agent, member_agent_task, history, copy(run_context.session_state)))
+
+            done_marker = object()
+            member_queue: "queue.Queue[Tuple[int, Any]]" = queue.Queue()
+            # Set when the delegation ends before all the members are done, so their threads stop reporting
+            stopped = threading.Event()
+            member_run_ids = [str(uuid4()) for _ in members]
+            started_members: Set[int] = set()
+
+            def report(index: int, item: Any) -> None:
+                if not stopped.is_set():
+                    member_queue.put((index, item))
+
+            def run_member(index: int) -> None:
+                member_agent, member_agent_task, history, member_session_state_copy = members[index]
+                if stopped.is_set():
+                    return
+                started_members.add(index)
+                try:
+                    member_run = member_agent.run(  # type: ignore
+                        input=member_agent_task if not history else history,
+                        run_id=member_run_ids[index],
+                        user_id=user_id,
+                        # All members have the same session_id
+                        session_id=session.session_id,
+                        session_state=member_session_state_copy,  # Send a copy to the agent
+                        images=images,
+                        videos=videos,
+                        audio=audio,
+                        files=files,
+                        stream=stream,
+                        stream_events=(stream_events or self.stream_member_events) if stream else None,
+                        knowledge_filters=run_context.knowledge_filters
+                        if not member_agent.knowledge_filters and member_agent.knowledge
+                        else None,
+                        debug_mode=debug_mode,
+                        dependencies=run_context.dependencies,
+                        add_dependencies_to_context=add_dependencies_to_context,
+                        add_session_state_to_context=add_session_state_to_context,
+                        metadata=run_context.metadata,
+                        yield_run_output=stream,
+                    )
+                    if stream:
+                        # Do NOT break out of the loop, Iterator need to exit properly
+                        for member_agent_run_response_chunk in member_run:
+                            report(index, member_agent_run_response_chunk)
+                    else:
+                        report(index, member_run)
+                except BaseException as e:
+                    report(index, e)
+                finally:
+                    report(index, done_marker)
+
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agno-team-member")
+            remaining = len(members)
+            try:
+                for index in range(len(members)):
+                    # Use copy_context().run to propagate context variables to the member threads
+                    executor.submit(copy_context().run, run_member, index)
+
+                member_responses: Dict[int, Union[TeamRunOutput, RunOutput]] = {}
+                while remaining > 0:
+                    index, item = member_queue.get()
+                    member_agent, member_agent_task, _, member_session_state_copy = members[index]
+
+                    if item is done_marker:
+                        remaining -= 1
+                        member_agent_run_response = member_responses.get(index)
+                        _process_delegate_task_to_member(
+                            member_agent_run_response,
+                            member_agent,
+                            member_agent_task,  # type: ignore
+                            member_session_state_copy,  # type: ignore
+                        )
+                        if not stream:
+                            member_response_str = _format_member_response(member_agent, member_agent_run_response)
+                            if member_response_str is not None:
+                                yield member_response_str
+                    elif isinstance(item, BaseException):
+                        raise item
+                    elif isinstance(item, (TeamRunOutput, RunOutput)):
+                        # Don't yield TeamRunOutput or RunOutput, only yield events
+                        if not stream:
+                            check_if_run_cancelled(item)
+                        member_responses[index] = item
+                    else:
+                        # Check if the run is cancelled
+                        check_if_run_cancelled(item)
+
+                        # Yield the member event directly
+                        item.parent_run_id = item.parent_run_id or (
+                            run_response.run_id if run_response is not None else None
+                        )
+                        yield item
+            finally:
+                if remaining > 0:
+                    # The delegation failed or was cancelled: do not start the pending members, and cancel the
+                    # running ones instead of waiting for them. Their threads stop reporting to the queue.
+                    stopped.set()
+                    for index in list(started_members):
+                        cancel_run_global(member_run_ids[index])
+                executor.shutdown(wait=False, cancel_futures=True)
+
         # When the task should be delegated to all members
         def delegate_task_to_members(task: str) -> Iterator[Union[RunOutputEvent, TeamRunOutputEvent, str]]:
             """
@@ -7719,6 +7883,18 @@ class Team:
                 str: The result of the delegated task.
             """
 
+            if (
+                self.max_concurrent_member_runs is not None
+                and self.max_concurrent_member_runs > 1
+                and len(self.members) > 1
+            ):
+                yield from _delegate_task_to_members_concurrently(
+                    task, max_workers=min(self.max_concurrent_member_runs, len(self.members))
+                )
+                # After all the member runs, switch back to the team logger
+                use_team_logger()
+                return
+
             # Run all the members sequentially
             for _, member_agent in enumerate(self.members):
                 member_agent_task, history = _setup_delegate_task_to_member(member_agent=member_agent, task=task)
@@ -7788,26 +7964,9 @@ class Team:
 
                     check_if_run_cancelled(member_agent_run_response)  # type: ignore
 
-                    try:
-                        if member_agent_run_response.content is None and (  # type: ignore
-                            member_agent_run_response.tools is None or len(member_agent_run_response.tools) == 0  # type: ignore
-                        ):
-                            yield f"Agent {member_agent.name}: No response from the member agent."
-                        elif isinstance(member_agent_run_response.content, str):  # type: ignore
-                            if len(member_agent_run_response.content.strip()) > 0:  # type: ignore
-                                yield f"Agent {member_agent.name}: {member_agent_run_response.content}"  # type: ignore
-                            elif (
-                                member_agent_run_response.tools is not None and len(member_agent_run_response.tools) > 0  # type: ignore
-                            ):
-                                yield f"Agent {member_agent.name}: {','.join([tool.result for tool in member_agent_run_response.tools])}"  # type: ignore
-                        elif issubclass(type(member_agent_run_response.content), BaseModel):  # type: ignore
-                            yield f"Agent {member_agent.name}: {member_agent_run_response.content.model_dump_json(indent=2)}"  # type: ignore
-                        else:
-                            import json
-
-                            yield f"Agent {member_agent.name}: {json.dumps(member_agent_run_response.content, indent=2)}"  # type: ignore
-                    except Exception as e:
-                        yield f"Agent {member_agent.name}: Error - {str(e)}"
+                    member_response_str = _format_member_response(member_agent, member_agent_run_response)
+                    if member_response_str is not None:
+                        yield member_response_str
 
                 _process_delegate_task_to_member(
                     member_agent_run_response,
@@ -8270,6 +8429,8 @@ class Team:
             config["respond_directly"] = self.respond_directly
         if self.delegate_to_all_members:
             config["delegate_to_all_members"] = self.delegate_to_all_members
+        if self.max_concurrent_member_runs is not None:
+            config["max_concurrent_member_runs"] = self.max_concurrent_member_runs
         if not self.determine_input_for_members:  # default is True
             config["determine_input_for_members"] = self.determine_input_for_members
 
@@ -8383,6 +8544,8 @@ class Team:
             config["tool_choice"] = self.tool_choice
         if self.tool_call_limit is not None:
             config["tool_call_limit"] = self.tool_call_limit
+        if self.max_concurrent_tool_calls is not None:
+            config["max_concurrent_tool_calls"] = self.max_concurrent_tool_calls
         if self.get_member_information_tool:
             config["get_member_information_tool"] = self.get_member_information_tool
 
@@ -8443,6 +8606,8 @@ class Team:
             config["num_history_runs"] = self.num_history_runs
         if self.num_history_messages is not None:
             config["num_history_messages"] = self.num_history_messages
+        if self.max_history_tokens is not None:
+            config["max_history_tokens"] = self.max_history_tokens
         if self.max_tool_calls_from_history is not None:
             config["max_tool_calls_from_history"] = self.max_tool_calls_from_history
 
@@ -8675,6 +8840,7 @@ class Team:
             # --- Execution settings ---
             respond_directly=config.get("respond_directly", False),
             delegate_to_all_members=config.get("delegate_to_all_members", False),
+            max_concurrent_member_runs=config.get("max_concurrent_member_runs"),
             determine_input_for_members=config.get("determine_input_for_members", True),
             # --- User settings ---
             user_id=config.get("user_id"),
@@ -8721,6 +8887,7 @@ class Team:
             # --- Tools ---
             tools=config.get("tools"),
             tool_call_limit=config.get("tool_call_limit"),
+            max_concurrent_tool_calls=config.get("max_concurrent_tool_calls"),
             tool_choice=config.get("tool_choice"),
             get_member_information_tool=config.get("get_member_information_tool", False),
             # --- Schema settings ---
@@ -8745,6 +8912,7 @@ class Team:
             add_history_to_context=config.get("add_history_to_context", False),
             num_history_runs=config.get("num_history_runs"),
             num_history_messages=config.get("num_history_messages"),
+            max_history_tokens=config.get("max_history_tokens"),
             max_tool_calls_from_history=config.get("max_tool_calls_from_history"),
             # --- Compression settings ---
             compress_tool_results=config.get("compress_tool_results", False),
@@ -1,7 +1,10 @@
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass, replace
 from functools import partial
 from importlib.metadata import version
-from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Type, TypeVar, get_type_hints
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple, Type, TypeVar, get_type_hints
 
 from docstring_parser import parse
 from packaging.version import Version
@@ -10,6 +13,7 @@ from pydantic import BaseModel, Field, validate_call
 from agno.exceptions import AgentRunException
 from agno.media import Audio, File, Image, Video
 from agno.run import RunContext
+from agno.utils.cache import TieredCache, get_tiered_cache
 from agno.utils.log import log_debug, log_error, log_exception, log_warning
 
 T = TypeVar("T")
@@ -70,6 +74,84 @@ class UserInputField:
         )
 
 
+@dataclass
+class _ProcessedEntrypoint:
+    """Result of parsing an entrypoint into a function definition."""
+
+    name: str
+    description: str
+    parameters: Dict[str, Any]
+    # The wrapped entrypoint, None for bound methods, which are wrapped again for each instance
+    entrypoint: Optional[Callable]
+    user_input_schema: Optional[List[UserInputField]] = None
+
+    def get_entrypoint(self, entrypoint: Callable) -> Callable:
+        """Get the wrapped entrypoint to use for the given entrypoint"""
+        return self.entrypoint if self.entrypoint is not None else Function._wrap_callable(entrypoint)
+
+
+# Processed entrypoints, so the tools of an Agent or Team are not parsed again on every run.
+# An LRU bounded to _MAX_PROCESSED_ENTRYPOINTS entries, as the entries keep their entrypoint alive.
+_MAX_PROCESSED_ENTRYPOINTS = 1024
+_processed_entrypoints: "OrderedDict[Tuple, _ProcessedEntrypoint]" = OrderedDict()
+_processed_entrypoints_lock = threading.Lock()
+
+
+def _get_processed_entrypoint(key: Optional[Tuple]) -> Optional[_ProcessedEntrypoint]:
+    if key is None:
+        return None
+    with _processed_entrypoints_lock:
+        processed = _processed_entrypoints.get(key)
+        if processed is not None:
+            _processed_entrypoints.move_to_end(key)
+        return processed
+
+
+def _set_processed_entrypoint(key: Optional[Tuple], processed: _ProcessedEntrypoint) -> None:
+    if key is None:
+        return
+    with _processed_entrypoints_lock:
+        _processed_entrypoints[key] = processed
+        _processed_entrypoints.move_to_end(key)
+        while len(_processed_entrypoints) > _MAX_PROCESSED_ENTRYPOINTS:
+            _processed_entrypoints.popitem(last=False)
+
+
+def _get_entrypoint_cache_key(entrypoint: Callable, *options: Any) -> Optional[Tuple]:
+    """Get the cache key of an entrypoint processed with the given options, None if it can't be cached.
+
+    Bound methods are keyed on their function, so the instances of a Toolkit share their entry. Closures and
+    other locally defined functions are not cached, as they are usually new objects on every run and their
+    entry would keep what they capture alive without ever being hit.
+    """
+    from inspect import ismethod
+
+    function = entrypoint.__func__ if ismethod(entrypoint) else entrypoint
+    if getattr(function, "__closure__", None) or "<locals>" in getattr(function, "__qualname__", ""):
+        return None
+
+    # The docstring is part of the key, as it is sometimes set after the function is defined
+    key = (function, *options, getattr(entrypoint, "__doc__", None))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _get_cached_entrypoint(entrypoint: Callable, wrapped: Callable) -> Optional[Callable]:
+    """Get the wrapped entrypoint to cache. Bound methods are not cached, as they hold their instance."""
+    from inspect import ismethod
+
+    return None if ismethod(entrypoint) else wrapped
+
+
+def clear_processed_entrypoints() -> None:
+    """Clear the cache of processed tool entrypoints, e.g. after redefining a tool at runtime."""
+    with _processed_entrypoints_lock:
+        _processed_entrypoints.clear()
+
+
 class Function(BaseModel):
     """Model for storing functions that can be called by an agent."""
 
@@ -140,6 +222,9 @@ class Function(BaseModel):
     _audios: Optional[Sequence[Audio]] = None
     _files: Optional[Sequence[File]] = None
 
+    # The processed entrypoint and the options it was processed with
+    _processed_with: Optional[Tuple[Callable, Tuple]] = None
+
     def to_dict(self) -> Dict[str, Any]:
         return self.model_dump(
             exclude_none=True,
@@ -205,8 +290,19 @@ class Function(BaseModel):
 
         from agno.utils.json_schema import get_json_schema
 
+        cache_key = _get_entrypoint_cache_key(c, "from_callable", name, strict)
+        cached = _get_processed_entrypoint(cache_key)
+        if cached is not None:
+            return cls(
+                name=cached.name,
+                description=cached.description,
+                parameters=deepcopy(cached.parameters),
+                entrypoint=cached.get_entrypoint(c),
+            )
+
         function_name = name or c.__name__
         parameters = {"type": "object", "properties": {}, "required": []}
+        parsed = False
         try:
             sig = signature(c)
             type_hints = get_type_hints(c)
@@ -306,14 +402,27 @@ class Function(BaseModel):
                 ]
 
             # log_debug(f"JSON schema for {function_name}: {parameters}")
+            parsed = True
         except Exception as e:
             log_warning(f"Could not parse args for {function_name}: {e}", exc_info=True)
 
         entrypoint = cls._wrap_callable(c)
+        description = get_entrypoint_docstring(entrypoint=c)
+
+        if parsed:
+            _set_processed_entrypoint(
+                cache_key,
+                _ProcessedEntrypoint(
+                    name=function_name,
+                    description=description,
+                    parameters=deepcopy(parameters),
+                    entrypoint=_get_cached_entrypoint(c, entrypoint),
+                ),
+            )
 
         return cls(
             name=function_name,
-            description=get_entrypoint_docstring(entrypoint=c),
+            description=description,
             parameters=parameters,
             entrypoint=entrypoint,
         )
@@ -332,6 +441,16 @@ class Function(BaseModel):
         if self.entrypoint is None:
             return
 
+        user_input_fields = tuple(self.user_input_fields) if self.user_input_fields is not None else None
+        options = (strict, bool(self.requires_user_input), user_input_fields)
+        # Processing is idempotent, so an entrypoint already processed with the same options is left as is
+        if (
+            self._processed_with is not None
+            and self._processed_with[0] is self.entrypoint
+            and self._processed_with[1] == options
+        ):
+            return
+
         parameters = {"type": "object", "properties": {}, "required": []}
 
         params_set_by_user = False
@@ -342,6 +461,22 @@ class Function(BaseModel):
         if self.requires_user_input:
             self.user_input_schema = self.user_input_schema or []
 
+        # Parameters set by the user are only completed, which is not worth caching
+        cache_key: Optional[Tuple] = None
+        entrypoint = self.entrypoint
+        if not params_set_by_user:
+            cache_key = _get_entrypoint_cache_key(entrypoint, "process_entrypoint", *options)
+            cached = _get_processed_entrypoint(cache_key)
+            if cached is not None:
+                self.parameters = deepcopy(cached.parameters)
+                self.description = self.description or cached.description
+                if cached.user_input_schema is not None:
+                    self.user_input_schema = [replace(field) for field in cached.user_input_schema]
+                self.entrypoint = cached.get_entrypoint(entrypoint)
+                self._processed_with = (self.entrypoint, options)
+                return
+
+        parsed = False
         try:
             sig = signature(self.entrypoint)
             type_hints = get_type_hints(self.entrypoint)
@@ -443,9 +578,11 @@ class Function(BaseModel):
                         if param.default == param.empty and name != "self" and name not in excluded_params
                     ]
 
-            self.description = self.description or get_entrypoint_docstring(self.entrypoint)
+            docstring_description = get_entrypoint_docstring(self.entrypoint)
+            self.description = self.description or docstring_description
 
             # log_debug(f"JSON schema for {self.name}: {parameters}")
+            parsed = True
         except Exception as e:
             log_warning(f"Could not parse args for {self.name}: {e}", exc_info=True)
 
@@ -460,6 +597,22 @@ class Function(BaseModel):
         except Exception as e:
             log_warning(f"Failed to add validate decorator to entrypoint: {e}")
 
+        if parsed:
+            self._processed_with = (self.entrypoint, options)
+        if parsed and cache_key is not None:
+            _set_processed_entrypoint(
+                cache_key,
+                _ProcessedEntrypoint(
+                    name=self.name,
+                    description=docstring_description,
+                    parameters=deepcopy(self.parameters),
+                    entrypoint=_get_cached_entrypoint(entrypoint, self.entrypoint),
+                    user_input_schema=[replace(field) for field in self.user_input_schema]
+                    if self.requires_user_input and self.user_input_schema is not None
+                    else None,
+                ),
+            )
+
     @staticmethod
     def _wrap_callable(func: Callable) -> Callable:
         """Wrap a callable with Pydantic's validate_call decorator, if relevant"""
@@ -580,51 +733,41 @@ class Function(BaseModel):
         key_str = f"{self.name}:{args_str}:{kwargs_str}"
         return md5(key_str.encode()).hexdigest()
 
-    def _get_cache_file_path(self, cache_key: str) -> str:
-        """Get the full path for the cache file."""
+    def _get_cache(self) -> TieredCache:
+        """Get the cache shared by all functions using the same cache_dir."""
         from pathlib import Path
         from tempfile import gettempdir
 
         base_cache_dir = self.cache_dir or Path(gettempdir()) / "agno_cache"
-        func_cache_dir = Path(base_cache_dir) / "functions" / self.name
-        func_cache_dir.mkdir(parents=True, exist_ok=True)
-        return str(func_cache_dir / f"{cache_key}.json")
+        return get_tiered_cache(Path(base_cache_dir) / "functions.db")
 
-    def _get_cached_result(self, cache_file: str) -> Optional[Any]:
+    def _get_cached_result(self, cache_key: str) -> Optional[Any]:
         """Retrieve cached result if valid."""
-        import json
-        from pathlib import Path
-        from time import time
-
-        cache_path = Path(cache_file)
-        if not cache_path.exists():
-            return None
-
         try:
-            with cache_path.open("r") as f:
-                cache_data = json.load(f)
-
-            timestamp = cache_data.get("timestamp", 0)
-            result = cache_data.get("result")
-
-            if time() - timestamp <= self.cache_ttl:
-                return result
-
-            # Remove expired entry
-            cache_path.unlink()
+            return self._get_cache().get(f"functions/{self.name}", cache_key, ttl=self.cache_ttl)
         except Exception as e:
             log_error(f"Error reading cache: {e}")
+        return None
 
+    async def _aget_cached_result(self, cache_key: str) -> Optional[Any]:
+        """Retrieve cached result if valid."""
+        try:
+            return await self._get_cache().aget(f"functions/{self.name}", cache_key, ttl=self.cache_ttl)
+        except Exception as e:
+            log_error(f"Error reading cache: {e}")
         return None
 
-    def _save_to_cache(self, cache_file: str, result: Any):
+    def _save_to_cache(self, cache_key: str, result: Any):
         """Save result to cache."""
-        import json
-        from time import time
+        try:
+            self._get_cache().set(f"functions/{self.name}", cache_key, result)
+        except Exception as e:
+            log_error(f"Error writing cache: {e}")
 
+    async def _asave_to_cache(self, cache_key: str, result: Any):
+        """Save result to cache."""
         try:
-            with open(cache_file, "w") as f:
-                json.dump({"timestamp": time(), "result": result}, f)
+            await self._get_cache().aset(f"functions/{self.name}", cache_key, result)
         except Exception as e:
             log_error(f"Error writing cache: {e}")
 
@@ -864,8 +1007,7 @@ class FunctionCall(BaseModel):
         # Check cache if enabled and not a generator function
         if self.function.cache_results and not isgeneratorfunction(self.function.entrypoint):
             cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
+            cached_result = self.function._get_cached_result(cache_key)
 
             if cached_result is not None:
                 log_debug(f"Cache hit for: {self.get_call_str()}")
@@ -899,8 +1041,7 @@ class FunctionCall(BaseModel):
                 # Only cache non-generator results
                 if self.function.cache_results:
                     cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                    cache_file = self.function._get_cache_file_path(cache_key)
-                    self.function._save_to_cache(cache_file, self.result)
+                    self.function._save_to_cache(cache_key, self.result)
 
                 updated_session_state = None
                 if entrypoint_args.get("run_context") is not None:
@@ -1077,8 +1218,7 @@ class FunctionCall(BaseModel):
             isasyncgenfunction(self.function.entrypoint) or isgeneratorfunction(self.function.entrypoint)
         ):
             cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
+            cached_result = await self.function._aget_cached_result(cache_key)
             if cached_result is not None:
                 log_debug(f"Cache hit for: {self.get_call_str()}")
                 self.result = cached_result
@@ -1112,8 +1252,7 @@ class FunctionCall(BaseModel):
             # Only cache if not a generator
             if self.function.cache_results and not (isgenerator(self.result) or isasyncgen(self.result)):
                 cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                cache_file = self.function._get_cache_file_path(cache_key)
-                self.function._save_to_cache(cache_file, self.result)
+                await self.function._asave_to_cache(cache_key, self.result)
 
             # For generators, don't capture updated_session_state -
             # session_state is passed by reference, so mutations made during
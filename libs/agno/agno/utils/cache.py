@@ -0,0 +1,291 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from agno.utils.log import log_debug, log_warning
+
+CacheKey = Tuple[str, str]
+
+# Number of writes between two eviction passes on the SQLite tier
+_EVICT_EVERY = 100
+# Number of pending access times that triggers a write to the SQLite tier outside of set
+_TOUCH_EVERY = 100
+
+
+class TieredCache:
+    """Two-tier key/value cache for JSON-serializable values.
+
+    Lookups go through an in-process LRU tier first, then a single SQLite file. Entries are keyed on
+    (namespace, key), and the SQLite tier is bounded to roughly max_db_entries rows by evicting the least
+    recently used ones. Access times of hits in either tier are batched and written with the next set, or
+    once enough of them are pending, so reads do not commit to SQLite. Expiry is checked on read against
+    the ttl passed by the caller, so the same entry can be read with different ttls. Access is guarded by a
+    lock, so the cache can be shared across threads, and the async methods keep SQLite IO off the event loop.
+
+    Args:
+        db_path: Path to the SQLite file. None keeps the cache in memory only.
+        max_entries: Maximum number of entries kept in the in-process LRU tier.
+        max_db_entries: Maximum number of entries kept in the SQLite tier.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        max_entries: int = 1_000,
+        max_db_entries: int = 100_000,
+    ):
+        if max_entries < 1 or max_db_entries < 1:
+            raise ValueError("max_entries and max_db_entries must be at least 1")
+
+        self.db_path = Path(db_path) if db_path is not None else None
+        self.max_entries = max_entries
+        self.max_db_entries = max_db_entries
+
+        self.hits = 0
+        self.misses = 0
+
+        # Values are kept serialized, so callers never share a mutable object
+        self._lru: "OrderedDict[CacheKey, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._writes_since_eviction = 0
+        self._pending_touches: Dict[CacheKey, float] = {}
+
+        if self.db_path is not None:
+            self._connection = self._open(self.db_path)
+
+    # --- Persistent tier ---
+
+    def _open(self, db_path: Path) -> Optional[sqlite3.Connection]:
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(db_path), check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "namespace TEXT NOT NULL, "
+                "key TEXT NOT NULL, "
+                "value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed_at ON cache_entries (accessed_at)"
+            )
+            connection.commit()
+        except (OSError, sqlite3.Error) as e:
+            log_warning(f"Could not open cache file {db_path}, caching in memory only: {e}")
+            return None
+        log_debug(f"Cache using SQLite file: {db_path}")
+        return connection
+
+    def _read_persistent(self, key: CacheKey) -> Optional[Tuple[float, str]]:
+        if self._connection is None:
+            return None
+        try:
+            row = self._connection.execute(
+                "SELECT created_at, value FROM cache_entries WHERE namespace = ? AND key = ?", key
+            ).fetchone()
+        except sqlite3.Error as e:
+            log_warning(f"Error reading from cache: {e}")
+            return None
+        return (row[0], row[1]) if row is not None else None
+
+    def _write_persistent(self, key: CacheKey, created_at: float, value: str) -> None:
+        if self._connection is None:
+            return
+        self._pending_touches.pop(key, None)
+        try:
+            self._write_touches()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache_entries (namespace, key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (*key, value, created_at, created_at),
+            )
+            self._writes_since_eviction += 1
+            if self._writes_since_eviction >= _EVICT_EVERY:
+                self._evict()
+            self._connection.commit()
+        except sqlite3.Error as e:
+            log_warning(f"Error writing to cache: {e}")
+
+    def _delete_persistent(self, key: CacheKey) -> None:
+        self._pending_touches.pop(key, None)
+        if self._connection is None:
+            return
+        try:
+            self._connection.execute("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", key)
+            self._connection.commit()
+        except sqlite3.Error as e:
+            log_warning(f"Error deleting from cache: {e}")
+
+    def _touch(self, key: CacheKey) -> None:
+        """Record a hit, so the entry is not evicted from the SQLite tier as least recently used."""
+        if self._connection is not None:
+            self._pending_touches[key] = time.time()
+
+    def _write_touches(self) -> None:
+        """Write the pending access times in one statement. The caller commits."""
+        assert self._connection is not None
+        if not self._pending_touches:
+            return
+        touches = [(accessed_at, *key) for key, accessed_at in self._pending_touches.items()]
+        self._pending_touches.clear()
+        self._connection.executemany(
+            "UPDATE cache_entries SET accessed_at = ? WHERE namespace = ? AND key = ?", touches
+        )
+
+    def _flush_touches(self) -> None:
+        if self._connection is None or not self._pending_touches:
+            return
+        try:
+            self._write_touches()
+            self._connection.commit()
+        except sqlite3.Error as e:
+            log_warning(f"Error updating cache access times: {e}")
+
+    def _evict(self) -> None:
+        """Drop the least recently used rows beyond max_db_entries."""
+        assert self._connection is not None
+        self._writes_since_eviction = 0
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+        excess = count - self.max_db_entries
+        if excess > 0:
+            self._connection.execute(
+                "DELETE FROM cache_entries WHERE rowid IN "
+                "(SELECT rowid FROM cache_entries ORDER BY accessed_at LIMIT ?)",
+                (excess,),
+            )
+            log_debug(f"Evicted {excess} entries from cache file {self.db_path}")
+
+    # --- In-process tier ---
+
+    def _remember(self, key: CacheKey, entry: Tuple[float, str]) -> None:
+        self._lru[key] = entry
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def _lookup_lru(self, key: CacheKey, ttl: Optional[float]) -> Tuple[bool, Optional[str]]:
+        """Look a key up in the LRU tier. Returns (found, value); an expired entry counts as found with no value."""
+        entry = self._lru.get(key)
+        if entry is None:
+            return False, None
+        if ttl is not None and time.time() - entry[0] > ttl:
+            return True, None
+        self._lru.move_to_end(key)
+        return True, entry[1]
+
+    def _get(self, key: CacheKey, ttl: Optional[float]) -> Optional[str]:
+        with self._lock:
+            found, value = self._lookup_lru(key, ttl)
+            if not found:
+                entry = self._read_persistent(key)
+                if entry is not None and (ttl is None or time.time() - entry[0] <= ttl):
+                    self._remember(key, entry)
+                    value = entry[1]
+
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._touch(key)
+                if len(self._pending_touches) >= _TOUCH_EVERY:
+                    self._flush_touches()
+            return value
+
+    @staticmethod
+    def _decode(value: Optional[str]) -> Optional[Any]:
+        return json.loads(value) if value is not None else None
+
+    # --- Public API ---
+
+    def get(self, namespace: str, key: str, ttl: Optional[float] = None) -> Optional[Any]:
+        """Return the cached value, or None when it is missing or older than ttl seconds."""
+        return self._decode(self._get((namespace, key), ttl))
+
+    async def aget(self, namespace: str, key: str, ttl: Optional[float] = None) -> Optional[Any]:
+        """Async variant of get. Hits in the in-process tier are served without leaving the event loop."""
+        cache_key = (namespace, key)
+        with self._lock:
+            found, value = self._lookup_lru(cache_key, ttl)
+            if found and value is not None:
+                # The access time is written later by a call that runs off the event loop
+                self.hits += 1
+                self._touch(cache_key)
+                return self._decode(value)
+        if self._connection is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        return self._decode(await asyncio.to_thread(self._get, cache_key, ttl))
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """Store a JSON-serializable value. Values that cannot be serialized are not cached."""
+        try:
+            serialized = json.dumps(value)
+        except (TypeError, ValueError) as e:
+            log_warning(f"Could not cache value for {namespace}: {e}")
+            return
+        created_at = time.time()
+        with self._lock:
+            self._remember((namespace, key), (created_at, serialized))
+            self._write_persistent((namespace, key), created_at, serialized)
+
+    async def aset(self, namespace: str, key: str, value: Any) -> None:
+        """Async variant of set."""
+        if self._connection is None:
+            self.set(namespace, key, value)
+        else:
+            await asyncio.to_thread(self.set, namespace, key, value)
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._lru.pop((namespace, key), None)
+            self._delete_persistent((namespace, key))
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._lru.clear()
+            self._pending_touches.clear()
+            if self._connection is not None:
+                try:
+                    self._connection.execute("DELETE FROM cache_entries")
+                    self._connection.commit()
+                except sqlite3.Error as e:
+                    log_warning(f"Error clearing cache: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._flush_touches()
+                self._connection.close()
+                self._connection = None
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+
+_caches: Dict[Path, TieredCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_tiered_cache(db_path: Union[str, Path]) -> TieredCache:
+    """Return the process-wide cache backed by the given SQLite file, creating it on first use."""
+    path = Path(db_path)
+    cache = _caches.get(path)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(path)
+            if cache is None:
+                cache = TieredCache(db_path=path)
+                _caches[path] = cache
+    return cache
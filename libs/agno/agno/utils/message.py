@@ -1,5 +1,5 @@
 from copy import deepcopy
-from typing import Dict, List, Union
+from typing import Any, Callable, Dict, List, Sequence, Union
 
 from pydantic import BaseModel
 
@@ -65,6 +65,79 @@ def filter_tool_calls(messages: List[Message], max_tool_calls: int) -> None:
     log_debug(f"Filtered {num_filtered} tool calls, kept {len(tool_call_ids_to_keep)}")
 
 
+def get_runs_within_token_budget(
+    runs: Sequence[Any],
+    max_tokens: int,
+    model_id: str = "gpt-4o",
+    should_skip_message: Callable[[Message], bool] = lambda message: False,
+) -> List[Any]:
+    """
+    Select the latest runs whose messages fit in a token budget.
+
+    Walks back from the newest run and stops at the first run that doesn't fit, so only the
+    messages of the selected runs are counted. System messages are not counted.
+
+    Args:
+        runs: Runs to select from, oldest first
+        max_tokens: Maximum number of tokens in the messages of the selected runs
+        model_id: Model whose tokenizer is used to count the tokens
+        should_skip_message: Messages for which this returns True are not counted
+
+    Returns:
+        The selected runs, oldest first
+    """
+    from agno.utils.tokens import count_message_tokens
+
+    selected_runs: List[Any] = []
+    num_tokens = 0
+    for run in reversed(runs):
+        if not run or not run.messages:
+            continue
+        run_tokens = sum(
+            count_message_tokens(message, model_id)
+            for message in run.messages
+            if message.role != "system" and not should_skip_message(message)
+        )
+        if num_tokens + run_tokens > max_tokens:
+            break
+        num_tokens += run_tokens
+        selected_runs.append(run)
+
+    log_debug(f"Selected {len(selected_runs)} runs with {num_tokens} tokens from history")
+    return selected_runs[::-1]
+
+
+def get_messages_within_token_budget(
+    messages: List[Message], max_tokens: int, model_id: str = "gpt-4o"
+) -> List[Message]:
+    """
+    Keep the latest messages that fit in a token budget, and the system message if there is one.
+
+    Args:
+        messages: Messages to select from, oldest first
+        max_tokens: Maximum number of tokens in the selected messages, not counting the system message
+        model_id: Model whose tokenizer is used to count the tokens
+
+    Returns:
+        The selected messages, oldest first
+    """
+    from agno.utils.tokens import count_message_tokens
+
+    system_messages = [message for message in messages if message.role == "system"]
+    selected_messages: List[Message] = []
+    num_tokens = 0
+    for message in reversed(messages):
+        if message.role == "system":
+            continue
+        message_tokens = count_message_tokens(message, model_id)
+        if num_tokens + message_tokens > max_tokens:
+            break
+        num_tokens += message_tokens
+        selected_messages.append(message)
+
+    return system_messages[:1] + selected_messages[::-1]
+
+
 def get_text_from_message(message: Union[List, Dict, str, Message, BaseModel]) -> str:
     """Return the user texts from the message"""
     import json
@@ -0,0 +1,225 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from time import monotonic, sleep
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from agno.utils.log import log_debug
+
+# How long waiters blocked on max_concurrent_requests sleep before checking again, if not woken up earlier
+_CONCURRENCY_POLL_SECONDS = 0.5
+
+
+class RateLimiter:
+    """Client-side rate limiter for requests sent to a model provider.
+
+    Limits requests per minute and tokens per minute with token buckets, and the number of requests in flight.
+    The same instance can be attached to any number of Models and Embedders, across threads and event loops,
+    so they share the provider quota instead of running into 429 errors and retrying. Copying an Agent or a
+    Model keeps the limiter shared.
+
+    Token counts are estimated before a request and corrected with the usage reported by the provider, when
+    available.
+
+    Args:
+        requests_per_minute: Maximum number of requests started per minute. None for no limit.
+        tokens_per_minute: Maximum number of tokens used per minute. None for no limit.
+        max_concurrent_requests: Maximum number of requests in flight. None for no limit.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrent_requests: Optional[int] = None,
+    ):
+        for name, value in (
+            ("requests_per_minute", requests_per_minute),
+            ("tokens_per_minute", tokens_per_minute),
+            ("max_concurrent_requests", max_concurrent_requests),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be greater than 0")
+
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrent_requests = max_concurrent_requests
+
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+        # Buckets start full, so the first requests of a minute are not delayed
+        self._available_requests = float(requests_per_minute or 0)
+        self._available_tokens = float(tokens_per_minute or 0)
+        self._refilled_at = monotonic()
+        self._in_flight = 0
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    @property
+    def counts_tokens(self) -> bool:
+        """Whether callers need to estimate the tokens of their requests."""
+        return self.tokens_per_minute is not None
+
+    def __copy__(self) -> "RateLimiter":
+        return self
+
+    def __deepcopy__(self, memo: Dict) -> "RateLimiter":
+        return self
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        if self.requests_per_minute is not None:
+            self._available_requests = min(
+                float(self.requests_per_minute), self._available_requests + elapsed * self.requests_per_minute / 60
+            )
+        if self.tokens_per_minute is not None:
+            self._available_tokens = min(
+                float(self.tokens_per_minute), self._available_tokens + elapsed * self.tokens_per_minute / 60
+            )
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Take a request slot if possible. Returns 0 when acquired, else how long to wait before trying again.
+
+        Must be called with the lock held.
+        """
+        if self.max_concurrent_requests is not None and self._in_flight >= self.max_concurrent_requests:
+            return _CONCURRENCY_POLL_SECONDS
+
+        self._refill(monotonic())
+        wait = 0.0
+        if self.requests_per_minute is not None and self._available_requests < 1:
+            wait = (1 - self._available_requests) * 60 / self.requests_per_minute
+        if self.tokens_per_minute is not None:
+            # A request larger than the whole bucket only waits for a full bucket
+            needed = min(float(tokens), float(self.tokens_per_minute))
+            if self._available_tokens < needed:
+                wait = max(wait, (needed - self._available_tokens) * 60 / self.tokens_per_minute)
+        if wait > 0:
+            return wait
+
+        if self.requests_per_minute is not None:
+            self._available_requests -= 1
+        if self.tokens_per_minute is not None:
+            self._available_tokens -= tokens
+        self._in_flight += 1
+        return 0.0
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until a request using about `tokens` tokens can be sent."""
+        with self._lock:
+            while True:
+                wait = self._try_acquire(tokens)
+                if wait == 0:
+                    return
+                log_debug(f"Rate limit reached, waiting {wait:.2f}s")
+                if self.max_concurrent_requests is not None and self._in_flight >= self.max_concurrent_requests:
+                    self._released.wait(wait)
+                else:
+                    self._lock.release()
+                    try:
+                        sleep(wait)
+                    finally:
+                        self._lock.acquire()
+
+    async def aacquire(self, tokens: int = 0) -> None:
+        """Async variant of acquire, waiting without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                wait = self._try_acquire(tokens)
+                if wait == 0:
+                    return
+                released: Optional[asyncio.Future] = None
+                if self.max_concurrent_requests is not None and self._in_flight >= self.max_concurrent_requests:
+                    released = loop.create_future()
+                    self._async_waiters.append((loop, released))
+            log_debug(f"Rate limit reached, waiting {wait:.2f}s")
+            if released is None:
+                await asyncio.sleep(wait)
+            else:
+                try:
+                    await asyncio.wait_for(released, timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+
+    def release(self, tokens_used: Optional[int] = None, tokens_estimated: int = 0) -> None:
+        """Release the request slot, correcting the token bucket with the tokens actually used, if known."""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            if tokens_used is not None and self.tokens_per_minute is not None:
+                self._refill(monotonic())
+                self._available_tokens -= tokens_used - tokens_estimated
+            self._released.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, future in waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_set_result, future)
+
+    @contextmanager
+    def limit(self, tokens: int = 0) -> Iterator["RateLimitUsage"]:
+        """Hold a request slot while the block runs. Report the tokens used on the yielded object, if known."""
+        self.acquire(tokens)
+        usage = RateLimitUsage()
+        try:
+            yield usage
+        finally:
+            self.release(tokens_used=usage.tokens, tokens_estimated=tokens)
+
+    @asynccontextmanager
+    async def alimit(self, tokens: int = 0) -> AsyncIterator["RateLimitUsage"]:
+        """Async variant of limit."""
+        await self.aacquire(tokens)
+        usage = RateLimitUsage()
+        try:
+            yield usage
+        finally:
+            self.release(tokens_used=usage.tokens, tokens_estimated=tokens)
+
+
+class RateLimitUsage:
+    """Tokens used by a request, reported back to the RateLimiter once known."""
+
+    def __init__(self) -> None:
+        self.tokens: Optional[int] = None
+
+    def add(self, tokens: Optional[int]) -> None:
+        if tokens:
+            self.tokens = (self.tokens or 0) + tokens
+
+    def add_max(self, tokens: Optional[int]) -> None:
+        """Record tokens reported cumulatively, such as the usage of stream chunks, keeping the largest value."""
+        if tokens:
+            self.tokens = max(self.tokens or 0, tokens)
+
+
+def _set_result(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    name: str,
+    requests_per_minute: Optional[float] = None,
+    tokens_per_minute: Optional[float] = None,
+    max_concurrent_requests: Optional[int] = None,
+) -> RateLimiter:
+    """Return the process-wide rate limiter with the given name (e.g. a provider or API key), creating it on first use.
+
+    The limits are only used when the limiter is created.
+    """
+    rate_limiter = _rate_limiters.get(name)
+    if rate_limiter is None:
+        with _rate_limiters_lock:
+            rate_limiter = _rate_limiters.get(name)
+            if rate_limiter is None:
+                rate_limiter = RateLimiter(
+                    requests_per_minute=requests_per_minute,
+                    tokens_per_minute=tokens_per_minute,
+                    max_concurrent_requests=max_concurrent_requests,
+                )
+                _rate_limiters[name] = rate_limiter
+    return rate_limiter
@@ -1,8 +1,18 @@
 """JSON serialization utilities for handling datetime and enum objects."""
 
+import json
+from copy import deepcopy
+from dataclasses import fields, is_dataclass
 from datetime import date, datetime, time
 from enum import Enum
-from typing import Any
+from typing import Any, Collection, Dict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+_ATOMIC_TYPES = (str, int, float, bool, type(None))
 
 
 def json_serializer(obj: Any) -> Any:
@@ -30,3 +40,55 @@ def json_serializer(obj: Any) -> Any:
 
     # Fallback to string
     return str(obj)
+
+
+def dataclass_to_dict(obj: Any, exclude: Collection[str] = (), exclude_none: bool = True) -> Dict[str, Any]:
+    """Convert a dataclass instance to a dictionary like dataclasses.asdict, skipping the excluded fields.
+
+    Unlike filtering the output of asdict, excluded fields are never converted, so large nested values serialized
+    separately by the caller (e.g. messages or media) are not deep-copied only to be thrown away.
+    """
+    result: Dict[str, Any] = {}
+    for f in fields(obj):
+        if f.name in exclude:
+            continue
+        value = getattr(obj, f.name)
+        if value is None:
+            if not exclude_none:
+                result[f.name] = None
+            continue
+        result[f.name] = _to_dict_value(value)
+    return result
+
+
+def _to_dict_value(value: Any) -> Any:
+    """Convert a field value the way dataclasses.asdict does."""
+    if isinstance(value, _ATOMIC_TYPES):
+        return value
+    if is_dataclass(value) and not isinstance(value, type):
+        return dataclass_to_dict(value, exclude_none=False)
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)(*[_to_dict_value(v) for v in value])
+    if isinstance(value, (list, tuple)):
+        return type(value)(_to_dict_value(v) for v in value)
+    if isinstance(value, dict):
+        return type(value)((_to_dict_value(k), _to_dict_value(v)) for k, v in value.items())
+    return deepcopy(value)
+
+
+def json_dumps_compact(obj: Any) -> str:
+    """Serialize to compact JSON, as json.dumps(obj, separators=(",", ":"), default=json_serializer, ensure_ascii=False).
+
+    Uses orjson when it is installed, falling back to json for values orjson cannot encode.
+    Unlike json, orjson writes NaN and Infinity as null.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                default=json_serializer,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode("utf-8")
+        except (TypeError, orjson.JSONEncodeError):
+            pass
+    return json.dumps(obj, separators=(",", ":"), default=json_serializer, ensure_ascii=False)
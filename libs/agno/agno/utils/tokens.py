@@ -1,6 +1,7 @@
 import json
 import math
 from functools import lru_cache
+from hashlib import md5
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
 
@@ -76,6 +77,17 @@ def _select_tokenizer(model_id: str) -> Tuple[str, Any]:
     return ("none", None)
 
 
+@lru_cache(maxsize=64)
+def _get_tokenizer_key(model_id: str) -> str:
+    """Name of the tokenizer used for a model, so that models sharing a tokenizer share cached counts."""
+    tokenizer_type, tokenizer = _select_tokenizer(model_id)
+    if tokenizer_type == "tiktoken":
+        return f"tiktoken:{tokenizer.name}"
+    if tokenizer_type == "huggingface":
+        return f"huggingface:{model_id}"
+    return "none"
+
+
 # =============================================================================
 # Tool Token Counting
 # =============================================================================
@@ -632,6 +644,40 @@ def _count_message_tokens(message: Message, model_id: str = "gpt-4o") -> int:
     return tokens
 
 
+def _get_message_token_state(message: Message) -> str:
+    """Digest of the parts of a message its token count depends on, to detect changes after it was counted."""
+    content = message.get_content(use_compressed_content=True)
+    state = (
+        content if content is None or isinstance(content, str) else repr(content),
+        repr(message.tool_calls) if message.tool_calls else None,
+        message.tool_call_id,
+        message.reasoning_content,
+        message.redacted_reasoning_content,
+        message.name,
+        tuple(len(media) if media else 0 for media in (message.images, message.audio, message.videos, message.files)),
+    )
+    return md5(repr(state).encode()).hexdigest()
+
+
+def count_message_tokens(message: Message, model_id: str = "gpt-4o") -> int:
+    """Count the tokens of a single message.
+
+    The count is cached on the message per tokenizer, and only recomputed when the message changes. Cached counts
+    are stored with the message, so history messages loaded from the database are not tokenized again.
+    """
+    model_id = model_id.lower()
+    tokenizer_key = _get_tokenizer_key(model_id)
+    state = _get_message_token_state(message)
+
+    cached = message._token_counts.get(tokenizer_key)
+    if cached is not None and cached[0] == state:
+        return cached[1]
+
+    tokens = _count_message_tokens(message, model_id)
+    message._token_counts[tokenizer_key] = (state, tokens)
+    return tokens
+
+
 def count_tokens(
     messages: List[Message],
     tools: Optional[List[Union[Function, Dict[str, Any]]]] = None,
@@ -644,7 +690,7 @@ def count_tokens(
     # Count message tokens
     if messages:
         for msg in messages:
-            total += _count_message_tokens(msg, model_id)
+            total += count_message_tokens(msg, model_id)
 
     # Add tool tokens
     if tools:
@@ -0,0 +1,9 @@
+from agno.vectordb.distance import Distance
+from agno.vectordb.numpydb.numpy_db import NumpyDb
+from agno.vectordb.search import SearchType
+
+__all__ = [
+    "Distance",
+    "NumpyDb",
+    "SearchType",
+]
@@ -0,0 +1,736 @@
+import asyncio
+import json
+import os
+import shutil
+import threading
+from hashlib import md5
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+from agno.filters import AND, EQ, GT, IN, LT, NOT, OR, FilterExpr
+from agno.knowledge.document import Document
+from agno.knowledge.embedder import Embedder
+from agno.knowledge.reranker.base import Reranker
+from agno.utils.log import log_debug, log_error, log_info, log_warning, logger
+from agno.vectordb.base import VectorDb
+from agno.vectordb.distance import Distance
+from agno.vectordb.search import SearchType
+
+VECTORS_FILE = "vectors.f32"
+INDEX_FILE = "index.jsonl"
+META_FILE = "meta.json"
+
+# Rows scored per chunk when assigning vectors to IVF lists, to bound temporary memory
+_ASSIGN_CHUNK_ROWS = 65_536
+
+
+class NumpyDb(VectorDb):
+    """
+    NumpyDb is a local, dependency-light vector database backed by NumPy.
+
+    Embeddings are stored as float32 rows in an append-only matrix, memory-mapped from disk when a path is
+    set and kept in memory otherwise. Document ids, content and metadata live in a sidecar JSON lines index
+    whose rows line up with the matrix. Deletes and metadata updates are appended to the index and applied
+    on load; `optimize()` compacts both files.
+
+    Search is a vectorized brute-force scan. For large collections an optional IVF coarse quantizer
+    (k-means centroids) restricts the scan to the `nprobe` closest lists.
+
+    Args:
+        collection: Name of the collection. Defaults to a sanitized `name`, or "documents".
+        name: Name of the vector database.
+        description: Description of the vector database.
+        id: Unique identifier for this vector database instance.
+        embedder: The embedder to use when embedding the document contents.
+        distance: The distance metric to use when searching for documents.
+        path: Directory where collections are stored. Set to None to keep the collection in memory only.
+        ivf_lists: Number of IVF lists (k-means centroids). Disabled when None.
+        nprobe: Number of IVF lists scanned per query.
+        ivf_min_rows: Minimum number of live rows before the IVF quantizer is trained and used.
+        reranker: The reranker to use when reranking documents.
+    """
+
+    def __init__(
+        self,
+        collection: Optional[str] = None,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        id: Optional[str] = None,
+        embedder: Optional[Embedder] = None,
+        distance: Distance = Distance.cosine,
+        path: Optional[str] = "tmp/numpydb",
+        ivf_lists: Optional[int] = None,
+        nprobe: int = 8,
+        ivf_min_rows: int = 10_000,
+        reranker: Optional[Reranker] = None,
+    ):
+        if collection is None:
+            collection = name.lower().replace(" ", "_") if name is not None else "documents"
+
+        if ivf_lists is not None and ivf_lists < 1:
+            raise ValueError("ivf_lists must be at least 1")
+        if nprobe < 1:
+            raise ValueError("nprobe must be at least 1")
+
+        # Dynamic ID generation based on unique identifiers
+        if id is None:
+            from agno.utils.string import generate_id
+
+            seed = f"{path or 'memory'}#{collection}"
+            id = generate_id(seed)
+
+        # Initialize base class with name, description, and generated ID
+        super().__init__(id=id, name=name, description=description)
+
+        self.collection_name: str = collection
+
+        # Embedder for embedding the document contents
+        if embedder is None:
+            from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+            log_debug("Embedder not provided, using OpenAIEmbedder as default.")
+        self.embedder: Embedder = embedder
+        self.dimensions: Optional[int] = self.embedder.dimensions
+
+        # Distance metric
+        self.distance: Distance = distance
+
+        # Storage location. None keeps everything in memory.
+        self.path: Optional[Path] = Path(path) / collection if path is not None else None
+
+        # IVF coarse quantizer settings
+        self.ivf_lists: Optional[int] = ivf_lists
+        self.nprobe: int = nprobe
+        self.ivf_min_rows: int = ivf_min_rows
+
+        # Reranker instance
+        self.reranker: Optional[Reranker] = reranker
+
+        self._lock = threading.RLock()
+        self._loaded: bool = False
+        self._created: bool = False
+        self._reset_state()
+
+    # --- State ---
+
+    def _reset_state(self) -> None:
+        self._records: List[Dict[str, Any]] = []
+        self._alive = np.zeros(0, dtype=bool)
+        self._matrix: np.ndarray = np.zeros((0, self.dimensions or 0), dtype=np.float32)
+        self._sq_norms = np.zeros(0, dtype=np.float32)
+        self._id_to_row: Dict[str, int] = {}
+        self._rows_by_content_hash: Dict[str, Set[int]] = {}
+        self._rows_by_content_id: Dict[str, Set[int]] = {}
+        self._rows_by_name: Dict[str, Set[int]] = {}
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+
+    def _index_row(self, row: int) -> None:
+        record = self._records[row]
+        previous = self._id_to_row.get(record["id"])
+        if previous is not None and previous != row:
+            self._remove_rows([previous])
+        self._id_to_row[record["id"]] = row
+        for rows_by_key, key in (
+            (self._rows_by_content_hash, record.get("content_hash")),
+            (self._rows_by_content_id, record.get("content_id")),
+            (self._rows_by_name, record.get("name")),
+        ):
+            if key is not None:
+                rows_by_key.setdefault(key, set()).add(row)
+
+    def _remove_rows(self, rows: List[int]) -> None:
+        for row in rows:
+            if not self._alive[row]:
+                continue
+            self._alive[row] = False
+            record = self._records[row]
+            if self._id_to_row.get(record["id"]) == row:
+                del self._id_to_row[record["id"]]
+            for rows_by_key, key in (
+                (self._rows_by_content_hash, record.get("content_hash")),
+                (self._rows_by_content_id, record.get("content_id")),
+                (self._rows_by_name, record.get("name")),
+            ):
+                if key is not None and key in rows_by_key:
+                    rows_by_key[key].discard(row)
+                    if not rows_by_key[key]:
+                        del rows_by_key[key]
+
+    # --- Persistence ---
+
+    def _open_matrix(self, num_rows: int) -> np.ndarray:
+        if self.path is None or num_rows == 0 or not self.dimensions:
+            return np.zeros((0, self.dimensions or 0), dtype=np.float32)
+        return np.memmap(self.path / VECTORS_FILE, dtype=np.float32, mode="r", shape=(num_rows, self.dimensions))
+
+    def _append_index(self, entries: List[Dict[str, Any]]) -> None:
+        if self.path is None or not entries:
+            return
+        with open(self.path / INDEX_FILE, "a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, default=str) + "\n")
+
+    def _write_meta(self) -> None:
+        if self.path is None:
+            return
+        meta = {"dimensions": self.dimensions, "distance": self.distance.value}
+        (self.path / META_FILE).write_text(json.dumps(meta), encoding="utf-8")
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            if self.path is not None and (self.path / META_FILE).exists():
+                self._load()
+            self._loaded = True
+
+    def _load(self) -> None:
+        assert self.path is not None
+        meta = json.loads((self.path / META_FILE).read_text(encoding="utf-8"))
+        stored_dimensions = meta.get("dimensions")
+        if self.dimensions is not None and stored_dimensions is not None and stored_dimensions != self.dimensions:
+            raise ValueError(
+                f"Collection '{self.collection_name}' stores {stored_dimensions}-dimensional vectors, "
+                f"but the embedder produces {self.dimensions}"
+            )
+        self.dimensions = stored_dimensions
+        self._created = True
+        self._reset_state()
+
+        records: List[Dict[str, Any]] = []
+        deleted: Set[int] = set()
+        index_path = self.path / INDEX_FILE
+        if index_path.exists():
+            with open(index_path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn final write, everything before it is still consistent
+                        log_warning(f"Skipping unreadable entry in {index_path}")
+                        continue
+                    op = entry.pop("op", None)
+                    if op == "add":
+                        records.append(entry)
+                    elif op == "delete":
+                        deleted.update(entry["rows"])
+                    elif op == "meta":
+                        if entry["row"] < len(records):
+                            records[entry["row"]]["meta_data"] = entry["meta_data"]
+
+        # Vectors are written before their index entries, so any trailing rows without an entry are dropped
+        vectors_path = self.path / VECTORS_FILE
+        row_bytes = 4 * (self.dimensions or 0)
+        stored_rows = vectors_path.stat().st_size // row_bytes if vectors_path.exists() and row_bytes else 0
+        num_rows = min(stored_rows, len(records))
+        if vectors_path.exists() and vectors_path.stat().st_size != num_rows * row_bytes:
+            os.truncate(vectors_path, num_rows * row_bytes)
+
+        self._records = records[:num_rows]
+        self._matrix = self._open_matrix(num_rows)
+        self._sq_norms = np.einsum("ij,ij->i", self._matrix, self._matrix) if num_rows else self._sq_norms
+        self._alive = np.ones(num_rows, dtype=bool)
+        for row in range(num_rows):
+            self._index_row(row)
+        self._remove_rows([row for row in deleted if row < num_rows])
+        log_debug(f"Loaded {int(self._alive.sum())} documents from {self.path}")
+
+    # --- Collection lifecycle ---
+
+    def create(self) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            if self.path is not None:
+                self.path.mkdir(parents=True, exist_ok=True)
+                if not (self.path / META_FILE).exists():
+                    self._write_meta()
+            self._created = True
+
+    async def async_create(self) -> None:
+        await asyncio.to_thread(self.create)
+
+    def exists(self) -> bool:
+        if self.path is not None:
+            return (self.path / META_FILE).exists()
+        return self._created
+
+    async def async_exists(self) -> bool:
+        return self.exists()
+
+    def drop(self) -> None:
+        with self._lock:
+            if self.path is not None and self.path.exists():
+                log_debug(f"Dropping collection: {self.collection_name}")
+                shutil.rmtree(self.path)
+            self.dimensions = self.embedder.dimensions
+            self._created = False
+            self._reset_state()
+
+    async def async_drop(self) -> None:
+        await asyncio.to_thread(self.drop)
+
+    def delete(self) -> bool:
+        """Delete every document in the collection, keeping the collection itself."""
+        with self._lock:
+            self._ensure_loaded()
+            if self.path is not None and self.path.exists():
+                for file_name in (VECTORS_FILE, INDEX_FILE):
+                    (self.path / file_name).unlink(missing_ok=True)
+            self._reset_state()
+            return True
+
+    def get_count(self) -> int:
+        self._ensure_loaded()
+        return int(self._alive.sum())
+
+    def optimize(self) -> None:
+        """Compact away deleted rows and (re)train the IVF quantizer if it is enabled."""
+        with self._lock:
+            self._ensure_loaded()
+            live_rows = np.flatnonzero(self._alive)
+            if len(live_rows) < len(self._records):
+                log_debug(f"Compacting {len(self._records) - len(live_rows)} deleted rows")
+                vectors = np.asarray(self._matrix[live_rows], dtype=np.float32)
+                records = [self._records[row] for row in live_rows]
+
+                if self.path is not None:
+                    tmp_vectors = self.path / f"{VECTORS_FILE}.tmp"
+                    tmp_index = self.path / f"{INDEX_FILE}.tmp"
+                    vectors.tofile(tmp_vectors)
+                    with open(tmp_index, "w", encoding="utf-8") as f:
+                        for record in records:
+                            f.write(json.dumps({"op": "add", **record}, default=str) + "\n")
+                    os.replace(tmp_vectors, self.path / VECTORS_FILE)
+                    os.replace(tmp_index, self.path / INDEX_FILE)
+
+                self._reset_state()
+                self._records = records
+                self._matrix = self._open_matrix(len(records)) if self.path is not None else vectors
+                self._sq_norms = np.einsum("ij,ij->i", vectors, vectors) if len(records) else self._sq_norms
+                self._alive = np.ones(len(records), dtype=bool)
+                for row in range(len(records)):
+                    self._index_row(row)
+
+            self._centroids = None
+            self._assignments = np.zeros(0, dtype=np.int32)
+            self._ensure_ivf()
+
+    # --- Writes ---
+
+    def _embed_documents(self, documents: List[Document]) -> None:
+        pending = [doc for doc in documents if doc.embedding is None]
+        if not pending:
+            return
+        if self.embedder.enable_batch and hasattr(self.embedder, "get_embeddings_batch_and_usage"):
+            try:
+                embeddings, usages = self.embedder.get_embeddings_batch_and_usage([doc.content for doc in pending])
+                for doc, embedding, usage in zip(pending, embeddings, usages):
+                    doc.embedding = embedding
+                    doc.usage = usage
+                return
+            except Exception as e:
+                log_warning(f"Batch embedding failed, falling back to individual embedding: {e}")
+        for doc in pending:
+            doc.embed(embedder=self.embedder)
+
+    async def _async_embed_documents(self, documents: List[Document]) -> None:
+        pending = [doc for doc in documents if doc.embedding is None]
+        if not pending:
+            return
+        if self.embedder.enable_batch and hasattr(self.embedder, "async_get_embeddings_batch_and_usage"):
+            try:
+                embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(
+                    [doc.content for doc in pending]
+                )
+                for doc, embedding, usage in zip(pending, embeddings, usages):
+                    doc.embedding = embedding
+                    doc.usage = usage
+                return
+            except Exception as e:
+                log_warning(f"Batch embedding failed, falling back to individual embedding: {e}")
+        await asyncio.gather(*[doc.async_embed(embedder=self.embedder) for doc in pending])
+
+    def _build_record(
+        self, document: Document, content_hash: str, filters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        cleaned_content = document.content.replace("\x00", "\ufffd")
+        base_id = document.id or md5(cleaned_content.encode()).hexdigest()
+        meta_data = dict(document.meta_data or {})
+        if filters:
+            meta_data.update(filters)
+        return {
+            "id": md5(f"{base_id}_{content_hash}".encode()).hexdigest(),
+            "name": document.name,
+            "content": cleaned_content,
+            "meta_data": meta_data,
+            "usage": document.usage,
+            "content_hash": content_hash,
+            "content_id": document.content_id,
+        }
+
+    def _write_documents(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        records: List[Dict[str, Any]] = []
+        vectors: List[List[float]] = []
+        for document in documents:
+            if not document.embedding:
+                log_error(f"Skipping document without embedding: {document.name}")
+                continue
+            records.append(self._build_record(document, content_hash, filters))
+            vectors.append(document.embedding)
+
+        if not records:
+            return
+
+        new_vectors = np.asarray(vectors, dtype=np.float32)
+        with self._lock:
+            self._ensure_loaded()
+            if not self._created:
+                self.create()
+            if self.dimensions is None:
+                self.dimensions = int(new_vectors.shape[1])
+                self._matrix = np.zeros((0, self.dimensions), dtype=np.float32)
+                self._write_meta()
+            if new_vectors.ndim != 2 or new_vectors.shape[1] != self.dimensions:
+                raise ValueError(f"Expected {self.dimensions}-dimensional embeddings, got shape {new_vectors.shape}")
+
+            start = len(self._records)
+            if self.path is not None:
+                # Vectors first: on a crash, rows without an index entry are truncated on load
+                with open(self.path / VECTORS_FILE, "ab") as f:
+                    f.write(new_vectors.tobytes())
+                self._append_index([{"op": "add", **record} for record in records])
+                self._matrix = self._open_matrix(start + len(records))
+            else:
+                self._matrix = np.concatenate([self._matrix, new_vectors])
+
+            self._records.extend(records)
+            self._sq_norms = np.concatenate([self._sq_norms, np.einsum("ij,ij->i", new_vectors, new_vectors)])
+            self._alive = np.concatenate([self._alive, np.ones(len(records), dtype=bool)])
+
+            replaced = [self._id_to_row[record["id"]] for record in records if record["id"] in self._id_to_row]
+            for row in range(start, start + len(records)):
+                self._index_row(row)
+            if replaced:
+                self._append_index([{"op": "delete", "rows": replaced}])
+
+        log_debug(f"Inserted {len(records)} documents into {self.collection_name}")
+
+    def insert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Embed and insert documents. Documents with an id that already exists replace the stored row."""
+        log_info(f"Inserting {len(documents)} documents")
+        self._embed_documents(documents)
+        self._write_documents(content_hash, documents, filters)
+
+    async def async_insert(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        log_info(f"Async Inserting {len(documents)} documents")
+        await self._async_embed_documents(documents)
+        await asyncio.to_thread(self._write_documents, content_hash, documents, filters)
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def upsert(self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Replace every document with the same content hash by the given documents."""
+        self._embed_documents(documents)
+        with self._lock:
+            self._delete_by_content_hash(content_hash)
+            self._write_documents(content_hash, documents, filters)
+
+    async def async_upsert(
+        self, content_hash: str, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> None:
+        await self._async_embed_documents(documents)
+
+        def _replace() -> None:
+            with self._lock:
+                self._delete_by_content_hash(content_hash)
+                self._write_documents(content_hash, documents, filters)
+
+        await asyncio.to_thread(_replace)
+
+    def update_metadata(self, content_id: str, metadata: Dict[str, Any]) -> None:
+        """Merge metadata into every document with the given content_id."""
+        with self._lock:
+            self._ensure_loaded()
+            rows = sorted(self._rows_by_content_id.get(content_id, set()))
+            if not rows:
+                log_debug(f"No documents found with content_id: {content_id}")
+                return
+            entries = []
+            for row in rows:
+                meta_data = dict(self._records[row].get("meta_data") or {})
+                meta_data.update(metadata)
+                self._records[row]["meta_data"] = meta_data
+                entries.append({"op": "meta", "row": row, "meta_data": meta_data})
+            self._append_index(entries)
+            log_debug(f"Updated metadata for {len(rows)} documents with content_id: {content_id}")
+
+    # --- Deletes ---
+
+    def _delete_rows(self, rows: List[int]) -> bool:
+        with self._lock:
+            if not rows:
+                return False
+            self._remove_rows(rows)
+            self._append_index([{"op": "delete", "rows": sorted(rows)}])
+            return True
+
+    def _delete_by_content_hash(self, content_hash: str) -> bool:
+        self._ensure_loaded()
+        return self._delete_rows(list(self._rows_by_content_hash.get(content_hash, set())))
+
+    def delete_by_id(self, id: str) -> bool:
+        self._ensure_loaded()
+        row = self._id_to_row.get(id)
+        return self._delete_rows([row] if row is not None else [])
+
+    def delete_by_name(self, name: str) -> bool:
+        self._ensure_loaded()
+        return self._delete_rows(list(self._rows_by_name.get(name, set())))
+
+    def delete_by_content_id(self, content_id: str) -> bool:
+        self._ensure_loaded()
+        return self._delete_rows(list(self._rows_by_content_id.get(content_id, set())))
+
+    def delete_by_metadata(self, metadata: Dict[str, Any]) -> bool:
+        self._ensure_loaded()
+        with self._lock:
+            rows = [row for row in np.flatnonzero(self._alive) if self._matches(self._records[row], metadata)]
+        return self._delete_rows([int(row) for row in rows])
+
+    # --- Lookups ---
+
+    def name_exists(self, name: str) -> bool:
+        self._ensure_loaded()
+        return name in self._rows_by_name
+
+    async def async_name_exists(self, name: str) -> bool:
+        return self.name_exists(name)
+
+    def id_exists(self, id: str) -> bool:
+        self._ensure_loaded()
+        return id in self._id_to_row
+
+    def content_hash_exists(self, content_hash: str) -> bool:
+        self._ensure_loaded()
+        return content_hash in self._rows_by_content_hash
+
+    # --- Search ---
+
+    @classmethod
+    def _evaluate(cls, expression: FilterExpr, meta_data: Dict[str, Any]) -> bool:
+        if isinstance(expression, EQ):
+            return meta_data.get(expression.key) == expression.value
+        if isinstance(expression, IN):
+            return meta_data.get(expression.key) in expression.values
+        if isinstance(expression, (GT, LT)):
+            value = meta_data.get(expression.key)
+            if value is None:
+                return False
+            try:
+                return value > expression.value if isinstance(expression, GT) else value < expression.value
+            except TypeError:
+                return False
+        if isinstance(expression, AND):
+            return all(cls._evaluate(e, meta_data) for e in expression.expressions)
+        if isinstance(expression, OR):
+            return any(cls._evaluate(e, meta_data) for e in expression.expressions)
+        if isinstance(expression, NOT):
+            return not cls._evaluate(expression.expression, meta_data)
+        raise ValueError(f"Unsupported filter expression: {expression!r}")
+
+    @classmethod
+    def _matches(cls, record: Dict[str, Any], filters: Union[Dict[str, Any], List[FilterExpr]]) -> bool:
+        meta_data = record.get("meta_data") or {}
+        if isinstance(filters, list):
+            return all(cls._evaluate(expression, meta_data) for expression in filters)
+        return all(meta_data.get(key) == value for key, value in filters.items())
+
+    def _coarse_space(self, vectors: np.ndarray, sq_norms: np.ndarray) -> np.ndarray:
+        """Map vectors into the space the IVF centroids live in."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if self.distance == Distance.cosine:
+            return vectors / np.maximum(np.sqrt(sq_norms), 1e-12)[:, None]
+        return vectors
+
+    def _nearest_centroids(self, vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        centroid_sq_norms = np.einsum("ij,ij->i", centroids, centroids)
+        return np.argmin(centroid_sq_norms[None, :] - 2.0 * (vectors @ centroids.T), axis=1).astype(np.int32)
+
+    def _train_centroids(self, rows: np.ndarray, num_lists: int, iterations: int = 10) -> np.ndarray:
+        rng = np.random.default_rng(0)
+        sample_rows = np.sort(rng.choice(rows, size=min(len(rows), num_lists * 64), replace=False))
+        sample = self._coarse_space(self._matrix[sample_rows], self._sq_norms[sample_rows])
+        centroids = sample[rng.choice(len(sample), size=num_lists, replace=False)].copy()
+        for _ in range(iterations):
+            assignments = self._nearest_centroids(sample, centroids)
+            for list_id in range(num_lists):
+                members = sample[assignments == list_id]
+                # Empty lists keep their previous centroid
+                if len(members) > 0:
+                    centroids[list_id] = members.mean(axis=0)
+        return centroids
+
+    def _ensure_ivf(self) -> bool:
+        """Train the coarse quantizer if needed and assign new rows. Returns True when IVF search is usable."""
+        if self.ivf_lists is None:
+            return False
+        with self._lock:
+            live_rows = np.flatnonzero(self._alive)
+            if len(live_rows) < max(self.ivf_min_rows, self.ivf_lists):
+                return False
+            if self._centroids is None:
+                log_debug(f"Training IVF quantizer with {self.ivf_lists} lists on {len(live_rows)} rows")
+                self._centroids = self._train_centroids(live_rows, self.ivf_lists)
+                self._assignments = np.zeros(0, dtype=np.int32)
+
+            assigned = len(self._assignments)
+            if assigned < len(self._records):
+                new_assignments = [self._assignments]
+                for start in range(assigned, len(self._records), _ASSIGN_CHUNK_ROWS):
+                    end = min(start + _ASSIGN_CHUNK_ROWS, len(self._records))
+                    chunk = self._coarse_space(self._matrix[start:end], self._sq_norms[start:end])
+                    new_assignments.append(self._nearest_centroids(chunk, self._centroids))
+                self._assignments = np.concatenate(new_assignments)
+            return True
+
+    def _score(self, vectors: np.ndarray, sq_norms: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Score rows against the query. Higher is always better."""
+        dot = vectors @ query
+        if self.distance == Distance.cosine:
+            return dot / (np.maximum(np.sqrt(sq_norms), 1e-12) * max(float(np.linalg.norm(query)), 1e-12))
+        if self.distance == Distance.l2:
+            return -(sq_norms - 2.0 * dot + float(query @ query))
+        return dot
+
+    def vector_search(
+        self,
+        query_embedding: List[float],
+        limit: int = 5,
+        filters: Optional[Union[Dict[str, Any], List[FilterExpr]]] = None,
+    ) -> List[Tuple[Document, float]]:
+        """Return the closest documents to an embedding, with their scores (higher is closer)."""
+        self._ensure_loaded()
+        query = np.asarray(query_embedding, dtype=np.float32)
+
+        with self._lock:
+            if not self._records or limit <= 0:
+                return []
+            if query.shape != (self.dimensions,):
+                raise ValueError(f"Expected a {self.dimensions}-dimensional query, got shape {query.shape}")
+
+            mask = self._alive.copy()
+            if self._ensure_ivf():
+                assert self._centroids is not None
+                query_space = self._coarse_space(query[None, :], np.asarray([query @ query]))
+                centroid_scores = self._score(
+                    self._centroids, np.einsum("ij,ij->i", self._centroids, self._centroids), query_space[0]
+                )
+                probe = np.argsort(-centroid_scores)[: self.nprobe]
+                mask &= np.isin(self._assignments, probe)
+            if filters:
+                for candidate in np.flatnonzero(mask):
+                    if not self._matches(self._records[candidate], filters):
+                        mask[candidate] = False
+
+            matrix, sq_norms, records = self._matrix, self._sq_norms, self._records
+
+        if mask.all():
+            scores = self._score(np.asarray(matrix), sq_norms, query)
+            candidate_rows = np.arange(len(scores))
+        else:
+            candidate_rows = np.flatnonzero(mask)
+            if len(candidate_rows) == 0:
+                return []
+            scores = self._score(np.asarray(matrix[candidate_rows]), sq_norms[candidate_rows], query)
+
+        k = min(limit, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        results: List[Tuple[Document, float]] = []
+        for position in top:
+            row = int(candidate_rows[position])
+            record = records[row]
+            document = Document(
+                id=record["id"],
+                name=record.get("name"),
+                meta_data=record.get("meta_data") or {},
+                content=record["content"],
+                embedder=self.embedder,
+                embedding=np.asarray(matrix[row]).tolist(),
+                usage=record.get("usage"),
+                content_id=record.get("content_id"),
+            )
+            results.append((document, float(scores[position])))
+        return results
+
+    def search(
+        self, query: str, limit: int = 5, filters: Optional[Union[Dict[str, Any], List[FilterExpr]]] = None
+    ) -> List[Document]:
+        """Search the collection for a query.
+
+        Args:
+            query (str): Query to search for.
+            limit (int): Number of results to return.
+            filters (Optional[Union[Dict[str, Any], List[FilterExpr]]]): Metadata filters. A dict matches on
+                equality of every key, a list of filter expressions must all match.
+
+        Returns:
+            List[Document]: List of search results.
+        """
+        query_embedding = self.embedder.get_embedding(query)
+        if not query_embedding:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        search_results = [document for document, _ in self.vector_search(query_embedding, limit, filters)]
+
+        if self.reranker and search_results:
+            try:
+                search_results = self.reranker.rerank(query=query, documents=search_results)
+            except Exception as e:
+                log_warning(f"Reranker failed, returning unranked results: {e}")
+
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Union[Dict[str, Any], List[FilterExpr]]] = None
+    ) -> List[Document]:
+        query_embedding = await self.embedder.async_get_embedding(query)
+        if not query_embedding:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        results = await asyncio.to_thread(self.vector_search, query_embedding, limit, filters)
+        search_results = [document for document, _ in results]
+
+        if self.reranker and search_results:
+            try:
+                search_results = self.reranker.rerank(query=query, documents=search_results)
+            except Exception as e:
+                log_warning(f"Reranker failed, returning unranked results: {e}")
+
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    def get_supported_search_types(self) -> List[str]:
+        """Get the supported search types for this vector database."""
+        return [SearchType.vector]
@@ -63,6 +63,7 @@ class PgVector(VectorDb):
         auto_upgrade_schema: bool = False,
         reranker: Optional[Reranker] = None,
         create_schema: bool = True,
+        embedding_workers: int = 1,
     ):
         """
         Initialize the PgVector instance.
@@ -85,6 +86,8 @@ class PgVector(VectorDb):
             auto_upgrade_schema (bool): Automatically upgrade schema if True.
             create_schema (bool): Whether to automatically create the database schema if it doesn't exist.
                 Set to False if schema is managed externally (e.g., via migrations). Defaults to True.
+            embedding_workers (int): Number of threads used to embed documents in the sync insert/upsert path
+                when batch embedding is not enabled. Defaults to 1 (sequential).
         """
         if not table_name:
             raise ValueError("Table name must be provided.")
@@ -153,6 +156,9 @@ class PgVector(VectorDb):
         # Schema creation flag
         self.create_schema: bool = create_schema
 
+        # Number of threads used for individual embedding in the sync path
+        self.embedding_workers: int = max(1, embedding_workers)
+
         # Database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
         # Database table
@@ -324,14 +330,24 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed all documents in the batch
+                        self._embed_documents(batch_docs)
+
                         # Prepare documents for insertion
                         batch_records = []
                         for doc in batch_docs:
+                            if not doc.embedding:
+                                log_error(f"Skipping document '{doc.name}': embedding failed")
+                                continue
                             try:
                                 batch_records.append(self._get_document_record(doc, filters, content_hash))
                             except Exception as e:
                                 log_error(f"Error processing document '{doc.name}': {e}")
 
+                        if not batch_records:
+                            log_info("No valid records to insert in this batch.")
+                            continue
+
                         # Insert the batch of records
                         insert_stmt = postgresql.insert(self.table)
                         sess.execute(insert_stmt, batch_records)
@@ -455,9 +471,15 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     log_info(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed all documents in the batch
+                        self._embed_documents(batch_docs)
+
                         # Prepare documents for upserting
                         batch_records_dict: Dict[str, Dict[str, Any]] = {}  # Use dict to deduplicate by ID
                         for doc in batch_docs:
+                            if not doc.embedding:
+                                log_error(f"Skipping document '{doc.name}': embedding failed")
+                                continue
                             try:
                                 record = self._get_document_record(doc, filters, content_hash)
                                 # Use the generated record ID (which includes content_hash) for deduplication
@@ -500,7 +522,8 @@ class PgVector(VectorDb):
     def _get_document_record(
         self, doc: Document, filters: Optional[Dict[str, Any]] = None, content_hash: str = ""
     ) -> Dict[str, Any]:
-        doc.embed(embedder=self.embedder)
+        if doc.embedding is None:
+            doc.embed(embedder=self.embedder)
         cleaned_content = self._clean_content(doc.content)
         # Include content_hash in ID to ensure uniqueness across different content hashes
         # This allows the same URL/content to be inserted with different descriptions
@@ -523,6 +546,64 @@ class PgVector(VectorDb):
             "content_id": doc.content_id,
         }
 
+    def _embed_documents(self, batch_docs: List[Document]) -> None:
+        """
+        Embed a batch of documents using either batch embedding or individual embedding.
+
+        Documents whose embedding fails are left with `embedding=None`.
+
+        Args:
+            batch_docs: List of documents to embed
+        """
+        if self.embedder.enable_batch and hasattr(self.embedder, "get_embeddings_batch_and_usage"):
+            # Use batch embedding when enabled and supported
+            try:
+                # Extract content from all documents
+                doc_contents = [doc.content for doc in batch_docs]
+
+                # Get batch embeddings and usage
+                embeddings, usages = self.embedder.get_embeddings_batch_and_usage(doc_contents)
+
+                # Process documents with pre-computed embeddings
+                for j, doc in enumerate(batch_docs):
+                    try:
+                        if j < len(embeddings):
+                            doc.embedding = embeddings[j]
+                            doc.usage = usages[j] if j < len(usages) else None
+                    except Exception as e:
+                        log_error(f"Error assigning batch embedding to document '{doc.name}': {e}")
+                return
+
+            except Exception as e:
+                # Check if this is a rate limit error - don't fall back as it would make things worse
+                error_str = str(e).lower()
+                is_rate_limit = any(
+                    phrase in error_str
+                    for phrase in ["rate limit", "too many requests", "429", "trial key", "api calls / minute"]
+                )
+
+                if is_rate_limit:
+                    log_error(f"Rate limit detected during batch embedding.  {e}")
+                    raise e
+                log_warning(f"Batch embedding failed, falling back to individual embeddings: {e}")
+
+        # Use individual embedding, optionally fanned out over a thread pool
+        def embed_document(doc: Document) -> None:
+            try:
+                doc.embed(embedder=self.embedder)
+            except Exception as e:
+                doc.embedding = None
+                log_error(f"Error embedding document '{doc.name}': {e}")
+
+        if self.embedding_workers > 1 and len(batch_docs) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(self.embedding_workers, len(batch_docs))) as executor:
+                list(executor.map(embed_document, batch_docs))
+        else:
+            for doc in batch_docs:
+                embed_document(doc)
+
     async def _async_embed_documents(self, batch_docs: List[Document]) -> None:
         """
         Embed a batch of documents using either batch embedding or individual embedding.
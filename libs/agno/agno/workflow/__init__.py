@@ -1,5 +1,6 @@
 from agno.workflow.agent import WorkflowAgent
 from agno.workflow.condition import Condition
+from agno.workflow.graph import Graph
 from agno.workflow.loop import Loop
 from agno.workflow.parallel import Parallel
 from agno.workflow.remote import RemoteWorkflow
@@ -19,6 +20,7 @@ __all__ = [
     "Parallel",
     "Condition",
     "Router",
+    "Graph",
     "WorkflowExecutionInput",
     "StepInput",
     "StepOutput",
@@ -0,0 +1,641 @@
+import asyncio
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from copy import deepcopy
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from uuid import uuid4
+
+from agno.models.metrics import Metrics
+from agno.run.agent import RunOutputEvent
+from agno.run.base import RunContext
+from agno.run.team import TeamRunOutputEvent
+from agno.run.workflow import WorkflowRunOutput, WorkflowRunOutputEvent
+from agno.session.workflow import WorkflowSession
+from agno.utils.log import log_debug, logger
+from agno.utils.merge_dict import merge_parallel_session_states
+from agno.workflow.step import Step
+from agno.workflow.types import StepInput, StepOutput, StepType
+
+WorkflowSteps = List[
+    Union[
+        Callable[
+            [StepInput], Union[StepOutput, Awaitable[StepOutput], Iterator[StepOutput], AsyncIterator[StepOutput]]
+        ],
+        Step,
+        "Steps",  # type: ignore # noqa: F821
+        "Loop",  # type: ignore # noqa: F821
+        "Parallel",  # type: ignore # noqa: F821
+        "Condition",  # type: ignore # noqa: F821
+        "Router",  # type: ignore # noqa: F821
+        "Graph",  # type: ignore # noqa: F821
+    ]
+]
+
+
+@dataclass
+class _GraphRun:
+    """Scheduling state of a Graph execution"""
+
+    # Names of the steps each step depends on
+    dependencies: Dict[str, List[str]]
+    # Steps not started yet
+    pending: Dict[str, List[str]] = field(init=False)
+    # Output of each completed step, passed to the steps depending on it
+    outputs: Dict[str, StepOutput] = field(default_factory=dict)
+    # All the outputs of each completed step
+    step_outputs: Dict[str, List[StepOutput]] = field(default_factory=dict)
+    # Names of the completed steps, in completion order
+    completed: List[str] = field(default_factory=list)
+    durations: Dict[str, float] = field(default_factory=dict)
+    running: int = 0
+    error: Optional[BaseException] = None
+    stop: bool = False
+
+    def __post_init__(self):
+        self.pending = dict(self.dependencies)
+
+    def get_ready_steps(self) -> List[str]:
+        """Get the steps whose dependencies are completed, marking them as started"""
+        if self.error is not None or self.stop:
+            return []
+        ready = [name for name, dependencies in self.pending.items() if all(d in self.outputs for d in dependencies)]
+        for name in ready:
+            del self.pending[name]
+        self.running += len(ready)
+        return ready
+
+    def complete(self, name: str, step_outputs: List[StepOutput], started_at: float, finished_at: float) -> None:
+        self.running -= 1
+        self.durations[name] = finished_at - started_at
+        self.completed.append(name)
+        self.step_outputs[name] = step_outputs
+        if step_outputs:
+            # Steps like Loop can return several outputs, the last one is passed to the dependent steps
+            self.outputs[name] = step_outputs[-1]
+            self.stop = self.stop or any(output.stop for output in step_outputs)
+        else:
+            self.outputs[name] = StepOutput(step_name=name, content=None)
+        log_debug(f"Graph step {name} completed in {self.durations[name]:.2f}s")
+
+    def fail(self, name: str, error: BaseException) -> None:
+        self.running -= 1
+        logger.error(f"Graph step {name} failed: {error}")
+        # Steps already running are completed, but no other step is started
+        if self.error is None:
+            self.error = error
+
+
+@dataclass
+class Graph:
+    """Steps that run as soon as the steps they depend on are completed.
+
+    Dependencies are declared with `Step.depends_on` or with `dependencies`, using step names.
+    Steps run on a pool of up to `max_workers` threads (or tasks, when running async), shared by all the steps.
+    """
+
+    steps: WorkflowSteps
+
+    name: Optional[str] = None
+    description: Optional[str] = None
+
+    # Names of the steps each step depends on, added to the dependencies declared with Step.depends_on
+    dependencies: Optional[Dict[str, List[str]]] = None
+    # Maximum number of steps running at the same time. Defaults to the number of steps.
+    max_workers: Optional[int] = None
+
+    def __init__(
+        self,
+        *steps: WorkflowSteps,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        dependencies: Optional[Dict[str, List[str]]] = None,
+        max_workers: Optional[int] = None,
+    ):
+        self.steps = list(steps)
+        self.name = name
+        self.description = description
+        self.dependencies = dependencies
+        self.max_workers = max_workers
+
+    def _prepare_steps(self):
+        """Prepare the steps for execution - mirrors workflow logic"""
+        from agno.agent.agent import Agent
+        from agno.team.team import Team
+        from agno.workflow.condition import Condition
+        from agno.workflow.loop import Loop
+        from agno.workflow.parallel import Parallel
+        from agno.workflow.router import Router
+        from agno.workflow.steps import Steps
+
+        prepared_steps: WorkflowSteps = []
+        for step in self.steps:
+            if callable(step) and hasattr(step, "__name__"):
+                prepared_steps.append(Step(name=step.__name__, description="User-defined callable step", executor=step))
+            elif isinstance(step, Agent):
+                prepared_steps.append(Step(name=step.name, description=step.description, agent=step))
+            elif isinstance(step, Team):
+                prepared_steps.append(Step(name=step.name, description=step.description, team=step))
+            elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router, Graph)):
+                prepared_steps.append(step)
+            else:
+                raise ValueError(f"Invalid step type: {type(step).__name__}")
+
+        self.steps = prepared_steps
+
+    def _get_dependencies(self) -> Dict[str, List[str]]:
+        """Get the names of the steps each step depends on, checking the graph is valid and acyclic"""
+        dependencies: Dict[str, List[str]] = {}
+        for step in self.steps:
+            step_name = getattr(step, "name", None)
+            if not step_name:
+                raise ValueError(f"Steps of Graph {self.name} must have a name")
+            if step_name in dependencies:
+                raise ValueError(f"Duplicate step name in Graph {self.name}: {step_name}")
+            step_dependencies = list(getattr(step, "depends_on", None) or [])
+            for dependency in (self.dependencies or {}).get(step_name, []):
+                if dependency not in step_dependencies:
+                    step_dependencies.append(dependency)
+            dependencies[step_name] = step_dependencies
+
+        for step_name, step_dependencies in dependencies.items():
+            for dependency in step_dependencies:
+                if dependency not in dependencies:
+                    raise ValueError(f"Step {step_name} of Graph {self.name} depends on unknown step {dependency}")
+        for step_name in (self.dependencies or {}).keys():
+            if step_name not in dependencies:
+                raise ValueError(f"Dependencies given for unknown step {step_name} of Graph {self.name}")
+
+        # Check there is no cycle, by removing the steps without remaining dependencies
+        remaining = {name: set(step_dependencies) for name, step_dependencies in dependencies.items()}
+        while remaining:
+            ready = [name for name, remaining_dependencies in remaining.items() if not remaining_dependencies]
+            if not ready:
+                raise ValueError(f"Graph {self.name} has a dependency cycle between steps: {sorted(remaining)}")
+            for name in ready:
+                del remaining[name]
+            for remaining_dependencies in remaining.values():
+                remaining_dependencies.difference_update(ready)
+
+        return dependencies
+
+    def _get_max_workers(self) -> int:
+        return max(1, self.max_workers or len(self.steps))
+
+    def _get_session_state_copies(
+        self, run_context: Optional[RunContext], session_state: Optional[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Create individual session_state copies for each step to prevent race conditions"""
+        session_state_copies: Dict[str, Dict[str, Any]] = {}
+        for step in self.steps:
+            step_name: str = step.name  # type: ignore
+            # If using run context, no need to deepcopy the state. We want the direct reference.
+            if run_context is not None and run_context.session_state is not None:
+                session_state_copies[step_name] = run_context.session_state
+            elif session_state is not None:
+                session_state_copies[step_name] = deepcopy(session_state)
+            else:
+                session_state_copies[step_name] = {}
+        return session_state_copies
+
+    def _create_step_input(self, step_input: StepInput, dependencies: List[str], graph_run: _GraphRun) -> StepInput:
+        """Create the input of a step, with the outputs of the steps it depends on as previous step outputs"""
+        previous_step_outputs = dict(step_input.previous_step_outputs or {})
+        previous_step_content = step_input.previous_step_content
+        dependency_contents = []
+        images = list(step_input.images or [])
+        videos = list(step_input.videos or [])
+        audio = list(step_input.audio or [])
+        files = list(step_input.files or [])
+
+        for dependency in dependencies:
+            dependency_output = graph_run.outputs[dependency]
+            # Move the dependencies after the outputs of the steps before the graph
+            previous_step_outputs.pop(dependency, None)
+            previous_step_outputs[dependency] = dependency_output
+            previous_step_content = dependency_output.content
+            dependency_contents.append(f"=== {dependency} ===\n{dependency_output.content or ''}")
+            images.extend(dependency_output.images or [])
+            videos.extend(dependency_output.videos or [])
+            audio.extend(dependency_output.audio or [])
+            files.extend(dependency_output.files or [])
+
+        # A step with several dependencies gets the content of all of them
+        if len(dependencies) > 1:
+            previous_step_content = "\n\n".join(dependency_contents)
+
+        return StepInput(
+            input=step_input.input,
+            previous_step_content=previous_step_content,
+            previous_step_outputs=previous_step_outputs,
+            depends_on=list(dependencies) if dependencies else None,
+            additional_data=step_input.additional_data,
+            images=images,
+            videos=videos,
+            audio=audio,
+            files=files,
+            workflow_session=step_input.workflow_session,
+        )
+
+    def _get_critical_path(self, graph_run: _GraphRun) -> Tuple[List[str], float]:
+        """Get the chain of dependent steps with the longest total duration"""
+        finished_at: Dict[str, float] = {}
+        previous_step: Dict[str, Optional[str]] = {}
+        # Steps are completed after their dependencies, so the completion order is a topological order
+        for name in graph_run.completed:
+            dependencies = [dependency for dependency in graph_run.dependencies[name] if dependency in finished_at]
+            slowest_dependency = max(dependencies, key=lambda dependency: finished_at[dependency], default=None)
+            previous_step[name] = slowest_dependency
+            finished_at[name] = graph_run.durations[name] + (
+                finished_at[slowest_dependency] if slowest_dependency is not None else 0.0
+            )
+
+        if not finished_at:
+            return [], 0.0
+
+        last_step: Optional[str] = max(finished_at, key=lambda name: finished_at[name])
+        critical_path_duration = finished_at[last_step]  # type: ignore[index]
+        critical_path = []
+        while last_step is not None:
+            critical_path.append(last_step)
+            last_step = previous_step[last_step]
+        return list(reversed(critical_path)), critical_path_duration
+
+    def _aggregate_results(self, graph_run: _GraphRun, duration: float) -> StepOutput:
+        """Aggregate the outputs of the steps into a single StepOutput, in the order the steps are declared"""
+        # The dependencies are listed in the order of the steps
+        step_names = [name for name in graph_run.dependencies if name in graph_run.outputs]
+        step_outputs = [output for name in step_names for output in graph_run.step_outputs[name]]
+
+        # The output of the graph is the output of the steps no other step depends on
+        dependent_steps = {
+            dependency for dependencies in graph_run.dependencies.values() for dependency in dependencies
+        }
+        final_outputs = [graph_run.outputs[name] for name in step_names if name not in dependent_steps] or step_outputs[
+            -1:
+        ]
+        if len(final_outputs) == 1:
+            content = final_outputs[0].content
+        else:
+            content = "\n\n".join(f"## {output.step_name}\n{output.content or ''}" for output in final_outputs)
+
+        all_images = []
+        all_videos = []
+        all_audio = []
+        all_files = []
+        for result in step_outputs:
+            all_images.extend(result.images or [])
+            all_videos.extend(result.videos or [])
+            all_audio.extend(result.audio or [])
+            all_files.extend(result.files or [])
+
+        # Token metrics are reported by the steps themselves, the graph only reports its timing
+        critical_path, critical_path_duration = self._get_critical_path(graph_run)
+        metrics = Metrics(
+            duration=duration,
+            additional_metrics={
+                "critical_path": critical_path,
+                "critical_path_duration": critical_path_duration,
+                "step_durations": dict(graph_run.durations),
+            },
+        )
+
+        return StepOutput(
+            step_name=self.name or "Graph",
+            step_id=str(uuid4()),
+            step_type=StepType.GRAPH,
+            executor_type="graph",
+            executor_name=self.name or "Graph",
+            content=content,
+            images=all_images if all_images else None,
+            videos=all_videos if all_videos else None,
+            audio=all_audio if all_audio else None,
+            files=all_files if all_files else None,
+            success=all(output.success for output in step_outputs),
+            stop=graph_run.stop,
+            metrics=metrics,
+            steps=step_outputs,
+        )
+
+    def _run_graph(
+        self,
+        step_input: StepInput,
+        run_step: Callable[[Any, int, StepInput, Dict[str, Any]], Iterator[Any]],
+        session_state_copies: Dict[str, Dict[str, Any]],
+    ) -> Iterator[Any]:
+        """Run each step on the thread pool as soon as its dependencies are completed.
+
+        Yields the events of the steps, then the aggregated StepOutput.
+        """
+        graph_run = _GraphRun(dependencies=self._get_dependencies())
+        step_indexes = {step.name: index for index, step in enumerate(self.steps)}  # type: ignore[union-attr]
+        event_queue: "queue.Queue[Tuple[str, str, Any]]" = queue.Queue()
+        start = monotonic()
+
+        def execute_step(name: str, graph_step_input: StepInput) -> None:
+            """Execute a step, putting its events and its completion in the queue"""
+            started_at = monotonic()
+            try:
+                step_outputs = []
+                index = step_indexes[name]
+                for event in run_step(self.steps[index], index, graph_step_input, session_state_copies[name]):
+                    if isinstance(event, StepOutput):
+                        step_outputs.append(event)
+                    elif isinstance(event, list):
+                        step_outputs.extend(event)
+                    else:
+                        event_queue.put(("event", name, event))
+                event_queue.put(("complete", name, (step_outputs, started_at, monotonic())))
+            except Exception as e:
+                event_queue.put(("error", name, e))
+
+        with ThreadPoolExecutor(max_workers=self._get_max_workers()) as executor:
+
+            def start_ready_steps() -> None:
+                for name in graph_run.get_ready_steps():
+                    graph_step_input = self._create_step_input(step_input, graph_run.dependencies[name], graph_run)
+                    # Use copy_context().run to propagate context variables to child threads
+                    executor.submit(copy_context().run, execute_step, name, graph_step_input)
+
+            start_ready_steps()
+            while graph_run.running > 0:
+                message_type, name, data = event_queue.get()
+                if message_type == "event":
+                    yield data
+                    continue
+                if message_type == "complete":
+                    graph_run.complete(name, *data)
+                else:
+                    graph_run.fail(name, data)
+                start_ready_steps()
+
+        if graph_run.error is not None:
+            raise graph_run.error
+        yield self._aggregate_results(graph_run, duration=monotonic() - start)
+
+    async def _arun_graph(
+        self,
+        step_input: StepInput,
+        arun_step: Callable[[Any, int, StepInput, Dict[str, Any]], AsyncIterator[Any]],
+        session_state_copies: Dict[str, Dict[str, Any]],
+    ) -> AsyncIterator[Any]:
+        """Run each step as a task as soon as its dependencies are completed.
+
+        Yields the events of the steps, then the aggregated StepOutput.
+        """
+        graph_run = _GraphRun(dependencies=self._get_dependencies())
+        step_indexes = {step.name: index for index, step in enumerate(self.steps)}  # type: ignore[union-attr]
+        event_queue: "asyncio.Queue[Tuple[str, str, Any]]" = asyncio.Queue()
+        semaphore = asyncio.Semaphore(self._get_max_workers())
+        tasks = []
+        start = monotonic()
+
+        async def execute_step(name: str, graph_step_input: StepInput) -> None:
+            """Execute a step, putting its events and its completion in the queue"""
+            async with semaphore:
+                started_at = monotonic()
+                try:
+                    step_outputs = []
+                    index = step_indexes[name]
+                    async for event in arun_step(
+                        self.steps[index], index, graph_step_input, session_state_copies[name]
+                    ):
+                        if isinstance(event, StepOutput):
+                            step_outputs.append(event)
+                        elif isinstance(event, list):
+                            step_outputs.extend(event)
+                        else:
+                            await event_queue.put(("event", name, event))
+                    await event_queue.put(("complete", name, (step_outputs, started_at, monotonic())))
+                except Exception as e:
+                    await event_queue.put(("error", name, e))
+
+        def start_ready_steps() -> None:
+            for name in graph_run.get_ready_steps():
+                graph_step_input = self._create_step_input(step_input, graph_run.dependencies[name], graph_run)
+                tasks.append(asyncio.create_task(execute_step(name, graph_step_input)))
+
+        start_ready_steps()
+        while graph_run.running > 0:
+            message_type, name, data = await event_queue.get()
+            if message_type == "event":
+                yield data
+                continue
+            if message_type == "complete":
+                graph_run.complete(name, *data)
+            else:
+                graph_run.fail(name, data)
+            start_ready_steps()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if graph_run.error is not None:
+            raise graph_run.error
+        yield self._aggregate_results(graph_run, duration=monotonic() - start)
+
+    def _get_sub_step_index(self, step_index: Optional[Union[int, tuple]], index: int) -> Union[int, tuple]:
+        # If the graph is a main step, its steps get sequential numbers: 1.1, 1.2, 1.3
+        if step_index is None or isinstance(step_index, int):
+            return (step_index if step_index is not None else 0, index)
+        # If the graph is a child step, its steps get the same number as the graph
+        return step_index
+
+    def execute(
+        self,
+        step_input: StepInput,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        workflow_run_response: Optional[WorkflowRunOutput] = None,
+        store_executor_outputs: bool = True,
+        run_context: Optional[RunContext] = None,
+        session_state: Optional[Dict[str, Any]] = None,
+        workflow_session: Optional[WorkflowSession] = None,
+        add_workflow_history_to_steps: Optional[bool] = False,
+        num_history_runs: int = 3,
+        background_tasks: Optional[Any] = None,
+    ) -> StepOutput:
+        """Execute the steps in dependency order and return aggregated result"""
+        log_debug(f"Graph Start: {self.name} ({len(self.steps)} steps)", center=True, symbol="=")
+
+        self._prepare_steps()
+        session_state_copies = self._get_session_state_copies(run_context, session_state)
+
+        def run_step(step: Any, index: int, graph_step_input: StepInput, step_session_state: Dict[str, Any]):
+            yield step.execute(
+                graph_step_input,
+                session_id=session_id,
+                user_id=user_id,
+                workflow_run_response=workflow_run_response,
+                store_executor_outputs=store_executor_outputs,
+                workflow_session=workflow_session,
+                add_workflow_history_to_steps=add_workflow_history_to_steps,
+                num_history_runs=num_history_runs,
+                run_context=run_context,
+                session_state=step_session_state,
+                background_tasks=background_tasks,
+            )
+
+        aggregated_result = None
+        for event in self._run_graph(step_input, run_step, session_state_copies):
+            aggregated_result = event
+
+        if run_context is None and session_state is not None:
+            merge_parallel_session_states(session_state, list(session_state_copies.values()))
+
+        log_debug(f"Graph End: {self.name} ({len(self.steps)} steps)", center=True, symbol="=")
+
+        return aggregated_result  # type: ignore[return-value]
+
+    def execute_stream(
+        self,
+        step_input: StepInput,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        stream_events: bool = False,
+        stream_executor_events: bool = True,
+        workflow_run_response: Optional[WorkflowRunOutput] = None,
+        step_index: Optional[Union[int, tuple]] = None,
+        store_executor_outputs: bool = True,
+        run_context: Optional[RunContext] = None,
+        session_state: Optional[Dict[str, Any]] = None,
+        parent_step_id: Optional[str] = None,
+        workflow_session: Optional[WorkflowSession] = None,
+        add_workflow_history_to_steps: Optional[bool] = False,
+        num_history_runs: int = 3,
+        background_tasks: Optional[Any] = None,
+    ) -> Iterator[Union[WorkflowRunOutputEvent, StepOutput]]:
+        """Execute the steps in dependency order with streaming support"""
+        log_debug(f"Graph Start: {self.name} ({len(self.steps)} steps)", center=True, symbol="=")
+
+        graph_step_id = str(uuid4())
+
+        self._prepare_steps()
+        session_state_copies = self._get_session_state_copies(run_context, session_state)
+
+        def run_step(step: Any, index: int, graph_step_input: StepInput, step_session_state: Dict[str, Any]):
+            yield from step.execute_stream(
+                graph_step_input,
+                session_id=session_id,
+                user_id=user_id,
+                stream_events=stream_events,
+                stream_executor_events=stream_executor_events,
+                workflow_run_response=workflow_run_response,
+                step_index=self._get_sub_step_index(step_index, index),
+                store_executor_outputs=store_executor_outputs,
+                session_state=step_session_state,
+                run_context=run_context,
+                parent_step_id=graph_step_id,
+                workflow_session=workflow_session,
+                add_workflow_history_to_steps=add_workflow_history_to_steps,
+                num_history_runs=num_history_runs,
+                background_tasks=background_tasks,
+            )
+
+        yield from self._run_graph(step_input, run_step, session_state_copies)
+
+        if run_context is None and session_state is not None:
+            merge_parallel_session_states(session_state, list(session_state_copies.values()))
+
+        log_debug(f"Graph End: {self.name} ({len(self.steps)} steps)", center=True, symbol="=")
+
+    async def aexecute(
+        self,
+        step_input: StepInput,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        workflow_run_response: Optional[WorkflowRunOutput] = None,
+        store_executor_outputs: bool = True,
+        run_context: Optional[RunContext] = None,
+        session_state: Optional[Dict[str, Any]] = None,
+        workflow_session: Optional[WorkflowSession] = None,
+        add_workflow_history_to_steps: Optional[bool] = False,
+        num_history_runs: int = 3,
+        background_tasks: Optional[Any] = None,
+    ) -> StepOutput:
+        """Execute the steps in dependency order using asyncio and return aggregated result"""
+        log_debug(f"Graph Start: {self.name} ({len(self.steps)} steps)", center=True, symbol="=")
+
+        self._prepare_steps()
+        session_state_copies = self._get_session_state_copies(run_context, session_state)
+
+        async def arun_step(step: Any, index: int, graph_step_input: StepInput, step_session_state: Dict[str, Any]):
+            yield await step.aexecute(
+                graph_step_input,
+                session_id=session_id,
+                user_id=user_id,
+                workflow_run_response=workflow_run_response,
+                store_executor_outputs=store_executor_outputs,
+                workflow_session=workflow_session,
+                add_workflow_history_to_steps=add_workflow_history_to_steps,
+                num_history_runs=num_history_runs,
+                session_state=step_session_state,
+                run_context=run_context,
+                background_tasks=background_tasks,
+            )
+
+        aggregated_result = None
+        async for event in self._arun_graph(step_input, arun_step, session_state_copies):
+            aggregated_result = event
+
+        if run_context is None and session_state is not None:
+            merge_parallel_session_states(session_state, list(session_state_copies.values()))
+
+        log_debug(f"Graph End: {self.name} ({len(self.steps)} steps)", center=True, symbol="=")
+
+        return aggregated_result  # type: ignore[return-value]
+
+    async def aexecute_stream(
+        self,
+        step_input: StepInput,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        stream_events: bool = False,
+        stream_executor_events: bool = True,
+        workflow_run_response: Optional[WorkflowRunOutput] = None,
+        step_index: Optional[Union[int, tuple]] = None,
+        store_executor_outputs: bool = True,
+        run_context: Optional[RunContext] = None,
+        session_state: Optional[Dict[str, Any]] = None,
+        parent_step_id: Optional[str] = None,
+        workflow_session: Optional[WorkflowSession] = None,
+        add_workflow_history_to_steps: Optional[bool] = False,
+        num_history_runs: int = 3,
+        background_tasks: Optional[Any] = None,
+    ) -> AsyncIterator[Union[WorkflowRunOutputEvent, TeamRunOutputEvent, RunOutputEvent, StepOutput]]:
+        """Execute the steps in dependency order with async streaming support"""
+        log_debug(f"Graph Start: {self.name} ({len(self.steps)} steps)", center=True, symbol="=")
+
+        graph_step_id = str(uuid4())
+
+        self._prepare_steps()
+        session_state_copies = self._get_session_state_copies(run_context, session_state)
+
+        async def arun_step(step: Any, index: int, graph_step_input: StepInput, step_session_state: Dict[str, Any]):
+            async for event in step.aexecute_stream(
+                graph_step_input,
+                session_id=session_id,
+                user_id=user_id,
+                stream_events=stream_events,
+                stream_executor_events=stream_executor_events,
+                workflow_run_response=workflow_run_response,
+                step_index=self._get_sub_step_index(step_index, index),
+                store_executor_outputs=store_executor_outputs,
+                session_state=step_session_state,
+                run_context=run_context,
+                parent_step_id=graph_step_id,
+                workflow_session=workflow_session,
+                add_workflow_history_to_steps=add_workflow_history_to_steps,
+                num_history_runs=num_history_runs,
+                background_tasks=background_tasks,
+            ):
+                yield event
+
+        async for event in self._arun_graph(step_input, arun_step, session_state_copies):
+            yield event
+
+        if run_context is None and session_state is not None:
+            merge_parallel_session_states(session_state, list(session_state_copies.values()))
+
+        log_debug(f"Graph End: {self.name} ({len(self.steps)} steps)", center=True, symbol="=")
@@ -72,6 +72,9 @@ class Step:
     add_workflow_history: Optional[bool] = None
     num_history_runs: int = 3
 
+    # Names of the steps this step depends on, when it is part of a Graph
+    depends_on: Optional[List[str]] = None
+
     _retry_count: int = 0
 
     def __init__(
@@ -87,6 +90,7 @@ class Step:
         strict_input_validation: bool = False,
         add_workflow_history: Optional[bool] = None,
         num_history_runs: int = 3,
+        depends_on: Optional[List[str]] = None,
     ):
         # Auto-detect name for function executors if not provided
         if name is None and executor is not None:
@@ -107,6 +111,7 @@ class Step:
         self.strict_input_validation = strict_input_validation
         self.add_workflow_history = add_workflow_history
         self.num_history_runs = num_history_runs
+        self.depends_on = depends_on
         self.step_id = step_id
 
         if step_id is None:
@@ -117,7 +122,7 @@ class Step:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert step to a dictionary representation."""
-        result = {
+        result: Dict[str, Any] = {
             "name": self.name,
             "step_id": self.step_id,
             "description": self.description,
@@ -128,6 +133,8 @@ class Step:
             "num_history_runs": self.num_history_runs,
         }
 
+        if self.depends_on is not None:
+            result["depends_on"] = self.depends_on
         if self.agent is not None:
             result["agent_id"] = self.agent.id
         if self.team is not None:
@@ -189,6 +196,7 @@ class Step:
             strict_input_validation=config.get("strict_input_validation", False),
             add_workflow_history=config.get("add_workflow_history"),
             num_history_runs=config.get("num_history_runs", 3),
+            depends_on=config.get("depends_on"),
             agent=agent,
             team=team,
             executor=executor,
@@ -440,6 +448,7 @@ class Step:
                     message = self._prepare_message(
                         step_input.input,
                         step_input.previous_step_outputs,
+                        step_input.depends_on,
                     )
 
                     # Execute agent or team with media
@@ -697,6 +706,7 @@ class Step:
                     message = self._prepare_message(
                         step_input.input,
                         step_input.previous_step_outputs,
+                        step_input.depends_on,
                     )
 
                     if self._executor_type in ["agent", "team"]:
@@ -962,6 +972,7 @@ class Step:
                     message = self._prepare_message(
                         step_input.input,
                         step_input.previous_step_outputs,
+                        step_input.depends_on,
                     )
 
                     # Execute agent or team with media
@@ -1216,6 +1227,7 @@ class Step:
                     message = self._prepare_message(
                         step_input.input,
                         step_input.previous_step_outputs,
+                        step_input.depends_on,
                     )
 
                     if self._executor_type in ["agent", "team"]:
@@ -1458,7 +1470,11 @@ class Step:
         last actual step rather than using the generic container message.
 
         For Parallel steps, aggregates content from ALL inner steps (not just the last one).
+        For Graph steps, uses the content of the graph, made of its steps no other step depends on.
         """
+        if step_output.step_type == StepType.GRAPH:
+            return step_output.content  # type: ignore
+
         # If this step has nested steps (like Steps, Condition, Router, Loop, Parallel, etc.)
         if hasattr(step_output, "steps") and step_output.steps and len(step_output.steps) > 0:
             # For Parallel steps, aggregate content from ALL inner steps
@@ -1481,10 +1497,24 @@ class Step:
         self,
         message: Optional[Union[str, Dict[str, Any], List[Any], BaseModel]],
         previous_step_outputs: Optional[Dict[str, StepOutput]] = None,
+        depends_on: Optional[List[str]] = None,
     ) -> Optional[Union[str, List[Any], Dict[str, Any], BaseModel]]:
         """Prepare the primary input by combining message and previous step outputs"""
 
         if previous_step_outputs and self._executor_type in ["agent", "team"]:
+            # A step of a Graph with several dependencies gets the content of all of them
+            if depends_on and len(depends_on) > 1:
+                aggregated_parts = []
+                for step_name in depends_on:
+                    dependency_output = previous_step_outputs.get(step_name)
+                    dependency_content = (
+                        self._get_deepest_content_from_step_output(dependency_output) if dependency_output else None
+                    )
+                    if dependency_content:
+                        aggregated_parts.append(f"=== {step_name} ===\n{dependency_content}")
+                if aggregated_parts:
+                    return "\n\n".join(aggregated_parts)
+
             last_output = list(previous_step_outputs.values())[-1] if previous_step_outputs else None
             if last_output:
                 deepest_content = self._get_deepest_content_from_step_output(last_output)
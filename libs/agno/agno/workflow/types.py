@@ -75,6 +75,9 @@ class StepInput:
 
     previous_step_content: Optional[Any] = None
     previous_step_outputs: Optional[Dict[str, "StepOutput"]] = None
+    # Names of the previous steps the step depends on, set by Graph.
+    # Agent and team steps get the content of all of them instead of only the last previous step.
+    depends_on: Optional[List[str]] = None
 
     additional_data: Optional[Dict[str, Any]] = None
 
@@ -149,12 +152,16 @@ class StepInput:
 
         For parallel steps, if you ask for the parallel step name, returns a dict
         with {step_name: content} for each sub-step.
+        For graph steps, returns the content of the graph, made of its steps no other step depends on.
         For other nested steps (Condition, Router, Loop, Steps), returns the deepest content.
         """
         step_output = self.get_step_output(step_name)
         if not step_output:
             return None
 
+        if step_output.step_type == "Graph":
+            return step_output.content  # type: ignore[return-value]
+
         # Check if this is a parallel step with nested steps
         if step_output.step_type == "Parallel" and step_output.steps:
             # Return dict with {step_name: content} for each sub-step
@@ -182,8 +189,8 @@ class StepInput:
 
     def _get_deepest_step_content(self, step_output: "StepOutput") -> Optional[Union[str, Dict[str, str]]]:
         """Helper method to recursively extract deepest content from nested steps"""
-        # If this step has nested steps, go deeper
-        if step_output.steps and len(step_output.steps) > 0:
+        # If this step has nested steps, go deeper. A graph has no last step, its content is used instead.
+        if step_output.steps and len(step_output.steps) > 0 and step_output.step_type != "Graph":
             return self._get_deepest_step_content(step_output.steps[-1])
 
         # Return the content of this step
@@ -481,3 +488,4 @@ class StepType(str, Enum):
     PARALLEL = "Parallel"
     CONDITION = "Condition"
     ROUTER = "Router"
+    GRAPH = "Graph"
@@ -83,6 +83,7 @@ from agno.utils.print_response.workflow import (
 from agno.utils.string import generate_id_from_name
 from agno.workflow.agent import WorkflowAgent
 from agno.workflow.condition import Condition
+from agno.workflow.graph import Graph
 from agno.workflow.loop import Loop
 from agno.workflow.parallel import Parallel
 from agno.workflow.router import Router
@@ -104,6 +105,7 @@ STEP_TYPE_MAPPING = {
     Parallel: StepType.PARALLEL,
     Condition: StepType.CONDITION,
     Router: StepType.ROUTER,
+    Graph: StepType.GRAPH,
 }
 
 WorkflowSteps = Union[
@@ -123,6 +125,7 @@ WorkflowSteps = Union[
             Parallel,
             Condition,
             Router,
+            Graph,
         ]
     ],
 ]
@@ -194,6 +197,13 @@ class Workflow:
     # Number of historical runs to include in the messages
     num_history_runs: int = 3
 
+    # --- Step checkpointing ---
+    # Save the session after each step, so a failed run can be resumed from its last completed step
+    checkpoint_steps: bool = False
+    # Reuse the stored output of a step when it runs again in the session with the same input.
+    # A step served from the cache doesn't run, so its session_state changes are not applied again.
+    cache_steps: bool = False
+
     # If True, run hooks as FastAPI background tasks (non-blocking). Set by AgentOS.
     _run_hooks_in_background: bool = False
 
@@ -223,6 +233,8 @@ class Workflow:
         telemetry: bool = True,
         add_workflow_history_to_steps: bool = False,
         num_history_runs: int = 3,
+        checkpoint_steps: bool = False,
+        cache_steps: bool = False,
     ):
         self.id = id
         self.name = name
@@ -247,6 +259,8 @@ class Workflow:
         self.telemetry = telemetry
         self.add_workflow_history_to_steps = add_workflow_history_to_steps
         self.num_history_runs = num_history_runs
+        self.checkpoint_steps = checkpoint_steps
+        self.cache_steps = cache_steps
         self._workflow_session: Optional[WorkflowSession] = None
         self.stream_events = stream_events
 
@@ -573,6 +587,10 @@ class Workflow:
         config["add_workflow_history_to_steps"] = self.add_workflow_history_to_steps
         config["num_history_runs"] = self.num_history_runs
 
+        # --- Step checkpointing settings ---
+        config["checkpoint_steps"] = self.checkpoint_steps
+        config["cache_steps"] = self.cache_steps
+
         # --- Streaming settings ---
         if self.stream is not None:
             config["stream"] = self.stream
@@ -674,6 +692,9 @@ class Workflow:
             # --- History settings ---
             add_workflow_history_to_steps=config.get("add_workflow_history_to_steps", False),
             num_history_runs=config.get("num_history_runs", 3),
+            # --- Step checkpointing settings ---
+            checkpoint_steps=config.get("checkpoint_steps", False),
+            cache_steps=config.get("cache_steps", False),
             # --- Streaming settings ---
             stream=config.get("stream"),
             stream_events=config.get("stream_events", False),
@@ -1527,9 +1548,11 @@ class Workflow:
                 for nested_step in step_output.steps:
                     process_step_output(nested_step)
 
-            # Only collect metrics from steps that actually have metrics (actual agents/teams)
+            # Only collect metrics from steps that actually have metrics (actual agents/teams, and graph timings)
             if (
-                step_output.step_name and step_output.metrics and step_output.executor_type in ["agent", "team"]
+                step_output.step_name
+                and step_output.metrics
+                and step_output.executor_type in ["agent", "team", "graph"]
             ):  # Only include actual executors
                 step_metrics = StepMetrics(
                     step_name=step_output.step_name,
@@ -1596,6 +1619,156 @@ class Workflow:
                 partial_step_content += event.content
         return partial_step_content
 
+    def _get_completed_step_outputs(self, session: WorkflowSession, run_id: Optional[str]) -> List[StepOutput]:
+        """Get the outputs of the steps completed by an unfinished run, to resume it"""
+        previous_run = session.get_run(run_id=run_id) if run_id else None
+        if previous_run is None or previous_run.status == RunStatus.completed:
+            return []
+
+        completed_step_outputs: List[StepOutput] = []
+        for step_result in previous_run.step_results or []:
+            if not isinstance(step_result, StepOutput) or not step_result.success:
+                break
+            completed_step_outputs.append(step_result)
+        return completed_step_outputs
+
+    @staticmethod
+    def _get_step_fingerprint(step: Any) -> str:
+        """Identify what a step runs. The generated step_id changes with every Workflow instance, so it isn't used."""
+        for executor_type in ("agent", "team"):
+            executor = getattr(step, executor_type, None)
+            if executor is not None:
+                return f"{executor_type}:{executor.id or executor.name}"
+        executor = getattr(step, "executor", None)
+        if executor is not None:
+            return f"executor:{getattr(executor, '__module__', '')}.{getattr(executor, '__qualname__', repr(executor))}"
+        return type(step).__name__
+
+    @staticmethod
+    def _get_media_fingerprint(media: Optional[List[Any]]) -> List[Optional[str]]:
+        """Identify media by location, or by a hash of their content"""
+        import hashlib
+
+        fingerprints: List[Optional[str]] = []
+        for item in media or []:
+            content = getattr(item, "content", None)
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            if item.url is not None or item.filepath is not None:
+                fingerprints.append(str(item.url or item.filepath))
+            elif isinstance(content, bytes):
+                fingerprints.append(hashlib.sha256(content).hexdigest())
+            else:
+                fingerprints.append(None)
+        return fingerprints
+
+    def _get_step_cache_key(self, step: Any, step_name: str, step_input: StepInput) -> Optional[str]:
+        """Hash of a step and its input, used to cache the step output. Must be taken before the step runs.
+
+        Only the content and media of the input and previous step outputs are hashed, so ids and metrics of the
+        previous steps don't change the key.
+        """
+        import hashlib
+        import json
+
+        if not self.cache_steps:
+            return None
+
+        def get_media(data: Union[StepInput, StepOutput]) -> Dict[str, Any]:
+            return {
+                "images": self._get_media_fingerprint(data.images),
+                "videos": self._get_media_fingerprint(data.videos),
+                "audio": self._get_media_fingerprint(data.audio),
+                "files": self._get_media_fingerprint(data.files),
+            }
+
+        step_data = {
+            "step_name": step_name,
+            "step": self._get_step_fingerprint(step),
+            "input": step_input.input,
+            "additional_data": step_input.additional_data,
+            "media": get_media(step_input),
+            "previous_step_outputs": {
+                name: {"content": output.content, "media": get_media(output)}
+                for name, output in (step_input.previous_step_outputs or {}).items()
+            },
+        }
+        serialized = json.dumps(
+            step_data,
+            sort_keys=True,
+            default=lambda value: value.model_dump(mode="json") if isinstance(value, BaseModel) else str(value),
+        )
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def _get_reusable_step_output(
+        self,
+        session: WorkflowSession,
+        step_index: int,
+        step_name: str,
+        cache_key: Optional[str],
+        completed_step_outputs: List[StepOutput],
+    ) -> Optional[StepOutput]:
+        """Get the output of a step that doesn't need to run again.
+
+        The output is reused when the step was completed by the run being resumed, or, with cache_steps,
+        when the step already ran in this session with the same input.
+        """
+        if step_index < len(completed_step_outputs) and completed_step_outputs[step_index].step_name == step_name:
+            log_debug(f"Step {step_name} was completed before, skipping it")
+            return completed_step_outputs[step_index]
+        # The steps after a step that runs again can't be resumed, as their input may change
+        completed_step_outputs.clear()
+
+        if cache_key is not None and session.session_data is not None:
+            step_cache = session.session_data.get("step_cache") or {}
+            cached_output = step_cache.get(cache_key)
+            if cached_output is not None:
+                log_debug(f"Step {step_name} has a cached output for this input, skipping it")
+                return StepOutput.from_dict(cached_output)
+        return None
+
+    def _update_step_cache(self, session: WorkflowSession, cache_key: Optional[str], step_output: StepOutput) -> None:
+        """Cache the output of a step, replacing the output cached for a previous input"""
+        if cache_key is None or not step_output.success:
+            return
+        if session.session_data is None:
+            session.session_data = {}
+        step_cache = session.session_data.setdefault("step_cache", {})
+        for key in [key for key, output in step_cache.items() if output.get("step_name") == step_output.step_name]:
+            del step_cache[key]
+        step_cache[cache_key] = step_output.to_dict()
+
+    def _save_step_output(
+        self,
+        session: WorkflowSession,
+        workflow_run_response: WorkflowRunOutput,
+        step_output: StepOutput,
+        cache_key: Optional[str] = None,
+    ) -> None:
+        """Cache the output of a step that ran, and save a checkpoint of the run"""
+        self._update_step_cache(session=session, cache_key=cache_key, step_output=step_output)
+        if self.checkpoint_steps:
+            session.upsert_run(run=workflow_run_response)
+            # Upsert directly, as save_session cleans up the session state the next steps still use
+            self._upsert_session(session=session)
+
+    async def _asave_step_output(
+        self,
+        session: WorkflowSession,
+        workflow_run_response: WorkflowRunOutput,
+        step_output: StepOutput,
+        cache_key: Optional[str] = None,
+    ) -> None:
+        """Cache the output of a step that ran, and save a checkpoint of the run"""
+        self._update_step_cache(session=session, cache_key=cache_key, step_output=step_output)
+        if self.checkpoint_steps:
+            session.upsert_run(run=workflow_run_response)
+            # Upsert directly, as save_session cleans up the session state the next steps still use
+            if self._has_async_db():
+                await self._aupsert_session(session=session)
+            else:
+                self._upsert_session(session=session)
+
     def _execute(
         self,
         session: WorkflowSession,
@@ -1644,6 +1817,11 @@ class Workflow:
                 shared_files: List[File] = execution_input.files or []
                 output_files: List[File] = (execution_input.files or []).copy()  # Start with input files
 
+                # Outputs of the steps completed by the run being resumed
+                completed_step_outputs = self._get_completed_step_outputs(session, workflow_run_response.run_id)
+                # Keep the completed steps on the run, so they are saved if a later step fails
+                workflow_run_response.step_results = collected_step_outputs
+
                 for i, step in enumerate(self.steps):  # type: ignore[arg-type]
                     raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
                     step_name = getattr(step, "name", f"step_{i + 1}")
@@ -1662,20 +1840,27 @@ class Workflow:
                     # Check for can cellation before executing step
                     raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
 
-                    step_output = step.execute(  # type: ignore[union-attr]
-                        step_input,
-                        session_id=session.session_id,
-                        user_id=self.user_id,
-                        workflow_run_response=workflow_run_response,
-                        run_context=run_context,
-                        store_executor_outputs=self.store_executor_outputs,
-                        workflow_session=session,
-                        add_workflow_history_to_steps=self.add_workflow_history_to_steps
-                        if self.add_workflow_history_to_steps
-                        else None,
-                        num_history_runs=self.num_history_runs,
-                        background_tasks=background_tasks,
+                    cache_key = self._get_step_cache_key(step, step_name, step_input)
+                    reused_step_output = self._get_reusable_step_output(
+                        session, i, step_name, cache_key, completed_step_outputs
                     )
+                    if reused_step_output is not None:
+                        step_output = reused_step_output
+                    else:
+                        step_output = step.execute(  # type: ignore[union-attr]
+                            step_input,
+                            session_id=session.session_id,
+                            user_id=self.user_id,
+                            workflow_run_response=workflow_run_response,
+                            run_context=run_context,
+                            store_executor_outputs=self.store_executor_outputs,
+                            workflow_session=session,
+                            add_workflow_history_to_steps=self.add_workflow_history_to_steps
+                            if self.add_workflow_history_to_steps
+                            else None,
+                            num_history_runs=self.num_history_runs,
+                            background_tasks=background_tasks,
+                        )
 
                     # Check for cancellation after step execution
                     raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
@@ -1683,6 +1868,8 @@ class Workflow:
                     # Update the workflow-level previous_step_outputs dictionary
                     previous_step_outputs[step_name] = step_output
                     collected_step_outputs.append(step_output)
+                    if reused_step_output is None:
+                        self._save_step_output(session, workflow_run_response, step_output, cache_key)
 
                     # Update shared media for next step
                     shared_images.extend(step_output.images or [])
@@ -1711,9 +1898,10 @@ class Workflow:
                     last_output = cast(StepOutput, collected_step_outputs[-1])
 
                     # Use deepest nested content if this is a container (Steps/Router/Loop/etc.)
+                    # A Graph has no last step, its content is made of its steps no other step depends on
                     if getattr(last_output, "steps", None):
                         _cur = last_output
-                        while getattr(_cur, "steps", None):
+                        while getattr(_cur, "steps", None) and _cur.step_type != StepType.GRAPH:
                             _steps = _cur.steps or []
                             if not _steps:
                                 break
@@ -1832,6 +2020,11 @@ class Workflow:
                 current_step = None
                 partial_step_content = ""
 
+                # Outputs of the steps completed by the run being resumed
+                completed_step_outputs = self._get_completed_step_outputs(session, workflow_run_response.run_id)
+                # Keep the completed steps on the run, so they are saved if a later step fails
+                workflow_run_response.step_results = collected_step_outputs
+
                 for i, step in enumerate(self.steps):  # type: ignore[arg-type]
                     raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
                     step_name = getattr(step, "name", f"step_{i + 1}")
@@ -1853,6 +2046,32 @@ class Workflow:
                         shared_files=shared_files,
                     )
 
+                    cache_key = self._get_step_cache_key(step, step_name, step_input)
+                    reused_step_output = self._get_reusable_step_output(
+                        session, i, step_name, cache_key, completed_step_outputs
+                    )
+                    if reused_step_output is not None:
+                        collected_step_outputs.append(reused_step_output)
+                        previous_step_outputs[step_name] = reused_step_output
+
+                        # Update shared media for next step
+                        shared_images.extend(reused_step_output.images or [])
+                        shared_videos.extend(reused_step_output.videos or [])
+                        shared_audio.extend(reused_step_output.audio or [])
+                        shared_files.extend(reused_step_output.files or [])
+                        output_images.extend(reused_step_output.images or [])
+                        output_videos.extend(reused_step_output.videos or [])
+                        output_audio.extend(reused_step_output.audio or [])
+                        output_files.extend(reused_step_output.files or [])
+
+                        yield self._transform_step_output_to_event(
+                            reused_step_output, workflow_run_response, step_index=i
+                        )
+                        if reused_step_output.stop:
+                            logger.info(f"Early termination requested by step {step_name}")
+                            break
+                        continue
+
                     # Execute step with streaming and yield all events
                     for event in step.execute_stream(  # type: ignore[union-attr]
                         step_input,
@@ -1883,6 +2102,7 @@ class Workflow:
 
                             # Update the workflow-level previous_step_outputs dictionary
                             previous_step_outputs[step_name] = step_output
+                            self._save_step_output(session, workflow_run_response, step_output, cache_key)
 
                             # Transform StepOutput to StepOutputEvent for consistent streaming interface
                             step_output_event = self._transform_step_output_to_event(
@@ -1955,9 +2175,10 @@ class Workflow:
                     last_output = cast(StepOutput, collected_step_outputs[-1])
 
                     # Use deepest nested content if this is a container (Steps/Router/Loop/etc.)
+                    # A Graph has no last step, its content is made of its steps no other step depends on
                     if getattr(last_output, "steps", None):
                         _cur = last_output
-                        while getattr(_cur, "steps", None):
+                        while getattr(_cur, "steps", None) and _cur.step_type != StepType.GRAPH:
                             _steps = _cur.steps or []
                             if not _steps:
                                 break
@@ -2228,6 +2449,13 @@ class Workflow:
                 shared_files: List[File] = execution_input.files or []
                 output_files: List[File] = (execution_input.files or []).copy()  # Start with input files
 
+                # Outputs of the steps completed by the run being resumed
+                completed_step_outputs = self._get_completed_step_outputs(
+                    workflow_session, workflow_run_response.run_id
+                )
+                # Keep the completed steps on the run, so they are saved if a later step fails
+                workflow_run_response.step_results = collected_step_outputs
+
                 for i, step in enumerate(self.steps):  # type: ignore[arg-type]
                     await araise_if_cancelled(workflow_run_response.run_id)  # type: ignore
                     step_name = getattr(step, "name", f"step_{i + 1}")
@@ -2246,20 +2474,27 @@ class Workflow:
                     # Check for cancellation before executing step
                     await araise_if_cancelled(workflow_run_response.run_id)  # type: ignore
 
-                    step_output = await step.aexecute(  # type: ignore[union-attr]
-                        step_input,
-                        session_id=session_id,
-                        user_id=self.user_id,
-                        workflow_run_response=workflow_run_response,
-                        run_context=run_context,
-                        store_executor_outputs=self.store_executor_outputs,
-                        workflow_session=workflow_session,
-                        add_workflow_history_to_steps=self.add_workflow_history_to_steps
-                        if self.add_workflow_history_to_steps
-                        else None,
-                        num_history_runs=self.num_history_runs,
-                        background_tasks=background_tasks,
+                    cache_key = self._get_step_cache_key(step, step_name, step_input)
+                    reused_step_output = self._get_reusable_step_output(
+                        workflow_session, i, step_name, cache_key, completed_step_outputs
                     )
+                    if reused_step_output is not None:
+                        step_output = reused_step_output
+                    else:
+                        step_output = await step.aexecute(  # type: ignore[union-attr]
+                            step_input,
+                            session_id=session_id,
+                            user_id=self.user_id,
+                            workflow_run_response=workflow_run_response,
+                            run_context=run_context,
+                            store_executor_outputs=self.store_executor_outputs,
+                            workflow_session=workflow_session,
+                            add_workflow_history_to_steps=self.add_workflow_history_to_steps
+                            if self.add_workflow_history_to_steps
+                            else None,
+                            num_history_runs=self.num_history_runs,
+                            background_tasks=background_tasks,
+                        )
 
                     # Check for cancellation after step execution
                     await araise_if_cancelled(workflow_run_response.run_id)  # type: ignore
@@ -2267,6 +2502,8 @@ class Workflow:
                     # Update the workflow-level previous_step_outputs dictionary
                     previous_step_outputs[step_name] = step_output
                     collected_step_outputs.append(step_output)
+                    if reused_step_output is None:
+                        await self._asave_step_output(workflow_session, workflow_run_response, step_output, cache_key)
 
                     # Update shared media for next step
                     shared_images.extend(step_output.images or [])
@@ -2295,9 +2532,10 @@ class Workflow:
                     last_output = cast(StepOutput, collected_step_outputs[-1])
 
                     # Use deepest nested content if this is a container (Steps/Router/Loop/etc.)
+                    # A Graph has no last step, its content is made of its steps no other step depends on
                     if getattr(last_output, "steps", None):
                         _cur = last_output
-                        while getattr(_cur, "steps", None):
+                        while getattr(_cur, "steps", None) and _cur.step_type != StepType.GRAPH:
                             _steps = _cur.steps or []
                             if not _steps:
                                 break
@@ -2431,6 +2669,13 @@ class Workflow:
                 current_step = None
                 partial_step_content = ""
 
+                # Outputs of the steps completed by the run being resumed
+                completed_step_outputs = self._get_completed_step_outputs(
+                    workflow_session, workflow_run_response.run_id
+                )
+                # Keep the completed steps on the run, so they are saved if a later step fails
+                workflow_run_response.step_results = collected_step_outputs
+
                 for i, step in enumerate(self.steps):  # type: ignore[arg-type]
                     if workflow_run_response.run_id:
                         await araise_if_cancelled(workflow_run_response.run_id)
@@ -2452,6 +2697,32 @@ class Workflow:
                         shared_files=shared_files,
                     )
 
+                    cache_key = self._get_step_cache_key(step, step_name, step_input)
+                    reused_step_output = self._get_reusable_step_output(
+                        workflow_session, i, step_name, cache_key, completed_step_outputs
+                    )
+                    if reused_step_output is not None:
+                        collected_step_outputs.append(reused_step_output)
+                        previous_step_outputs[step_name] = reused_step_output
+
+                        # Update shared media for next step
+                        shared_images.extend(reused_step_output.images or [])
+                        shared_videos.extend(reused_step_output.videos or [])
+                        shared_audio.extend(reused_step_output.audio or [])
+                        shared_files.extend(reused_step_output.files or [])
+                        output_images.extend(reused_step_output.images or [])
+                        output_videos.extend(reused_step_output.videos or [])
+                        output_audio.extend(reused_step_output.audio or [])
+                        output_files.extend(reused_step_output.files or [])
+
+                        yield self._transform_step_output_to_event(
+                            reused_step_output, workflow_run_response, step_index=i
+                        )
+                        if reused_step_output.stop:
+                            logger.info(f"Early termination requested by step {step_name}")
+                            break
+                        continue
+
                     # Execute step with streaming and yield all events
                     async for event in step.aexecute_stream(  # type: ignore[union-attr]
                         step_input,
@@ -2482,6 +2753,9 @@ class Workflow:
 
                             # Update the workflow-level previous_step_outputs dictionary
                             previous_step_outputs[step_name] = step_output
+                            await self._asave_step_output(
+                                workflow_session, workflow_run_response, step_output, cache_key
+                            )
 
                             # Transform StepOutput to StepOutputEvent for consistent streaming interface
                             step_output_event = self._transform_step_output_to_event(
@@ -2557,9 +2831,10 @@ class Workflow:
                     last_output = cast(StepOutput, collected_step_outputs[-1])
 
                     # Use deepest nested content if this is a container (Steps/Router/Loop/etc.)
+                    # A Graph has no last step, its content is made of its steps no other step depends on
                     if getattr(last_output, "steps", None):
                         _cur = last_output
-                        while getattr(_cur, "steps", None):
+                        while getattr(_cur, "steps", None) and _cur.step_type != StepType.GRAPH:
                             _steps = _cur.steps or []
                             if not _steps:
                                 break
@@ -3805,6 +4080,113 @@ class Workflow:
         """
         return await acancel_run_global(run_id)
 
+    def _check_resume_kwargs(self, kwargs: Dict[str, Any]) -> None:
+        if kwargs.get("background"):
+            raise ValueError("Runs can't be resumed in the background")
+
+    def _get_run_to_resume(self, run: Optional[WorkflowRunOutput], run_id: str) -> WorkflowRunOutput:
+        if run is None:
+            raise ValueError(f"Run {run_id} not found")
+        if run.status == RunStatus.completed:
+            raise ValueError(f"Run {run_id} is already completed")
+        return run
+
+    def resume(
+        self,
+        run_id: str,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        additional_data: Optional[Dict[str, Any]] = None,
+        audio: Optional[List[Audio]] = None,
+        images: Optional[List[Image]] = None,
+        videos: Optional[List[Video]] = None,
+        files: Optional[List[File]] = None,
+        stream: Optional[bool] = None,
+        stream_events: Optional[bool] = None,
+        background_tasks: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> Union[WorkflowRunOutput, Iterator[WorkflowRunOutputEvent]]:
+        """Resume a failed or cancelled run, skipping the steps it completed.
+
+        The run is executed again with its input, reusing the stored outputs of its completed steps.
+        Set checkpoint_steps to store the output of each step as soon as it completes.
+        The additional data and media of the run are not stored, and need to be given again.
+
+        Args:
+            run_id (str): The run_id of the run to resume.
+            session_id (Optional[str]): The session of the run. Defaults to the workflow session_id.
+
+        Runs can't be resumed in the background: the background run replaces the stored run, and with it the
+        outputs of the completed steps, before it starts.
+        """
+        self._check_resume_kwargs(kwargs)
+        session_id = session_id or self.session_id
+        run = self._get_run_to_resume(self.get_run_output(run_id=run_id, session_id=session_id), run_id=run_id)
+        log_debug(f"Resuming workflow run {run_id}")
+
+        return self.run(  # type: ignore
+            input=run.input,
+            additional_data=additional_data,
+            user_id=user_id or run.user_id,
+            run_id=run_id,
+            session_id=run.session_id or session_id,
+            audio=audio,
+            images=images,
+            videos=videos,
+            files=files,
+            stream=stream,
+            stream_events=stream_events,
+            background_tasks=background_tasks,
+            **kwargs,
+        )
+
+    async def aresume(
+        self,
+        run_id: str,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        additional_data: Optional[Dict[str, Any]] = None,
+        audio: Optional[List[Audio]] = None,
+        images: Optional[List[Image]] = None,
+        videos: Optional[List[Video]] = None,
+        files: Optional[List[File]] = None,
+        stream: Optional[bool] = None,
+        stream_events: Optional[bool] = None,
+        background_tasks: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> Union[WorkflowRunOutput, AsyncIterator[WorkflowRunOutputEvent]]:
+        """Resume a failed or cancelled run asynchronously, skipping the steps it completed.
+
+        See resume(). When streaming, the events are returned as an async iterator.
+        """
+        self._check_resume_kwargs(kwargs)
+        session_id = session_id or self.session_id
+        if self._has_async_db():
+            run_output = await self.aget_run_output(run_id=run_id, session_id=session_id)
+        else:
+            run_output = self.get_run_output(run_id=run_id, session_id=session_id)
+        run = self._get_run_to_resume(run_output, run_id=run_id)
+        log_debug(f"Resuming workflow run {run_id}")
+
+        result = self.arun(  # type: ignore
+            input=run.input,
+            additional_data=additional_data,
+            user_id=user_id or run.user_id,
+            run_id=run_id,
+            session_id=run.session_id or session_id,
+            audio=audio,
+            images=images,
+            videos=videos,
+            files=files,
+            stream=stream,
+            stream_events=stream_events,
+            background_tasks=background_tasks,
+            **kwargs,
+        )
+        if stream or (stream is None and self.stream):
+            return result
+        return await result
+
     @overload
     def run(
         self,
@@ -4196,7 +4578,7 @@ class Workflow:
     def _prepare_steps(self):
         """Prepare the steps for execution"""
         if not callable(self.steps) and self.steps is not None:
-            prepared_steps: List[Union[Step, Steps, Loop, Parallel, Condition, Router]] = []
+            prepared_steps: List[Union[Step, Steps, Loop, Parallel, Condition, Router, Graph]] = []
             for i, step in enumerate(self.steps):  # type: ignore
                 if callable(step) and hasattr(step, "__name__"):
                     step_name = step.__name__
@@ -4216,7 +4598,7 @@ class Workflow:
                         "but no database is configured in the Workflow. "
                         "History won't be persisted. Add a database to persist runs across executions."
                     )
-                elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router)):
+                elif isinstance(step, (Step, Steps, Loop, Parallel, Condition, Router, Graph)):
                     step_type = type(step).__name__
                     step_name = getattr(step, "name", f"unnamed_{step_type.lower()}")
                     log_debug(f"Step {i + 1}: {step_type} '{step_name}'")
@@ -4433,7 +4815,7 @@ class Workflow:
                     [serialize_step(step) for step in step.choices] if hasattr(step, "choices") else None
                 )
 
-            elif isinstance(step, (Loop, Condition, Steps, Parallel)):
+            elif isinstance(step, (Loop, Condition, Steps, Parallel, Graph)):
                 step_dict["steps"] = [serialize_step(step) for step in step.steps] if hasattr(step, "steps") else None
 
             return step_dict
@@ -4459,7 +4841,8 @@ class Workflow:
 
         # Aggregate metrics from all steps
         for step_name, step_metrics in workflow_metrics.steps.items():
-            if step_metrics.metrics:
+            # Graph metrics only hold the timing of steps already counted
+            if step_metrics.metrics and step_metrics.executor_type != "graph":
                 session_metrics += step_metrics.metrics
 
         session_metrics.time_to_first_token = None
@@ -4883,6 +5266,7 @@ class Workflow:
         from agno.agent import Agent
         from agno.team import Team
         from agno.workflow.condition import Condition
+        from agno.workflow.graph import Graph
         from agno.workflow.loop import Loop
         from agno.workflow.parallel import Parallel
         from agno.workflow.router import Router
@@ -4910,6 +5294,7 @@ class Workflow:
                 "strict_input_validation",
                 "add_workflow_history",
                 "num_history_runs",
+                "depends_on",
             ]:
                 if hasattr(step, attr):
                     value = getattr(step, attr)
@@ -4931,6 +5316,17 @@ class Workflow:
             copied_parallel_steps = [self._deep_copy_single_step(s) for s in step.steps] if step.steps else []
             return Parallel(*copied_parallel_steps, name=step.name, description=step.description)
 
+        # Handle Graph steps
+        if isinstance(step, Graph):
+            copied_graph_steps = [self._deep_copy_single_step(s) for s in step.steps] if step.steps else []
+            return Graph(
+                *copied_graph_steps,
+                name=step.name,
+                description=step.description,
+                dependencies=deepcopy(step.dependencies),
+                max_workers=step.max_workers,
+            )
+
         # Handle Loop steps
         if isinstance(step, Loop):
             copied_loop_steps = [self._deep_copy_single_step(s) for s in step.steps] if step.steps else []
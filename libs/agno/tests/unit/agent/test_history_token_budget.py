@@ -0,0 +1,87 @@
+"""Tests for selecting the history of a session by token budget."""
+
+from agno.agent.agent import Agent
+from agno.models.message import Message
+from agno.run.agent import RunOutput
+from agno.run.team import TeamRunOutput
+from agno.session import AgentSession, TeamSession
+from agno.utils.tokens import count_message_tokens
+
+
+def _messages(i: int):
+    return [
+        Message(role="system", content="You are a helpful assistant"),
+        Message(role="user", content=f"Question number {i} " + "word " * 20),
+        Message(role="assistant", content=f"Answer number {i} " + "word " * 20),
+    ]
+
+
+def _session(num_runs: int = 5) -> AgentSession:
+    runs = [RunOutput(run_id=f"run-{i}", agent_id="agent", messages=_messages(i)) for i in range(num_runs)]
+    return AgentSession(session_id="session", agent_id="agent", runs=runs)
+
+
+def _run_tokens(session: AgentSession, index: int) -> int:
+    return sum(count_message_tokens(m) for m in session.runs[index].messages if m.role != "system")  # type: ignore
+
+
+def test_latest_runs_within_budget_are_returned_in_order():
+    session = _session()
+    budget = _run_tokens(session, 4) + _run_tokens(session, 3) + 1
+
+    messages = session.get_messages(max_tokens=budget)
+
+    assert [m.role for m in messages] == ["system", "user", "assistant", "user", "assistant"]
+    assert messages[1].content.startswith("Question number 3")
+    assert messages[-1].content.startswith("Answer number 4")
+
+
+def test_only_selected_runs_are_counted():
+    session = _session(num_runs=50)
+    budget = _run_tokens(session, 49) * 2
+
+    session.get_messages(max_tokens=budget)
+
+    # The runs that were not selected, except the first one that did not fit, were never tokenized
+    counted_runs = [run for run in session.runs if any(m._token_counts for m in run.messages)]  # type: ignore
+    assert len(counted_runs) == 3
+
+
+def test_budget_is_combined_with_message_limit():
+    session = _session()
+    budget = count_message_tokens(session.runs[-1].messages[-1])  # type: ignore
+
+    messages = session.get_messages(limit=4, max_tokens=budget)
+
+    assert [m.role for m in messages] == ["system", "assistant"]
+
+
+def test_team_session_budget():
+    runs = [TeamRunOutput(run_id=f"run-{i}", team_id="team", messages=_messages(i)) for i in range(3)]
+    session = TeamSession(session_id="session", team_id="team", runs=runs)
+
+    assert session.get_messages(max_tokens=0) == []
+    assert len(session.get_messages(max_tokens=10_000)) == 7
+
+
+def test_agent_defaults_to_budget_only_history():
+    agent = Agent(add_history_to_context=True, max_history_tokens=1000)
+    assert agent.num_history_runs is None
+
+    assert Agent(add_history_to_context=True).num_history_runs == 3
+
+
+def test_token_counts_are_stored_with_the_session(monkeypatch):
+    import agno.utils.tokens as tokens
+
+    session = _session()
+    budget = _run_tokens(session, 4) + _run_tokens(session, 3) + 1
+    session.get_messages(max_tokens=budget)
+
+    calls = []
+    monkeypatch.setattr(tokens, "_count_message_tokens", lambda message, model_id="gpt-4o": calls.append(message))
+    restored = AgentSession.from_dict(session.to_dict())
+    messages = restored.get_messages(max_tokens=budget)  # type: ignore[union-attr]
+
+    assert calls == []
+    assert messages[1].content.startswith("Question number 3")
@@ -0,0 +1,127 @@
+"""Tests for the daily metrics aggregation statements used by the Postgres dbs."""
+
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from sqlalchemy import Column, MetaData, Table
+from sqlalchemy.dialects import postgresql
+
+from agno.db.postgres.schemas import get_table_schema_definition
+from agno.db.postgres.utils import (
+    TOKEN_METRICS_FIELDS,
+    build_daily_metrics_records,
+    date_to_day,
+    day_to_date,
+    get_daily_metrics_stmts,
+    get_updated_session_days_stmt,
+)
+
+
+def make_table(name: str, table_type: str) -> Table:
+    schema = get_table_schema_definition(table_type)
+    columns = []
+    for column_name, column_schema in schema.items():
+        if column_name.startswith("_"):
+            continue
+        columns.append(Column(column_name, column_schema["type"]()))
+    return Table(name, MetaData(), *columns)
+
+
+def compile_sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def session_row(day: int, session_type: str, sessions_count: int, **tokens: int):
+    return SimpleNamespace(
+        day=day,
+        session_type=session_type,
+        sessions_count=sessions_count,
+        **{field: tokens.get(field) for field in TOKEN_METRICS_FIELDS},
+    )
+
+
+def test_day_numbers_round_trip():
+    assert day_to_date(0) == date(1970, 1, 1)
+    assert date_to_day(date(2024, 3, 1)) == 19783
+    assert day_to_date(date_to_day(date(2024, 3, 1))) == date(2024, 3, 1)
+
+
+def test_updated_session_days_use_the_updated_at_column():
+    sessions = make_table("sessions", "sessions")
+
+    sql = compile_sql(get_updated_session_days_stmt(sessions, since=100))
+
+    assert "DISTINCT" in sql
+    assert "sessions.updated_at >=" in sql
+
+
+def test_daily_metrics_are_aggregated_in_sql():
+    sessions = make_table("sessions", "sessions")
+
+    sessions_stmt, users_stmt, runs_stmt = get_daily_metrics_stmts(sessions, None, [10, 11, 20])
+
+    sessions_sql = compile_sql(sessions_stmt)
+    assert "GROUP BY" in sessions_sql
+    assert "->>" in sessions_sql
+    # Consecutive days are filtered with a single range
+    assert sessions_sql.count("sessions.created_at >=") == 2
+    assert "count(DISTINCT sessions.user_id)" in compile_sql(users_stmt)
+
+    runs_sql = compile_sql(runs_stmt)
+    assert "jsonb_array_elements" in runs_sql
+    assert "jsonb_typeof" in runs_sql
+    assert "UNION" not in runs_sql
+
+
+def test_daily_metrics_include_the_runs_table():
+    sessions = make_table("sessions", "sessions")
+    runs = make_table("runs", "runs")
+
+    _, _, runs_stmt = get_daily_metrics_stmts(sessions, runs, [10])
+
+    runs_sql = compile_sql(runs_stmt)
+    # UNION, not UNION ALL, so runs kept in both places are counted once
+    assert "UNION " in runs_sql
+    assert "UNION ALL" not in runs_sql
+    assert "runs.run_data ->>" in runs_sql
+
+
+def test_daily_metrics_records_are_built_per_day():
+    today = datetime.now(timezone.utc).date()
+    past_day = date_to_day(today - timedelta(days=2))
+    current_day = date_to_day(today)
+
+    records = build_daily_metrics_records(
+        session_rows=[
+            session_row(past_day, "agent", 2, input_tokens=10, total_tokens=12),
+            session_row(past_day, "team", 1, input_tokens=5),
+            session_row(current_day, "workflow", 1),
+        ],
+        user_rows=[SimpleNamespace(day=past_day, users_count=2), SimpleNamespace(day=current_day, users_count=1)],
+        run_rows=[
+            SimpleNamespace(
+                day=past_day, session_type="agent", model_id="gpt-4o", model_provider="OpenAI", runs_count=3
+            ),
+            SimpleNamespace(
+                day=past_day, session_type="team", model_id="gpt-4o", model_provider="OpenAI", runs_count=1
+            ),
+            SimpleNamespace(day=current_day, session_type="workflow", model_id=None, model_provider=None, runs_count=1),
+            # Runs of days without sessions are ignored
+            SimpleNamespace(day=current_day + 1, session_type="agent", model_id="x", model_provider="y", runs_count=1),
+        ],
+    )
+
+    assert [record["date"] for record in records] == [today - timedelta(days=2), today]
+    past, current = records
+    assert past["completed"] is True
+    assert (past["agent_sessions_count"], past["team_sessions_count"]) == (2, 1)
+    assert (past["agent_runs_count"], past["team_runs_count"]) == (3, 1)
+    assert past["users_count"] == 2
+    assert past["token_metrics"]["input_tokens"] == 15
+    assert past["token_metrics"]["total_tokens"] == 12
+    assert past["model_metrics"] == [{"model_id": "gpt-4o", "model_provider": "OpenAI", "count": 4}]
+
+    assert current["completed"] is False
+    assert current["workflow_sessions_count"] == 1
+    assert current["workflow_runs_count"] == 1
+    assert current["model_metrics"] == []
@@ -0,0 +1,341 @@
+"""Tests for the sorted set indexes used by RedisDb to list sessions and memories."""
+
+import fnmatch
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import pytest
+
+pytest.importorskip("redis")
+
+from redis.exceptions import WatchError  # noqa: E402
+
+from agno.db.base import SessionType  # noqa: E402
+from agno.db.redis import RedisDb  # noqa: E402
+from agno.db.redis.utils import serialize_data  # noqa: E402
+from agno.db.schemas.memory import UserMemory  # noqa: E402
+from agno.session import AgentSession, TeamSession  # noqa: E402
+
+
+def _score(value: Any) -> float:
+    return float(value.replace("+", "")) if isinstance(value, str) else float(value)
+
+
+class FakeRedis:
+    """In-memory stand-in for the subset of the Redis client used by RedisDb."""
+
+    def __init__(self):
+        self.strings: Dict[str, str] = {}
+        self.zsets: Dict[str, Dict[str, float]] = {}
+        self.hashes: Dict[str, Dict[str, str]] = {}
+        self.sets: Dict[str, Set[str]] = {}
+        # Number of times each key was written, to detect changes to watched keys
+        self.versions: Dict[str, int] = {}
+        self.fetched_keys = 0
+        self.scans = 0
+        # Called once with no arguments after the next index read, to interleave another client's writes
+        self.after_next_read: Optional[Callable[[], None]] = None
+
+    def get(self, key):
+        self.fetched_keys += 1
+        return self.strings.get(key)
+
+    def set(self, key, value, ex=None):
+        self.strings[key] = value
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def mget(self, keys):
+        self.fetched_keys += len(keys)
+        return [self.strings.get(key) for key in keys]
+
+    def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            self.versions[key] = self.versions.get(key, 0) + 1
+            for store in (self.strings, self.zsets, self.hashes, self.sets):
+                if store.pop(key, None) is not None:
+                    deleted += 1
+        return deleted
+
+    def scan_iter(self, match):
+        self.scans += 1
+        keys = list(self.strings) + list(self.zsets) + list(self.hashes) + list(self.sets)
+        return iter([key for key in keys if fnmatch.fnmatchcase(key, match)])
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hmget(self, key, fields):
+        values = [self.hashes.get(key, {}).get(field) for field in fields]
+        if self.after_next_read is not None:
+            after_next_read, self.after_next_read = self.after_next_read, None
+            after_next_read()
+        return values
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    def hdel(self, key, *fields):
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+
+    def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    def srem(self, key, member):
+        self.sets.get(key, set()).discard(member)
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, member):
+        self.zsets.get(key, {}).pop(member, None)
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    def zcount(self, key, min_score, max_score):
+        return len(self._range(key, min_score, max_score, descending=False))
+
+    def zrangebyscore(self, key, min_score, max_score, start=None, num=None):
+        return self._slice(self._range(key, min_score, max_score, descending=False), start, num)
+
+    def zrevrangebyscore(self, key, max_score, min_score, start=None, num=None):
+        return self._slice(self._range(key, min_score, max_score, descending=True), start, num)
+
+    def _range(self, key, min_score, max_score, descending):
+        members = [
+            (score, member)
+            for member, score in self.zsets.get(key, {}).items()
+            if _score(min_score) <= score <= _score(max_score)
+        ]
+        return [member for _, member in sorted(members, reverse=descending)]
+
+    @staticmethod
+    def _slice(members: List[str], start, num):
+        start = start or 0
+        return members[start:] if num is None or num < 0 else members[start : start + num]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Pipeline running commands immediately while watching keys, and queueing them otherwise or after multi()."""
+
+    def __init__(self, client: FakeRedis):
+        self.client = client
+        self.reset()
+
+    def reset(self):
+        self.commands: List[Any] = []
+        self.watching = False
+        self.explicit_transaction = False
+        self.watched: Dict[str, int] = {}
+
+    def watch(self, *keys):
+        self.watching = True
+        self.watched = {key: self.client.versions.get(key, 0) for key in keys}
+
+    def multi(self):
+        self.explicit_transaction = True
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            if self.watching and not self.explicit_transaction:
+                return getattr(self.client, name)(*args, **kwargs)
+            self.commands.append((name, args, kwargs))
+
+        return queue
+
+    def execute(self):
+        changed = any(self.client.versions.get(key, 0) != version for key, version in self.watched.items())
+        commands = self.commands
+        self.reset()
+        if changed:
+            raise WatchError("Watched variable changed.")
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in commands]
+
+
+@pytest.fixture
+def client():
+    return FakeRedis()
+
+
+@pytest.fixture
+def db(client):
+    return RedisDb(redis_client=client)  # type: ignore[arg-type]
+
+
+def _agent_session(session_id: str, user_id: str, agent_id: str = "agent", created_at: int = 0, name=None):
+    return AgentSession(
+        session_id=session_id,
+        agent_id=agent_id,
+        user_id=user_id,
+        created_at=created_at,
+        session_data={"session_name": name} if name else None,
+    )
+
+
+def test_listing_a_user_sessions_reads_only_the_page(client, db):
+    for i in range(100):
+        db.upsert_session(_agent_session(f"s{i}", user_id=f"user{i % 4}", created_at=1000 + i))
+    db.get_sessions(session_type=SessionType.AGENT, limit=1)
+    client.fetched_keys, client.scans = 0, 0
+
+    sessions, total = db.get_sessions(
+        session_type=SessionType.AGENT,
+        user_id="user1",
+        limit=5,
+        page=2,
+        sort_by="created_at",
+        sort_order="desc",
+        deserialize=False,
+    )
+
+    assert total == 25
+    assert [session["session_id"] for session in sessions] == [f"s{i}" for i in (77, 73, 69, 65, 61)]
+    assert client.fetched_keys == 5
+    assert client.scans == 0
+
+
+def test_sessions_are_filtered_by_component_type_and_time(db):
+    db.upsert_session(_agent_session("a1", "alice", agent_id="support", created_at=100))
+    db.upsert_session(_agent_session("a2", "alice", agent_id="sales", created_at=200))
+    db.upsert_session(_agent_session("a3", "bob", agent_id="support", created_at=300))
+    db.upsert_session(TeamSession(session_id="t1", team_id="support", user_id="alice", created_at=400))
+
+    def ids(**kwargs):
+        sessions, _ = db.get_sessions(sort_by="created_at", deserialize=False, **kwargs)
+        return [session["session_id"] for session in sessions]
+
+    assert ids(session_type=SessionType.AGENT, component_id="support") == ["a1", "a3"]
+    assert ids(session_type=SessionType.TEAM, component_id="support") == ["t1"]
+    assert ids(user_id="alice") == ["a1", "a2", "t1"]
+    assert ids(session_type=SessionType.AGENT, start_timestamp=150, end_timestamp=300) == ["a2", "a3"]
+    # Time range while sorting by another field
+    sessions, total = db.get_sessions(
+        session_type=SessionType.AGENT, start_timestamp=150, sort_by="updated_at", deserialize=False
+    )
+    assert (sorted(session["session_id"] for session in sessions), total) == (["a2", "a3"], 2)
+
+    typed = db.get_sessions(session_type=SessionType.AGENT, user_id="bob")
+    assert [session.session_id for session in typed] == ["a3"]
+
+
+def test_session_name_search_and_unindexed_sort(db):
+    db.upsert_session(_agent_session("s1", "alice", name="Trip to Rome", created_at=1))
+    db.upsert_session(_agent_session("s2", "alice", name="Budget", created_at=2))
+    db.upsert_session(_agent_session("s3", "alice", name="Rome restaurants", created_at=3))
+
+    sessions, total = db.get_sessions(
+        session_type=SessionType.AGENT, session_name="rome", sort_by="created_at", limit=1, page=2, deserialize=False
+    )
+    assert ([session["session_id"] for session in sessions], total) == (["s3"], 2)
+
+    sessions, total = db.get_sessions(
+        session_type=SessionType.AGENT, sort_by="session_id", sort_order="desc", limit=2, deserialize=False
+    )
+    assert ([session["session_id"] for session in sessions], total) == (["s3", "s2"], 3)
+
+
+def test_indexes_follow_updates_and_deletes(client, db, monkeypatch):
+    db.upsert_session(_agent_session("s1", "alice", created_at=1))
+    db.upsert_session(_agent_session("s2", "alice", created_at=2))
+    db.upsert_session(_agent_session("s1", "bob", created_at=1, name="First"))
+    db.delete_session("s2")
+
+    assert db.get_sessions(session_type=SessionType.AGENT, user_id="alice", deserialize=False) == ([], 0)
+    sessions, total = db.get_sessions(session_type=SessionType.AGENT, user_id="bob", deserialize=False)
+    assert ([session["session_id"] for session in sessions], total) == (["s1"], 1)
+
+    # A renamed session moves to the front when sorting by updated_at
+    db.upsert_session(_agent_session("s3", "bob", created_at=3))
+    monkeypatch.setattr(time, "time", lambda: 4_000_000_000)
+    db.rename_session("s1", SessionType.AGENT, "Renamed")
+    sessions, _ = db.get_sessions(user_id="bob", sort_by="updated_at", sort_order="desc", deserialize=False)
+    assert sessions[0]["session_data"]["session_name"] == "Renamed"
+
+
+def test_concurrent_updates_of_a_record_keep_the_indexes_consistent(client, db):
+    db.upsert_session(_agent_session("s1", "alice"))
+
+    # Another client moves the session to bob while this one reads the indexes it is in
+    other_db = RedisDb(redis_client=client)  # type: ignore[arg-type]
+    client.after_next_read = lambda: other_db.upsert_session(_agent_session("s1", "bob"))
+    db.upsert_session(_agent_session("s1", "carol"))
+
+    def ids(user_id):
+        sessions, _ = db.get_sessions(session_type=SessionType.AGENT, user_id=user_id, deserialize=False)
+        return [session["session_id"] for session in sessions]
+
+    assert (ids("alice"), ids("bob"), ids("carol")) == ([], [], ["s1"])
+
+
+def test_deletes_remove_legacy_index_entries(client, db):
+    # Per-field sets written before the sorted set indexes
+    client.sadd("agno:sessions:index:user_id:alice", "s1")
+    client.sadd("agno:memories:index:user_id:alice", "m1")
+    db.upsert_session(_agent_session("s1", "alice"))
+    db.upsert_user_memory(UserMemory(memory_id="m1", memory="Likes tea", user_id="alice"))
+
+    db.delete_session("s1")
+    db.delete_user_memories(["m1"])
+
+    assert not any(client.sets.values())
+
+
+def test_expired_records_are_dropped_from_the_indexes(client, db):
+    db.upsert_session(_agent_session("s1", "alice", created_at=1))
+    db.upsert_session(_agent_session("s2", "alice", created_at=2))
+    # Expired through its TTL: the record is gone but the indexes still reference it
+    del client.strings["agno:sessions:s1"]
+
+    sessions, total = db.get_sessions(session_type=SessionType.AGENT, user_id="alice", deserialize=False)
+
+    assert ([session["session_id"] for session in sessions], total) == (["s2"], 1)
+    assert db.get_sessions(session_type=SessionType.AGENT, user_id="alice", deserialize=False)[1] == 1
+
+
+def test_existing_records_are_indexed_once(client):
+    now = int(time.time())
+    for i in range(3):
+        record = {"session_id": f"old{i}", "session_type": "agent", "agent_id": "agent", "user_id": "alice"}
+        client.set(f"agno:sessions:old{i}", serialize_data({**record, "created_at": now + i, "updated_at": now + i}))
+
+    db = RedisDb(redis_client=client)  # type: ignore[arg-type]
+    sessions, total = db.get_sessions(session_type=SessionType.AGENT, user_id="alice", deserialize=False)
+    assert total == 3
+
+    # Another client on the same database does not rebuild the indexes
+    client.scans = 0
+    other_db = RedisDb(redis_client=client)  # type: ignore[arg-type]
+    assert other_db.get_sessions(session_type=SessionType.AGENT, deserialize=False)[1] == 3
+    assert client.scans == 0
+
+
+def test_user_memories_are_listed_from_the_indexes(client, db):
+    for i in range(10):
+        db.upsert_user_memory(
+            UserMemory(
+                memory_id=f"m{i}",
+                memory=f"Memory {i}",
+                user_id="alice" if i % 2 else "bob",
+                agent_id="agent",
+                topics=["food"] if i < 4 else ["travel"],
+            )
+        )
+
+    memories, total = db.get_user_memories(user_id="alice", limit=2, sort_by="created_at", deserialize=False)
+    assert total == 5
+    assert len(memories) == 2
+
+    food = db.get_user_memories(user_id="alice", agent_id="agent", topics=["food"])
+    assert sorted(memory.memory_id for memory in food) == ["m1", "m3"]
+
+    db.delete_user_memory("m1")
+    assert [memory.memory_id for memory in db.get_user_memories(user_id="alice", search_content="memory 3")] == ["m3"]
+
+    db.clear_memories()
+    assert db.get_user_memories(user_id="alice", deserialize=False) == ([], 0)
+    assert not any(":memories:" in key for key in list(client.zsets) + list(client.hashes))
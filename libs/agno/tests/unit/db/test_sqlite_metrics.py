@@ -0,0 +1,120 @@
+"""Tests for the daily metrics rollups calculated by SqliteDb.calculate_metrics."""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from agno.db.sqlite import SqliteDb
+from agno.run.agent import RunOutput
+from agno.run.team import TeamRunOutput
+from agno.session import AgentSession, TeamSession
+
+DAY = 86400
+
+
+@pytest.fixture
+def db(tmp_path):
+    return SqliteDb(db_file=str(tmp_path / "metrics.db"))
+
+
+def agent_session(session_id: str, created_at: int, user_id: str = "alice", num_runs: int = 1, input_tokens: int = 10):
+    runs = [
+        RunOutput(run_id=f"{session_id}-{i}", agent_id="agent", model="gpt-4o", model_provider="OpenAI")
+        for i in range(num_runs)
+    ]
+    return AgentSession(
+        session_id=session_id,
+        agent_id="agent",
+        user_id=user_id,
+        runs=runs,
+        session_data={"session_metrics": {"input_tokens": input_tokens, "total_tokens": input_tokens + 1}},
+        created_at=created_at,
+    )
+
+
+def metrics_by_date(db: SqliteDb):
+    metrics, _ = db.get_metrics()
+    return {row["date"]: row for row in metrics}
+
+
+def test_metrics_are_aggregated_per_day(db):
+    now = int(time.time())
+    today = datetime.now(timezone.utc).date()
+    db.upsert_session(agent_session("a1", now - 2 * DAY, user_id="alice", num_runs=2, input_tokens=10))
+    db.upsert_session(agent_session("a2", now - 2 * DAY, user_id="bob", input_tokens=5))
+    db.upsert_session(agent_session("a3", now, user_id="alice"))
+    db.upsert_session(
+        TeamSession(
+            session_id="t1",
+            team_id="team",
+            user_id="carol",
+            runs=[TeamRunOutput(run_id="t1-0", team_id="team", model="claude", model_provider="Anthropic")],
+            created_at=now,
+        )
+    )
+
+    results = db.calculate_metrics()
+
+    assert len(results) == 2
+    metrics = metrics_by_date(db)
+    two_days_ago = metrics[today - timedelta(days=2)]
+    assert two_days_ago["completed"] is True
+    assert two_days_ago["agent_sessions_count"] == 2
+    assert two_days_ago["agent_runs_count"] == 3
+    assert two_days_ago["users_count"] == 2
+    assert two_days_ago["token_metrics"]["input_tokens"] == 15
+    assert two_days_ago["token_metrics"]["total_tokens"] == 17
+    assert two_days_ago["model_metrics"] == [{"model_id": "gpt-4o", "model_provider": "OpenAI", "count": 3}]
+
+    current = metrics[today]
+    assert current["completed"] is False
+    assert (current["agent_sessions_count"], current["team_sessions_count"]) == (1, 1)
+    assert (current["agent_runs_count"], current["team_runs_count"]) == (1, 1)
+    assert current["users_count"] == 2
+    assert sorted(current["model_metrics"], key=lambda model: model["model_id"]) == [
+        {"model_id": "claude", "model_provider": "Anthropic", "count": 1},
+        {"model_id": "gpt-4o", "model_provider": "OpenAI", "count": 1},
+    ]
+
+
+def test_completed_days_are_only_recalculated_when_their_sessions_change(db):
+    now = int(time.time())
+    today = datetime.now(timezone.utc).date()
+    db.upsert_session(agent_session("old", now - 3 * DAY))
+    db.upsert_session(agent_session("new", now))
+    db.calculate_metrics()
+
+    # Nothing changed: only the incomplete current day is calculated again
+    results = db.calculate_metrics()
+    assert [row["date"] for row in results] == [today]
+
+    # A completed day is updated when one of its sessions gets a new run
+    db.upsert_session(agent_session("old", now - 3 * DAY, num_runs=3))
+    results = db.calculate_metrics()
+
+    assert sorted(row["date"] for row in results) == [today - timedelta(days=3), today]
+    assert metrics_by_date(db)[today - timedelta(days=3)]["agent_runs_count"] == 3
+
+
+def test_runs_in_the_runs_table_are_counted_once(tmp_path):
+    db = SqliteDb(db_file=str(tmp_path / "metrics.db"), append_only_runs=True)
+    now = int(time.time())
+    session = agent_session("a1", now, num_runs=2)
+    db.upsert_session(session)
+    session.upsert_run(RunOutput(run_id="a1-2", agent_id="agent", model="gpt-4o-mini", model_provider="OpenAI"))
+    db.upsert_session(session)
+
+    db.calculate_metrics()
+
+    current = metrics_by_date(db)[datetime.now(timezone.utc).date()]
+    assert current["agent_runs_count"] == 3
+    assert sorted((model["model_id"], model["count"]) for model in current["model_metrics"]) == [
+        ("gpt-4o", 2),
+        ("gpt-4o-mini", 1),
+    ]
+
+
+def test_no_sessions_means_no_metrics(db):
+    assert db.calculate_metrics() is None
+    assert db.get_metrics() == ([], None)
@@ -0,0 +1,141 @@
+"""Tests for storing session runs in their own table with SqliteDb(append_only_runs=True)."""
+
+import time
+
+import pytest
+from sqlalchemy import func, select
+
+from agno.db.base import SessionType
+from agno.db.sqlite import SqliteDb
+from agno.run.agent import RunOutput
+from agno.run.base import RunStatus
+from agno.run.workflow import WorkflowRunOutput
+from agno.session import AgentSession, WorkflowSession
+
+
+@pytest.fixture
+def db(tmp_path):
+    return SqliteDb(db_file=str(tmp_path / "sessions.db"), append_only_runs=True)
+
+
+def make_run(run_id: str, status: RunStatus = RunStatus.completed, agent_id: str = "agent") -> RunOutput:
+    return RunOutput(run_id=run_id, agent_id=agent_id, session_id="s1", content=run_id, status=status)
+
+
+def make_session(*run_ids: str) -> AgentSession:
+    session = AgentSession(session_id="s1", agent_id="agent", session_data={}, created_at=int(time.time()))
+    for run_id in run_ids:
+        session.upsert_run(make_run(run_id))
+    return session
+
+
+def count_rows(db: SqliteDb, table_type: str) -> int:
+    table = db._get_table(table_type=table_type)
+    with db.Session() as sess:
+        return sess.execute(select(func.count()).select_from(table)).scalar()
+
+
+def test_runs_are_stored_in_their_own_rows(db):
+    db.upsert_session(make_session("r1", "r2"))
+
+    loaded = db.get_session(session_id="s1", session_type=SessionType.AGENT)
+
+    assert [run.run_id for run in loaded.runs] == ["r1", "r2"]
+    assert count_rows(db, "runs") == 2
+    raw = db.get_session(session_id="s1", session_type=SessionType.AGENT, deserialize=False)
+    assert [run["run_id"] for run in raw["runs"]] == ["r1", "r2"]
+
+
+def test_only_new_and_updated_runs_are_written(db):
+    db.upsert_session(make_session("r1", "r2"))
+    session = db.get_session(session_id="s1", session_type=SessionType.AGENT)
+    assert session._unsaved_run_ids == set()
+
+    session.upsert_run(make_run("r3"))
+    updated = make_run("r1")
+    updated.content = "updated"
+    session.upsert_run(updated)
+    assert session._unsaved_run_ids == {"r1", "r3"}
+
+    db.upsert_session(session)
+
+    assert session._unsaved_run_ids == set()
+    loaded = db.get_session(session_id="s1", session_type=SessionType.AGENT)
+    assert [run.run_id for run in loaded.runs] == ["r1", "r2", "r3"]
+    assert loaded.runs[0].content == "updated"
+
+
+def test_num_history_runs_reads_last_usable_runs(db):
+    session = make_session("r1", "r2")
+    session.upsert_run(make_run("r3", status=RunStatus.error))
+    session.upsert_run(make_run("r4"))
+    db.upsert_session(session)
+
+    loaded = db.get_session(session_id="s1", session_type=SessionType.AGENT, num_history_runs=2)
+
+    assert [run.run_id for run in loaded.runs] == ["r2", "r4"]
+
+
+def test_num_history_runs_skips_runs_of_other_agents(db):
+    session = make_session("r1", "r2")
+    session.upsert_run(make_run("other", agent_id="other-agent"))
+    db.upsert_session(session)
+
+    loaded = db.get_session(session_id="s1", session_type=SessionType.AGENT, num_history_runs=2)
+
+    assert [run.run_id for run in loaded.runs] == ["r1", "r2"]
+
+
+def test_positions_are_generated_in_insertion_order(db):
+    db.upsert_session(make_session("r1", "r2"))
+    session = db.get_session(session_id="s1", session_type=SessionType.AGENT)
+    session.upsert_run(make_run("r3"))
+    updated = make_run("r1")
+    updated.content = "updated"
+    session.upsert_run(updated)
+    db.upsert_session(session)
+
+    table = db._get_table(table_type="runs")
+    with db.Session() as sess:
+        rows = sess.execute(select(table.c.run_id).order_by(table.c.position)).fetchall()
+    assert [row[0] for row in rows] == ["r1", "r2", "r3"]
+
+
+def test_legacy_runs_are_moved_to_runs_table(tmp_path):
+    db_file = str(tmp_path / "sessions.db")
+    SqliteDb(db_file=db_file).upsert_session(make_session("r1", "r2"))
+
+    db = SqliteDb(db_file=db_file, append_only_runs=True)
+    session = db.get_session(session_id="s1", session_type=SessionType.AGENT, num_history_runs=1)
+    assert [run.run_id for run in session.runs] == ["r1", "r2"]
+
+    session.upsert_run(make_run("r3"))
+    db.upsert_session(session)
+
+    assert count_rows(db, "runs") == 3
+    table = db._get_table(table_type="sessions")
+    with db.Session() as sess:
+        assert sess.execute(select(table.c.runs)).scalar() in (None, "null")
+    loaded = db.get_session(session_id="s1", session_type=SessionType.AGENT)
+    assert [run.run_id for run in loaded.runs] == ["r1", "r2", "r3"]
+
+
+def test_workflow_runs_are_always_written(db):
+    session = WorkflowSession(session_id="w1", workflow_id="workflow", session_data={}, created_at=int(time.time()))
+    run = WorkflowRunOutput(run_id="wr1", workflow_id="workflow", session_id="w1", content="first")
+    session.upsert_run(run)
+    db.upsert_session(session)
+
+    run.content = "second"
+    db.upsert_session(session)
+
+    loaded = db.get_session(session_id="w1", session_type=SessionType.WORKFLOW)
+    assert [r.content for r in loaded.runs] == ["second"]
+
+
+def test_delete_session_removes_runs(db):
+    db.upsert_session(make_session("r1", "r2"))
+
+    db.delete_session("s1")
+
+    assert count_rows(db, "runs") == 0
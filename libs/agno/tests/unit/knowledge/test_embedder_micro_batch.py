@@ -0,0 +1,99 @@
+"""Tests for batching concurrent embedding requests."""
+
+import asyncio
+import threading
+import time
+from typing import List
+
+import pytest
+
+from agno.knowledge.embedder.micro_batch import MicroBatcher
+
+
+class FakeModel:
+    """Embeds a text as its length, recording the size of every batch."""
+
+    def __init__(self):
+        self.batches: List[List[str]] = []
+
+    def encode(self, texts: List[str]) -> List[List[float]]:
+        self.batches.append(texts)
+        return [[float(len(text))] for text in texts]
+
+
+async def test_concurrent_requests_are_embedded_in_one_batch():
+    model = FakeModel()
+    batcher = MicroBatcher(model.encode, max_batch_size=32, max_wait_ms=20)
+
+    texts = [f"text {'x' * i}" for i in range(10)]
+    embeddings = await asyncio.gather(*(batcher.embed(text) for text in texts))
+
+    assert embeddings == [[float(len(text))] for text in texts]
+    assert model.batches == [texts]
+
+
+async def test_batches_are_split_at_the_max_batch_size():
+    model = FakeModel()
+    batcher = MicroBatcher(model.encode, max_batch_size=4, max_wait_ms=1000)
+
+    start = time.monotonic()
+    await asyncio.gather(*(batcher.embed(str(i)) for i in range(8)))
+
+    # Full batches don't wait for the window
+    assert time.monotonic() - start < 0.5
+    assert [len(batch) for batch in model.batches] == [4, 4]
+
+
+async def test_a_single_request_waits_at_most_the_window():
+    model = FakeModel()
+    batcher = MicroBatcher(model.encode, max_batch_size=32, max_wait_ms=20)
+
+    start = time.monotonic()
+    assert await batcher.embed("hello") == [5.0]
+
+    assert time.monotonic() - start < 0.5
+    assert model.batches == [["hello"]]
+
+
+async def test_errors_are_raised_for_every_request_in_the_batch():
+    def failing_encode(texts):
+        raise RuntimeError("model failed")
+
+    batcher = MicroBatcher(failing_encode, max_wait_ms=5)
+
+    results = await asyncio.gather(batcher.embed("a"), batcher.embed("b"), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_batches_run_off_the_event_loop():
+    loop_thread = threading.get_ident()
+    threads = []
+
+    def encode(texts):
+        threads.append(threading.get_ident())
+        return [[0.0] for _ in texts]
+
+    batcher = MicroBatcher(encode, max_wait_ms=1)
+    await batcher.embed("a")
+
+    assert threads and threads[0] != loop_thread
+
+
+def test_requests_on_different_event_loops_are_not_mixed():
+    model = FakeModel()
+    batcher = MicroBatcher(model.encode, max_wait_ms=5)
+
+    assert asyncio.run(batcher.embed("first")) == [5.0]
+    assert asyncio.run(batcher.embed("second")) == [6.0]
+    assert model.batches == [["first"], ["second"]]
+
+
+@pytest.mark.parametrize("max_batch_size", [0, 1])
+async def test_batch_size_of_one_embeds_every_request_alone(max_batch_size):
+    model = FakeModel()
+    batcher = MicroBatcher(model.encode, max_batch_size=max_batch_size, max_wait_ms=1000)
+
+    await asyncio.gather(batcher.embed("a"), batcher.embed("b"))
+
+    assert model.batches == [["a"], ["b"]]
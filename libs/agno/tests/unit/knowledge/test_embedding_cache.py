@@ -0,0 +1,149 @@
+"""Tests for the content-addressed EmbeddingCache shared by Embedder implementations."""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.embedder.cache import EmbeddingCache
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    id: str = "counting-model"
+    dimensions: Optional[int] = 3
+    calls: List[str] = field(default_factory=list)
+
+    def _vector(self, text: str) -> List[float]:
+        return [float(len(text)), 1.0, 0.5]
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.calls.append(text)
+        return self._vector(text)
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.calls.append(text)
+        return self._vector(text), {"total_tokens": 1}
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        self.calls.append(text)
+        return self._vector(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.calls.append(text)
+        return self._vector(text), {"total_tokens": 1}
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.calls.extend(texts)
+        return [self._vector(text) for text in texts], [{"total_tokens": 1} for _ in texts]
+
+
+@dataclass
+class FailingEmbedder(CountingEmbedder):
+    def get_embedding(self, text: str) -> List[float]:
+        self.calls.append(text)
+        return []
+
+
+def test_embedder_without_cache_always_computes():
+    embedder = CountingEmbedder()
+    embedder.get_embedding("hello")
+    embedder.get_embedding("hello")
+    assert embedder.calls == ["hello", "hello"]
+
+
+def test_get_embedding_is_cached():
+    cache = EmbeddingCache()
+    embedder = CountingEmbedder(embedding_cache=cache)
+
+    first = embedder.get_embedding("hello")
+    second = embedder.get_embedding("hello")
+
+    assert first == second
+    assert embedder.calls == ["hello"]
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_cache_hit_reports_no_usage():
+    embedder = CountingEmbedder(embedding_cache=EmbeddingCache())
+
+    _, usage = embedder.get_embedding_and_usage("hello")
+    embedding, cached_usage = embedder.get_embedding_and_usage("hello")
+
+    assert usage == {"total_tokens": 1}
+    assert cached_usage is None
+    assert embedding == [5.0, 1.0, 0.5]
+
+
+def test_cache_is_namespaced_by_model_and_dimensions():
+    cache = EmbeddingCache()
+    small = CountingEmbedder(embedding_cache=cache, id="small")
+    large = CountingEmbedder(embedding_cache=cache, id="large")
+    wide = CountingEmbedder(embedding_cache=cache, id="small", dimensions=6)
+
+    small.get_embedding("hello")
+    large.get_embedding("hello")
+    wide.get_embedding("hello")
+
+    assert small.calls == ["hello"]
+    assert large.calls == ["hello"]
+    assert wide.calls == ["hello"]
+
+
+def test_empty_embeddings_are_not_cached():
+    embedder = FailingEmbedder(embedding_cache=EmbeddingCache())
+    embedder.get_embedding("hello")
+    embedder.get_embedding("hello")
+    assert embedder.calls == ["hello", "hello"]
+
+
+def test_lru_tier_evicts_oldest_entries():
+    cache = EmbeddingCache(max_entries=2)
+    embedder = CountingEmbedder(embedding_cache=cache)
+
+    for text in ["a", "b", "c"]:
+        embedder.get_embedding(text)
+    embedder.get_embedding("a")
+
+    assert len(cache) == 2
+    assert embedder.calls == ["a", "b", "c", "a"]
+
+
+def test_persistent_tier_survives_new_cache(tmp_path):
+    db_path = tmp_path / "cache" / "embeddings.db"
+    embedder = CountingEmbedder(embedding_cache=EmbeddingCache(db_path=db_path))
+    embedder.get_embedding("hello")
+    embedder.embedding_cache.close()
+
+    reopened = CountingEmbedder(embedding_cache=EmbeddingCache(db_path=db_path))
+    embedding = reopened.get_embedding("hello")
+
+    assert reopened.calls == []
+    assert embedding == pytest.approx([5.0, 1.0, 0.5])
+
+
+async def test_async_embedding_is_cached():
+    embedder = CountingEmbedder(embedding_cache=EmbeddingCache())
+
+    await embedder.async_get_embedding("hello")
+    embedding, usage = await embedder.async_get_embedding_and_usage("hello")
+
+    assert embedder.calls == ["hello"]
+    assert usage is None
+    assert embedding == [5.0, 1.0, 0.5]
+
+
+async def test_batch_only_embeds_changed_texts():
+    embedder = CountingEmbedder(embedding_cache=EmbeddingCache())
+    await embedder.async_get_embeddings_batch_and_usage(["one", "two"])
+    embedder.calls.clear()
+
+    embeddings, usages = await embedder.async_get_embeddings_batch_and_usage(["one", "three", "two", "three"])
+
+    assert embedder.calls == ["three"]
+    assert [embedding[0] for embedding in embeddings] == [3.0, 5.0, 3.0, 5.0]
+    assert usages == [None, {"total_tokens": 1}, None, {"total_tokens": 1}]
@@ -2048,3 +2048,45 @@ def test_excel_reader_xls_encoding_parameter_passed_to_xlrd(tmp_path: Path):
     assert len(docs) == 1
     assert "name" in docs[0].content
     assert "test" in docs[0].content
+
+
+def test_excel_reader_iter_read_yields_windows_of_rows(tmp_path: Path):
+    openpyxl = pytest.importorskip("openpyxl")
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Data"
+    sheet.append(["id", "value"])
+    for i in range(11):
+        sheet.append([i, f"value {i}"])
+    workbook.create_sheet("Empty")
+    file_path = tmp_path / "large.xlsx"
+    workbook.save(file_path)
+    workbook.close()
+
+    reader = ExcelReader(rows_per_window=5, chunk=False)
+    batches = list(reader.iter_read(file_path))
+
+    assert [[doc.meta_data for doc in batch] for batch in batches] == [
+        [{"sheet_name": "Data", "sheet_index": 1, "start_row": 1, "rows": 5}],
+        [{"sheet_name": "Data", "sheet_index": 1, "start_row": 6, "rows": 5}],
+        [{"sheet_name": "Data", "sheet_index": 1, "start_row": 11, "rows": 2}],
+    ]
+    assert "\n".join(batch[0].content for batch in batches) == reader.read(file_path)[0].content
+
+
+@pytest.mark.asyncio
+async def test_excel_reader_async_iter_read_matches_iter_read(tmp_path: Path):
+    openpyxl = pytest.importorskip("openpyxl")
+
+    workbook = openpyxl.Workbook()
+    for i in range(7):
+        workbook.active.append([i])
+    file_path = tmp_path / "small.xlsx"
+    workbook.save(file_path)
+    workbook.close()
+
+    reader = ExcelReader(rows_per_window=3, chunk=False)
+    batches = [batch async for batch in reader.async_iter_read(file_path)]
+
+    assert [batch[0].content for batch in batches] == ["0\n1\n2", "3\n4\n5", "6"]
@@ -0,0 +1,210 @@
+"""Tests for incremental re-indexing of paths with Knowledge.insert(incremental=True)."""
+
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.db.sqlite import SqliteDb
+from agno.knowledge.chunking.document import DocumentChunking
+from agno.knowledge.content import ContentStatus
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.fingerprint import CHUNK_DIGEST_METADATA_KEY
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.reader.base import Reader
+from agno.vectordb.numpydb import NumpyDb
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    dimensions: Optional[int] = 2
+    calls: List[str] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.calls.append(text)
+        return [float(len(text)), 1.0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+class ParagraphReader(Reader):
+    """Reads one document per paragraph, so each paragraph is a chunk."""
+
+    def __init__(self):
+        super().__init__(chunk=False)
+        self.reads: List[str] = []
+
+    def read(self, obj, name=None, password=None) -> List[Document]:
+        self.reads.append(obj.name)
+        return [Document(name=name, content=paragraph) for paragraph in obj.read_text().split("\n\n") if paragraph]
+
+    async def async_read(self, obj, name=None, password=None) -> List[Document]:
+        return self.read(obj, name=name, password=password)
+
+
+class ChunkingReader(Reader):
+    """Reads a file as one document without an id, so its chunker gives the chunks positional ids."""
+
+    def __init__(self):
+        # One paragraph per chunk
+        super().__init__(chunking_strategy=DocumentChunking(chunk_size=12))
+
+    def read(self, obj, name=None, password=None) -> List[Document]:
+        return self.chunk_document(Document(name=obj.stem, content=obj.read_text()))
+
+    async def async_read(self, obj, name=None, password=None) -> List[Document]:
+        return self.read(obj, name=name, password=password)
+
+
+@pytest.fixture
+def setup(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.txt").write_text("alpha one\n\nalpha two")
+    (docs / "b.txt").write_text("bravo")
+    embedder = CountingEmbedder()
+    reader = ParagraphReader()
+    knowledge = Knowledge(
+        vector_db=NumpyDb(collection="docs", path=None, embedder=embedder),
+        contents_db=SqliteDb(db_file=str(tmp_path / "contents.db")),
+    )
+    return knowledge, docs, embedder, reader
+
+
+def stored_chunks(knowledge: Knowledge) -> List[str]:
+    return sorted(doc.content for doc in knowledge.vector_db.search("x", limit=100))
+
+
+def test_unchanged_files_are_skipped(setup):
+    knowledge, docs, embedder, reader = setup
+    knowledge.insert(path=str(docs), reader=reader, incremental=True)
+    assert sorted(reader.reads) == ["a.txt", "b.txt"]
+
+    reader.reads.clear()
+    embedder.calls.clear()
+    knowledge.insert(path=str(docs), reader=reader, incremental=True)
+
+    assert reader.reads == []
+    assert embedder.calls == []
+    assert stored_chunks(knowledge) == ["alpha one", "alpha two", "bravo"]
+
+
+def test_changed_file_only_embeds_changed_chunks(setup):
+    knowledge, docs, embedder, reader = setup
+    knowledge.insert(path=str(docs), reader=reader, incremental=True)
+
+    (docs / "a.txt").write_text("alpha one\n\nalpha three")
+    reader.reads.clear()
+    embedder.calls.clear()
+    knowledge.insert(path=str(docs), reader=reader, incremental=True)
+
+    assert reader.reads == ["a.txt"]
+    assert embedder.calls == ["alpha three"]
+    assert stored_chunks(knowledge) == ["alpha one", "alpha three", "bravo"]
+    assert all(CHUNK_DIGEST_METADATA_KEY in doc.meta_data for doc in knowledge.vector_db.search("x", limit=100))
+
+
+def test_touched_file_with_same_bytes_is_not_reread(setup):
+    knowledge, docs, embedder, reader = setup
+    knowledge.insert(path=str(docs), reader=reader, incremental=True)
+
+    stat = (docs / "b.txt").stat()
+    os.utime(docs / "b.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+    reader.reads.clear()
+    knowledge.insert(path=str(docs), reader=reader, incremental=True)
+
+    assert reader.reads == []
+
+
+def test_deleted_files_are_removed(setup):
+    knowledge, docs, embedder, reader = setup
+    knowledge.insert(path=str(docs), reader=reader, incremental=True)
+
+    (docs / "b.txt").unlink()
+    knowledge.insert(path=str(docs), reader=reader, incremental=True)
+
+    contents, _ = knowledge.get_content()
+    assert [content.name for content in contents] == ["a.txt"]
+    assert stored_chunks(knowledge) == ["alpha one", "alpha two"]
+
+
+def test_fingerprint_is_hidden_from_content_metadata(setup):
+    knowledge, docs, embedder, reader = setup
+    knowledge.insert(path=str(docs), reader=reader, metadata={"team": "docs"}, incremental=True)
+
+    contents, _ = knowledge.get_content()
+
+    assert all(content.metadata == {"team": "docs"} for content in contents)
+    assert all(content.fingerprint is not None and content.fingerprint.chunks for content in contents)
+    assert knowledge.get_valid_filters() == {"team"}
+
+
+def test_metadata_change_reindexes_file(setup):
+    knowledge, docs, embedder, reader = setup
+    knowledge.insert(path=str(docs / "b.txt"), reader=reader, metadata={"v": 1}, incremental=True)
+    reader.reads.clear()
+
+    knowledge.insert(path=str(docs / "b.txt"), reader=reader, metadata={"v": 2}, incremental=True)
+
+    assert reader.reads == ["b.txt"]
+    results = knowledge.vector_db.search("x", limit=100)
+    assert [doc.meta_data["v"] for doc in results] == [2]
+
+
+def test_failed_content_is_retried(setup):
+    knowledge, docs, embedder, reader = setup
+    knowledge.insert(path=str(docs / "b.txt"), reader=reader, incremental=True)
+    contents, _ = knowledge.get_content()
+    content = contents[0]
+    content.status = ContentStatus.FAILED
+    knowledge.patch_content(content)
+    reader.reads.clear()
+
+    knowledge.insert(path=str(docs / "b.txt"), reader=reader, incremental=True)
+
+    assert reader.reads == ["b.txt"]
+    assert knowledge.get_content_status(content.id)[0] == ContentStatus.COMPLETED
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+async def test_new_chunks_do_not_overwrite_chunks_with_the_same_position(setup, use_async):
+    knowledge, docs, embedder, _ = setup
+    reader = ChunkingReader()
+    (docs / "a.txt").write_text("para one\n\npara two\n\npara three")
+    insert = knowledge.ainsert if use_async else knowledge.insert
+
+    result = insert(path=str(docs / "a.txt"), reader=reader, incremental=True)
+    if use_async:
+        await result
+    (docs / "a.txt").write_text("para zero\n\npara one\n\npara two\n\npara three")
+    embedder.calls.clear()
+    result = insert(path=str(docs / "a.txt"), reader=reader, incremental=True)
+    if use_async:
+        await result
+
+    assert embedder.calls == ["para zero"]
+    assert stored_chunks(knowledge) == ["para one", "para three", "para two", "para zero"]
+
+
+async def test_async_incremental_insert(setup):
+    knowledge, docs, embedder, reader = setup
+    await knowledge.ainsert(path=str(docs), reader=reader, incremental=True)
+
+    (docs / "a.txt").write_text("alpha one")
+    (docs / "c.txt").write_text("charlie")
+    reader.reads.clear()
+    embedder.calls.clear()
+    await knowledge.ainsert(path=str(docs), reader=reader, incremental=True)
+
+    assert sorted(reader.reads) == ["a.txt", "c.txt"]
+    assert embedder.calls == ["charlie"]
+    assert stored_chunks(knowledge) == ["alpha one", "bravo", "charlie"]
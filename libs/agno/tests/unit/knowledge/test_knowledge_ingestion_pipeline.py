@@ -0,0 +1,332 @@
+"""Tests for concurrent bulk ingestion with IngestionPipeline."""
+
+import asyncio
+import threading
+import time
+from typing import AsyncIterator, Iterator, List, Optional
+
+import pytest
+
+from agno.knowledge.content import ContentStatus
+from agno.knowledge.document.base import Document
+from agno.knowledge.ingestion import IngestionPipeline
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.reader.base import Reader
+from agno.vectordb.base import VectorDb
+
+
+class RecordingVectorDb(VectorDb):
+    """VectorDb stub that records inserts and tracks write concurrency."""
+
+    def __init__(self, delay: float = 0.02, fail_on: str = "", upserts: bool = False):
+        super().__init__()
+        self.delay = delay
+        self.fail_on = fail_on
+        self.upserts = upserts
+        self.inserted = []
+        self.deleted_content_ids: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _enter(self):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _exit(self, documents):
+        with self._lock:
+            self.in_flight -= 1
+            self.inserted.extend(doc.content for doc in documents)
+
+    def _check(self, documents):
+        if self.fail_on and any(self.fail_on in doc.content for doc in documents):
+            raise RuntimeError("embedding failed")
+
+    def create(self) -> None:
+        pass
+
+    async def async_create(self) -> None:
+        pass
+
+    def name_exists(self, name: str) -> bool:
+        return False
+
+    def async_name_exists(self, name: str) -> bool:
+        return False
+
+    def id_exists(self, id: str) -> bool:
+        return False
+
+    def content_hash_exists(self, content_hash: str) -> bool:
+        return False
+
+    def insert(self, content_hash: str, documents, filters=None) -> None:
+        self._check(documents)
+        self._enter()
+        time.sleep(self.delay)
+        self._exit(documents)
+
+    async def async_insert(self, content_hash: str, documents, filters=None) -> None:
+        self._check(documents)
+        self._enter()
+        await asyncio.sleep(self.delay)
+        self._exit(documents)
+
+    def upsert_available(self) -> bool:
+        return self.upserts
+
+    def upsert(self, content_hash: str, documents, filters=None) -> None:
+        self.insert(content_hash, documents, filters)
+
+    async def async_upsert(self, content_hash: str, documents, filters=None) -> None:
+        await self.async_insert(content_hash, documents, filters)
+
+    def search(self, query: str, limit: int = 5, filters=None):
+        return []
+
+    async def async_search(self, query: str, limit: int = 5, filters=None):
+        return []
+
+    def drop(self) -> None:
+        pass
+
+    async def async_drop(self) -> None:
+        pass
+
+    def exists(self) -> bool:
+        return True
+
+    async def async_exists(self) -> bool:
+        return True
+
+    def delete(self) -> bool:
+        return True
+
+    def delete_by_id(self, id: str) -> bool:
+        return True
+
+    def delete_by_name(self, name: str) -> bool:
+        return True
+
+    def delete_by_metadata(self, metadata) -> bool:
+        return True
+
+    def update_metadata(self, content_id: str, metadata) -> None:
+        pass
+
+    def delete_by_content_id(self, content_id: str) -> bool:
+        self.deleted_content_ids.append(content_id)
+        return True
+
+    def get_supported_search_types(self):
+        return ["vector"]
+
+
+def test_pipeline_rejects_invalid_limits():
+    with pytest.raises(ValueError):
+        IngestionPipeline(max_concurrency=0)
+    with pytest.raises(ValueError):
+        IngestionPipeline(write_concurrency=0)
+
+
+def test_insert_many_with_pipeline_inserts_all_items():
+    vector_db = RecordingVectorDb()
+    knowledge = Knowledge(vector_db=vector_db)
+    texts = [f"document {i}" for i in range(12)]
+
+    knowledge.insert_many(text_contents=texts, pipeline=IngestionPipeline(max_concurrency=4))
+
+    assert sorted(vector_db.inserted) == sorted(texts)
+    assert vector_db.max_in_flight > 1
+
+
+def test_insert_many_respects_write_concurrency():
+    vector_db = RecordingVectorDb()
+    knowledge = Knowledge(vector_db=vector_db)
+
+    knowledge.insert_many(
+        text_contents=[f"document {i}" for i in range(10)],
+        pipeline=IngestionPipeline(max_concurrency=8, write_concurrency=2),
+    )
+
+    assert len(vector_db.inserted) == 10
+    assert vector_db.max_in_flight <= 2
+
+
+def test_insert_many_reports_progress_per_content():
+    vector_db = RecordingVectorDb(fail_on="bad")
+    knowledge = Knowledge(vector_db=vector_db)
+    reported = []
+    lock = threading.Lock()
+
+    def on_progress(content):
+        with lock:
+            reported.append((content.name, content.status))
+
+    knowledge.insert_many(
+        [{"name": f"doc_{i}", "text_content": f"good {i}"} for i in range(5)]
+        + [{"name": "doc_bad", "text_content": "bad"}],
+        pipeline=IngestionPipeline(max_concurrency=3, on_progress=on_progress),
+    )
+
+    assert len(reported) == 6
+    statuses = dict(reported)
+    assert statuses["doc_bad"] == ContentStatus.FAILED
+    assert all(statuses[f"doc_{i}"] == ContentStatus.COMPLETED for i in range(5))
+
+
+async def test_ainsert_many_with_pipeline_runs_concurrently():
+    vector_db = RecordingVectorDb(delay=0.05)
+    knowledge = Knowledge(vector_db=vector_db)
+    reported = []
+
+    await knowledge.ainsert_many(
+        text_contents=[f"document {i}" for i in range(8)],
+        pipeline=IngestionPipeline(max_concurrency=4, write_concurrency=3, on_progress=reported.append),
+    )
+
+    assert len(vector_db.inserted) == 8
+    assert 1 < vector_db.max_in_flight <= 3
+    assert len(reported) == 8
+    assert all(content.status == ContentStatus.COMPLETED for content in reported)
+
+
+async def test_ainsert_many_without_pipeline_is_sequential():
+    vector_db = RecordingVectorDb()
+    knowledge = Knowledge(vector_db=vector_db)
+
+    await knowledge.ainsert_many(text_contents=[f"document {i}" for i in range(4)])
+
+    assert len(vector_db.inserted) == 4
+    assert vector_db.max_in_flight == 1
+
+
+class StreamingSiteReader(Reader):
+    """Reader yielding the pages of a site one at a time, like WebsiteReader(concurrent=True)."""
+
+    concurrent: bool = True
+
+    def __init__(self, pages: List[str], vector_db: RecordingVectorDb):
+        super().__init__(chunk=True)
+        self.pages = pages
+        self.vector_db = vector_db
+        self.inserted_before_page: List[int] = []
+
+    def read(self, url: str, name: Optional[str] = None) -> List[Document]:
+        raise AssertionError("Pages should be streamed")
+
+    async def async_iter_read(self, url: str, name: Optional[str] = None) -> AsyncIterator[List[Document]]:
+        for i, page in enumerate(self.pages):
+            self.inserted_before_page.append(len(self.vector_db.inserted))
+            yield [Document(name=name or url, id=f"{url}/{i}", content=page, meta_data={"url": f"{url}/{i}"})]
+
+
+async def test_crawled_pages_are_inserted_as_they_arrive():
+    vector_db = RecordingVectorDb(delay=0)
+    knowledge = Knowledge(vector_db=vector_db)
+    reader = StreamingSiteReader(["page one", "page two", "page three"], vector_db)
+
+    await knowledge.ainsert(url="https://example.com", reader=reader)
+
+    assert vector_db.inserted == ["page one", "page two", "page three"]
+    # Each page was inserted before the next one was crawled
+    assert reader.inserted_before_page == [0, 1, 2]
+
+
+class WindowedFileReader(Reader):
+    """Reader yielding the lines of a file in windows, recording how much was inserted before each window."""
+
+    streams_documents = True
+
+    def __init__(self, vector_db: RecordingVectorDb, lines_per_window: int = 2, stream_windows: bool = True):
+        super().__init__(chunk=True, stream_windows=stream_windows)
+        self.vector_db = vector_db
+        self.lines_per_window = lines_per_window
+        self.inserted_before_window: List[int] = []
+
+    def read(self, path, name: Optional[str] = None) -> List[Document]:
+        return [Document(name=path.name, content=path.read_text())]
+
+    async def async_read(self, path, name: Optional[str] = None) -> List[Document]:
+        return self.read(path, name=name)
+
+    def _windows(self, path):
+        lines = path.read_text().splitlines()
+        for start in range(0, len(lines), self.lines_per_window):
+            self.inserted_before_window.append(len(self.vector_db.inserted))
+            yield [Document(name=path.name, content=line) for line in lines[start : start + self.lines_per_window]]
+
+    def iter_read(self, path, name: Optional[str] = None) -> Iterator[List[Document]]:
+        yield from self._windows(path)
+
+    async def async_iter_read(self, path, name: Optional[str] = None) -> AsyncIterator[List[Document]]:
+        for documents in self._windows(path):
+            yield documents
+
+
+def test_file_windows_are_inserted_as_they_are_read(tmp_path):
+    file_path = tmp_path / "rows.txt"
+    file_path.write_text("row 1\nrow 2\nrow 3\nrow 4\nrow 5\n")
+    vector_db = RecordingVectorDb(delay=0)
+    knowledge = Knowledge(vector_db=vector_db)
+    reader = WindowedFileReader(vector_db)
+
+    knowledge.insert(path=str(file_path), reader=reader, metadata={"source": "rows"})
+
+    assert vector_db.inserted == ["row 1", "row 2", "row 3", "row 4", "row 5"]
+    # Each window was inserted before the next one was read
+    assert reader.inserted_before_window == [0, 2, 4]
+
+
+async def test_file_windows_are_inserted_as_they_are_read_async(tmp_path):
+    file_path = tmp_path / "rows.txt"
+    file_path.write_text("row 1\nrow 2\nrow 3\n")
+    vector_db = RecordingVectorDb(delay=0)
+    knowledge = Knowledge(vector_db=vector_db)
+    reader = WindowedFileReader(vector_db)
+
+    await knowledge.ainsert(path=str(file_path), reader=reader)
+
+    assert vector_db.inserted == ["row 1", "row 2", "row 3"]
+    assert reader.inserted_before_window == [0, 2]
+
+
+def test_files_are_only_streamed_when_the_reader_opts_in(tmp_path):
+    file_path = tmp_path / "rows.txt"
+    file_path.write_text("row 1\nrow 2\nrow 3\n")
+    vector_db = RecordingVectorDb(delay=0)
+    knowledge = Knowledge(vector_db=vector_db)
+    reader = WindowedFileReader(vector_db, stream_windows=False)
+
+    knowledge.insert(path=str(file_path), reader=reader)
+
+    assert vector_db.inserted == ["row 1\nrow 2\nrow 3\n"]
+    assert reader.inserted_before_window == []
+
+
+def test_upserting_a_streamed_file_replaces_its_documents(tmp_path):
+    file_path = tmp_path / "rows.txt"
+    file_path.write_text("")
+    vector_db = RecordingVectorDb(delay=0, upserts=True)
+    knowledge = Knowledge(vector_db=vector_db)
+
+    knowledge.insert(path=str(file_path), reader=WindowedFileReader(vector_db), upsert=True)
+
+    # The documents of the previous version are removed even though the file has no windows left
+    assert len(vector_db.deleted_content_ids) == 1
+    assert vector_db.inserted == []
+
+
+def test_failed_window_marks_the_content_as_failed(tmp_path):
+    file_path = tmp_path / "rows.txt"
+    file_path.write_text("row 1\nrow 2\nbad row\n")
+    vector_db = RecordingVectorDb(delay=0, fail_on="bad")
+    knowledge = Knowledge(vector_db=vector_db)
+    statuses = []
+    pipeline = IngestionPipeline(on_progress=lambda content: statuses.append(content.status))
+
+    knowledge.insert_many([{"path": str(file_path), "reader": WindowedFileReader(vector_db)}], pipeline=pipeline)
+
+    assert vector_db.inserted == ["row 1", "row 2"]
+    assert statuses == [ContentStatus.FAILED]
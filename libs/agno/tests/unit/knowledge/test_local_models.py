@@ -0,0 +1,107 @@
+"""Tests for the process-wide local model registry."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from agno.knowledge.embedder.base import Embedder
+from agno.knowledge.local_models import LocalModelRegistry, get_model_key
+from agno.knowledge.reranker.base import Reranker
+from agno.os import AgentOS
+
+
+def test_models_are_loaded_once_across_threads():
+    registry = LocalModelRegistry()
+    loads = []
+
+    def loader():
+        loads.append(threading.get_ident())
+        time.sleep(0.05)
+        return object()
+
+    key = get_model_key("cross-encoder", "BAAI/bge-reranker-v2-m3", device="cpu")
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get(key, loader))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert all(model is results[0] for model in results)
+    # The arguments a model is loaded with are part of its key
+    assert get_model_key("cross-encoder", "BAAI/bge-reranker-v2-m3", device="cuda") != key
+
+
+def test_least_recently_used_models_are_unloaded_over_the_memory_budget():
+    registry = LocalModelRegistry(max_memory_bytes=250)
+
+    def get(name: str):
+        return registry.get(name, lambda: name, size=lambda model: 100)
+
+    get("a")
+    get("b")
+    get("a")
+    get("c")
+
+    assert "b" not in registry
+    assert ("a" in registry, "c" in registry) == (True, True)
+    assert registry.memory_bytes == 200
+
+
+def test_max_models_and_idle_unloading():
+    registry = LocalModelRegistry(max_models=2)
+    for name in ("a", "b", "c"):
+        registry.get(name, lambda: name)
+
+    assert len(registry) == 2
+    assert "a" not in registry
+
+    assert registry.unload_idle(max_idle_seconds=3600) == 0
+    assert registry.unload_idle(max_idle_seconds=0) == 2
+    assert len(registry) == 0
+
+
+def test_failed_loads_are_not_cached():
+    registry = LocalModelRegistry()
+
+    def failing_loader():
+        raise OSError("model not found")
+
+    with pytest.raises(OSError):
+        registry.get("model", failing_loader)
+
+    assert registry.get("model", lambda: "loaded") == "loaded"
+
+
+class WarmupReranker(Reranker):
+    warmed_up: int = 0
+
+    def rerank(self, query, documents):
+        return documents
+
+    def warmup(self) -> None:
+        self.warmed_up += 1
+
+
+class WarmupEmbedder(Embedder):
+    def __init__(self):
+        super().__init__()
+        self.warmed_up = 0
+
+    def warmup(self) -> None:
+        self.warmed_up += 1
+
+
+def test_agent_os_warms_up_local_models_on_startup():
+    embedder, reranker = WarmupEmbedder(), WarmupReranker()
+    knowledge = SimpleNamespace(vector_db=SimpleNamespace(embedder=embedder, reranker=reranker), contents_db=None)
+    agent_os = AgentOS(knowledge=[knowledge, knowledge], warmup_local_models=True, telemetry=False)  # type: ignore[list-item]
+
+    assert (embedder.warmed_up, reranker.warmed_up) == (0, 0)
+
+    with TestClient(agent_os.get_app()):
+        assert (embedder.warmed_up, reranker.warmed_up) == (1, 1)
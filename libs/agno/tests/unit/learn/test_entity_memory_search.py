@@ -0,0 +1,105 @@
+"""Tests for the indexed EntityMemoryStore search."""
+
+import pytest
+
+from agno.db.sqlite import SqliteDb
+from agno.learn.config import EntityMemoryConfig
+from agno.learn.index import BM25Index
+from agno.learn.stores.entity_memory import EntityMemoryStore, _search_indexes
+
+
+@pytest.fixture
+def db(tmp_path):
+    return SqliteDb(db_file=str(tmp_path / "learnings.db"))
+
+
+@pytest.fixture
+def store(db):
+    return EntityMemoryStore(config=EntityMemoryConfig(db=db))
+
+
+def test_bm25_index_ranks_and_updates_documents():
+    index = BM25Index()
+    index.add("a", "postgres postgres database")
+    index.add("b", "redis cache and a postgres replica with many other words")
+    index.add("c", "kafka streams")
+
+    assert [doc_id for doc_id, _ in index.search("postgres")] == ["a", "b"]
+
+    index.add("a", "mysql database")
+    index.remove("c")
+
+    assert [doc_id for doc_id, _ in index.search("postgres")] == ["b"]
+    assert index.search("kafka") == []
+    assert len(index) == 2
+
+
+def test_search_finds_entities_beyond_the_first_rows(store):
+    for i in range(50):
+        store.create_entity(entity_id=f"company_{i}", entity_type="company", name=f"Company {i}")
+    store.add_fact(entity_id="company_3", entity_type="company", fact="Runs on PostgreSQL")
+
+    results = store.search(query="postgresql", limit=1)
+
+    assert [entity.entity_id for entity in results] == ["company_3"]
+
+
+def test_search_ranks_by_relevance_and_filters_by_type(store):
+    store.create_entity(entity_id="acme_corp", entity_type="company", name="Acme Corp", description="Rockets")
+    store.create_entity(entity_id="acme_rocket", entity_type="product", name="Acme Rocket")
+    store.create_entity(entity_id="bob", entity_type="person", name="Bob", description="Works at a bakery")
+
+    assert {entity.entity_id for entity in store.search(query="acme")} == {"acme_corp", "acme_rocket"}
+    assert [entity.entity_id for entity in store.search(query="acme", entity_type="product")] == ["acme_rocket"]
+    assert [entity.entity_id for entity in store.search(query="acme rocket")][0] == "acme_rocket"
+
+
+def test_search_index_is_updated_incrementally(db, store):
+    store.create_entity(entity_id="acme", entity_type="company", name="Acme")
+    assert store.search(query="kubernetes") == []
+
+    # Another store on the same database shares the index
+    other_store = EntityMemoryStore(config=EntityMemoryConfig(db=db))
+    other_store.add_fact(entity_id="acme", entity_type="company", fact="Deploys on Kubernetes")
+    other_store.add_event(entity_id="acme", entity_type="company", event="Raised a Series B")
+
+    assert [entity.entity_id for entity in store.search(query="kubernetes")] == ["acme"]
+    assert [entity.entity_id for entity in store.search(query="series")] == ["acme"]
+
+
+def test_search_indexes_are_bounded(db):
+    store = EntityMemoryStore(config=EntityMemoryConfig(db=db, namespace="user", max_search_indexes=2))
+    for user_id in ["alice", "bob", "carol"]:
+        store.create_entity(entity_id=f"{user_id}_co", entity_type="company", name="Acme", user_id=user_id)
+        assert [entity.entity_id for entity in store.search(query="acme", user_id=user_id)] == [f"{user_id}_co"]
+
+    indexes = _search_indexes[db]
+    assert list(indexes) == [("user", "bob"), ("user", "carol")]
+
+    # An evicted index is rebuilt from the database
+    assert [entity.entity_id for entity in store.search(query="acme", user_id="alice")] == ["alice_co"]
+    assert list(indexes) == [("user", "carol"), ("user", "alice")]
+
+
+def test_search_falls_back_to_substring_match(store):
+    store.create_entity(entity_id="acme", entity_type="company", name="Acme Corporation")
+
+    assert [entity.entity_id for entity in store.search(query="corpor")] == ["acme"]
+
+
+def test_returned_entities_do_not_change_the_index(store):
+    store.create_entity(entity_id="acme", entity_type="company", name="Acme")
+    store.add_fact(entity_id="acme", entity_type="company", fact="Uses Redis")
+
+    entity = store.search(query="redis")[0]
+    entity.facts.clear()
+
+    assert store.search(query="redis")[0].facts
+
+
+async def test_asearch(store):
+    await store.acreate_entity(entity_id="acme", entity_type="company", name="Acme", description="Rocket maker")
+
+    results = await store.asearch(query="rocket")
+
+    assert [entity.entity_id for entity in results] == ["acme"]
@@ -0,0 +1,180 @@
+"""Tests for the "semantic" retrieval method of MemoryManager.search_user_memories."""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.db.sqlite import SqliteDb
+from agno.knowledge.embedder.base import Embedder
+from agno.memory import MemoryManager, UserMemory
+from agno.memory.index import MemoryVectorIndex
+
+VOCABULARY = ["pizza", "pasta", "hiking", "mountains", "python", "code", "cat"]
+
+
+@dataclass
+class BagOfWordsEmbedder(Embedder):
+    """Embeds a text as the counts of the vocabulary words it contains."""
+
+    dimensions: Optional[int] = len(VOCABULARY)
+    calls: List[str] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        self.calls.append(text)
+        words = text.lower().replace(",", " ").split()
+        return [float(words.count(word)) for word in VOCABULARY]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+
+@pytest.fixture
+def db(tmp_path):
+    return SqliteDb(db_file=str(tmp_path / "memories.db"))
+
+
+@pytest.fixture
+def embedder():
+    return BagOfWordsEmbedder()
+
+
+@pytest.fixture
+def memory_manager(db, embedder):
+    return MemoryManager(db=db, embedder=embedder)
+
+
+def _add(memory_manager: MemoryManager, text: str, user_id: str = "alice") -> str:
+    memory_id = memory_manager.add_user_memory(UserMemory(memory=text), user_id=user_id)
+    assert memory_id is not None
+    return memory_id
+
+
+def test_vector_index_returns_most_similar_first():
+    index = MemoryVectorIndex()
+    index.upsert("a", "a", [1.0, 0.0])
+    index.upsert("b", "b", [0.6, 0.8])
+    index.upsert("c", "c", [0.0, 1.0])
+
+    assert [memory_id for memory_id, _ in index.search([1.0, 0.1], limit=2)] == ["a", "b"]
+
+    index.retain(["b", "c"])
+    assert [memory_id for memory_id, _ in index.search([1.0, 0.1], limit=5)] == ["b", "c"]
+
+
+def test_semantic_search_ranks_by_similarity(memory_manager):
+    _add(memory_manager, "Likes pizza and pasta")
+    hiking_id = _add(memory_manager, "Goes hiking in the mountains")
+    _add(memory_manager, "Writes python code")
+
+    results = memory_manager.search_user_memories(
+        query="hiking trip to the mountains", limit=1, retrieval_method="semantic", user_id="alice"
+    )
+
+    assert [memory.memory_id for memory in results] == [hiking_id]
+
+
+def test_memories_are_embedded_once(memory_manager, embedder):
+    _add(memory_manager, "Likes pizza")
+    _add(memory_manager, "Has a cat")
+    assert len(embedder.calls) == 2
+
+    for _ in range(3):
+        memory_manager.search_user_memories(query="pizza", retrieval_method="semantic", user_id="alice")
+
+    # Only the queries were embedded
+    assert embedder.calls[2:] == ["pizza"] * 3
+
+
+def test_index_follows_updates_and_deletes(memory_manager):
+    memory_id = _add(memory_manager, "Likes pizza")
+    cat_id = _add(memory_manager, "Has a cat")
+
+    memory_manager.replace_user_memory(memory_id, UserMemory(memory="Writes python code"), user_id="alice")
+    memory_manager.delete_user_memory(cat_id, user_id="alice")
+
+    results = memory_manager.search_user_memories(query="cat python", retrieval_method="semantic", user_id="alice")
+    assert [memory.memory for memory in results] == ["Writes python code"]
+
+
+async def test_async_memory_tools_update_the_index(db, memory_manager, embedder):
+    tools = {
+        tool.__name__: tool
+        for tool in await memory_manager._aget_db_tools(user_id="alice", db=db, input_string="I like pizza")
+    }
+    await tools["add_memory"]("Likes pizza")
+    await tools["add_memory"]("Has a cat")
+    memory_ids = {memory.memory: memory.memory_id for memory in memory_manager.get_user_memories(user_id="alice")}
+
+    await tools["update_memory"](memory_ids["Likes pizza"], "Writes python code")
+    await tools["delete_memory"](memory_ids["Has a cat"])
+    index = memory_manager._get_memory_index("alice")
+
+    assert list(index._entries) == [memory_ids["Likes pizza"]]
+    assert index.is_current(memory_ids["Likes pizza"], "Writes python code")
+    assert embedder.calls == ["Likes pizza", "Has a cat", "Writes python code"]
+
+
+def test_memories_written_elsewhere_are_indexed_on_search(db, memory_manager):
+    # Written by a manager without an embedder, e.g. in another process
+    MemoryManager(db=db).add_user_memory(UserMemory(memory="Loves pasta"), user_id="alice")
+    _add(memory_manager, "Has a cat")
+
+    results = memory_manager.search_user_memories(query="pasta", limit=1, retrieval_method="semantic", user_id="alice")
+    assert [memory.memory for memory in results] == ["Loves pasta"]
+
+
+def test_semantic_search_is_scoped_to_the_user(memory_manager):
+    _add(memory_manager, "Likes pizza", user_id="alice")
+    _add(memory_manager, "Likes pizza too", user_id="bob")
+
+    results = memory_manager.search_user_memories(query="pizza", retrieval_method="semantic", user_id="bob")
+    assert [memory.user_id for memory in results] == ["bob"]
+
+
+def test_user_indexes_are_bounded(db, embedder):
+    from agno.memory.index import _memory_indexes
+
+    memory_manager = MemoryManager(db=db, embedder=embedder, max_memory_indexes=2)
+    for user_id in ("alice", "bob", "carol"):
+        _add(memory_manager, "Likes pizza", user_id=user_id)
+        memory_manager.search_user_memories(query="pizza", retrieval_method="semantic", user_id=user_id)
+
+    assert [user_id for user_id, _ in _memory_indexes[db]] == ["bob", "carol"]
+
+    # An evicted index is rebuilt on the next search
+    results = memory_manager.search_user_memories(query="pizza", retrieval_method="semantic", user_id="alice")
+    assert [memory.user_id for memory in results] == ["alice"]
+    assert [user_id for user_id, _ in _memory_indexes[db]] == ["carol", "alice"]
+
+
+def test_rerank_only_sees_the_shortlist(memory_manager):
+    for i in range(20):
+        _add(memory_manager, f"Writes python code {i}")
+    pizza_id = _add(memory_manager, "Likes pizza")
+
+    seen: List[List[UserMemory]] = []
+
+    def fake_agentic(user_id, query, limit=None, user_memories=None):
+        seen.append(user_memories)
+        return user_memories[:limit]
+
+    memory_manager._search_user_memories_agentic = fake_agentic
+
+    results = memory_manager.search_user_memories(
+        query="pizza", limit=1, retrieval_method="semantic", user_id="alice", rerank=True
+    )
+
+    assert [memory.memory_id for memory in results] == [pizza_id]
+    assert len(seen[0]) == 10
+
+
+def test_semantic_search_requires_an_embedder(db):
+    memory_manager = MemoryManager(db=db)
+    memory_manager.add_user_memory(UserMemory(memory="Likes pizza"), user_id="alice")
+
+    with pytest.raises(ValueError):
+        memory_manager.search_user_memories(query="pizza", retrieval_method="semantic", user_id="alice")
@@ -0,0 +1,162 @@
+"""Tests for running the function calls of a model turn concurrently with max_concurrent_tool_calls."""
+
+import threading
+import time
+from typing import List, Optional
+
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.models.response import ModelResponse, ModelResponseEvent
+from agno.tools.function import Function, FunctionCall
+
+
+def make_function_calls(function: Function, count: int) -> List[FunctionCall]:
+    function.process_entrypoint()
+    return [FunctionCall(function=function, arguments={"n": i}, call_id=f"call_{i}") for i in range(count)]
+
+
+def run(function_calls: List[FunctionCall], max_concurrent_tool_calls: Optional[int] = None, **kwargs):
+    model = OpenAIChat(id="gpt-4o", api_key="test")
+    results: List[Message] = []
+    events = list(
+        model.run_function_calls(
+            function_calls=function_calls,
+            function_call_results=results,
+            max_concurrent_tool_calls=max_concurrent_tool_calls,
+            **kwargs,
+        )
+    )
+    return events, results
+
+
+def slow_tool(n: int) -> str:
+    """Sleep, with the longest sleep for the first call."""
+    time.sleep(0.2 - n * 0.04)
+    return f"result {n}"
+
+
+def test_parallel_calls_keep_result_order():
+    function_calls = make_function_calls(Function.from_callable(slow_tool), 4)
+
+    events, results = run(function_calls, max_concurrent_tool_calls=4)
+
+    assert [message.content for message in results] == [f"result {i}" for i in range(4)]
+    assert [message.tool_call_id for message in results] == [f"call_{i}" for i in range(4)]
+    kinds = [e.event for e in events if isinstance(e, ModelResponse)]
+    assert kinds[:4] == [ModelResponseEvent.tool_call_started.value] * 4
+    started = [
+        e.tool_executions[0].tool_call_id for e in events if e.event == ModelResponseEvent.tool_call_started.value
+    ]
+    completed = [
+        e.tool_executions[0].tool_call_id for e in events if e.event == ModelResponseEvent.tool_call_completed.value
+    ]
+    assert started == [f"call_{i}" for i in range(4)]
+    assert sorted(completed) == started
+
+
+def test_parallel_call_events_are_yielded_as_they_arrive():
+    release = threading.Event()
+    released_by_consumer = []
+
+    def tool(n: int) -> str:
+        if n == 0:
+            released_by_consumer.append(release.wait(timeout=5))
+        return str(n)
+
+    model = OpenAIChat(id="gpt-4o", api_key="test")
+    results: List[Message] = []
+    completed = []
+    for event in model.run_function_calls(
+        function_calls=make_function_calls(Function.from_callable(tool), 2),
+        function_call_results=results,
+        max_concurrent_tool_calls=2,
+    ):
+        if event.event == ModelResponseEvent.tool_call_completed.value:
+            completed.append(event.tool_executions[0].tool_call_id)
+            # The first call only finishes once the second one has been seen
+            release.set()
+
+    assert released_by_consumer == [True]
+    assert completed == ["call_1", "call_0"]
+    assert [message.content for message in results] == ["0", "1"]
+
+
+def test_sequential_by_default():
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def tracked_tool(n: int) -> str:
+        with lock:
+            active.append(n)
+            peak.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.remove(n)
+        return str(n)
+
+    _, results = run(make_function_calls(Function.from_callable(tracked_tool), 4))
+
+    assert max(peak) == 1
+    assert [message.content for message in results] == ["0", "1", "2", "3"]
+
+
+def test_cap_bounds_calls_in_flight():
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def tracked_tool(n: int) -> str:
+        with lock:
+            active.append(n)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.remove(n)
+        return str(n)
+
+    _, results = run(make_function_calls(Function.from_callable(tracked_tool), 6), max_concurrent_tool_calls=2)
+
+    assert max(peak) == 2
+    assert [message.content for message in results] == [str(i) for i in range(6)]
+
+
+def test_calls_over_the_limit_are_not_executed():
+    executed = []
+
+    def tool(n: int) -> str:
+        executed.append(n)
+        return str(n)
+
+    _, results = run(
+        make_function_calls(Function.from_callable(tool), 4),
+        max_concurrent_tool_calls=4,
+        function_call_limit=2,
+    )
+
+    assert sorted(executed) == [0, 1]
+    assert [bool(message.tool_call_error) for message in results] == [False, False, True, True]
+    assert "Tool call limit reached" in results[2].content
+
+
+def test_paused_calls_are_not_executed():
+    executed = []
+
+    def tool(n: int) -> str:
+        executed.append(n)
+        return str(n)
+
+    confirmed = Function.from_callable(tool)
+    needs_confirmation = Function.from_callable(tool)
+    needs_confirmation.requires_confirmation = True
+    function_calls = make_function_calls(confirmed, 2) + make_function_calls(needs_confirmation, 1)
+    function_calls[2].call_id = "call_paused"
+
+    events, results = run(function_calls, max_concurrent_tool_calls=3)
+
+    assert sorted(executed) == [0, 1]
+    assert len(results) == 2
+    paused = [
+        e for e in events if isinstance(e, ModelResponse) and e.event == ModelResponseEvent.tool_call_paused.value
+    ]
+    assert [e.tool_executions[0].tool_call_id for e in paused] == ["call_paused"]
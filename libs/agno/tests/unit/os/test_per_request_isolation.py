@@ -242,6 +242,99 @@ class TestAgentDeepCopy:
         assert agent.name == "original"
 
 
+class TestAgentCopyForRun:
+    """Tests for Agent.copy_for_run() method."""
+
+    def test_copy_for_run_shares_configuration(self):
+        """copy_for_run shares tools and instructions instead of copying them."""
+
+        def tool() -> str:
+            return "result"
+
+        agent = Agent(name="test-agent", id="test-id", tools=[tool], instructions=["Do this"])
+
+        copy = agent.copy_for_run()
+
+        assert copy is not agent
+        assert copy.id == agent.id
+        assert copy.tools[0] is agent.tools[0]
+        assert copy.instructions == agent.instructions
+
+    def test_copy_for_run_isolates_containers(self):
+        """Adding to the lists and dicts of the copy doesn't affect the original."""
+        agent = Agent(
+            name="test-agent",
+            id="test-id",
+            instructions=["Do this"],
+            dependencies={"key": "original"},
+            session_state={"items": []},
+        )
+
+        copy = agent.copy_for_run()
+        copy.instructions.append("Do that")
+        copy.dependencies["key"] = "resolved"
+        copy.session_state["items"].append("item")
+
+        assert agent.instructions == ["Do this"]
+        assert agent.dependencies == {"key": "original"}
+        assert agent.session_state == {"items": []}
+
+    def test_copy_for_run_resets_run_state(self):
+        """Per-run state starts empty in the copy."""
+        agent = Agent(name="test-agent", id="test-id")
+        agent._cached_session = "cached_value"  # type: ignore
+        agent._mcp_tools_initialized_on_run = ["tool"]
+
+        copy = agent.copy_for_run()
+
+        assert copy._cached_session is None
+        assert copy._mcp_tools_initialized_on_run == []
+        assert agent._mcp_tools_initialized_on_run == ["tool"]
+
+    def test_copy_for_run_copies_connectable_toolkits(self):
+        """Toolkits that connect on each run are not shared between run copies."""
+        from agno.tools.toolkit import Toolkit
+
+        class ConnectableToolkit(Toolkit):
+            _requires_connect = True
+
+        shared = Toolkit(name="shared")
+        connectable = ConnectableToolkit(name="connectable")
+        agent = Agent(name="test-agent", id="test-id", tools=[shared, connectable])
+
+        copy = agent.copy_for_run()
+
+        assert copy.tools[0] is shared
+        assert copy.tools[1] is not connectable
+        assert isinstance(copy.tools[1], ConnectableToolkit)
+
+    def test_parsing_tools_leaves_shared_function_untouched(self):
+        """Functions shared by run copies are copied before their entrypoint is processed."""
+        from agno.models.openai import OpenAIChat
+        from agno.tools.function import Function
+
+        def tool(city: str) -> str:
+            return city
+
+        function = Function(name="tool", entrypoint=tool)
+        agent = Agent(name="test-agent", id="test-id", tools=[function])
+
+        functions = agent.copy_for_run()._parse_tools(tools=[function], model=OpenAIChat(id="gpt-4o"))
+
+        assert "city" in functions[0].parameters["properties"]
+        assert function.parameters["properties"] == {}
+        assert function._processed_with is None
+
+    def test_copy_for_run_with_update(self):
+        """copy_for_run can update specific fields."""
+        agent = Agent(name="original", id="test-id")
+
+        copy = agent.copy_for_run(update={"name": "updated"})
+
+        assert copy.name == "updated"
+        assert agent.name == "original"
+
+
 # ============================================================================
 # Team Deep Copy Tests
 # ============================================================================
@@ -319,3 +319,40 @@ async def test_async_read_path_with_custom_encoding(temp_dir):
     content = documents[0].content
     assert "José" in content
     assert "São Paulo" in content
+
+
+def test_iter_read_yields_windows_of_rows(temp_dir):
+    file_path = temp_dir / "large.csv"
+    file_path.write_text("id,value\n" + "".join(f"{i},value {i}\n" for i in range(24)), encoding="utf-8")
+
+    reader = CSVReader(rows_per_window=10, chunk=False)
+    batches = list(reader.iter_read(file_path))
+
+    assert [len(batch) for batch in batches] == [1, 1, 1]
+    assert [batch[0].meta_data for batch in batches] == [
+        {"page": 1, "start_row": 1, "rows": 10},
+        {"page": 2, "start_row": 11, "rows": 10},
+        {"page": 3, "start_row": 21, "rows": 5},
+    ]
+    assert batches[0][0].content.splitlines()[:2] == ["id, value", "0, value 0"]
+    assert batches[2][0].content.splitlines()[-1] == "23, value 23"
+
+
+@pytest.mark.asyncio
+async def test_async_iter_read_matches_iter_read(csv_file):
+    reader = CSVReader(rows_per_window=2, chunk=False)
+
+    batches = [batch async for batch in reader.async_iter_read(csv_file)]
+
+    assert [batch[0].content for batch in batches] == [batch[0].content for batch in reader.iter_read(csv_file)]
+    assert len(batches) == 2
+
+
+def test_iter_read_wrong_encoding_yields_nothing():
+    file_obj = io.BytesIO(LATIN1_CSV.encode("latin-1"))
+    file_obj.name = "latin1.csv"
+
+    reader = CSVReader(chunk=False)
+
+    assert reader.read(file_obj) == []
+    assert list(reader.iter_read(file_obj)) == []
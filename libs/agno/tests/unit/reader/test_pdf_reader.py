@@ -377,3 +377,67 @@ async def test_pdf_reader_async_password_none_falls_back_to_instance():
     reader = PDFReader(password="")
     docs = await reader.async_read(pdf, password=None)
     assert docs is not None
+
+
+def _create_pdf_with_pages(page_texts) -> BytesIO:
+    """Build a minimal PDF with one line of text per page."""
+    num_pages = len(page_texts)
+    font_id = 3 + 2 * num_pages
+    kids = " ".join(f"{3 + 2 * i} 0 R" for i in range(num_pages))
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", f"<< /Type /Pages /Kids [{kids}] /Count {num_pages} >>"]
+    for i, text in enumerate(page_texts):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {4 + 2 * i} 0 R "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    pdf = "%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n{obj}\nendobj\n"
+    xref_offset = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    pdf += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n"
+
+    buffer = BytesIO(pdf.encode("latin-1"))
+    buffer.name = "numbered.pdf"
+    return buffer
+
+
+NUMBERED_PAGES = [f"Recipe {i} text {i}" for i in range(1, 8)]
+
+
+def test_pdf_reader_iter_read_yields_windows_of_pages():
+    reader = PDFReader(pages_per_window=3, chunk=False)
+
+    batches = list(reader.iter_read(_create_pdf_with_pages(NUMBERED_PAGES)))
+    documents = reader.read(_create_pdf_with_pages(NUMBERED_PAGES))
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    # Page numbers detected on the first window are applied to the next ones
+    streamed = [doc for batch in batches for doc in batch]
+    assert [doc.meta_data for doc in streamed] == [doc.meta_data for doc in documents]
+    assert [doc.content for doc in streamed] == [doc.content for doc in documents]
+    assert streamed[6].content == "<start page 7>\nRecipe 7 text\n<end page 7>"
+
+
+@pytest.mark.asyncio
+async def test_pdf_reader_async_iter_read_matches_async_read():
+    reader = PDFReader(pages_per_window=2, chunk=False)
+
+    batches = [batch async for batch in reader.async_iter_read(_create_pdf_with_pages(NUMBERED_PAGES))]
+    documents = await reader.async_read(_create_pdf_with_pages(NUMBERED_PAGES))
+
+    assert len(batches) == 4
+    assert [doc.content for batch in batches for doc in batch] == [doc.content for doc in documents]
+
+
+def test_pdf_reader_iter_read_without_password_for_encrypted_pdf_yields_nothing():
+    pdf = _create_encrypted_pdf_with_password("secret")
+
+    assert list(PDFReader().iter_read(pdf)) == []
@@ -273,3 +273,91 @@ async def test_async_crawl_max_depth(mock_html_content, mock_html_content_with_a
         assert len(result) == 2
         assert "https://example.com" in result
         assert "https://example.com/page1" in result
+
+
+def _site_transport(pages, delay=0.0, stats=None):
+    """Serve `pages` (path -> html), recording the number of concurrent requests."""
+    import asyncio
+
+    import httpx
+
+    async def handler(request):
+        if stats is not None:
+            stats["in_flight"] += 1
+            stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+            stats["requested"].append(request.url.path)
+        try:
+            await asyncio.sleep(delay)
+            html = pages.get(request.url.path)
+            if html is None:
+                return httpx.Response(404)
+            return httpx.Response(200, html=html)
+        finally:
+            if stats is not None:
+                stats["in_flight"] -= 1
+
+    return httpx.MockTransport(handler)
+
+
+def _linked_pages(num_pages):
+    links = "".join(f'<a href="/page{i}#top">Page {i}</a>' for i in range(num_pages))
+    pages = {"/": f"<html><body><main>Home</main>{links}</body></html>"}
+    for i in range(num_pages):
+        pages[f"/page{i}"] = f'<html><body><main>Page {i}</main><a href="/">Home</a></body></html>'
+    return pages
+
+
+async def test_async_iter_crawl_fetches_pages_concurrently():
+    import httpx
+
+    stats = {"in_flight": 0, "max_in_flight": 0, "requested": []}
+    reader = WebsiteReader(max_links=10, concurrent=True, max_concurrent_requests_per_host=4, min_request_interval=0.0)
+
+    async with httpx.AsyncClient(transport=_site_transport(_linked_pages(20), delay=0.05, stats=stats)) as client:
+        pages = [page async for page in reader.async_iter_crawl("https://example.com/", client=client)]
+
+    assert len(pages) == 10
+    assert pages[0] == ("https://example.com/", "Home")
+    assert stats["max_in_flight"] == 4
+    # Links are crawled once, without their fragment, and no more pages are fetched than needed
+    assert len(stats["requested"]) == len(set(stats["requested"])) <= 10
+
+
+async def test_async_iter_crawl_respects_max_depth():
+    import httpx
+
+    pages = _linked_pages(3)
+    pages["/page0"] = '<html><body><main>Page 0</main><a href="/deep">Deep</a></body></html>'
+    pages["/deep"] = "<html><body><main>Deep</main></body></html>"
+    reader = WebsiteReader(max_depth=2, max_links=10, concurrent=True, min_request_interval=0.0)
+
+    async with httpx.AsyncClient(transport=_site_transport(pages)) as client:
+        crawled = dict([page async for page in reader.async_iter_crawl("https://example.com/", client=client)])
+
+    assert set(crawled) == {"https://example.com/", *(f"https://example.com/page{i}" for i in range(3))}
+
+
+async def test_async_iter_crawl_raises_for_the_starting_url():
+    import httpx
+
+    reader = WebsiteReader(concurrent=True)
+
+    async with httpx.AsyncClient(transport=_site_transport({})) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            async for _ in reader.async_iter_crawl("https://example.com/missing", client=client):
+                pass
+
+
+async def test_async_iter_read_yields_documents_per_page():
+    import httpx
+
+    reader = WebsiteReader(max_links=3, concurrent=True, min_request_interval=0.0)
+    reader.chunk = False
+
+    with patch("agno.knowledge.reader.website_reader.get_default_async_client") as get_client:
+        get_client.return_value = httpx.AsyncClient(transport=_site_transport(_linked_pages(5)))
+        batches = [batch async for batch in reader.async_iter_read("https://example.com/", name="docs")]
+
+    assert len(batches) == 3
+    assert all(len(batch) == 1 and batch[0].name == "docs" for batch in batches)
+    assert batches[0][0].meta_data["url"] == "https://example.com/"
@@ -0,0 +1,140 @@
+"""Tests for RedisRunCancellationManager with use_pubsub=True."""
+
+import asyncio
+import time
+
+import pytest
+
+from agno.exceptions import RunCancelledException
+from agno.run.cancellation_management import RedisRunCancellationManager
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+class CountingRedis(fakeredis.FakeStrictRedis):
+    """Fake Redis client counting GET calls."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.get_calls = 0
+
+    def get(self, name):
+        self.get_calls += 1
+        return super().get(name)
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def make_manager(server, **kwargs) -> RedisRunCancellationManager:
+    manager = RedisRunCancellationManager(redis_client=CountingRedis(server=server), use_pubsub=True, **kwargs)
+    manager._ensure_listener()
+    assert manager._subscribed.wait(timeout=5)
+    return manager
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_checks_are_served_from_local_cache(server):
+    manager = make_manager(server)
+    try:
+        manager.register_run("run-1")
+        for _ in range(100):
+            manager.raise_if_cancelled("run-1")
+
+        assert manager.redis_client.get_calls == 0
+    finally:
+        manager.close()
+
+
+def test_cancellation_propagates_across_managers(server):
+    worker = make_manager(server)
+    api = RedisRunCancellationManager(redis_client=fakeredis.FakeStrictRedis(server=server))
+    try:
+        worker.register_run("run-1")
+        assert worker.is_cancelled("run-1") is False
+
+        assert api.cancel_run("run-1") is True
+
+        assert wait_for(lambda: worker.is_cancelled("run-1"))
+        assert worker.redis_client.get_calls == 0
+        with pytest.raises(RunCancelledException):
+            worker.raise_if_cancelled("run-1")
+    finally:
+        worker.close()
+
+
+def test_untracked_runs_are_read_from_redis(server):
+    worker = make_manager(server)
+    other = make_manager(server)
+    try:
+        other.register_run("run-1")
+        other.cancel_run("run-1")
+
+        assert worker.is_cancelled("run-1") is True
+        assert worker.redis_client.get_calls == 1
+    finally:
+        worker.close()
+        other.close()
+
+
+def test_runs_are_reconciled_with_redis(server):
+    manager = make_manager(server, reconcile_interval_seconds=0.0)
+    try:
+        manager.register_run("run-1")
+        # Cancel without publishing, as if the message had been missed
+        manager.redis_client.set(manager._get_key("run-1"), "1")
+
+        assert manager.is_cancelled("run-1") is True
+        assert manager.redis_client.get_calls == 1
+    finally:
+        manager.close()
+
+
+def test_cleanup_run_clears_local_state(server):
+    manager = make_manager(server)
+    try:
+        manager.register_run("run-1")
+        manager.cancel_run("run-1")
+        assert manager.is_cancelled("run-1") is True
+
+        manager.cleanup_run("run-1")
+
+        assert manager.is_cancelled("run-1") is False
+        assert "run-1" not in manager._cancelled_run_ids
+    finally:
+        manager.close()
+
+
+async def test_async_cancellation_with_pubsub(server):
+    from fakeredis.aioredis import FakeRedis as AsyncFakeRedis
+
+    manager = RedisRunCancellationManager(async_redis_client=AsyncFakeRedis(server=server), use_pubsub=True)
+    try:
+        await manager.aregister_run("run-1")
+        for _ in range(100):
+            if manager._subscribed.is_set():
+                break
+            await manager.araise_if_cancelled("run-1")
+            await asyncio.sleep(0.01)
+        assert manager._subscribed.is_set()
+
+        assert await manager.acancel_run("run-1") is True
+        for _ in range(100):
+            if "run-1" in manager._cancelled_run_ids:
+                break
+            await asyncio.sleep(0.01)
+
+        with pytest.raises(RunCancelledException):
+            await manager.araise_if_cancelled("run-1")
+    finally:
+        manager.close()
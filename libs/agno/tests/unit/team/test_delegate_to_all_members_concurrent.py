@@ -0,0 +1,162 @@
+"""Tests for running members concurrently when a sync team delegates to all members."""
+
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from agno.agent.agent import Agent
+from agno.exceptions import RunCancelledException
+from agno.run.agent import RunCancelledEvent, RunContentEvent, RunOutput
+from agno.run.base import RunContext
+from agno.run.cancel import cleanup_run, raise_if_cancelled, register_run
+from agno.run.team import TeamRunOutput
+from agno.session.team import TeamSession
+from agno.team.team import Team
+
+
+class SlowMemberAgent(Agent):
+    """Agent whose run sleeps instead of calling a model, recording the threads it ran on."""
+
+    def __init__(self, name: str, delay: float = 0.1, **kwargs: Any):
+        super().__init__(name=name, id=name.lower(), **kwargs)
+        self.delay = delay
+        self.threads: List[int] = []
+
+    def run(self, *, input: Any = None, session_state: Dict[str, Any], stream: bool = False, **kwargs: Any):  # type: ignore[override]
+        self.threads.append(threading.get_ident())
+        run_id = f"run-{self.name}"
+        output = RunOutput(run_id=run_id, agent_id=self.id, agent_name=self.name, content=f"Response from {self.name}")
+
+        def execute() -> RunOutput:
+            time.sleep(self.delay)
+            session_state[self.name] = True  # type: ignore[index]
+            return output
+
+        if not stream:
+            return execute()
+
+        def events():
+            yield RunContentEvent(run_id=run_id, agent_id=self.id, agent_name=self.name, content="chunk")
+            yield execute()
+
+        return events()
+
+
+def _delegate(team: Team, stream: bool = False):
+    run_response = TeamRunOutput(run_id="team-run", team_id=team.id, session_id="session-1")
+    run_context = RunContext(run_id="team-run", session_id="session-1", session_state={"shared": 1})
+    function = team._get_delegate_task_function(
+        run_response=run_response,
+        run_context=run_context,
+        session=TeamSession(session_id="session-1"),
+        team_run_context={},
+        stream=stream,
+    )
+    return list(function.entrypoint(task="Research the topic")), run_response, run_context  # type: ignore[misc]
+
+
+def _team(members: List[Agent], max_concurrent_member_runs=None) -> Team:
+    team = Team(
+        name="Research Team",
+        members=members,  # type: ignore[arg-type]
+        delegate_to_all_members=True,
+        max_concurrent_member_runs=max_concurrent_member_runs,
+    )
+    team.set_id()
+    return team
+
+
+def test_members_run_concurrently():
+    members = [SlowMemberAgent(name=f"Researcher{i}") for i in range(4)]
+
+    start = time.monotonic()
+    results, run_response, run_context = _delegate(_team(members, max_concurrent_member_runs=4))
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.3
+    assert sorted(results) == sorted(f"Agent Researcher{i}: Response from Researcher{i}" for i in range(4))
+    # Member state changes are merged, and member runs are recorded on the team run
+    assert run_context.session_state == {"shared": 1, **{f"Researcher{i}": True for i in range(4)}}
+    assert len(run_response.member_responses) == 4
+    assert len({thread for member in members for thread in member.threads}) > 1
+
+
+def test_members_run_sequentially_by_default():
+    members = [SlowMemberAgent(name=f"Researcher{i}", delay=0.05) for i in range(3)]
+
+    start = time.monotonic()
+    results, _, _ = _delegate(_team(members))
+
+    assert time.monotonic() - start >= 0.15
+    assert results == [f"Agent Researcher{i}: Response from Researcher{i}" for i in range(3)]
+
+
+def test_concurrent_member_events_are_streamed():
+    members = [SlowMemberAgent(name=f"Researcher{i}") for i in range(3)]
+
+    events, run_response, run_context = _delegate(_team(members, max_concurrent_member_runs=3), stream=True)
+
+    assert [type(event) for event in events] == [RunContentEvent] * 3
+    assert all(event.parent_run_id == "team-run" for event in events)
+    assert len(run_response.member_responses) == 3
+    assert all(run_context.session_state[f"Researcher{i}"] for i in range(3))
+
+
+def test_member_errors_are_raised():
+    class FailingAgent(SlowMemberAgent):
+        def run(self, **kwargs: Any):  # type: ignore[override]
+            raise RuntimeError("member failed")
+
+    team = _team([SlowMemberAgent(name="Researcher"), FailingAgent(name="Failing")], max_concurrent_member_runs=2)
+
+    with pytest.raises(RuntimeError, match="member failed"):
+        _delegate(team)
+
+
+def test_cancelled_member_run_cancels_the_delegation():
+    class CancelledAgent(SlowMemberAgent):
+        def run(self, **kwargs: Any):  # type: ignore[override]
+            yield RunCancelledEvent(run_id="run-Cancelled", agent_id=self.id, reason="Cancelled by user")
+
+    team = _team([SlowMemberAgent(name="Researcher"), CancelledAgent(name="Cancelled")], max_concurrent_member_runs=2)
+
+    with pytest.raises(RunCancelledException):
+        _delegate(team, stream=True)
+
+
+def test_running_members_are_cancelled_when_the_delegation_fails():
+    chunks_after_failure: List[int] = []
+    member_cancelled = threading.Event()
+
+    class StreamingAgent(SlowMemberAgent):
+        def run(self, *, run_id: str, **kwargs: Any):  # type: ignore[override]
+            register_run(run_id)
+            try:
+                for i in range(100):
+                    time.sleep(0.01)
+                    raise_if_cancelled(run_id)
+                    if failed.is_set():
+                        chunks_after_failure.append(i)
+                    yield RunContentEvent(run_id=run_id, agent_id=self.id, agent_name=self.name, content="chunk")
+            except RunCancelledException:
+                member_cancelled.set()
+            finally:
+                cleanup_run(run_id)
+
+    failed = threading.Event()
+
+    class FailingAgent(SlowMemberAgent):
+        def run(self, **kwargs: Any):  # type: ignore[override]
+            time.sleep(0.05)
+            failed.set()
+            raise RuntimeError("member failed")
+
+    team = _team([StreamingAgent(name="Researcher"), FailingAgent(name="Failing")], max_concurrent_member_runs=2)
+
+    with pytest.raises(RuntimeError, match="member failed"):
+        _delegate(team, stream=True)
+
+    assert member_cancelled.wait(timeout=1)
+    assert len(chunks_after_failure) <= 1
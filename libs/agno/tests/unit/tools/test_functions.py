@@ -4,7 +4,7 @@ import pytest
 from pydantic import ValidationError
 
 from agno.tools.decorator import tool
-from agno.tools.function import Function, FunctionCall
+from agno.tools.function import Function, FunctionCall, clear_processed_entrypoints
 
 
 def test_function_initialization():
@@ -255,47 +255,39 @@ def test_function_cache_key_dict_order_independence():
     assert cache_key1 == cache_key2 == cache_key3
 
 
-def test_function_cache_file_path():
-    """Test generation of cache file paths."""
-    func = Function(name="test_func", cache_results=True, cache_dir="/tmp")
+def test_function_cache_is_shared_per_cache_dir(tmp_path):
+    """Test that functions with the same cache_dir share one cache file."""
+    func1 = Function(name="func1", cache_results=True, cache_dir=str(tmp_path))
+    func2 = Function(name="func2", cache_results=True, cache_dir=str(tmp_path))
 
-    cache_key = "test_key"
-    cache_file = func._get_cache_file_path(cache_key)
-    assert cache_file.startswith("/tmp/")
-    assert "test_func" in cache_file
-    assert "test_key" in cache_file
+    assert func1._get_cache() is func2._get_cache()
+    assert func1._get_cache().db_path == tmp_path / "functions.db"
 
 
 def test_function_cache_operations(tmp_path):
     """Test caching operations (save and retrieve)."""
-    import json
-    import os
-
     func = Function(name="test_func", cache_results=True, cache_dir=str(tmp_path))
+    other_func = Function(name="other_func", cache_results=True, cache_dir=str(tmp_path))
 
     # Test saving to cache
     test_result = {"result": "test_data"}
-    cache_file = os.path.join(str(tmp_path), "test_cache.json")
-    func._save_to_cache(cache_file, test_result)
-
-    # Verify cache file exists and contains correct data
-    assert os.path.exists(cache_file)
-    with open(cache_file, "r") as f:
-        cached_data = json.load(f)
-    assert cached_data["result"] == {"result": "test_data"}
+    func._save_to_cache("test_key", test_result)
 
     # Test retrieving from cache
-    retrieved_result = func._get_cached_result(cache_file)
-    assert retrieved_result == test_result
+    assert func._get_cached_result("test_key") == test_result
+
+    # Results are scoped to the function
+    assert other_func._get_cached_result("test_key") is None
 
     # Test retrieving non-existent cache
-    non_existent_file = os.path.join(str(tmp_path), "non_existent.json")
-    assert func._get_cached_result(non_existent_file) is None
+    assert func._get_cached_result("non_existent") is None
+
+    # No file is created per entry
+    assert not list(tmp_path.glob("**/*.json"))
 
 
 def test_function_cache_ttl(tmp_path):
     """Test cache TTL functionality."""
-    import os
     import time
 
     func = Function(
@@ -307,17 +299,35 @@ def test_function_cache_ttl(tmp_path):
 
     # Save test data to cache
     test_result = {"result": "test_data"}
-    cache_file = os.path.join(str(tmp_path), "test_cache.json")
-    func._save_to_cache(cache_file, test_result)
+    func._save_to_cache("test_key", test_result)
 
     # Verify cache is valid immediately
-    assert func._get_cached_result(cache_file) == test_result
+    assert func._get_cached_result("test_key") == test_result
 
     # Wait for cache to expire
     time.sleep(1.1)
 
     # Verify cache is no longer valid
-    assert func._get_cached_result(cache_file) is None
+    assert func._get_cached_result("test_key") is None
+
+
+def test_function_call_uses_cached_result(tmp_path):
+    """Test that a cached function is only executed once for the same arguments."""
+    calls = []
+
+    def add(a: int, b: int) -> int:
+        calls.append((a, b))
+        return a + b
+
+    func = Function.from_callable(add)
+    func.cache_results = True
+    func.cache_dir = str(tmp_path)
+
+    for _ in range(3):
+        result = FunctionCall(function=func, arguments={"a": 1, "b": 2}).execute()
+        assert result.result == 3
+
+    assert calls == [(1, 2)]
 
 
 def test_function_call_initialization():
@@ -726,3 +736,183 @@ def test_tool_decorator_with_complex_types():
     assert complex_types_func.parameters["properties"]["param2"]["type"] == "object"
     assert complex_types_func.parameters["properties"]["param3"]["type"] == "boolean"
     assert "param3" not in complex_types_func.parameters["required"]
+
+
+def _cached_func(param1: str, param2: int = 0) -> str:
+    """Function processed once per process."""
+    return f"{param1}-{param2}"
+
+
+def _options_func(param1: str, param2: int = 0) -> str:
+    """Function with an optional parameter."""
+    return param1
+
+
+def _doc_func(param1: str) -> str:
+    """Original description."""
+    return param1
+
+
+def _shared_func(param1: str) -> str:
+    """Function created twice."""
+    return param1
+
+
+def _first_func(param: str) -> str:
+    return param
+
+
+def _second_func(param: str) -> str:
+    return param
+
+
+def _third_func(param: str) -> str:
+    return param
+
+
+class _LookupTools:
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+
+    def lookup(self, query: str) -> str:
+        """Look something up."""
+        return f"{self.prefix}{query}"
+
+
+def test_process_entrypoint_reuses_cached_result(monkeypatch):
+    """Test that processing a copy of a function reuses the cached schema and wrapped entrypoint."""
+    from agno.utils import json_schema
+
+    clear_processed_entrypoints()
+
+    first = Function(name="cached_func", entrypoint=_cached_func)
+    first.process_entrypoint()
+
+    calls = []
+    original_get_json_schema = json_schema.get_json_schema
+
+    def counting_get_json_schema(*args, **kwargs):
+        calls.append(args)
+        return original_get_json_schema(*args, **kwargs)
+
+    monkeypatch.setattr(json_schema, "get_json_schema", counting_get_json_schema)
+
+    second = Function(name="cached_func", entrypoint=_cached_func)
+    second.process_entrypoint()
+
+    assert calls == []
+    assert second.parameters == first.parameters
+    assert second.parameters is not first.parameters
+    assert second.entrypoint is first.entrypoint
+    assert second.entrypoint(param1="a", param2=1) == "a-1"
+
+
+def test_process_entrypoint_cache_is_keyed_on_options():
+    """Test that strict and non-strict schemas are cached separately."""
+    clear_processed_entrypoints()
+
+    strict_func = Function(name="options_func", entrypoint=_options_func)
+    strict_func.process_entrypoint(strict=True)
+    loose_func = Function(name="options_func", entrypoint=_options_func)
+    loose_func.process_entrypoint(strict=False)
+
+    assert strict_func.parameters["required"] == ["param1", "param2"]
+    assert loose_func.parameters["required"] == ["param1"]
+
+
+def test_process_entrypoint_cache_tracks_docstring():
+    """Test that changing the docstring of a function invalidates its cached description."""
+    clear_processed_entrypoints()
+
+    original_doc = _doc_func.__doc__
+    original = Function(name="doc_func", entrypoint=_doc_func)
+    original.process_entrypoint()
+    try:
+        _doc_func.__doc__ = "Updated description."
+        updated = Function(name="doc_func", entrypoint=_doc_func)
+        updated.process_entrypoint()
+    finally:
+        _doc_func.__doc__ = original_doc
+
+    assert original.description == "Original description."
+    assert updated.description == "Updated description."
+
+
+def test_from_callable_returns_independent_parameters():
+    """Test that functions created from the cache do not share their parameters."""
+    clear_processed_entrypoints()
+
+    first = Function.from_callable(_shared_func)
+    first.parameters["properties"]["param1"]["description"] = "changed"
+    second = Function.from_callable(_shared_func)
+
+    assert second.parameters["properties"]["param1"].get("description") != "changed"
+
+
+def test_process_entrypoint_cache_does_not_keep_instances_alive():
+    """Test that bound methods are cached on their function, without keeping their instance alive."""
+    import gc
+    import weakref
+
+    from agno.tools import function as function_module
+
+    clear_processed_entrypoints()
+
+    tools = _LookupTools("first:")
+    Function(name="lookup", entrypoint=tools.lookup).process_entrypoint()
+    tools_ref = weakref.ref(tools)
+    del tools
+    gc.collect()
+
+    assert tools_ref() is None
+    assert [key[0] for key in function_module._processed_entrypoints] == [_LookupTools.lookup]
+    other = Function(name="lookup", entrypoint=_LookupTools("second:").lookup)
+    other.process_entrypoint()
+    assert other.description == "Look something up."
+    assert other.entrypoint(query="x") == "second:x"
+
+
+def test_process_entrypoint_cache_is_bounded(monkeypatch):
+    """Test that the least recently used entrypoints are evicted from the cache."""
+    from agno.tools import function as function_module
+
+    clear_processed_entrypoints()
+    monkeypatch.setattr(function_module, "_MAX_PROCESSED_ENTRYPOINTS", 2)
+
+    for entrypoint in (_first_func, _second_func, _third_func):
+        Function(name=entrypoint.__name__, entrypoint=entrypoint).process_entrypoint()
+
+    cached = [key[0] for key in function_module._processed_entrypoints]
+    assert cached == [_second_func, _third_func]
+
+
+def test_from_callable_does_not_cache_closures():
+    """Test that per-run closures are not cached, so their captured state is not kept alive."""
+    import gc
+    import weakref
+
+    from agno.tools import function as function_module
+
+    clear_processed_entrypoints()
+
+    class RunState:
+        pass
+
+    def make_search(state: RunState):
+        def search(query: str) -> str:
+            """Search with the state of the run."""
+            return f"{state}{query}"
+
+        return search
+
+    state_refs = []
+    for _ in range(5):
+        state = RunState()
+        state_refs.append(weakref.ref(state))
+        function = Function.from_callable(make_search(state))
+        assert function.description == "Search with the state of the run."
+        del state, function
+
+    gc.collect()
+    assert len(function_module._processed_entrypoints) == 0
+    assert all(state_ref() is None for state_ref in state_refs)
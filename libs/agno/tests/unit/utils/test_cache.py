@@ -0,0 +1,127 @@
+import time
+
+from agno.models.openai import OpenAIChat
+from agno.models.response import ModelResponse
+from agno.utils.cache import TieredCache, get_tiered_cache
+
+
+def test_get_and_set(tmp_path):
+    cache = TieredCache(db_path=tmp_path / "cache.db")
+
+    assert cache.get("ns", "key") is None
+    cache.set("ns", "key", {"answer": [1, 2]})
+
+    assert cache.get("ns", "key") == {"answer": [1, 2]}
+    assert cache.get("other", "key") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_values_are_not_shared():
+    cache = TieredCache()
+    cache.set("ns", "key", {"items": []})
+
+    cache.get("ns", "key")["items"].append(1)
+
+    assert cache.get("ns", "key") == {"items": []}
+
+
+def test_ttl(tmp_path):
+    cache = TieredCache(db_path=tmp_path / "cache.db")
+    cache.set("ns", "key", "value")
+
+    assert cache.get("ns", "key", ttl=60) == "value"
+    time.sleep(0.05)
+    assert cache.get("ns", "key", ttl=0.01) is None
+    assert cache.get("ns", "key") == "value"
+
+
+def test_persistent_tier_survives_reopen(tmp_path):
+    cache = TieredCache(db_path=tmp_path / "cache.db", max_entries=1)
+    cache.set("ns", "a", 1)
+    cache.set("ns", "b", 2)
+    assert len(cache) == 1
+    # Served from the SQLite tier after being pushed out of the LRU tier
+    assert cache.get("ns", "a") == 1
+    cache.close()
+
+    reopened = TieredCache(db_path=tmp_path / "cache.db")
+    assert reopened.get("ns", "a") == 1
+    assert reopened.get("ns", "b") == 2
+
+
+def test_persistent_tier_is_bounded(tmp_path):
+    cache = TieredCache(db_path=tmp_path / "cache.db", max_entries=1, max_db_entries=10)
+    for i in range(200):
+        cache.set("ns", str(i), i)
+
+    (count,) = cache._connection.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+    assert count <= 10
+    assert cache.get("ns", "199") == 199
+    assert cache.get("ns", "0") is None
+
+
+def test_hits_in_lru_tier_keep_entries_in_persistent_tier(tmp_path):
+    cache = TieredCache(db_path=tmp_path / "cache.db", max_db_entries=10)
+    cache.set("ns", "hot", "value")
+    for i in range(200):
+        time.sleep(0.001)
+        assert cache.get("ns", "hot") == "value"
+        cache.set("ns", str(i), i)
+
+    row = cache._connection.execute("SELECT value FROM cache_entries WHERE key = 'hot'").fetchone()
+    assert row is not None
+
+
+def test_reads_do_not_write_to_persistent_tier(tmp_path):
+    cache = TieredCache(db_path=tmp_path / "cache.db", max_entries=1)
+    cache.set("ns", "a", 1)
+    cache.set("ns", "b", 2)
+    changes = cache._connection.total_changes
+
+    assert cache.get("ns", "a") == 1
+    assert cache.get("ns", "b") == 2
+
+    assert cache._connection.total_changes == changes
+
+
+def test_unserializable_values_are_skipped():
+    cache = TieredCache()
+    cache.set("ns", "key", object())
+
+    assert cache.get("ns", "key") is None
+
+
+def test_delete_and_clear(tmp_path):
+    cache = TieredCache(db_path=tmp_path / "cache.db")
+    cache.set("ns", "a", 1)
+    cache.set("ns", "b", 2)
+
+    cache.delete("ns", "a")
+    assert cache.get("ns", "a") is None
+    cache.clear()
+    assert cache.get("ns", "b") is None
+
+
+def test_shared_cache_per_path(tmp_path):
+    assert get_tiered_cache(tmp_path / "cache.db") is get_tiered_cache(str(tmp_path / "cache.db"))
+    assert get_tiered_cache(tmp_path / "cache.db") is not get_tiered_cache(tmp_path / "other.db")
+
+
+async def test_async_access(tmp_path):
+    cache = TieredCache(db_path=tmp_path / "cache.db", max_entries=1)
+    await cache.aset("ns", "a", 1)
+    await cache.aset("ns", "b", 2)
+
+    assert await cache.aget("ns", "b") == 2
+    assert await cache.aget("ns", "a") == 1
+    assert await cache.aget("ns", "c") is None
+
+
+def test_model_response_cache(tmp_path):
+    model = OpenAIChat(id="gpt-4o", api_key="test", cache_response=True, cache_dir=str(tmp_path))
+    model._save_model_response_to_cache("key", ModelResponse(role="assistant", content="hello"))
+
+    cached = model._get_cached_model_response("key")
+
+    assert model._model_response_from_cache(cached).content == "hello"
+    assert not list(tmp_path.glob("*.json"))
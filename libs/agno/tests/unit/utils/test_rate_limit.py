@@ -0,0 +1,259 @@
+"""Tests for the client-side RateLimiter shared by Models and Embedders."""
+
+import asyncio
+import copy
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import pytest
+
+from agno.knowledge.embedder.base import Embedder
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.response import ModelResponse
+from agno.utils.rate_limit import RateLimiter, get_rate_limiter
+
+
+class RecordingRateLimiter(RateLimiter):
+    """RateLimiter recording the token estimates it is given."""
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.estimates: List[int] = []
+
+    def acquire(self, tokens: int = 0) -> None:
+        self.estimates.append(tokens)
+        super().acquire(tokens)
+
+    async def aacquire(self, tokens: int = 0) -> None:
+        self.estimates.append(tokens)
+        await super().aacquire(tokens)
+
+
+@dataclass
+class UsageModel(Model):
+    id: str = "gpt-4o"
+    total_tokens: int = 100
+
+    def _response(self) -> ModelResponse:
+        return ModelResponse(content="ok", response_usage=Metrics(total_tokens=self.total_tokens))
+
+    def invoke(self, *args, **kwargs) -> ModelResponse:
+        return self._response()
+
+    async def ainvoke(self, *args, **kwargs) -> ModelResponse:
+        return self._response()
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[ModelResponse]:
+        yield self._response()
+
+    async def ainvoke_stream(self, *args, **kwargs) -> AsyncIterator[ModelResponse]:
+        yield self._response()
+
+    def _parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return response
+
+    def _parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return response
+
+
+@dataclass
+class NestedEmbedder(Embedder):
+    id: str = "text-embedding-3-small"
+    dimensions: Optional[int] = 2
+    calls: List[str] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.calls.append(text)
+        return [1.0, 0.0], None
+
+
+def test_invalid_limits_are_rejected():
+    with pytest.raises(ValueError):
+        RateLimiter(requests_per_minute=0)
+
+
+def test_tokens_per_minute_delays_requests():
+    # 600 tokens per minute refill at 10 tokens per second
+    limiter = RateLimiter(tokens_per_minute=600)
+    limiter.acquire(600)
+    limiter.release()
+
+    start = time.monotonic()
+    limiter.acquire(2)
+    assert time.monotonic() - start >= 0.15
+
+
+def test_reported_usage_corrects_the_estimate():
+    limiter = RateLimiter(tokens_per_minute=600)
+    with limiter.limit(tokens=0) as usage:
+        usage.add(600)
+
+    start = time.monotonic()
+    limiter.acquire(2)
+    assert time.monotonic() - start >= 0.15
+
+
+def test_max_concurrent_requests_across_threads():
+    limiter = RateLimiter(max_concurrent_requests=2)
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def request():
+        nonlocal in_flight, max_in_flight
+        with limiter.limit():
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max_in_flight == 2
+
+
+async def test_max_concurrent_requests_across_tasks():
+    limiter = RateLimiter(max_concurrent_requests=2)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def request():
+        nonlocal in_flight, max_in_flight
+        async with limiter.alimit():
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+
+    start = time.monotonic()
+    await asyncio.gather(*[request() for _ in range(8)])
+
+    assert max_in_flight == 2
+    # Waiters are woken up on release instead of polling
+    assert time.monotonic() - start < 0.4
+
+
+def test_rate_limiter_is_shared_by_copies():
+    limiter = RateLimiter(requests_per_minute=10)
+    model = UsageModel(rate_limiter=limiter)
+
+    assert copy.deepcopy(model).rate_limiter is limiter
+    assert get_rate_limiter("test-provider", requests_per_minute=10) is get_rate_limiter("test-provider")
+
+
+def test_model_requests_are_rate_limited():
+    limiter = RecordingRateLimiter(tokens_per_minute=100_000, max_concurrent_requests=1)
+    model = UsageModel(rate_limiter=limiter)
+
+    response = model._invoke_with_retry(messages=[Message(role="user", content="Hello there")])
+    list(model._invoke_stream_with_retry(messages=[Message(role="user", content="Hello there")]))
+
+    assert response.content == "ok"
+    assert len(limiter.estimates) == 2
+    assert all(estimate > 0 for estimate in limiter.estimates)
+    assert limiter._in_flight == 0
+    # Each request used 100 tokens, as reported by the provider
+    assert limiter._available_tokens < 100_000 - 190
+
+
+def test_cumulative_stream_usage_is_not_double_counted():
+    class CumulativeUsageModel(UsageModel):
+        def invoke_stream(self, *args, **kwargs) -> Iterator[ModelResponse]:
+            for total_tokens in [40, 70, 100]:
+                yield ModelResponse(content="ok", response_usage=Metrics(total_tokens=total_tokens))
+
+    released: List[Optional[int]] = []
+
+    class ReleaseRecordingRateLimiter(RateLimiter):
+        def release(self, tokens_used: Optional[int] = None, tokens_estimated: int = 0) -> None:
+            released.append(tokens_used)
+            super().release(tokens_used=tokens_used, tokens_estimated=tokens_estimated)
+
+    model = CumulativeUsageModel(rate_limiter=ReleaseRecordingRateLimiter(tokens_per_minute=100_000))
+
+    list(model._invoke_stream_with_retry(messages=[Message(role="user", content="Hello there")]))
+
+    assert released == [100]
+
+
+def test_nested_embedder_calls_hold_a_single_slot():
+    limiter = RecordingRateLimiter(max_concurrent_requests=1, tokens_per_minute=100_000)
+    embedder = NestedEmbedder(rate_limiter=limiter)
+
+    assert embedder.get_embedding("hello") == [1.0, 0.0]
+    assert len(limiter.estimates) == 1
+    assert limiter.estimates[0] > 0
+    assert limiter._in_flight == 0
+
+
+def _openai_embedder(limiter: RateLimiter, create: Any):
+    from unittest.mock import MagicMock
+
+    from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+    client = MagicMock()
+    client.embeddings.create.side_effect = create
+    return OpenAIEmbedder(openai_client=client, batch_size=2, rate_limiter=limiter)
+
+
+def _embedding_response(inputs: Any) -> Any:
+    from types import SimpleNamespace
+
+    texts = inputs if isinstance(inputs, list) else [inputs]
+    return SimpleNamespace(data=[SimpleNamespace(embedding=[1.0, 0.0]) for _ in texts], usage=None)
+
+
+def test_batch_embedding_holds_a_slot_per_provider_request():
+    limiter = RecordingRateLimiter(requests_per_minute=1_000)
+    embedder = _openai_embedder(limiter, lambda **req: _embedding_response(req["input"]))
+
+    embeddings, _ = embedder.get_embeddings_batch_and_usage(["a", "b", "c", "d", "e"])
+
+    assert len(embeddings) == 5
+    assert embedder.client.embeddings.create.call_count == 3
+    assert len(limiter.estimates) == 3
+
+
+def test_batch_embedding_fallback_holds_a_slot_per_text():
+    def create(**req: Any) -> Any:
+        if isinstance(req["input"], list):
+            raise RuntimeError("batch failed")
+        return _embedding_response(req["input"])
+
+    limiter = RecordingRateLimiter(requests_per_minute=1_000)
+    embedder = _openai_embedder(limiter, create)
+
+    embeddings, _ = embedder.get_embeddings_batch_and_usage(["a", "b", "c"])
+
+    assert embeddings == [[1.0, 0.0]] * 3
+    # Two failed batch requests, then one request per text
+    assert len(limiter.estimates) == 5
+    assert limiter._in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_async_batch_embedding_holds_a_slot_per_provider_request():
+    from unittest.mock import AsyncMock
+
+    limiter = RecordingRateLimiter(requests_per_minute=1_000)
+    embedder = _openai_embedder(limiter, None)
+    embedder.async_client = AsyncMock()
+    embedder.async_client.embeddings.create.side_effect = lambda **req: _embedding_response(req["input"])
+
+    embeddings, _ = await embedder.async_get_embeddings_batch_and_usage(["a", "b", "c", "d", "e"])
+
+    assert len(embeddings) == 5
+    assert len(limiter.estimates) == 3
@@ -0,0 +1,82 @@
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.response import ToolExecution
+from agno.run.agent import RunContentEvent, RunOutput
+from agno.utils.serialize import dataclass_to_dict, json_dumps_compact, json_serializer
+
+
+@dataclass
+class Inner:
+    values: List[int] = field(default_factory=list)
+
+
+@dataclass
+class Outer:
+    name: str = "outer"
+    inner: Inner = field(default_factory=Inner)
+    data: Optional[Dict[str, Any]] = None
+    pair: tuple = (1, 2)
+    skipped: Optional[List[int]] = None
+
+
+def test_dataclass_to_dict_matches_asdict():
+    obj = Outer(inner=Inner(values=[1, 2]), data={"nested": {"a": [1]}}, skipped=[3])
+
+    expected = {k: v for k, v in asdict(obj).items() if k != "skipped"}
+    assert dataclass_to_dict(obj, exclude={"skipped"}) == expected
+
+
+def test_dataclass_to_dict_copies_values():
+    obj = Outer(data={"nested": {"a": [1]}})
+
+    result = dataclass_to_dict(obj)
+    result["data"]["nested"]["a"].append(2)
+
+    assert obj.data == {"nested": {"a": [1]}}
+
+
+def test_dataclass_to_dict_drops_none_values():
+    assert "data" not in dataclass_to_dict(Outer())
+    assert dataclass_to_dict(Outer(), exclude_none=False)["data"] is None
+
+
+def test_run_output_to_dict():
+    run_output = RunOutput(
+        run_id="run-1",
+        content="Hello",
+        session_state={"counter": 1},
+        messages=[Message(role="user", content="Hi"), Message(role="assistant", content="Hello")],
+        metrics=Metrics(input_tokens=10, output_tokens=5, total_tokens=15),
+        tools=[ToolExecution(tool_name="get_weather", tool_args={"city": "Paris"}, result="Sunny")],
+    )
+
+    result = run_output.to_dict()
+
+    assert result["run_id"] == "run-1"
+    assert result["session_state"] == {"counter": 1}
+    assert result["session_state"] is not run_output.session_state
+    assert [m["content"] for m in result["messages"]] == ["Hi", "Hello"]
+    assert result["metrics"] == {"input_tokens": 10, "output_tokens": 5, "total_tokens": 15}
+    assert result["tools"][0]["tool_args"] == {"city": "Paris"}
+    assert result["status"] == "RUNNING"
+    assert "images" not in result
+    json.dumps(result)
+
+
+def test_json_dumps_compact_matches_json():
+    data = {"text": "héllo", "when": datetime(2024, 1, 2, 3, 4, 5), 1: [1.5, None, True], "big": 2**70}
+
+    assert json_dumps_compact(data) == json.dumps(
+        data, separators=(",", ":"), default=json_serializer, ensure_ascii=False
+    )
+
+
+def test_event_to_json_compact():
+    event = RunContentEvent(run_id="run-1", content="chunk")
+
+    assert json.loads(event.to_json(separators=(",", ":"), indent=None)) == json.loads(event.to_json())
@@ -427,3 +427,46 @@ async def test_model_acount_tokens_with_schema():
 
     # Schema should add tokens
     assert tokens_with_schema > tokens_no_schema
+
+
+def test_count_message_tokens_is_cached_per_message(monkeypatch):
+    import agno.utils.tokens as tokens
+
+    calls = []
+    count_uncached = tokens._count_message_tokens
+
+    def counting(message, model_id="gpt-4o"):
+        calls.append(message.id)
+        return count_uncached(message, model_id)
+
+    monkeypatch.setattr(tokens, "_count_message_tokens", counting)
+    messages = [Message(role="user", content="Hello world"), Message(role="assistant", content="Hi there")]
+
+    first = count_tokens(messages)
+    assert count_tokens(messages) == first
+    assert len(calls) == 2
+
+    # Changed messages are counted again
+    messages[1].compressed_content = "Hi"
+    assert tokens.count_message_tokens(messages[1]) == count_text_tokens("Hi")
+    assert calls[-1] == messages[1].id
+    assert len(calls) == 3
+
+
+def test_count_message_tokens_is_stored_with_the_message(monkeypatch):
+    import agno.utils.tokens as tokens
+
+    message = Message(role="user", content="Hello world")
+    expected = tokens.count_message_tokens(message)
+
+    calls = []
+    monkeypatch.setattr(tokens, "_count_message_tokens", lambda message, model_id="gpt-4o": calls.append(message))
+    restored = Message.from_dict(message.to_dict())
+
+    assert tokens.count_message_tokens(restored) == expected
+    assert calls == []
+
+    # A stored count is not used for a message with different content
+    changed = Message.from_dict({**message.to_dict(), "content": "Something else"})
+    tokens.count_message_tokens(changed)
+    assert calls == [changed]
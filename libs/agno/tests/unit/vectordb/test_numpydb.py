@@ -0,0 +1,205 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pytest
+
+from agno.filters import EQ, GT, NOT
+from agno.knowledge.document import Document
+from agno.knowledge.embedder.base import Embedder
+from agno.vectordb.distance import Distance
+from agno.vectordb.numpydb import NumpyDb
+
+VECTORS = {
+    "north": [0.0, 1.0, 0.0],
+    "east": [1.0, 0.0, 0.0],
+    "up": [0.0, 0.0, 1.0],
+    "north east": [0.7, 0.7, 0.0],
+}
+
+
+@dataclass
+class KeywordEmbedder(Embedder):
+    """Embeds a text to the vector of the first known keyword it contains."""
+
+    dimensions: Optional[int] = 3
+
+    def get_embedding(self, text: str) -> List[float]:
+        for keyword in sorted(VECTORS, key=len, reverse=True):
+            if keyword in text:
+                return VECTORS[keyword]
+        return [0.1, 0.1, 0.1]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+@pytest.fixture
+def numpy_db(tmp_path):
+    db = NumpyDb(collection="test", path=str(tmp_path), embedder=KeywordEmbedder())
+    db.create()
+    return db
+
+
+def create_documents() -> List[Document]:
+    return [
+        Document(content="go north", name="north", meta_data={"kind": "cardinal", "rank": 1}, content_id="c1"),
+        Document(content="go east", name="east", meta_data={"kind": "cardinal", "rank": 2}, content_id="c1"),
+        Document(content="go up", name="up", meta_data={"kind": "vertical", "rank": 3}, content_id="c2"),
+    ]
+
+
+def test_create_and_exists(tmp_path):
+    db = NumpyDb(collection="test", path=str(tmp_path), embedder=KeywordEmbedder())
+    assert not db.exists()
+    db.create()
+    assert db.exists()
+    assert db.get_count() == 0
+
+
+def test_insert_and_search(numpy_db):
+    numpy_db.insert(content_hash="hash1", documents=create_documents())
+
+    assert numpy_db.get_count() == 3
+    assert numpy_db.content_hash_exists("hash1")
+    assert numpy_db.name_exists("east")
+
+    results = numpy_db.search("heading north east", limit=2)
+    assert [doc.name for doc in results] == ["north", "east"] or [doc.name for doc in results] == ["east", "north"]
+    assert numpy_db.search("straight up", limit=1)[0].name == "up"
+
+
+@pytest.mark.parametrize("distance", [Distance.cosine, Distance.l2, Distance.max_inner_product])
+def test_search_orders_by_distance(tmp_path, distance):
+    db = NumpyDb(collection="test", path=str(tmp_path), embedder=KeywordEmbedder(), distance=distance)
+    db.insert(content_hash="hash1", documents=create_documents())
+
+    results = db.vector_search([0.1, 0.9, 0.0], limit=3)
+
+    assert results[0][0].name == "north"
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_search_with_filters(numpy_db):
+    numpy_db.insert(content_hash="hash1", documents=create_documents())
+
+    assert [doc.name for doc in numpy_db.search("north", filters={"kind": "vertical"})] == ["up"]
+    assert {doc.name for doc in numpy_db.search("north", filters=[GT("rank", 1)])} == {"east", "up"}
+    assert {doc.name for doc in numpy_db.search("north", filters=[NOT(EQ("kind", "vertical"))])} == {"north", "east"}
+
+
+def test_upsert_replaces_content_hash(numpy_db):
+    numpy_db.insert(content_hash="hash1", documents=create_documents())
+    numpy_db.upsert(content_hash="hash1", documents=[Document(content="go up again", name="up again")])
+
+    assert numpy_db.get_count() == 1
+    assert not numpy_db.name_exists("north")
+    assert numpy_db.name_exists("up again")
+
+
+def test_deletes(numpy_db):
+    numpy_db.insert(content_hash="hash1", documents=create_documents())
+
+    assert numpy_db.delete_by_name("north")
+    assert not numpy_db.delete_by_name("north")
+    assert numpy_db.delete_by_content_id("c2")
+    assert numpy_db.delete_by_metadata({"kind": "cardinal"})
+    assert numpy_db.get_count() == 0
+    assert numpy_db.search("go north") == []
+
+
+def test_update_metadata(numpy_db):
+    numpy_db.insert(content_hash="hash1", documents=create_documents())
+    numpy_db.update_metadata("c1", {"reviewed": True})
+
+    assert {doc.name for doc in numpy_db.search("north", filters={"reviewed": True})} == {"north", "east"}
+
+
+def test_collection_survives_reopen(tmp_path):
+    db = NumpyDb(collection="test", path=str(tmp_path), embedder=KeywordEmbedder())
+    db.insert(content_hash="hash1", documents=create_documents())
+    db.delete_by_name("east")
+    db.update_metadata("c2", {"reviewed": True})
+
+    reopened = NumpyDb(collection="test", path=str(tmp_path), embedder=KeywordEmbedder())
+
+    assert reopened.get_count() == 2
+    assert not reopened.name_exists("east")
+    assert [doc.name for doc in reopened.search("north", filters={"reviewed": True})] == ["up"]
+
+
+def test_reopen_drops_vectors_without_index_entry(tmp_path):
+    db = NumpyDb(collection="test", path=str(tmp_path), embedder=KeywordEmbedder())
+    db.insert(content_hash="hash1", documents=create_documents())
+    # Simulate a crash between writing vectors and their index entries
+    with open(db.path / "vectors.f32", "ab") as f:
+        f.write(np.ones(3, dtype=np.float32).tobytes())
+
+    reopened = NumpyDb(collection="test", path=str(tmp_path), embedder=KeywordEmbedder())
+    reopened.insert(content_hash="hash2", documents=[Document(content="go north east", name="ne")])
+
+    assert reopened.get_count() == 4
+    assert reopened.search("north east", limit=1)[0].name == "ne"
+
+
+def test_optimize_compacts_deleted_rows(tmp_path):
+    db = NumpyDb(collection="test", path=str(tmp_path), embedder=KeywordEmbedder())
+    db.insert(content_hash="hash1", documents=create_documents())
+    db.delete_by_name("north")
+
+    db.optimize()
+
+    assert (db.path / "vectors.f32").stat().st_size == 2 * 3 * 4
+    reopened = NumpyDb(collection="test", path=str(tmp_path), embedder=KeywordEmbedder())
+    assert reopened.get_count() == 2
+    assert reopened.search("go east", limit=1)[0].name == "east"
+
+
+def test_in_memory_collection():
+    db = NumpyDb(collection="test", path=None, embedder=KeywordEmbedder())
+    db.insert(content_hash="hash1", documents=create_documents())
+
+    assert db.get_count() == 3
+    assert db.search("go up", limit=1)[0].name == "up"
+
+
+def test_ivf_search_matches_brute_force():
+    rng = np.random.default_rng(42)
+    centers = rng.normal(size=(8, 16)) * 10
+    vectors = np.concatenate([center + rng.normal(size=(50, 16)) for center in centers])
+    documents = [Document(content=f"doc {i}", embedding=vector.tolist()) for i, vector in enumerate(vectors)]
+
+    brute = NumpyDb(collection="brute", path=None, embedder=KeywordEmbedder(dimensions=16), distance=Distance.l2)
+    ivf = NumpyDb(
+        collection="ivf",
+        path=None,
+        embedder=KeywordEmbedder(dimensions=16),
+        distance=Distance.l2,
+        ivf_lists=8,
+        nprobe=2,
+        ivf_min_rows=100,
+    )
+    brute.insert(content_hash="hash", documents=documents)
+    ivf.insert(content_hash="hash", documents=documents)
+
+    query = (centers[3] + rng.normal(size=16)).tolist()
+    expected = [doc.content for doc, _ in brute.vector_search(query, limit=5)]
+    actual = [doc.content for doc, _ in ivf.vector_search(query, limit=5)]
+
+    assert ivf._centroids is not None
+    assert actual == expected
+
+
+async def test_async_insert_and_search(numpy_db):
+    await numpy_db.async_insert(content_hash="hash1", documents=create_documents())
+
+    results = await numpy_db.async_search("go up", limit=1)
+
+    assert results[0].name == "up"
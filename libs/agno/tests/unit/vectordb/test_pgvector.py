@@ -791,3 +791,92 @@ def test_insert_merges_filters_into_metadata(mock_pgvector, mock_embedder):
         assert batch_records[0]["meta_data"]["doc_key"] == "doc_value"
         assert batch_records[0]["meta_data"]["knowledge_base_id"] == "kb-123"
         assert batch_records[0]["meta_data"]["source"] == "test"
+
+
+def test_insert_uses_sync_batch_embedding(mock_pgvector):
+    """Sync insert embeds each batch with a single get_embeddings_batch_and_usage call."""
+    embedder = MagicMock()
+    embedder.enable_batch = True
+    embedder.get_embeddings_batch_and_usage.side_effect = lambda texts: (
+        [[0.1] * 1024 for _ in texts],
+        [{"total_tokens": 1} for _ in texts],
+    )
+    mock_pgvector.embedder = embedder
+    docs = create_test_documents(5)
+
+    sess = MagicMock()
+    cm = MagicMock()
+    cm.__enter__.return_value = sess
+    mock_pgvector.Session.return_value = cm
+
+    with patch("agno.vectordb.pgvector.pgvector.postgresql.insert"):
+        mock_pgvector.insert("test_hash", docs, batch_size=2)
+
+    assert embedder.get_embeddings_batch_and_usage.call_count == 3
+    embedder.get_embedding_and_usage.assert_not_called()
+    assert all(doc.embedding == [0.1] * 1024 for doc in docs)
+    assert sum(len(call.args[1]) for call in sess.execute.call_args_list) == 5
+
+
+def test_insert_fans_out_individual_embedding_over_threads(mock_pgvector):
+    """With embedding_workers > 1, individual embeddings run on a thread pool and each doc is embedded once."""
+    embedder = MagicMock()
+    embedder.enable_batch = False
+    embedder.get_embedding_and_usage.return_value = ([0.2] * 1024, None)
+    mock_pgvector.embedder = embedder
+    mock_pgvector.embedding_workers = 4
+    docs = create_test_documents(6)
+
+    sess = MagicMock()
+    cm = MagicMock()
+    cm.__enter__.return_value = sess
+    mock_pgvector.Session.return_value = cm
+
+    with patch("agno.vectordb.pgvector.pgvector.postgresql.insert"):
+        mock_pgvector.insert("test_hash", docs)
+
+    assert embedder.get_embedding_and_usage.call_count == 6
+    assert len(sess.execute.call_args.args[1]) == 6
+
+
+def test_upsert_skips_documents_whose_embedding_failed(mock_pgvector):
+    """Documents that fail to embed are left out of the upsert batch instead of being embedded again."""
+    embedder = MagicMock()
+    embedder.enable_batch = False
+    embedder.get_embedding_and_usage.side_effect = [([0.3] * 1024, None), RuntimeError("boom")]
+    mock_pgvector.embedder = embedder
+    docs = create_test_documents(2)
+
+    sess = MagicMock()
+    cm = MagicMock()
+    cm.__enter__.return_value = sess
+    mock_pgvector.Session.return_value = cm
+
+    with patch("agno.vectordb.pgvector.pgvector.postgresql.insert") as mock_insert:
+        mock_pgvector._upsert("test_hash", docs)
+
+    assert embedder.get_embedding_and_usage.call_count == 2
+    values = mock_insert.return_value.values.call_args.args[0]
+    assert len(values) == 1
+
+
+def test_insert_skips_documents_with_empty_batch_embedding(mock_pgvector):
+    """Documents the batch fallback returns an empty embedding for are left out of the insert batch."""
+    embedder = MagicMock()
+    embedder.enable_batch = True
+    embedder.get_embeddings_batch_and_usage.return_value = ([[0.1] * 1024, []], [None, None])
+    mock_pgvector.embedder = embedder
+    docs = create_test_documents(2)
+
+    sess = MagicMock()
+    cm = MagicMock()
+    cm.__enter__.return_value = sess
+    mock_pgvector.Session.return_value = cm
+
+    with patch("agno.vectordb.pgvector.pgvector.postgresql.insert"):
+        mock_pgvector.insert("test_hash", docs)
+
+    batch_records = sess.execute.call_args.args[1]
+    assert len(batch_records) == 1
+    assert batch_records[0]["embedding"] == [0.1] * 1024
+    embedder.get_embedding_and_usage.assert_not_called()
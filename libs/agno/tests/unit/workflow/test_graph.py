@@ -0,0 +1,311 @@
+"""Tests for Graph, running workflow steps as soon as the steps they depend on are completed."""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+import pytest
+
+from agno.agent import Agent
+from agno.models.base import Model
+from agno.models.response import ModelResponse
+from agno.run.workflow import WorkflowCompletedEvent
+from agno.workflow import Graph, Step, Workflow
+from agno.workflow.types import StepInput, StepOutput
+
+
+class Tracker:
+    """Records the steps that started, and the maximum number of steps running at the same time."""
+
+    def __init__(self):
+        self.started: List[str] = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def enter(self, name: str) -> None:
+        with self._lock:
+            self.started.append(name)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+
+    def exit(self) -> None:
+        with self._lock:
+            self.running -= 1
+
+    def step(
+        self,
+        name: str,
+        delay: float = 0.05,
+        depends_on=None,
+        fail: bool = False,
+        barrier: Optional[threading.Barrier] = None,
+    ) -> Step:
+        """A step that sleeps for delay, or waits at the barrier for the steps that must run at the same time."""
+
+        def execute(step_input: StepInput) -> StepOutput:
+            self.enter(name)
+            try:
+                if barrier is not None:
+                    barrier.wait()
+                else:
+                    time.sleep(delay)
+                if fail:
+                    raise RuntimeError(f"{name} failed")
+                inputs = ",".join(sorted(step_input.previous_step_outputs or {}))
+                return StepOutput(content=f"{name}({inputs})")
+            finally:
+                self.exit()
+
+        return Step(name=name, executor=execute, depends_on=depends_on, max_retries=0)
+
+    def async_step(self, name: str, delay: float = 0.05, depends_on=None) -> Step:
+        async def execute(step_input: StepInput) -> StepOutput:
+            self.enter(name)
+            try:
+                await asyncio.sleep(delay)
+                inputs = ",".join(sorted(step_input.previous_step_outputs or {}))
+                return StepOutput(content=f"{name}({inputs})")
+            finally:
+                self.exit()
+
+        return Step(name=name, executor=execute, depends_on=depends_on, max_retries=0)
+
+
+@dataclass
+class EchoModel(Model):
+    """Model answering with the last user message, recording the messages it is given."""
+
+    id: str = "echo"
+    inputs: List[str] = field(default_factory=list)
+
+    def _response(self, messages: List[Any]) -> ModelResponse:
+        content = next(message.content for message in reversed(messages) if message.role == "user")
+        self.inputs.append(content)
+        return ModelResponse(role="assistant", content=f"echo: {content}")
+
+    def invoke(self, *args, **kwargs) -> ModelResponse:
+        return self._response(kwargs["messages"])
+
+    async def ainvoke(self, *args, **kwargs) -> ModelResponse:
+        return self._response(kwargs["messages"])
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[ModelResponse]:
+        yield self._response(kwargs["messages"])
+
+    async def ainvoke_stream(self, *args, **kwargs) -> AsyncIterator[ModelResponse]:
+        yield self._response(kwargs["messages"])
+
+    def _parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return response
+
+    def _parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return response
+
+
+def _workflow(*steps) -> Workflow:
+    return Workflow(name="Graph Workflow", steps=list(steps), telemetry=False)
+
+
+def _barrier(parties: int) -> threading.Barrier:
+    # Times out, failing the step, if the steps don't run at the same time
+    return threading.Barrier(parties, timeout=5)
+
+
+def test_steps_run_as_soon_as_their_dependencies_complete():
+    tracker = Tracker()
+    fetch_barrier = _barrier(2)
+    graph = Graph(
+        tracker.step("fetch_a", barrier=fetch_barrier),
+        tracker.step("fetch_b", barrier=fetch_barrier),
+        tracker.step("summarize_a", depends_on=["fetch_a"]),
+        tracker.step("report", depends_on=["summarize_a", "fetch_b"]),
+        name="pipeline",
+    )
+
+    result = _workflow(graph).run(input="topic")
+
+    # fetch_a and fetch_b run concurrently
+    assert tracker.max_running == 2
+    assert set(tracker.started[:2]) == {"fetch_a", "fetch_b"}
+    assert tracker.started[-1] == "report"
+    # A step gets the outputs of the steps it depends on
+    assert result.content == "report(fetch_b,summarize_a)"
+    graph_output = result.step_results[0]
+    assert graph_output.step_type == "Graph"
+    assert {output.step_name for output in graph_output.steps} == {"fetch_a", "fetch_b", "summarize_a", "report"}
+    summarize_output = next(output for output in graph_output.steps if output.step_name == "summarize_a")
+    assert summarize_output.content == "summarize_a(fetch_a)"
+
+
+def test_max_workers_bounds_the_running_steps():
+    tracker = Tracker()
+    # The steps run in pairs, a third step running at the same time would be over max_workers
+    pair_barrier = _barrier(2)
+    graph = Graph(*[tracker.step(f"step_{i}", barrier=pair_barrier) for i in range(4)], name="pipeline", max_workers=2)
+
+    _workflow(graph).run(input="topic")
+
+    assert tracker.max_running == 2
+    assert len(tracker.started) == 4
+
+
+def test_critical_path_is_reported_in_the_run_metrics():
+    tracker = Tracker()
+    graph = Graph(
+        tracker.step("slow", delay=0.1),
+        tracker.step("fast", delay=0.01),
+        tracker.step("merge", delay=0.01, depends_on=["slow", "fast"]),
+        name="pipeline",
+    )
+
+    result = _workflow(graph).run(input="topic")
+
+    graph_metrics = result.metrics.steps["pipeline"].metrics
+    assert graph_metrics.additional_metrics["critical_path"] == ["slow", "merge"]
+    assert graph_metrics.additional_metrics["critical_path_duration"] >= 0.11
+    assert set(graph_metrics.additional_metrics["step_durations"]) == {"slow", "fast", "merge"}
+    assert graph_metrics.duration >= graph_metrics.additional_metrics["critical_path_duration"]
+
+
+def test_dependencies_can_be_given_on_the_graph():
+    def draft(step_input: StepInput) -> StepOutput:
+        return StepOutput(content="draft")
+
+    def review(step_input: StepInput) -> StepOutput:
+        return StepOutput(content=f"review of {step_input.get_step_content('draft')}")
+
+    result = _workflow(Graph(review, draft, dependencies={"review": ["draft"]})).run(input="topic")
+
+    assert result.content == "review of draft"
+
+
+def test_dependents_of_a_failed_step_do_not_run():
+    tracker = Tracker()
+    graph = Graph(
+        tracker.step("fetch", fail=True),
+        tracker.step("summarize", depends_on=["fetch"]),
+        name="pipeline",
+    )
+    workflow = _workflow(graph)
+
+    with pytest.raises(RuntimeError, match="fetch failed"):
+        workflow.run(input="topic")
+
+    assert tracker.started == ["fetch"]
+
+
+@pytest.mark.parametrize(
+    "dependencies, error",
+    [
+        ({"a": ["b"], "b": ["a"]}, "dependency cycle"),
+        ({"a": ["missing"]}, "unknown step missing"),
+        ({"missing": ["a"]}, "unknown step missing"),
+    ],
+)
+def test_invalid_graphs_are_rejected(dependencies, error):
+    tracker = Tracker()
+    graph = Graph(tracker.step("a"), tracker.step("b"), dependencies=dependencies)
+    graph._prepare_steps()
+
+    with pytest.raises(ValueError, match=error):
+        graph._get_dependencies()
+
+
+def test_steps_are_streamed():
+    tracker = Tracker()
+    fetch_barrier = _barrier(2)
+    graph = Graph(
+        tracker.step("fetch_a", barrier=fetch_barrier),
+        tracker.step("fetch_b", barrier=fetch_barrier),
+        tracker.step("report", depends_on=["fetch_a", "fetch_b"]),
+        name="pipeline",
+    )
+    workflow = _workflow(graph)
+
+    events = list(workflow.run(input="topic", stream=True, stream_events=True))
+
+    assert tracker.max_running == 2
+    completed = events[-1]
+    assert isinstance(completed, WorkflowCompletedEvent)
+    assert completed.content == "report(fetch_a,fetch_b)"
+
+
+async def test_async_steps_run_as_tasks():
+    tracker = Tracker()
+    graph = Graph(
+        tracker.async_step("fetch_a"),
+        tracker.async_step("fetch_b"),
+        tracker.async_step("report", depends_on=["fetch_a", "fetch_b"]),
+        name="pipeline",
+        max_workers=2,
+    )
+
+    result = await _workflow(graph).arun(input="topic")
+
+    # The fetch steps sleep at the same time on the event loop
+    assert tracker.max_running == 2
+    assert result.content == "report(fetch_a,fetch_b)"
+
+
+async def test_async_steps_are_streamed():
+    tracker = Tracker()
+    graph = Graph(
+        tracker.async_step("fetch"),
+        tracker.async_step("report", depends_on=["fetch"]),
+        name="pipeline",
+    )
+
+    events = [event async for event in _workflow(graph).arun(input="topic", stream=True, stream_events=True)]
+
+    assert events[-1].content == "report(fetch)"
+    assert tracker.started == ["fetch", "report"]
+
+
+def test_graph_output_is_in_declaration_order():
+    def slow(step_input: StepInput) -> StepOutput:
+        time.sleep(0.05)
+        return StepOutput(content="slow")
+
+    def fast(step_input: StepInput) -> StepOutput:
+        return StepOutput(content="fast")
+
+    result = _workflow(Graph(slow, fast, name="pipeline")).run(input="topic")
+
+    assert result.content == "## slow\nslow\n\n## fast\nfast"
+    assert [output.step_name for output in result.step_results[0].steps] == ["slow", "fast"]
+
+
+def test_agent_step_after_a_graph_gets_the_graph_output():
+    def draft(step_input: StepInput) -> StepOutput:
+        return StepOutput(content="draft")
+
+    def outline(step_input: StepInput) -> StepOutput:
+        time.sleep(0.05)
+        return StepOutput(content="outline")
+
+    model = EchoModel()
+    editor = Agent(name="editor", model=model, telemetry=False)
+
+    result = _workflow(Graph(outline, draft, name="pipeline"), Step(name="edit", agent=editor)).run(input="topic")
+
+    assert model.inputs == ["## outline\noutline\n\n## draft\ndraft"]
+    assert result.content == f"echo: {model.inputs[0]}"
+
+
+def test_agent_step_in_a_graph_gets_all_its_dependencies():
+    def fetch_a(step_input: StepInput) -> StepOutput:
+        return StepOutput(content="a")
+
+    def fetch_b(step_input: StepInput) -> StepOutput:
+        return StepOutput(content="b")
+
+    model = EchoModel()
+    report = Step(name="report", agent=Agent(name="reporter", model=model, telemetry=False))
+    graph = Graph(fetch_a, fetch_b, report, dependencies={"report": ["fetch_a", "fetch_b"]}, name="pipeline")
+
+    _workflow(graph).run(input="topic")
+
+    assert model.inputs == ["=== fetch_a ===\na\n\n=== fetch_b ===\nb"]
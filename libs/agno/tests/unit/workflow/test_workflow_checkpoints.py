@@ -0,0 +1,204 @@
+"""Tests for resuming workflow runs from their completed steps, and caching step outputs."""
+
+from typing import Dict, List
+from uuid import uuid4
+
+import pytest
+
+from agno.db.sqlite import SqliteDb
+from agno.run.base import RunStatus
+from agno.run.workflow import StepOutputEvent
+from agno.workflow.step import Step
+from agno.workflow.types import StepInput, StepOutput
+from agno.workflow.workflow import Workflow
+
+
+class Pipeline:
+    """Function steps that record their calls, and can be made to fail."""
+
+    def __init__(self, num_steps: int = 4):
+        self.calls: List[str] = []
+        self.failing: Dict[str, bool] = {}
+        self.steps = [
+            Step(name=f"step_{i}", executor=self._executor(f"step_{i}"), max_retries=0) for i in range(num_steps)
+        ]
+
+    def _executor(self, name: str):
+        def execute(step_input: StepInput) -> StepOutput:
+            self.calls.append(name)
+            if self.failing.get(name):
+                raise RuntimeError(f"{name} failed")
+            return StepOutput(content=f"{step_input.previous_step_content or step_input.input} > {name}")
+
+        return execute
+
+
+@pytest.fixture
+def db(tmp_path):
+    return SqliteDb(db_file=str(tmp_path / "workflows.db"))
+
+
+def _workflow(db, pipeline: Pipeline, **kwargs) -> Workflow:
+    return Workflow(name="Pipeline", db=db, steps=pipeline.steps, session_id="session-1", telemetry=False, **kwargs)
+
+
+def test_resume_skips_completed_steps(db):
+    pipeline = Pipeline()
+    pipeline.failing["step_2"] = True
+    workflow = _workflow(db, pipeline)
+
+    with pytest.raises(RuntimeError, match="step_2 failed"):
+        workflow.run(input="topic", run_id="run-1")
+
+    failed_run = workflow.get_run_output(run_id="run-1")
+    assert failed_run.status == RunStatus.error
+    assert [output.step_name for output in failed_run.step_results] == ["step_0", "step_1"]
+
+    pipeline.calls.clear()
+    pipeline.failing.clear()
+    result = workflow.resume(run_id="run-1")
+
+    assert pipeline.calls == ["step_2", "step_3"]
+    assert result.status == RunStatus.completed
+    assert result.content == "topic > step_0 > step_1 > step_2 > step_3"
+    session = workflow.get_session()
+    assert [run.run_id for run in session.runs] == ["run-1"]
+
+
+def test_resume_rejects_completed_and_unknown_runs(db):
+    workflow = _workflow(db, Pipeline(num_steps=1))
+    workflow.run(input="topic", run_id="run-1")
+
+    with pytest.raises(ValueError, match="already completed"):
+        workflow.resume(run_id="run-1")
+    with pytest.raises(ValueError, match="not found"):
+        workflow.resume(run_id="missing")
+
+
+async def test_checkpoints_are_saved_after_each_step(db):
+    pipeline = Pipeline()
+    pipeline.failing["step_3"] = True
+    workflow = _workflow(db, pipeline, checkpoint_steps=True)
+
+    with pytest.raises(RuntimeError, match="step_3 failed"):
+        await workflow.arun(input="topic", run_id="run-1")
+
+    # The async run is not saved when a step fails, but its checkpoints are
+    stored_run = workflow.get_session().get_run("run-1")
+    assert [output.step_name for output in stored_run.step_results] == ["step_0", "step_1", "step_2"]
+
+    pipeline.calls.clear()
+    pipeline.failing.clear()
+    result = await workflow.aresume(run_id="run-1")
+
+    assert pipeline.calls == ["step_3"]
+    assert result.content == "topic > step_0 > step_1 > step_2 > step_3"
+
+
+def test_resume_streams_the_outputs_of_skipped_steps(db):
+    pipeline = Pipeline(num_steps=3)
+    pipeline.failing["step_1"] = True
+    workflow = _workflow(db, pipeline, checkpoint_steps=True)
+
+    with pytest.raises(RuntimeError):
+        list(workflow.run(input="topic", run_id="run-1", stream=True))
+
+    pipeline.calls.clear()
+    pipeline.failing.clear()
+    events = list(workflow.resume(run_id="run-1", stream=True, stream_events=True))
+
+    assert pipeline.calls == ["step_1", "step_2"]
+    skipped = [event for event in events if isinstance(event, StepOutputEvent) and event.step_name == "step_0"]
+    assert len(skipped) == 1
+    assert workflow.get_run_output(run_id="run-1").content == "topic > step_0 > step_1 > step_2"
+
+
+def test_cached_steps_are_not_run_again_for_the_same_input(db):
+    pipeline = Pipeline(num_steps=2)
+    workflow = _workflow(db, pipeline, cache_steps=True)
+
+    first = workflow.run(input="topic")
+    second = workflow.run(input="topic")
+
+    assert pipeline.calls == ["step_0", "step_1"]
+    assert second.content == first.content == "topic > step_0 > step_1"
+
+    workflow.run(input="other topic")
+    assert pipeline.calls == ["step_0", "step_1", "step_0", "step_1"]
+    # Only the output for the latest input of each step is kept
+    assert len(workflow.get_session().session_data["step_cache"]) == 2
+
+
+def test_step_cache_ignores_run_ids_of_previous_steps(db):
+    calls: List[str] = []
+
+    def first(step_input: StepInput) -> StepOutput:
+        calls.append("first")
+        return StepOutput(content="same", step_run_id=str(uuid4()))
+
+    def second(step_input: StepInput) -> StepOutput:
+        calls.append("second")
+        return StepOutput(content=f"{step_input.previous_step_content} > second")
+
+    # Only the second step is cached, so the first one runs again with a new run id
+    workflow = Workflow(
+        name="Pipeline",
+        db=db,
+        steps=[Step(name="first", executor=first), Step(name="second", executor=second)],
+        session_id="session-1",
+        cache_steps=True,
+    )
+    workflow.run(input="topic")
+    session = workflow.get_session()
+    session.session_data["step_cache"] = {
+        key: output for key, output in session.session_data["step_cache"].items() if output["step_name"] == "second"
+    }
+    db.upsert_session(session)
+    result = workflow.run(input="topic")
+
+    assert calls == ["first", "second", "first"]
+    assert result.content == "same > second"
+
+
+def test_step_cache_is_keyed_on_what_the_step_runs(db):
+    pipeline = Pipeline(num_steps=1)
+    _workflow(db, pipeline, cache_steps=True).run(input="topic")
+
+    def other_executor(step_input: StepInput) -> StepOutput:
+        return StepOutput(content="other")
+
+    other_step = Step(name="step_0", executor=other_executor)
+    result = Workflow(name="Pipeline", db=db, steps=[other_step], session_id="session-1", cache_steps=True).run(
+        input="topic"
+    )
+
+    assert result.content == "other"
+
+
+async def test_resume_rejects_background_runs(db):
+    workflow = _workflow(db, Pipeline(num_steps=1))
+
+    with pytest.raises(ValueError, match="background"):
+        workflow.resume(run_id="run-1", background=True)
+    with pytest.raises(ValueError, match="background"):
+        await workflow.aresume(run_id="run-1", background=True)
+
+
+def test_steps_are_not_cached_by_default(db):
+    pipeline = Pipeline(num_steps=2)
+    workflow = _workflow(db, pipeline)
+
+    workflow.run(input="topic")
+    workflow.run(input="topic")
+
+    assert pipeline.calls == ["step_0", "step_1", "step_0", "step_1"]
+    assert "step_cache" not in workflow.get_session().session_data
+
+
+def test_checkpoint_settings_are_serialized():
+    workflow = Workflow(name="Pipeline", checkpoint_steps=True, cache_steps=True)
+
+    restored = Workflow.from_dict(workflow.to_dict())
+
+    assert restored.checkpoint_steps is True
+    assert restored.cache_steps is True